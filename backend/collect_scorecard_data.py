@@ -2,6 +2,25 @@
 from backend.functions.logging import configure_logging
 from backend.functions.scorecard import Hole19Scrapper
 from shared import Variables
+import argparse
+
+# Parse command line arguments
+parser = argparse.ArgumentParser(description="Scrape new Hole19 scorecards into blob storage")
+parser.add_argument("--workers", type=int, default=1,
+                    help="Logged-in browser workers scraping rounds concurrently (1 scrapes them one by one)")
+parser.add_argument("--rate", type=float, default=2.0,
+                    help="Most round page loads per second across all workers, 0 for no limit")
+parser.add_argument("--http", action="store_true",
+                    help="Fetch rounds from their JSON endpoint over HTTP with the browser's login cookies "
+                         "instead of rendering them (needs round_site_api_url or browser_capture_network)")
+parser.add_argument("--full-history", action="store_true",
+                    help="Page through the whole round history instead of stopping at the newest ingested round. "
+                         "Incremental runs also page back to rounds recorded as failed by the previous run, but "
+                         "miss older rounds that were never ingested nor recorded as failed (e.g. after an "
+                         "interrupted run); use this flag to pick those up")
+parser.add_argument("--rebuild-summaries", action="store_true",
+                    help="Rebuild every hole summary from all scorecards instead of merging in only new rounds")
+args = parser.parse_args()
 
 # Configure logger
 logger = configure_logging()
@@ -11,4 +30,5 @@ vars = Variables()
 
 # Initiate Hole 19 Scrapper and execute scrapper
 app = Hole19Scrapper(logger=logger)
-app.run(headless=True, driver_path=vars.chromedriver_path)
+app.run(headless=True, driver_path=vars.chromedriver_path, workers=args.workers, rate=args.rate,
+        http=args.http, incremental=not args.full_history, rebuild_summaries=args.rebuild_summaries)
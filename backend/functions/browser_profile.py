@@ -0,0 +1,161 @@
+# Import dependencies
+from dataclasses import dataclass, field, replace
+from typing import Optional
+from shared import Variables
+import os
+
+# Resources a scraper never reads: images, fonts and third-party analytics
+LEAN_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.css",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*connect.facebook.net*", "*hotjar.com*", "*segment.io*", "*segment.com*"
+]
+
+# Resources each site still needs, subtracted from the blocked URLs
+LEAN_ALLOWED_URLS = {
+    "hole19": ["*.css"],
+    "trackman": ["*.css"]
+}
+
+@dataclass
+class BrowserProfile:
+    """
+    Chrome settings applied by `SeleniumDriver.configure_driver`.
+
+    The "default" profile launches a stock Chrome that waits for the full page
+    load on every navigation. The "lean" profile returns from a navigation as
+    soon as the DOM is ready (eager page-load strategy), disables extensions
+    and the GPU, and blocks images, fonts, stylesheets and analytics through
+    the DevTools `Network.setBlockedURLs` command. Sites that need some of
+    those resources to render (e.g. stylesheets deciding which buttons are
+    clickable) list them in `allowed_urls`, keyed by site.
+
+    Either profile can reuse a persistent user-data directory, so the HTTP
+    cache and cookies survive between runs, and can record the browser's
+    network traffic in its performance log, so scrapers can read the JSON
+    responses pages are rendered from (see `NetworkCapture`).
+
+    Typical usage example:
+        profile = BrowserProfile.from_variables(Variables())
+        driver = SeleniumDriver().configure_driver(driver_path=path, profile=profile, site="hole19")
+
+    Attributes:
+        name (str): Profile name reported alongside navigation timings.
+        page_load_strategy (str): Selenium page-load strategy ("normal", "eager" or "none").
+        blocked_urls (list[str]): URL patterns blocked on every site, `*` matching any characters.
+        allowed_urls (dict[str, list[str]]): Blocked URL patterns a site is still allowed to load.
+        disable_extensions (bool): Whether to launch Chrome without extensions.
+        disable_gpu (bool): Whether to launch Chrome without GPU acceleration.
+        user_data_dir (Optional[str]): Persistent Chrome user-data directory, a fresh profile if unset.
+        capture_network (bool): Whether to record network events in the performance log.
+    """
+    name: str = "default"
+    page_load_strategy: str = "normal"
+    blocked_urls: list[str] = field(default_factory=list)
+    allowed_urls: dict[str, list[str]] = field(default_factory=dict)
+    disable_extensions: bool = False
+    disable_gpu: bool = False
+    user_data_dir: Optional[str] = None
+    capture_network: bool = False
+
+    @classmethod
+    def lean(cls, user_data_dir: Optional[str] = None, capture_network: bool = False) -> "BrowserProfile":
+        """
+        Build the lean profile.
+
+        Args:
+            user_data_dir (Optional[str], optional): Persistent Chrome user-data directory. Defaults to None.
+            capture_network (bool, optional): Whether to record network events. Defaults to False.
+
+        Returns:
+            BrowserProfile: Eager, extension-free and GPU-free profile blocking unused resources.
+        """
+        return cls(name="lean", page_load_strategy="eager", blocked_urls=list(LEAN_BLOCKED_URLS),
+                   allowed_urls={site: list(urls) for site, urls in LEAN_ALLOWED_URLS.items()},
+                   disable_extensions=True, disable_gpu=True, user_data_dir=user_data_dir,
+                   capture_network=capture_network)
+
+    @classmethod
+    def from_name(cls, name: str, user_data_dir: Optional[str] = None,
+                  capture_network: bool = False) -> "BrowserProfile":
+        """
+        Build a profile by name.
+
+        Args:
+            name (str): "default" or "lean".
+            user_data_dir (Optional[str], optional): Persistent Chrome user-data directory. Defaults to None.
+            capture_network (bool, optional): Whether to record network events. Defaults to False.
+
+        Returns:
+            BrowserProfile: The named profile.
+
+        Raises:
+            ValueError: If the name is not a known profile.
+        """
+        if name == "default":
+            return cls(user_data_dir=user_data_dir, capture_network=capture_network)
+        if name == "lean":
+            return cls.lean(user_data_dir=user_data_dir, capture_network=capture_network)
+        raise ValueError(f"Unknown browser profile '{name}', expected 'default' or 'lean'")
+
+    @classmethod
+    def from_variables(cls, vars: Variables) -> "BrowserProfile":
+        """
+        Build the profile configured by the `browser_profile`, `browser_user_data_dir` and
+        `browser_capture_network` variables.
+
+        Args:
+            vars (Variables): Loaded application variables.
+
+        Returns:
+            BrowserProfile: The configured profile.
+        """
+        return cls.from_name(name=vars.browser_profile, user_data_dir=vars.browser_user_data_dir,
+                             capture_network=vars.browser_capture_network)
+
+    def blocked_for(self, site: Optional[str] = None) -> list[str]:
+        """
+        URL patterns to block while browsing a site.
+
+        Args:
+            site (Optional[str], optional): Site key into `allowed_urls`. Defaults to None.
+
+        Returns:
+            list[str]: Blocked URL patterns minus those the site is allowed to load.
+        """
+        allowed = set(self.allowed_urls.get(site, [])) if site else set()
+        return [url for url in self.blocked_urls if url not in allowed]
+
+    def arguments(self) -> list[str]:
+        """
+        Chrome command line switches of the profile.
+
+        Returns:
+            list[str]: Switches to add to the Chrome options.
+        """
+        arguments = []
+        if self.disable_extensions:
+            arguments.append("--disable-extensions")
+        if self.disable_gpu:
+            arguments.append("--disable-gpu")
+        if self.user_data_dir:
+            arguments.append(f"--user-data-dir={os.path.abspath(self.user_data_dir)}")
+        return arguments
+
+    def for_worker(self, index: int) -> "BrowserProfile":
+        """
+        Copy of the profile for one of several browsers running at once.
+
+        Chrome locks its user-data directory, so concurrent browsers each get
+        their own subdirectory of it.
+
+        Args:
+            index (int): Worker number.
+
+        Returns:
+            BrowserProfile: The profile with a per-worker user-data directory.
+        """
+        if not self.user_data_dir:
+            return self
+        return replace(self, user_data_dir=os.path.join(self.user_data_dir, f"worker-{index}"))
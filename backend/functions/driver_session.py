@@ -0,0 +1,160 @@
+# Import dependencies
+from selenium.webdriver.chrome.webdriver import WebDriver
+from ..interfaces.scrape_models import DriverSessionReport
+from .browser_profile import BrowserProfile
+from .selenium_driver import SeleniumDriver
+from typing import Optional
+import logging
+import time
+
+class DriverSession(SeleniumDriver):
+    """
+    One browser session shared by every class of a scraping run.
+
+    Used as a context manager: entering launches and warms up Chrome, classes
+    `borrow` the running browser instead of each launching their own, and
+    exiting always calls `quit()` so the chromedriver process and the browser
+    are torn down even when the run fails. Because borrowers share a single
+    browser, cookies from a login made by one carry over to the next.
+
+    Every borrow health-checks the browser first and relaunches it if the
+    session has died. Launch time is recorded so the run can report the
+    startup seconds saved by sharing (`report`).
+
+    Typical usage example:
+        with DriverSession(logger=logger, driver_path=path, headless=True) as session:
+            navigator.initiate_driver(session=session)
+            parser.initiate_driver(session=session)
+
+    Attributes:
+        warm_up_url (Optional[str]): Page loaded right after launch to prime DNS, TLS and the HTTP cache.
+        profile (Optional[BrowserProfile]): Browser profile of the session, resolved on first launch.
+        report (DriverSessionReport): Launch, borrow and restart counters.
+        driver (Optional[WebDriver]): The running browser, None before entering or after exiting.
+    """
+    def __init__(self, logger: logging.Logger,
+                 driver_path: str = 'chromedriver.exe',
+                 headless: bool = False,
+                 warm_up_url: Optional[str] = None,
+                 profile: Optional[BrowserProfile] = None,
+                 site: Optional[str] = None) -> None:
+        """
+        Initialize the session without launching a browser.
+
+        Args:
+            logger (logging.Logger): Logger instance for recording progress and errors.
+            driver_path (str, optional): Path to the ChromeDriver executable. Defaults to 'chromedriver.exe'.
+            headless (bool, optional): Whether to run Chrome in headless mode. Defaults to False.
+            warm_up_url (Optional[str], optional): Page loaded right after launch. Defaults to None.
+            profile (Optional[BrowserProfile], optional): Browser profile to launch with.
+                Defaults to the one configured in Variables.
+            site (Optional[str], optional): Site the browser will be used on. Defaults to None.
+        """
+        self.logger = logger
+        self.driver_path = driver_path
+        self.headless = headless
+        self.warm_up_url = warm_up_url
+        self.profile = profile
+        self.site = site
+        self.report = DriverSessionReport()
+        self.driver: Optional[WebDriver] = None
+
+    def __enter__(self) -> "DriverSession":
+        """
+        Launch and warm up the browser.
+
+        Returns:
+            DriverSession: The running session.
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """
+        Quit the browser, even when the block raised.
+
+        Returns: None
+        """
+        self.quit()
+
+    def start(self) -> WebDriver:
+        """
+        Launch a browser and warm it up, timing both.
+
+        Returns:
+            WebDriver: The new browser.
+        """
+        started = time.perf_counter()
+        try:
+            self.driver = self.configure_driver(driver_path=self.driver_path, headless=self.headless,
+                                                profile=self.profile, site=self.site)
+            self.warm_up()
+        finally:
+            self.report.starts += 1
+            self.report.startup_seconds += time.perf_counter() - started
+        return self.driver
+
+    def warm_up(self) -> None:
+        """
+        Load the warm-up page, if any, so the first real navigation starts on warm connections.
+
+        A failed warm-up is logged and ignored; the browser is still usable.
+
+        Returns: None
+        """
+        if not self.warm_up_url:
+            return
+
+        try:
+            self.navigate(self.warm_up_url)
+        except Exception as e:
+            self.logger.warning(f"Browser warm-up failed - {e}")
+
+    def healthy(self) -> bool:
+        """
+        Check the browser still answers commands.
+
+        Returns:
+            bool: True if the session is alive.
+        """
+        if self.driver is None:
+            return False
+
+        try:
+            self.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def borrow(self) -> WebDriver:
+        """
+        Lend the running browser, relaunching it first if its session died.
+
+        Returns:
+            WebDriver: A live browser.
+        """
+        if not self.healthy():
+            if self.driver is not None:
+                self.logger.warning("Browser session failed its health check, relaunching")
+                self.report.restarts += 1
+                self.quit()
+            self.start()
+
+        self.report.borrows += 1
+        return self.driver
+
+    def quit(self) -> None:
+        """
+        Quit the browser and its chromedriver process, ignoring errors from a session that already died.
+
+        Returns: None
+        """
+        if self.driver is None:
+            return
+
+        try:
+            self.driver.quit()
+        except Exception as e:
+            self.logger.warning(f"Browser did not quit cleanly - {e}")
+        finally:
+            self.driver = None
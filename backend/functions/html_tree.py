@@ -0,0 +1,235 @@
+# Import dependencies
+from typing import Iterator, List, Optional
+from html.parser import HTMLParser
+import re
+
+class HtmlNode:
+    """
+    Element of a parsed HTML document.
+
+    A minimal, read-only stand-in for the handful of WebElement lookups the
+    scrapers make, so a page can be walked in-process from a single
+    `driver.page_source` instead of one WebDriver round trip per lookup.
+
+    Attributes:
+        tag (str): Lower-case tag name.
+        attrs (dict): Attribute values by name.
+        parent (Optional[HtmlNode]): Enclosing element, None for the document root.
+        children (List[HtmlNode]): Child elements in document order.
+    """
+    def __init__(self, tag: str, attrs: dict, parent: Optional["HtmlNode"] = None) -> None:
+        """
+        Initialize an element.
+
+        Args:
+            tag (str): Lower-case tag name.
+            attrs (dict): Attribute values by name.
+            parent (Optional[HtmlNode]): Enclosing element.
+        """
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.children: List[HtmlNode] = []
+        self._content: List["HtmlNode | str"] = []
+
+    @property
+    def classes(self) -> List[str]:
+        """
+        CSS classes of the element.
+
+        Returns:
+            List[str]: Class names from the `class` attribute.
+        """
+        return (self.attrs.get("class") or "").split()
+
+    @property
+    def text(self) -> str:
+        """
+        Text of the element and its descendants, with whitespace collapsed.
+
+        Returns:
+            str: The element's text.
+        """
+        return re.sub(r"\s+", " ", "".join(self._iter_text())).strip()
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        """
+        Read an attribute.
+
+        Args:
+            name (str): Attribute name.
+
+        Returns:
+            Optional[str]: The attribute value, or None if the element has no such attribute.
+        """
+        return self.attrs.get(name)
+
+    def matches(self, tag: Optional[str] = None, cls: Optional[str] = None, **attrs: str) -> bool:
+        """
+        Check the element against a simple `tag.class[attr="value"]` selector.
+
+        Args:
+            tag (Optional[str]): Required tag name, any tag if None.
+            cls (Optional[str]): Required CSS class, if any.
+            **attrs (str): Required attribute values.
+
+        Returns:
+            bool: True if the element matches.
+        """
+        if tag is not None and self.tag != tag:
+            return False
+        if cls is not None and cls not in self.classes:
+            return False
+        return all(self.attrs.get(name) == value for name, value in attrs.items())
+
+    def iter(self) -> Iterator["HtmlNode"]:
+        """
+        Walk the element's descendants in document order.
+
+        Returns:
+            Iterator[HtmlNode]: Every descendant element.
+        """
+        for child in self.children:
+            yield child
+            yield from child.iter()
+
+    def find(self, tag: Optional[str] = None, cls: Optional[str] = None, **attrs: str) -> Optional["HtmlNode"]:
+        """
+        Find the first descendant matching a simple selector.
+
+        Args:
+            tag (Optional[str]): Required tag name, any tag if None.
+            cls (Optional[str]): Required CSS class, if any.
+            **attrs (str): Required attribute values.
+
+        Returns:
+            Optional[HtmlNode]: The first match in document order, or None.
+        """
+        return next(self.find_all(tag, cls, **attrs), None)
+
+    def find_all(self, tag: Optional[str] = None, cls: Optional[str] = None, **attrs: str) -> Iterator["HtmlNode"]:
+        """
+        Find every descendant matching a simple selector.
+
+        Args:
+            tag (Optional[str]): Required tag name, any tag if None.
+            cls (Optional[str]): Required CSS class, if any.
+            **attrs (str): Required attribute values.
+
+        Returns:
+            Iterator[HtmlNode]: Matches in document order.
+        """
+        return (node for node in self.iter() if node.matches(tag, cls, **attrs))
+
+    def nth_of_type(self, n: int) -> bool:
+        """
+        Check whether the element is the n-th of its tag among its siblings (CSS `:nth-of-type(n)`).
+
+        Args:
+            n (int): One-based position.
+
+        Returns:
+            bool: True if the element is at that position.
+        """
+        if self.parent is None:
+            return n == 1
+        siblings = [child for child in self.parent.children if child.tag == self.tag]
+        return len(siblings) >= n and siblings[n - 1] is self
+
+    def _iter_text(self) -> Iterator[str]:
+        """
+        Yield the text content of the element in document order.
+
+        Returns:
+            Iterator[str]: Text fragments.
+        """
+        for item in self._content:
+            if isinstance(item, str):
+                yield item
+            else:
+                yield from item._iter_text()
+
+class HtmlTree(HTMLParser):
+    """
+    Builds an `HtmlNode` tree from page source with the standard library parser.
+
+    Void elements (`img`, `br`, ...) never take children, and a stray end tag
+    closes the nearest open element with that tag, ignoring it if none is open,
+    which is enough for the serialized DOM that `driver.page_source` returns.
+
+    Typical usage example:
+        root = HtmlTree.parse(driver.page_source)
+        grid = root.find("section", cls="round-scorecard")
+
+    Attributes:
+        root (HtmlNode): Document root.
+    """
+    void_elements = frozenset({"area", "base", "br", "col", "embed", "hr", "img", "input",
+                               "link", "meta", "param", "source", "track", "wbr"})
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty document.
+        """
+        super().__init__(convert_charrefs=True)
+        self.root = HtmlNode("#document", {})
+        self._stack = [self.root]
+
+    @classmethod
+    def parse(cls, page_source: str) -> HtmlNode:
+        """
+        Parse page source into a tree.
+
+        Args:
+            page_source (str): HTML of the page.
+
+        Returns:
+            HtmlNode: Document root.
+        """
+        tree = cls()
+        tree.feed(page_source)
+        tree.close()
+        return tree.root
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        """
+        Open an element under the current one.
+
+        Returns: None
+        """
+        parent = self._stack[-1]
+        node = HtmlNode(tag, {name: value or "" for name, value in attrs}, parent=parent)
+        parent.children.append(node)
+        parent._content.append(node)
+
+        if tag not in self.void_elements:
+            self._stack.append(node)
+
+    def handle_startendtag(self, tag: str, attrs: list) -> None:
+        """
+        Add a self-closing element under the current one.
+
+        Returns: None
+        """
+        self.handle_starttag(tag, attrs)
+        if tag not in self.void_elements:
+            self._stack.pop()
+
+    def handle_endtag(self, tag: str) -> None:
+        """
+        Close the nearest open element with the tag, and any left open inside it.
+
+        Returns: None
+        """
+        for index in range(len(self._stack) - 1, 0, -1):
+            if self._stack[index].tag == tag:
+                del self._stack[index:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        """
+        Append text to the current element.
+
+        Returns: None
+        """
+        self._stack[-1]._content.append(data)
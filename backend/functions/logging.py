@@ -1,4 +1,5 @@
 # Import python dependencies
+from shared import BlobClient, BlobMetrics, BlobSnapshot, BlobWriteBuffer, BlobWriteReport
 import warnings
 import logging
 
@@ -67,3 +68,79 @@ def configure_logging() -> logging.Logger:
         logger.addHandler(log_handler)
 
     return logger
+
+def export_blob_io_report(logger: logging.Logger, pipeline: str) -> None:
+    '''
+    Logs the blob I/O recorded during a pipeline run and exports the full report.
+
+    One line is logged per blob client class with its calls, errors, bytes and
+    time spent, followed by the number of uploads skipped as unchanged, and the
+    detailed `BlobMetrics` report is uploaded to blob storage for the dashboard's
+    diagnostics page. A failed upload is logged, not raised.
+
+    Args:
+        logger (logging.Logger): Logger to write the summary to.
+        pipeline (str): Name the report is stored under (e.g. "hole19").
+
+    Returns: None
+    '''
+    # Log the time and bytes spent per caller, most time spent first
+    for caller, stats in BlobMetrics.totals(by="caller").items():
+        logger.info(f"Blob I/O - {caller}: {stats.calls} calls, {stats.errors} errors, "
+                    f"{stats.bytes:,} bytes, {stats.total_seconds:.2f}s")
+
+    # Log how many uploads were avoided because their content was unchanged
+    skipped = BlobMetrics.totals(by="operation").get("write_skipped")
+    if skipped is not None:
+        logger.info(f"Blob I/O - {skipped.calls} unchanged writes skipped")
+
+    # Export the detailed report
+    try:
+        report_name = BlobClient().export_metrics_report(pipeline=pipeline)
+        logger.info(f"Blob I/O report exported to {report_name}")
+    except Exception as e:
+        logger.error(f"Failed to export blob I/O report - {e}")
+
+def flush_blob_writes(logger: logging.Logger, buffer: BlobWriteBuffer, stage: str) -> BlobWriteReport:
+    '''
+    Uploads the writes a pipeline stage left in the write-behind buffer and logs the outcome.
+
+    Failed uploads are logged, not raised; they stay in the buffer (and its spill
+    file) for the next flush.
+
+    Args:
+        logger (logging.Logger): Logger to write the outcome to.
+        buffer (BlobWriteBuffer): The active write-behind buffer.
+        stage (str): Name of the stage whose outputs are flushed (e.g. "scorecards").
+
+    Returns:
+        BlobWriteReport: Which blobs were uploaded and which failed.
+    '''
+    logger.info(f"Flushing {buffer.pending} buffered {stage} writes...")
+    report = buffer.flush()
+    if not report.ok:
+        logger.error(f"Failed to upload some {stage} - {report}")
+    elif report.succeeded:
+        logger.info(f"Flushed {stage} - {report}")
+    return report
+
+def publish_dashboard_snapshot(logger: logging.Logger) -> None:
+    '''
+    Publishes the packed snapshot the dashboard serves its pages from.
+
+    The snapshot is only uploaded when its content changed since the last
+    publish. A failed publish is logged, not raised; the dashboard keeps serving
+    the previous snapshot.
+
+    Args:
+        logger (logging.Logger): Logger to write the outcome to.
+
+    Returns: None
+    '''
+    try:
+        logger.info("Publishing dashboard snapshot...")
+        version, size, uploaded = BlobSnapshot().publish()
+        state = "published" if uploaded else "unchanged"
+        logger.info(f"Dashboard snapshot {version[:12]} {state} ({size:,} bytes) \n")
+    except Exception as e:
+        logger.error(f"Failed to publish dashboard snapshot - {e}")
@@ -0,0 +1,102 @@
+# Import dependencies
+from ..interfaces.scrape_models import NavigationStats
+from typing import Dict, List, Optional
+import threading
+
+class NavigationMetrics:
+    """
+    Process-wide timings of browser page loads.
+
+    Every `SeleniumDriver.navigate` call is recorded here, tagged with the
+    class that navigated and the browser profile it ran under, so a run can
+    report how long each class waited on page loads and, when the same class
+    navigated under two profiles (e.g. in the browser profile benchmark), the
+    time each navigation saved.
+
+    Typical usage example:
+        NavigationMetrics.reset()
+        navigator.navigate(url)
+        for line in NavigationMetrics.summary():
+            logger.info(line)
+    """
+    _lock = threading.Lock()
+    _stats: Dict[tuple[str, str], NavigationStats] = {}
+
+    @classmethod
+    def record(cls, caller: str, profile: str, seconds: float, error: bool = False) -> None:
+        """
+        Record one page load.
+
+        Args:
+            caller (str): Name of the class that navigated.
+            profile (str): Name of the browser profile.
+            seconds (float): Duration of the page load.
+            error (bool): Whether the page load raised.
+
+        Returns: None
+        """
+        with cls._lock:
+            stats = cls._stats.get((caller, profile))
+            if stats is None:
+                stats = cls._stats[(caller, profile)] = NavigationStats(caller=caller, profile=profile)
+            stats.navigations += 1
+            stats.errors += int(error)
+            stats.seconds += seconds
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Forget every recorded page load.
+
+        Returns: None
+        """
+        with cls._lock:
+            cls._stats = {}
+
+    @classmethod
+    def stats(cls) -> List[NavigationStats]:
+        """
+        Recorded page loads per class and profile.
+
+        Returns:
+            List[NavigationStats]: Copies of the counters, ordered by caller then profile.
+        """
+        with cls._lock:
+            return [NavigationStats(**vars(stats)) for _, stats in sorted(cls._stats.items())]
+
+    @classmethod
+    def savings(cls, caller: str, baseline: str = "default", candidate: str = "lean") -> Optional[float]:
+        """
+        Seconds a class saved per navigation by running under another profile.
+
+        Args:
+            caller (str): Name of the class that navigated.
+            baseline (str, optional): Profile compared against. Defaults to "default".
+            candidate (str, optional): Profile compared. Defaults to "lean".
+
+        Returns:
+            Optional[float]: Mean baseline minus mean candidate seconds, None unless both were recorded.
+        """
+        with cls._lock:
+            before = cls._stats.get((caller, baseline))
+            after = cls._stats.get((caller, candidate))
+            if not before or not after:
+                return None
+            return before.mean_seconds - after.mean_seconds
+
+    @classmethod
+    def summary(cls) -> List[str]:
+        """
+        One log line per class and profile, with per-navigation savings where both profiles ran.
+
+        Returns:
+            List[str]: Summary lines.
+        """
+        lines = []
+        for stats in cls.stats():
+            line = str(stats)
+            saved = cls.savings(caller=stats.caller, candidate=stats.profile)
+            if stats.profile != "default" and saved is not None:
+                line += f" ({saved:.2f}s saved per navigation against default)"
+            lines.append(line)
+        return lines
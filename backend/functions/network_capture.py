@@ -0,0 +1,182 @@
+# Import dependencies
+from selenium.webdriver.chrome.webdriver import WebDriver
+from typing import Any, Callable, Iterator, Optional, TypeVar
+import base64
+import json
+import time
+
+T = TypeVar("T")
+
+def walk_json(payload: Any) -> Iterator[dict]:
+    """
+    Yield every object nested in a JSON document, outermost first.
+
+    Args:
+        payload (Any): Decoded JSON document.
+
+    Returns:
+        Iterator[dict]: Each object in document order.
+    """
+    stack = [payload]
+    while stack:
+        node = stack.pop(0)
+        if isinstance(node, dict):
+            yield node
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+
+def pick(record: dict, aliases: tuple[str, ...], default: Any = None) -> Any:
+    """
+    Value of the first key of `aliases` present in a JSON object.
+
+    Args:
+        record (dict): JSON object.
+        aliases (tuple[str, ...]): Candidate keys in order of preference.
+        default (Any, optional): Returned if no key is present. Defaults to None.
+
+    Returns:
+        Any: The value found, or the default.
+    """
+    return next((record[key] for key in aliases if key in record), default)
+
+class NetworkCapture:
+    """
+    Reads the JSON responses a Chrome session received from its performance log.
+
+    The browser must have been launched with performance logging enabled (see
+    `BrowserProfile.capture_network`). Reading the performance log consumes
+    it, so the capture keeps every JSON response it has seen: `clear` forgets
+    them before a navigation, and `wait_for` polls the log until one of the
+    responses received since then can be parsed, fetching bodies through the
+    DevTools `Network.getResponseBody` command.
+
+    Typical usage example:
+        capture = NetworkCapture(driver=driver)
+        capture.clear()
+        driver.get(url)
+        round_data = capture.wait_for(parse=parser.parse_scorecard_json, url_filter="/rounds/")
+
+    Attributes:
+        driver (WebDriver): Browser launched with performance logging.
+        responses (dict[str, str]): URLs of finished JSON responses not yet read, by DevTools request ID.
+        matched_url (Optional[str]): URL of the response the last successful `wait_for` parsed.
+    """
+    def __init__(self, driver: WebDriver) -> None:
+        """
+        Initialize the capture on a running browser.
+
+        Args: driver (WebDriver): Browser launched with performance logging.
+        """
+        self.driver = driver
+        self.responses: dict[str, str] = {}
+        self.matched_url: Optional[str] = None
+        self._pending: dict[str, str] = {}
+
+    def clear(self) -> None:
+        """
+        Drain the performance log and forget every response seen so far.
+
+        Returns: None
+        """
+        self.driver.get_log("performance")
+        self.responses = {}
+        self._pending = {}
+
+    def poll(self) -> None:
+        """
+        Read new performance log entries, keeping JSON responses whose body has finished loading.
+
+        Returns: None
+        """
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"]).get("message", {})
+            params = message.get("params", {})
+
+            if message.get("method") == "Network.responseReceived":
+                response = params.get("response", {})
+                if "json" in response.get("mimeType", ""):
+                    self._pending[params["requestId"]] = response.get("url", "")
+
+            elif message.get("method") == "Network.loadingFinished" and params.get("requestId") in self._pending:
+                self.responses[params["requestId"]] = self._pending.pop(params["requestId"])
+
+    def body(self, request_id: str) -> Any:
+        """
+        Fetch and decode the body of a finished JSON response.
+
+        Args:
+            request_id (str): DevTools request ID.
+
+        Returns:
+            Any: Decoded JSON document.
+
+        Raises:
+            selenium.common.exceptions.WebDriverException: If the browser no longer holds the body.
+            ValueError: If the body is not JSON.
+        """
+        result = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        body = result.get("body", "")
+        if result.get("base64Encoded"):
+            body = base64.b64decode(body).decode("utf-8")
+        return json.loads(body)
+
+    def read(self, url_filter: Optional[str] = None) -> list[tuple[str, Any]]:
+        """
+        Fetch every JSON response finished since the last read, without waiting.
+
+        Responses whose body the browser has already discarded are skipped.
+
+        Args:
+            url_filter (Optional[str], optional): Substring response URLs must contain. Defaults to any URL.
+
+        Returns:
+            list[tuple[str, Any]]: URL and decoded body of each response, in the order they finished.
+        """
+        self.poll()
+
+        documents = []
+        for request_id, url in list(self.responses.items()):
+            del self.responses[request_id]
+            if url_filter and url_filter not in url:
+                continue
+            try:
+                documents.append((url, self.body(request_id)))
+            except Exception:
+                continue
+        return documents
+
+    def wait_for(self, parse: Callable[[Any], T], url_filter: Optional[str] = None,
+                 timeout: float = 10, interval: float = 0.1) -> T:
+        """
+        Poll for a JSON response that `parse` accepts.
+
+        Args:
+            parse (Callable[[Any], T]): Maps a decoded response, raising if it is not the one wanted.
+            url_filter (Optional[str], optional): Substring response URLs must contain. Defaults to any URL.
+            timeout (float, optional): Seconds to wait. Defaults to 10.
+            interval (float, optional): Seconds between polls of the log. Defaults to 0.1.
+
+        Returns:
+            T: The parsed response.
+
+        Raises:
+            TimeoutError: If no matching response arrived in time.
+        """
+        deadline = time.monotonic() + timeout
+        errors = []
+        while True:
+            # Try each response once, in the order it finished
+            for url, document in self.read(url_filter=url_filter):
+                try:
+                    parsed = parse(document)
+                except Exception as e:
+                    errors.append(f"{url}: {e}")
+                    continue
+                self.matched_url = url
+                return parsed
+
+            if time.monotonic() >= deadline:
+                detail = f" - {errors[-1]}" if errors else ""
+                raise TimeoutError(f"No matching JSON response within {timeout}s ({len(errors)} rejected){detail}")
+            time.sleep(interval)
@@ -0,0 +1,59 @@
+# Import dependencies
+import threading
+import time
+
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by browser workers hitting the same site.
+
+    Tokens refill continuously at `rate` per second up to `burst`; `acquire`
+    takes one, sleeping until it is available, so however many workers share
+    the limiter the site sees at most `rate` page loads per second on average.
+
+    Typical usage example:
+        limiter = RateLimiter(rate=2.0)
+        limiter.acquire()
+        driver.get(url)
+
+    Attributes:
+        rate (float): Tokens added per second, 0 disables limiting.
+        burst (int): Most tokens that can accumulate while workers are idle.
+        waited (float): Total seconds callers spent waiting for a token.
+    """
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate (float): Tokens added per second, 0 disables limiting.
+            burst (int): Most tokens that can accumulate while workers are idle.
+        """
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.waited = 0.0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take a token, blocking until one is available.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        # Reserve the next token, then sleep outside the lock until it has refilled
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.waited += delay
+
+        if delay:
+            time.sleep(delay)
+        return delay
@@ -1,8 +1,17 @@
 # Import dependencies
 from .scorecard_aggregator import RoundAggregator
 from .scorecard_navigator import Hole19Navigator
+from .scorecard_pool import ScorecardWorkerPool
+from .scorecard_http import ScorecardHttpFetcher
 from .scorecard_parser import ScorecardParser
-from shared import BlobClient
+from .navigation_metrics import NavigationMetrics
+from .browser_profile import BrowserProfile
+from .driver_session import DriverSession
+from .rate_limiter import RateLimiter
+from .logging import export_blob_io_report, flush_blob_writes, publish_dashboard_snapshot
+from shared import BlobClient, BlobCatalog, BlobMetrics, BlobWriteBuffer, Variables
+from azure.core.exceptions import ResourceNotFoundError
+from typing import Callable
 import logging
 
 class Hole19Scrapper:
@@ -11,7 +20,12 @@ class Hole19Scrapper:
 
     Coordinates navigation, parsing, exporting to blob storage, and
     aggregation of round-level and hole-level data.
+
+    Attributes:
+        failed_rounds_name (str): Blob listing the IDs of rounds the last run could not ingest.
     """
+    failed_rounds_name = "catalog/failed_rounds.json"
+
     def __init__(self, logger: logging.Logger) -> None:
         """
         Initialize the Hole19Scrapper.
@@ -20,88 +34,256 @@ class Hole19Scrapper:
         """
         self.logger = logger
 
-    def run(self, driver_path: str, headless: bool):
+    def run(self, driver_path: str, headless: bool, workers: int = 1, rate: float = 2.0, http: bool = False,
+            incremental: bool = True, rebuild_summaries: bool = False):
         """
         Execute the full Hole19 scraping workflow.
 
         Logs into Hole19, collects round URLs, parses scorecards, saves data
-        to blob storage, and aggregates hole-level results.
+        to blob storage, and aggregates hole-level results. In HTTP mode, new
+        rounds are downloaded concurrently with the browser's login cookies by a
+        `ScorecardHttpFetcher` from the JSON endpoint the round pages are
+        rendered from. Otherwise, with more than one worker, they are
+        scraped by a `ScorecardWorkerPool` of logged-in browsers sharing a rate
+        limit, or else one by one. Rounds the HTTP mode cannot parse are scraped
+        in the browser. In incremental mode, the round history is only paged back
+        until the newest already ingested round and every round an earlier run
+        failed to ingest come into view. Hole summaries are updated by merging in
+        only this run's rounds, unless a rebuild is asked for.
 
         Args:
             driver_path (str): Path to the ChromeDriver executable.
             headless (bool): Whether to run Chrome in headless mode.
+            workers (int): Browser workers scraping rounds concurrently. Defaults to 1.
+            rate (float): Most round page loads per second across all workers, 0 for no limit. Defaults to 2.0.
+            http (bool): Whether to fetch rounds over HTTP, using the browser only to log in. Defaults to False.
+            incremental (bool): Whether to stop paging the round history at the first ingested round. Defaults to True.
+            rebuild_summaries (bool): Whether to rebuild every hole summary from all scorecards. Defaults to False.
 
         Returns: None
 
         Raises: BaseException: If scorecard data cannot be collected or exported.
         """
-        # Initiate Hole19Navigator object
-        self.navigator = Hole19Navigator(logger=self.logger, driver_path=driver_path, headless=headless)
-        self.navigator.initiate_driver()
-
-        # Login to Hole 19 website and collect scorecard urls
-        self.logger.info("Logging into Hole 19...")
-        self.navigator.login_to_website()
-        self.logger.info("Login to Hole 19 completed \n")
-
-        # Navigate to performance tab
-        self.logger.info("Navigating to hole 19 performance tab...")
-        self.navigator.navigate_to_performance_tab()
-        self.logger.info("Performance tab navigated to successfully \n")
-
-        # Load all rounds into memory
-        self.logger.info("Loading all scorecards into view...")
-        self.navigator.load_all_hole19_rounds()
-        self.logger.info("All scorecards loaded into view \n")
-
-        # Collect round urls
-        self.logger.info("Collecting round urls...")
-        urls = self.navigator.collect_round_urls()
-        self.logger.info("Round url collected \n")
-
-        # Close down selenium driver
-        self.logger.info("Closing driver...")
-        self.navigator.driver.close()
-        self.logger.info("Driver successfully closed \n")
-
-        # Initiate Scorecard Parser object
-        self.parser = ScorecardParser(logger=self.logger, driver_path=driver_path, headless=headless)
-        self.parser.initiate_driver()
-
-        # Identify new scorecard records to scrape
-        self.logger.info("Identifying new scorecard data to scrape...")
-        new_urls = self.parser.identify_new_data(scorecard_urls=urls)
-        self.logger.info("New scorecard data identified \n")
-
-        # Iterate through new scorecard urls and collect scorecard data
-        if new_urls:
-
-            for index, url in enumerate(iterable=new_urls, start=1):
-                try:
-                    # Log progress message
-                    self.logger.info(f"Scraping round {index} of {len(new_urls)}")
-
-                    # Collect Scorecard Data
-                    scorecard, file_name = self.parser.collect_scorecard_data(url=url)
+        # Record this run's blob I/O and page loads from a clean slate
+        BlobMetrics.reset()
+        NavigationMetrics.reset()
+
+        # Hold pipeline outputs in a write-behind buffer, and share one browser between navigation and parsing
+        vars = Variables()
+        profile = BrowserProfile.from_variables(vars)
+        session = DriverSession(logger=self.logger, driver_path=driver_path, headless=headless,
+                                warm_up_url=vars.round_site_base_url, profile=profile, site="hole19")
+        with BlobWriteBuffer() as buffer, session:
+            if buffer.recovered:
+                self.logger.warning(f"Replaying {buffer.recovered} buffered writes left by an interrupted run")
+
+            # Initiate Hole19Navigator object on the shared browser session
+            self.navigator = Hole19Navigator(logger=self.logger, driver_path=driver_path, headless=headless)
+            self.navigator.initiate_driver(session=session)
+
+            # Login to Hole 19 website and collect scorecard urls
+            self.logger.info("Logging into Hole 19...")
+            self.navigator.login_to_website()
+            self.logger.info("Login to Hole 19 completed \n")
+
+            # Navigate to performance tab
+            self.logger.info("Navigating to hole 19 performance tab...")
+            self.navigator.navigate_to_performance_tab()
+            self.logger.info("Performance tab navigated to successfully \n")
+
+            # Initiate Scorecard Parser object
+            self.parser = ScorecardParser(logger=self.logger, driver_path=driver_path, headless=headless)
 
+            # Load rounds into view, back to the newest ingested round when incremental
+            self.logger.info("Loading scorecards into view...")
+            self.parser.catalog.ensure()
+            known_ids = self.parser.catalog.ids(kind="round") if incremental else None
+            listing = self.navigator.load_hole19_rounds(known_ids=known_ids, retry_ids=self.failed_round_ids())
+            self.logger.info(f"Scorecards loaded into view - {listing} \n")
+
+            # Collect round urls
+            self.logger.info("Collecting round urls...")
+            urls = self.navigator.collect_round_urls()
+            self.logger.info("Round url collected \n")
+
+            # Identify new scorecard records to scrape
+            self.logger.info("Identifying new scorecard data to scrape...")
+            new_urls = self.parser.identify_new_data(scorecard_urls=urls)
+            self.logger.info("New scorecard data identified \n")
+
+            # Iterate through new scorecard urls and collect scorecard data
+            if new_urls:
+                entries = []
+
+                def export_round(url: str, scorecard: list[dict], file_name: str) -> None:
                     # Export data to blob
                     BlobClient().export_dict_to_blob(data=scorecard, container="golf", output_filename=file_name)
+                    entries.append(BlobCatalog.round_entry(blob_name=file_name))
+
+                self.scrape_rounds(urls=new_urls, session=session, on_result=export_round, driver_path=driver_path,
+                                   headless=headless, workers=workers, rate=rate, http=http)
+
+            # Release the browser before the storage-only stages
+            self.logger.info("Closing browser session...")
+            session.quit()
+            self.logger.info(f"Browser session closed - {session.report}")
+            self.logger.info(f"Page loads - {'; '.join(NavigationMetrics.summary())} \n")
+
+            recorded = []
+            if new_urls:
+                # Upload the scorecards before the aggregator lists them
+                written = flush_blob_writes(logger=self.logger, buffer=buffer, stage="scorecards")
+
+                # Record the uploaded rounds in the ingest catalog
+                self.logger.info("Updating ingest catalog...")
+                recorded = [entry for entry in entries if entry is not None and entry.blob_name in written.succeeded]
+                self.parser.catalog.record(recorded)
+                self.logger.info("Ingest catalog updated \n")
+
+                # Initiate Round Aggregator
+                self.aggregator = RoundAggregator(logger=self.logger)
+
+                # Aggregate round data
+                self.logger.info("Aggregating data at hole level...")
+                self.aggregator.aggregate_holes_by_course(new_scorecards=[entry.blob_name for entry in recorded],
+                                                          rebuild=rebuild_summaries)
+                flush_blob_writes(logger=self.logger, buffer=buffer, stage="hole summaries")
+                self.logger.info("Data aggregated to hole level \n")
+
+                # Summarise data at a hole level
+                self.logger.info("Aggregating data for each hole...")
+                self.aggregator.summarize_course_strokes()
+                self.logger.info("Data aggregated for each hole \n")
+
+            else:
+                self.logger.info("Pipeline Complete - No new scorecard data recorded since last pipeline run")
+
+            # Keep the rounds that could not be ingested, so later runs page back to them
+            attempted_ids = {self.navigator.round_id(url) for url in new_urls}
+            self.record_failed_rounds(attempted_ids - {entry.id for entry in recorded})
+
+            # Upload whatever the last stage left buffered
+            flush_blob_writes(logger=self.logger, buffer=buffer, stage="remaining")
+
+        # Publish the run's outputs to the dashboard in a single packed snapshot
+        publish_dashboard_snapshot(logger=self.logger)
+
+        # Export the blob I/O recorded during the run
+        export_blob_io_report(logger=self.logger, pipeline="hole19")
+
+    def failed_round_ids(self) -> set[str]:
+        """
+        Read the IDs of the rounds the last run could not ingest.
+
+        Returns: set[str]: Round IDs to page back to, empty if none were recorded.
+        """
+        try:
+            return set(BlobClient().read_blob_to_dict(container="golf", input_filename=self.failed_rounds_name))
+        except ResourceNotFoundError:
+            return set()
 
-                except BaseException as e:
-                    self.logger.error(f"Failed to collect and export scorecard data - {e}")
+    def record_failed_rounds(self, failed_ids: set[str]) -> None:
+        """
+        Replace the recorded failed rounds with the ones this run could not ingest.
+
+        Rounds retried and ingested are dropped, as are rounds that were not found
+        again, since paging only stops short of the end of the history once every
+        failed round is in view.
+
+        Args: failed_ids (set[str]): Round IDs this run tried and failed to ingest.
+
+        Returns: None
+        """
+        if failed_ids:
+            self.logger.warning(f"{len(failed_ids)} rounds could not be ingested and will be retried next run")
+        BlobClient().export_dict_to_blob(data=sorted(failed_ids), container="golf",
+                                         output_filename=self.failed_rounds_name)
+
+    def scrape_rounds(self, urls: list[str], session: DriverSession, on_result: Callable[[str, list[dict], str], None],
+                      driver_path: str, headless: bool, workers: int, rate: float, http: bool) -> None:
+        """
+        Scrape new rounds over HTTP, on a pool of browsers, or one by one on the shared browser.
 
-            # Initiate Round Aggregator
-            self.aggregator = RoundAggregator(logger=self.logger)
+        HTTP mode requests each round from its JSON endpoint (`round_site_api_url`).
+        If that is not configured, the first round is scraped in the browser to learn
+        the endpoint from its network traffic; if none is seen, every round is scraped
+        in the browser, since the pages themselves render client-side. Rounds the HTTP
+        mode cannot fetch or parse are scraped on the shared browser.
 
-            # Aggregate round data
-            self.logger.info("Aggregating data at hole level...")
-            self.aggregator.aggregate_holes_by_course()
-            self.logger.info("Data aggregated to hole level \n")
+        Args:
+            urls (list[str]): Round URLs to scrape.
+            session (DriverSession): Logged-in browser session shared with navigation.
+            on_result (Callable[[str, list[dict], str], None]): Exports a scraped round.
+            driver_path (str): Path to the ChromeDriver executable.
+            headless (bool): Whether to run Chrome in headless mode.
+            workers (int): Concurrent HTTP downloads or browser workers.
+            rate (float): Most round page loads per second, 0 for no limit.
+            http (bool): Whether to fetch rounds over HTTP.
+
+        Returns: None
+        """
+        if http:
+            # Learn the JSON endpoint rounds are rendered from by scraping the first one in the browser
+            api_url = Variables().round_site_api_url
+            if not api_url:
+                self.scrape_in_browser(urls=urls[:1], session=session, on_result=on_result)
+                urls, api_url = urls[1:], self.parser.round_api_url
 
-            # Summarise data at a hole level
-            self.logger.info("Aggregating data for each hole...")
-            self.aggregator.summarize_course_strokes()
-            self.logger.info("Data aggregated for each hole \n")
+            if api_url:
+                # Fetch rounds over HTTP with the browser's login cookies
+                fetcher = ScorecardHttpFetcher(logger=self.logger, parser=self.parser, workers=workers,
+                                               rate_limiter=RateLimiter(rate=rate), api_url=api_url)
+                fetcher.use_browser_cookies(driver=self.navigator.driver)
+                self.logger.info(f"Fetching {len(urls)} rounds over HTTP with {workers} workers...")
+                fetched = fetcher.run(urls=urls, on_result=on_result)
+                fetcher.close()
+                self.logger.info(f"Rounds fetched - {fetched} \n")
+                remaining_urls = list(fetched.failed)
+            else:
+                self.logger.warning("No JSON round endpoint was captured, scraping rounds in the browser instead")
+                remaining_urls = urls
+
+        elif workers > 1:
+            # Scrape rounds on a pool of browsers, exporting each as it completes
+            self.logger.info(f"Scraping {len(urls)} rounds with {workers} workers...")
+            pool = ScorecardWorkerPool(logger=self.logger, driver_path=driver_path, headless=headless,
+                                       workers=workers, rate_limiter=RateLimiter(rate=rate), profile=session.profile)
+            scraped = pool.run(urls=urls, on_result=on_result)
+            self.logger.info(f"Rounds scraped - {scraped} \n")
+            remaining_urls = []
 
         else:
-            self.logger.info("Pipeline Complete - No new scorecard data recorded since last pipeline run")
+            remaining_urls = urls
+
+        if remaining_urls:
+            self.scrape_in_browser(urls=remaining_urls, session=session, on_result=on_result)
+
+    def scrape_in_browser(self, urls: list[str], session: DriverSession,
+                          on_result: Callable[[str, list[dict], str], None]) -> None:
+        """
+        Scrape rounds one by one on the shared browser, logging rounds that fail.
+
+        Args:
+            urls (list[str]): Round URLs to scrape.
+            session (DriverSession): Logged-in browser session shared with navigation.
+            on_result (Callable[[str, list[dict], str], None]): Exports a scraped round.
+
+        Returns: None
+        """
+        if not urls:
+            return
+
+        # Parse rounds on the browser that is already logged in
+        self.parser.initiate_driver(session=session)
+
+        for index, url in enumerate(iterable=urls, start=1):
+            try:
+                # Log progress message
+                self.logger.info(f"Scraping round {index} of {len(urls)}")
+
+                # Collect Scorecard Data
+                scorecard, file_name = self.parser.collect_scorecard_data(url=url)
+                on_result(url=url, scorecard=scorecard, file_name=file_name)
+
+            except BaseException as e:
+                self.logger.error(f"Failed to collect and export scorecard data - {e}")
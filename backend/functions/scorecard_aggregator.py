@@ -1,8 +1,11 @@
 # Import dependencies
+from azure.core.exceptions import ResourceNotFoundError
+from typing import Iterable, Optional
 from shared import Variables, BlobClient
 from collections import defaultdict
 from datetime import datetime
 import logging
+import heapq
 import re
 
 class RoundAggregator(BlobClient):
@@ -14,7 +17,20 @@ class RoundAggregator(BlobClient):
     reading scorecard files, extracting hole-level information, and exporting
     aggregated summaries for each hole. Data is sorted chronologically (most
     recent first) to support time-series analysis of golf performance.
+
+    Hole summaries are maintained incrementally: a manifest next to them
+    records the scorecards they hold and the `schema_version` they were built
+    with, and each run merges only its new scorecards in. Bump
+    `schema_version` whenever the layout of a hole entry changes, so the next
+    run rebuilds every summary from scratch.
+
+    Attributes:
+        schema_version (int): Layout version of the hole summaries.
+        manifest_name (str): File name of the manifest in the hole summary directory.
     """
+    schema_version = 1
+    manifest_name = "manifest.json"
+
     def __init__(self, logger: logging.Logger):
         """
         Initialize the RoundAggregator with logging and variable configurations.
@@ -26,22 +42,33 @@ class RoundAggregator(BlobClient):
         self.logger = logger
         self.vars = Variables()
 
-    def aggregate_holes_by_course(self) -> None:
+    def summary_path(self, name: str) -> str:
         """
-        Aggregate hole-level data across scorecards for the configured golf course.
+        Blob name of a file in the course's hole summary directory.
 
-        Reads scorecard JSON files from blob storage, groups hole data by hole number,
-        sorts them by date, and writes aggregated summaries back to storage.
+        Args: name (str): File name, e.g. "hole_1.json".
 
-        Args: None
+        Returns: str: The blob name.
+        """
+        return f"{self.vars.golf_course_name}_golf_course_hole_summary/{name}"
 
-        Returns: None
+    def collect_course_round_dates(self, filenames: Optional[list[str]] = None) -> dict[str, str]:
+        """
+        Map every scorecard blob for the configured golf course to its round date.
+
+        Files that are not JSON, belong to another course, or have no valid date in
+        their name are skipped.
 
-        Raises: Exception: If a scorecard file cannot be read from blob storage.
+        Args: filenames (Optional[list[str]]): Scorecard blobs to consider. Defaults to every blob
+            listed under "scorecards".
+
+        Returns: dict[str, str]: Scorecard blob name mapped to its YYYY-MM-DD round date.
         """
-        # Define hole data map and iterate through each file in blob container
-        hole_data_map = defaultdict(list)
-        for filename in self.list_blob_filenames(container_name="golf", directory_path="scorecards"):
+        if filenames is None:
+            filenames = self.list_blob_filenames(container_name="golf", directory_path="scorecards")
+
+        round_dates = {}
+        for filename in filenames:
 
             # Make sure container file is a json file and has the course of interest in the name
             if filename.lower().endswith(".json") and self.vars.golf_course_name.lower() in filename.lower():
@@ -49,44 +76,239 @@ class RoundAggregator(BlobClient):
                 # Find date in filename
                 match = re.search(r"\d{4}-\d{2}-\d{2}", filename)
                 if match:
-                    file_date = match.group(0)
+                    round_dates[filename] = match.group(0)
                 else:
                     self.logger.warning("A file was skipped as no valid round date could be found")
-                    continue
-
-                self.logger.info(f"Collecting scorecard from the {file_date}...")
-                try:
-                    round_data = self.read_blob_to_dict(container="golf", input_filename=filename)
-
-                # Handle exception if file could not be read
-                except Exception as e:
-                    self.logger.error(f"Error reading round data from the {file_date}: {e}")
-                    continue
-
-                # Iterate through each hole and append data to hole data map
-                for hole in round_data:
-                    hole_number = hole.get("hole")
-                    if hole_number:
-                        hole_with_date = dict(hole)
-                        hole_with_date["date"] = file_date
-                        hole_data_map[hole_number].append(hole_with_date)
-
-        # Save each hole’s data sorted by date (most recent first)
+
+        return round_dates
+
+    def collect_hole_entries(self, round_dates: dict[str, str]) -> tuple[dict[int, list[dict]], list[str]]:
+        """
+        Download scorecards concurrently and group their holes by hole number.
+
+        Scorecards that cannot be read are logged and skipped.
+
+        Args: round_dates (dict[str, str]): Scorecard blob names mapped to their round date.
+
+        Returns: tuple[dict[int, list[dict]], list[str]]: Hole entries stamped with their round date,
+            by hole number in scorecard order, and the scorecards that were read.
+        """
+        hole_data_map = defaultdict(list)
+        read = []
+        for result in self.read_blobs_to_dicts(container="golf", input_filenames=list(round_dates)):
+            file_date = round_dates[result.name]
+
+            # Handle exception if file could not be read
+            if not result.ok:
+                self.logger.error(f"Error reading round data from the {file_date}: {result.error}")
+                continue
+
+            # Iterate through each hole and append data to hole data map
+            read.append(result.name)
+            for hole in result.data:
+                hole_number = hole.get("hole")
+                if hole_number:
+                    hole_with_date = dict(hole)
+                    hole_with_date["date"] = file_date
+                    hole_data_map[hole_number].append(hole_with_date)
+
+        return hole_data_map, read
+
+    def aggregate_holes_by_course(self, new_scorecards: Optional[list[str]] = None, rebuild: bool = False) -> None:
+        """
+        Aggregate hole-level data across scorecards for the configured golf course.
+
+        Given the scorecards ingested this run, merges only those into the
+        existing hole summaries (see `merge_new_rounds`). Falls back to
+        rebuilding every summary from all scorecards when asked to, when no
+        new scorecards are given, or when the summaries cannot be merged into
+        (no manifest, an incomplete or different `schema_version`, or an
+        unreadable summary).
+
+        Args:
+            new_scorecards (Optional[list[str]]): Scorecard blobs ingested this run. Defaults to None.
+            rebuild (bool): Whether to rebuild every summary regardless. Defaults to False.
+
+        Returns: None
+
+        Raises:
+            RuntimeError: If the hole summaries or their manifest could not be stored.
+        """
+        if not rebuild and new_scorecards is not None:
+            reason = self.merge_new_rounds(new_scorecards=new_scorecards)
+            if reason is None:
+                return
+            self.logger.warning(f"Rebuilding hole summaries, {reason}")
+
+        self.rebuild_hole_summaries()
+
+    def rebuild_hole_summaries(self) -> None:
+        """
+        Rebuild every hole summary from all of the course's scorecards.
+
+        Reads scorecard JSON files from blob storage concurrently, groups hole data by
+        hole number, sorts them by date, and writes every hole summary back to storage
+        followed by the manifest of scorecards they hold (see `publish_hole_summaries`).
+
+        Args: None
+
+        Returns: None
+
+        Raises:
+            RuntimeError: If the hole summaries or their manifest could not be stored.
+        """
+        # Identify scorecards for the course of interest along with their round dates
+        round_dates = self.collect_course_round_dates()
+
+        # Download every scorecard concurrently, keeping results in filename order
+        self.logger.info(f"Collecting {len(round_dates)} scorecards...")
+        hole_data_map, read = self.collect_hole_entries(round_dates=round_dates)
+
+        # Sort each hole’s data by date (most recent first)
+        hole_summaries = {}
         for index, (hole_num, hole_list) in enumerate(hole_data_map.items(), start=1):
 
             # Log progress and sort data by mmost recent datetime
             self.logger.info(f"{index}/{len(hole_data_map)} - Aggregating data for hole {hole_num}")
-            sorted_holes = sorted(
+            output_filename = self.summary_path(f"hole_{hole_num}.json")
+            hole_summaries[output_filename] = sorted(
                 hole_list,
                 key=lambda h: datetime.strptime(h["date"], "%Y-%m-%d"),
                 reverse=True
             )
 
-            # Export aggregated data to blob
-            self.export_dict_to_blob(
-                data=sorted_holes,
-                container='golf',
-                output_filename=f'{self.vars.golf_course_name}_golf_course_hole_summary/hole_{hole_num}.json')
+        # Export every hole summary, then the manifest of the scorecards they hold
+        self.publish_hole_summaries(hole_summaries=hole_summaries, scorecards=read)
+
+    def build_manifest(self, scorecards: Iterable[str]) -> dict:
+        """
+        Build the manifest of the scorecards merged into the hole summaries.
+
+        Args: scorecards (Iterable[str]): Scorecard blobs the summaries hold.
+
+        Returns: dict: The schema version and the sorted scorecard blob names.
+        """
+        return {"schema_version": self.schema_version, "scorecards": sorted(set(scorecards))}
+
+    def load_manifest(self) -> Optional[dict]:
+        """
+        Read the manifest of the scorecards merged into the hole summaries.
+
+        Args: None
+
+        Returns: Optional[dict]: The manifest, or None if the summaries have none.
+        """
+        try:
+            return self.read_blob_to_dict(container="golf", input_filename=self.summary_path(self.manifest_name))
+        except ResourceNotFoundError:
+            return None
+
+    def merge_new_rounds(self, new_scorecards: list[str]) -> Optional[str]:
+        """
+        Merge new scorecards into the existing hole summaries.
+
+        Reads the summaries of the holes the new rounds played and merges the
+        new entries into them by date (most recent first), so only the new
+        scorecards and the touched summaries are downloaded. Scorecards the
+        manifest already lists are skipped, so a repeated merge adds nothing.
+
+        Args: new_scorecards (list[str]): Scorecard blobs ingested this run.
+
+        Returns: Optional[str]: None once merged, or why the summaries must be rebuilt instead.
+        """
+        # Check the summaries were built by this schema version
+        manifest = self.load_manifest()
+        if manifest is None:
+            return "no manifest of merged scorecards was found"
+        if manifest.get("schema_version") is None:
+            return "the last export of the hole summaries did not complete"
+        if manifest.get("schema_version") != self.schema_version:
+            return f"schema version {manifest.get('schema_version')} differs from {self.schema_version}"
+
+        # Download only the new scorecards for the course of interest
+        merged = set(manifest.get("scorecards", []))
+        round_dates = self.collect_course_round_dates(filenames=new_scorecards)
+        round_dates = {name: round_date for name, round_date in round_dates.items() if name not in merged}
+        if not round_dates:
+            self.logger.info("No new rounds to merge into the hole summaries")
+            return None
+
+        self.logger.info(f"Merging {len(round_dates)} new scorecards into the hole summaries...")
+        hole_data_map, read = self.collect_hole_entries(round_dates=round_dates)
+
+        # Merge the new entries into each touched hole summary by date (most recent first)
+        holes = sorted(hole_data_map)
+        results = self.read_blobs_to_dicts(container="golf",
+                                           input_filenames=[self.summary_path(f"hole_{hole}.json") for hole in holes])
+        hole_summaries = {}
+        for hole, result in zip(holes, results):
+            if result.ok:
+                existing = result.data
+            elif isinstance(result.error, ResourceNotFoundError):
+                existing = []
+            else:
+                return f"the hole {hole} summary could not be read - {result.error}"
+
+            additions = sorted(hole_data_map[hole], key=lambda h: h["date"], reverse=True)
+            hole_summaries[result.name] = list(heapq.merge(existing, additions, key=lambda h: h["date"], reverse=True))
+
+        # Export the touched hole summaries, then the manifest of the scorecards they hold
+        self.publish_hole_summaries(hole_summaries=hole_summaries, scorecards=merged | set(read))
+        return None
+
+    def store_golf_blobs(self, payloads: dict[str, object]) -> dict[str, BaseException]:
+        """
+        Write payloads to the golf container and wait until they are stored.
+
+        While a `BlobWriteBuffer` is active, exports are only buffered, so the
+        buffer is flushed before the outcome of these payloads is known.
+
+        Args: payloads (dict[str, object]): Payloads keyed by blob name.
+
+        Returns: dict[str, BaseException]: Blobs that could not be stored mapped to the raised error.
+        """
+        report = self.export_dicts_to_blobs(payloads=payloads, container='golf')
+        failed = dict(report.failed)
+        if self.write_buffer is not None:
+            flushed = self.write_buffer.flush()
+            failed.update({name: error for name, error in flushed.failed.items() if name in payloads})
+        return failed
+
+    def publish_hole_summaries(self, hole_summaries: dict[str, list], scorecards: Iterable[str]) -> None:
+        """
+        Store hole summaries and, once every one of them is stored, their manifest.
+
+        The stored manifest is first marked incomplete, so a run interrupted
+        between the summaries and the manifest is rebuilt by the next run
+        rather than merged into (see `merge_new_rounds`).
+
+        Args:
+            hole_summaries (dict[str, list]): Hole summaries keyed by blob name.
+            scorecards (Iterable[str]): Scorecard blobs the summaries hold.
+
+        Returns: None
+
+        Raises:
+            RuntimeError: If the manifest or a hole summary could not be stored.
+        """
+        manifest_path = self.summary_path(self.manifest_name)
+
+        # Mark the manifest incomplete before touching any summary
+        failed = self.store_golf_blobs(payloads={manifest_path: {"schema_version": None, "scorecards": []}})
+        if failed:
+            raise RuntimeError(f"Hole summary manifest could not be marked incomplete - {failed[manifest_path]}")
+
+        # Store every summary, leaving the manifest incomplete if any of them failed
+        failed = self.store_golf_blobs(payloads=hole_summaries)
+        if failed:
+            failures = ", ".join(f"{name}: {error}" for name, error in failed.items())
+            raise RuntimeError(f"Failed to export {len(failed)} of {len(hole_summaries)} hole summaries, "
+                               f"they will be rebuilt by the next run - {failures}")
+
+        # Record the scorecards the summaries now hold
+        failed = self.store_golf_blobs(payloads={manifest_path: self.build_manifest(scorecards=scorecards)})
+        if failed:
+            raise RuntimeError(f"Hole summary manifest could not be exported - {failed[manifest_path]}")
 
     def summarize_course_strokes(self) -> None:
         """
@@ -98,18 +320,20 @@ class RoundAggregator(BlobClient):
 
         Return: None
         """
-        # Iterate through each hole summary and collect data
-        strokes = []
-        for hole in range(1, 19, 1):
-            self.logger.info(f"Collecting strokes for hole: {hole}")
+        # Download every hole summary concurrently, keeping results in hole order
+        self.logger.info("Collecting strokes for all 18 holes...")
+        input_filenames = [self.summary_path(f"hole_{hole}.json") for hole in range(1, 19, 1)]
 
-            # Define input file name
-            input_filename = f"{self.vars.golf_course_name}_golf_course_hole_summary/hole_{hole}.json"
+        strokes = []
+        results = self.read_blobs_to_dicts(container="golf", input_filenames=input_filenames)
+        for hole, result in enumerate(results, start=1):
 
-            # Read data from blob
-            hole_data = self.read_blob_to_dict(container="golf", input_filename=input_filename)
+            # Surface failures, the course overview is meaningless without every hole
+            if not result.ok:
+                raise result.error
 
             # Append data to strokes list
+            hole_data = result.data
             strokes.append(
                 {
                     f"Hole {hole}": {
@@ -123,4 +347,4 @@ class RoundAggregator(BlobClient):
         self.export_dict_to_blob(
             data=strokes,
             container='golf',
-            output_filename=f'{self.vars.golf_course_name}_golf_course_hole_summary/course_overview.json')
+            output_filename=self.summary_path("course_overview.json"))
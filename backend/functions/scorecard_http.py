@@ -0,0 +1,162 @@
+# Import dependencies
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from selenium.webdriver.chrome.webdriver import WebDriver
+from ..interfaces.scrape_models import ScrapeReport
+from .scorecard_parser import ScorecardParser
+from requests.adapters import HTTPAdapter
+from typing import Callable, Optional
+from .rate_limiter import RateLimiter
+from urllib3.util.retry import Retry
+import requests
+import logging
+import time
+
+class ScorecardHttpFetcher:
+    """
+    Fetches Hole19 round pages over plain HTTP with the cookies of a logged-in browser.
+
+    The browser is only needed to log in: `use_browser_cookies` copies its
+    session cookies and user agent into a pooled `requests.Session`, and
+    `run` then downloads rounds concurrently and feeds them through the same
+    `build_scorecard` transform chain as pages rendered in Chrome.
+
+    Hole19 renders round pages client-side, so the page itself holds no
+    scorecard. Given `api_url`, the URL template of the JSON endpoint the page
+    is rendered from (e.g. learned by `ScorecardParser` from the browser's
+    network traffic), each round is requested from that endpoint instead and
+    parsed with `ScorecardParser.parse_scorecard_json`. HTML responses are
+    parsed with `ScorecardParser.parse_page_source`. Rounds whose response
+    cannot be parsed (e.g. a client-rendered page, or an expired login) are
+    reported as failed, so the caller can scrape them in the browser.
+
+    Typical usage example:
+        fetcher = ScorecardHttpFetcher(logger=logger, parser=parser, workers=4, api_url=parser.round_api_url)
+        fetcher.use_browser_cookies(driver)
+        report = fetcher.run(urls=new_urls, on_result=export_round)
+
+    Attributes:
+        parser (ScorecardParser): Parser whose transform chain builds the stored records.
+        workers (int): Concurrent page downloads.
+        rate_limiter (RateLimiter): Limiter shared by every download.
+        timeout (float): Seconds allowed for each download.
+        api_url (Optional[str]): URL template of the JSON round endpoint, `{round_id}` standing for the round ID.
+        session (requests.Session): Pooled HTTP session carrying the login cookies.
+    """
+    def __init__(self, logger: logging.Logger, parser: ScorecardParser, workers: int = 4,
+                 rate_limiter: Optional[RateLimiter] = None, timeout: float = 30,
+                 api_url: Optional[str] = None) -> None:
+        """
+        Initialize the fetcher with a connection pool sized to its workers.
+
+        Args:
+            logger (logging.Logger): Logger instance for recording progress and errors.
+            parser (ScorecardParser): Parser whose transform chain builds the stored records.
+            workers (int, optional): Concurrent page downloads. Defaults to 4.
+            rate_limiter (Optional[RateLimiter], optional): Limiter shared by every download. Defaults to no limit.
+            timeout (float, optional): Seconds allowed for each download. Defaults to 30.
+            api_url (Optional[str], optional): URL template of the JSON round endpoint. Defaults to the
+                round page itself.
+        """
+        self.logger = logger
+        self.parser = parser
+        self.workers = max(workers, 1)
+        self.rate_limiter = rate_limiter or RateLimiter(rate=0)
+        self.timeout = timeout
+        self.api_url = api_url
+
+        # Keep one connection per worker alive, retrying throttled and transient server errors
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                        allowed_methods=["GET"])
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=self.workers, max_retries=retries))
+
+    def use_browser_cookies(self, driver: WebDriver) -> int:
+        """
+        Copy the browser's cookies and user agent into the HTTP session.
+
+        Args:
+            driver (WebDriver): Logged-in browser.
+
+        Returns:
+            int: Number of cookies copied.
+        """
+        cookies = driver.get_cookies()
+        for cookie in cookies:
+            self.session.cookies.set(cookie["name"], cookie["value"],
+                                     domain=cookie.get("domain"), path=cookie.get("path", "/"))
+
+        self.session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent")
+        return len(cookies)
+
+    def fetch(self, url: str) -> tuple[list[dict], str]:
+        """
+        Download one round, from its JSON endpoint if known, and build its records.
+
+        Args:
+            url (str): The scorecard page URL, ending in the round ID.
+
+        Returns:
+            tuple[list[dict], str]: Processed scorecard data and output file name.
+
+        Raises:
+            PermissionError: If the site redirected to its sign-in page.
+            requests.HTTPError: If the page could not be downloaded.
+            ValueError: If the response holds no scorecard.
+        """
+        # Request the round's JSON when its endpoint is known, otherwise the page itself
+        self.rate_limiter.acquire()
+        if self.api_url:
+            response = self.session.get(self.api_url.format(round_id=url.rstrip("/").split("/")[-1]),
+                                        headers={"Accept": "application/json"}, timeout=self.timeout)
+        else:
+            response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+
+        if "/sign_in" in response.url:
+            raise PermissionError("Login cookies were not accepted")
+
+        # Parse JSON responses like a captured response, and anything else as a rendered page
+        if "json" in response.headers.get("Content-Type", ""):
+            scorecard_data, round_date, course_name = self.parser.parse_scorecard_json(response.json())
+        else:
+            scorecard_data, round_date, course_name = self.parser.parse_page_source(response.text)
+        return self.parser.build_scorecard(scorecard_data=scorecard_data, round_date=round_date,
+                                           course_name=course_name, url=url)
+
+    def run(self, urls: list[str], on_result: Callable[[str, list[dict], str], None]) -> ScrapeReport:
+        """
+        Fetch every URL concurrently, handing each round on as it completes.
+
+        Args:
+            urls (list[str]): Round URLs to fetch.
+            on_result (Callable[[str, list[dict], str], None]): Called with the URL, scorecard and
+                output file name of each round as it completes. Exceptions count as failures of that round.
+
+        Returns:
+            ScrapeReport: Which rounds were fetched and which failed.
+        """
+        report = ScrapeReport(workers=self.workers)
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self.fetch, url): url for url in urls}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    scorecard, file_name = future.result()
+                    on_result(url, scorecard, file_name)
+                    report.succeeded.append(url)
+                except Exception as e:
+                    report.failed[url] = e
+                    self.logger.warning(f"Failed to fetch {url} over HTTP - {e}")
+
+        report.seconds = time.perf_counter() - started
+        return report
+
+    def close(self) -> None:
+        """
+        Close the pooled connections.
+
+        Returns: None
+        """
+        self.session.close()
@@ -1,20 +1,31 @@
 # Import dependencies
-from selenium.common.exceptions import ElementClickInterceptedException, NoSuchElementException, TimeoutException
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 from ..interfaces.data_collection_base import AbstractDataCollection
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.remote.webelement import WebElement
+from ..interfaces.scrape_models import RoundListingReport
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
+from .network_capture import NetworkCapture, walk_json
 from .selenium_driver import SeleniumDriver
+from .driver_session import DriverSession
 from shared import Variables
+from typing import Any, Optional
 import logging
+import math
+import time
 
 class Hole19Navigator(AbstractDataCollection, SeleniumDriver):
     """
     Automates navigation and data collection from the Hole19 website.
 
     Uses Selenium to log in, load performance data, and extract round URLs
-    for further processing.
+    for further processing. When the browser profile captures network
+    traffic, rounds listed in the JSON responses behind the round history are
+    collected alongside the links rendered on the page.
     """
+    site = "hole19"
+
     def __init__(self, logger: logging.Logger,
                  driver_path: str = 'chromedriver.exe',
                  headless: bool = False) -> None:
@@ -31,18 +42,24 @@ class Hole19Navigator(AbstractDataCollection, SeleniumDriver):
         self.headless = headless
         self.logger = logger
         self.vars = Variables()
+        self.capture: Optional[NetworkCapture] = None
 
-    def initiate_driver(self) -> None:
+    def initiate_driver(self, session: Optional[DriverSession] = None) -> None:
         """
         Configure and start the Selenium WebDriver.
 
-        Creates a ChromeDriver instance with the given path and headless setting.
+        Borrows the browser of a shared `DriverSession` if one is given, otherwise
+        creates a ChromeDriver instance with the given path and headless setting.
 
-        Args: None
+        Args: session (Optional[DriverSession]): Shared browser session to borrow. Defaults to None.
 
         Returns: None
         """
-        self.driver = self.configure_driver(driver_path=self.driver_path, headless=self.headless)
+        if session is not None:
+            self.driver = session.borrow()
+            self.profile = session.profile
+        else:
+            self.driver = self.configure_driver(driver_path=self.driver_path, headless=self.headless)
 
     def login_to_website(self) -> None:
         """
@@ -59,7 +76,7 @@ class Hole19Navigator(AbstractDataCollection, SeleniumDriver):
             NoSuchElementException: If login form fields are not found.
         """
         # Navigate the trackman report page
-        self.driver.get(self.vars.round_site_base_url + "/users/sign_in")
+        self.navigate(self.vars.round_site_base_url + "/users/sign_in")
 
         # Zoom out to load all html components into view
         self.driver.execute_script("document.body.style.zoom='50%'")
@@ -90,10 +107,15 @@ class Hole19Navigator(AbstractDataCollection, SeleniumDriver):
 
         Returns: None
         """
+        # Start capturing the round history's JSON responses, if network traffic is recorded
+        self.capture = self.network_capture()
+        if self.capture is not None:
+            self.capture.clear()
+
         # Navigate the trackman report page
-        self.driver.get(self.vars.round_site_base_url + "/performance/rounds")
+        self.navigate(self.vars.round_site_base_url + "/performance/rounds")
 
-    def load_all_hole19_rounds(self):
+    def load_all_hole19_rounds(self) -> RoundListingReport:
         """
         Load all available rounds.
 
@@ -101,35 +123,146 @@ class Hole19Navigator(AbstractDataCollection, SeleniumDriver):
 
         Args: None
 
-        Returns: None
+        Returns: RoundListingReport: Pages and rounds loaded.
+        """
+        return self.load_hole19_rounds(known_ids=None)
 
-        Raises:
-            ElementClickInterceptedException: If a click attempt is blocked by another element.
+    def load_hole19_rounds(self, known_ids: Optional[set[str]] = None, retry_ids: Optional[set[str]] = None,
+                           timeout: float = 10, settle: float = 0.25) -> RoundListingReport:
         """
-        # Define wait component
-        wait = WebDriverWait(self.driver, 10)
+        Load rounds into view until an already ingested round appears or the history ends.
 
-        # Iterate through all pages and load rounds into view
-        while True:
-            try:
-                # Wait until the button is clickable. Use the current Hole19 button styling.
-                load_more_button = wait.until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "button.bg-primary-solid-2.text-white")))
+        Rounds are listed newest first, so once any known round ID is in view every
+        round below it has been ingested, except rounds that failed in earlier runs.
+        Those are passed as `retry_ids`, and paging continues until they are in view
+        too. Each click waits on DOM changes rather than a fixed timeout: for the
+        round list to grow, then for it to stay unchanged for `settle` seconds,
+        after which a missing 'Load More' button means the history has ended.
+
+        Args:
+            known_ids (Optional[set[str]]): Round IDs already ingested, None to load the whole history.
+            retry_ids (Optional[set[str]]): Round IDs that failed in earlier runs and must be loaded again.
+            timeout (float): Most seconds to wait for a page of rounds to load.
+            settle (float): Seconds the round list must stay unchanged before the page counts as rendered.
+
+        Returns: RoundListingReport: Pages and rounds loaded, and the page loads skipped.
+        """
+        report = RoundListingReport()
+        started = time.perf_counter()
+        wait = WebDriverWait(self.driver, timeout, poll_frequency=0.1)
 
-                # Scroll into view and click it via JS (safer for tricky buttons)
-                self.driver.execute_script("arguments[0].scrollIntoView(true); arguments[0].click();", load_more_button)
+        # Wait for the first page of rounds to render
+        try:
+            wait.until(lambda driver: self.loaded_round_urls() or self.load_more_button() is not None)
+        except TimeoutException:
+            self.logger.info("No rounds found on the performance tab.")
 
-                # Optionally wait for loading spinner to disappear
-                wait.until(EC.invisibility_of_element_located((By.CSS_SELECTOR, ".lm-start.spinner")))
+        while True:
+            urls = self.loaded_round_urls()
+            loaded_ids = {self.round_id(url) for url in urls}
+            report.rounds_loaded = len(urls)
+
+            # Every round below a known round has been ingested already, once no failed round is still to load
+            if known_ids and loaded_ids & known_ids and not (retry_ids or set()) - loaded_ids:
+                report.stopped_at_known = True
+                report.pages_skipped = self.estimate_skipped_pages(report, known_ids - loaded_ids)
+                break
 
-            # Button no longer found or clickable - break the loop
-            except (TimeoutException, NoSuchElementException):
+            # No button once the list has settled - the history has ended
+            button = self.load_more_button()
+            if button is None:
                 self.logger.info("No more 'Load More' buttons found or clickable.")
                 break
 
-            # If something else blocks the click, try scrolling more or wait a bit and retry
-            except ElementClickInterceptedException:
-                self.logger.info("Click intercepted, retrying after a short wait.")
+            try:
+                self.driver.execute_script("arguments[0].scrollIntoView(true); arguments[0].click();", button)
+                wait.until(lambda driver: len(self.loaded_round_urls()) > len(urls))
+                self.wait_until_settled(settle=settle, timeout=timeout)
+                report.pages_loaded += 1
+
+            # The click loaded nothing - treat the history as ended
+            except TimeoutException:
+                self.logger.info("'Load More' did not load any further rounds.")
+                break
+
+            # The button re-rendered before it was clicked - look it up again
+            except StaleElementReferenceException:
+                self.logger.info("'Load More' button went stale, retrying.")
+
+        report.seconds = time.perf_counter() - started
+        return report
+
+    def load_more_button(self) -> Optional[WebElement]:
+        """
+        Find the 'Load More' button if it is currently displayed and enabled.
+
+        Args: None
+
+        Returns: Optional[WebElement]: The button, or None if the history has no further pages.
+        """
+        for button in self.driver.find_elements(By.CSS_SELECTOR, "button.bg-primary-solid-2.text-white"):
+            try:
+                if button.is_displayed() and button.is_enabled():
+                    return button
+            except StaleElementReferenceException:
+                continue
+        return None
+
+    def loaded_round_urls(self) -> list:
+        """
+        Read the links of every round in view in a single script call.
+
+        Args: None
+
+        Returns: list: Round URLs in page order, without duplicates.
+        """
+        hrefs = self.driver.execute_script(
+            "return Array.from(document.querySelectorAll(arguments[0]), a => a.href);",
+            "a[href*='/performance/rounds/']"
+        )
+        return list(dict.fromkeys(href for href in hrefs or [] if href))
+
+    def wait_until_settled(self, settle: float, timeout: float) -> None:
+        """
+        Wait until the number of rounds in view stops changing for `settle` seconds.
+
+        Args:
+            settle (float): Seconds the round count must stay unchanged.
+            timeout (float): Most seconds to wait overall.
+
+        Returns: None
+        """
+        deadline = time.monotonic() + timeout
+        count, stable_since = len(self.loaded_round_urls()), time.monotonic()
+
+        while time.monotonic() - stable_since < settle and time.monotonic() < deadline:
+            time.sleep(min(0.05, settle))
+            current = len(self.loaded_round_urls())
+            if current != count:
+                count, stable_since = current, time.monotonic()
+
+    def round_id(self, url: str) -> str:
+        """
+        Extract the round ID from a round URL.
+
+        Args: url (str): Round URL.
+
+        Returns: str: The round ID.
+        """
+        return url.rstrip("/").split("/")[-1]
+
+    def estimate_skipped_pages(self, report: RoundListingReport, unseen_known_ids: set[str]) -> int:
+        """
+        Estimate the page loads avoided by stopping at a known round.
+
+        Args:
+            report (RoundListingReport): Paging so far.
+            unseen_known_ids (set[str]): Ingested round IDs that were never loaded into view.
+
+        Returns: int: Pages it would have taken to load the remaining ingested rounds.
+        """
+        rounds_per_page = max(report.rounds_loaded // (report.pages_loaded + 1), 1)
+        return math.ceil(len(unseen_known_ids) / rounds_per_page)
 
     def collect_round_urls(self) -> list:
         """
@@ -141,14 +274,39 @@ class Hole19Navigator(AbstractDataCollection, SeleniumDriver):
 
         Returns: list: A list of round URLs extracted from the page.
         """
-        # Find all round anchors using the current Hole19 page structure.
-        round_link_elements = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='/performance/rounds/']")
+        # Read every round link in a single script call and preserve order without duplicates
+        urls = self.loaded_round_urls()
 
-        round_links = []
-        for a_tag in round_link_elements:
-            href = a_tag.get_attribute("href")
-            if href:
-                round_links.append(href)
+        # Add rounds listed in captured JSON responses that were not rendered as links
+        return list(dict.fromkeys(urls + self.captured_round_urls()))
 
-        # Preserve order and remove duplicates
-        return list(dict.fromkeys(round_links))
+    def parse_rounds_json(self, payload: Any) -> list[str]:
+        """
+        Extract round IDs from a JSON response of the round history.
+
+        Args: payload (Any): Decoded JSON response.
+
+        Returns: list[str]: IDs of the rounds listed under a "rounds" key, or of a top-level list of rounds.
+        """
+        listings = [payload] if isinstance(payload, list) else []
+        listings += [node["rounds"] for node in walk_json(payload) if isinstance(node.get("rounds"), list)]
+
+        return [str(item["id"]) for listing in listings for item in listing
+                if isinstance(item, dict) and item.get("id") is not None]
+
+    def captured_round_urls(self) -> list[str]:
+        """
+        Round URLs listed in the JSON responses captured since the performance tab was opened.
+
+        Args: None
+
+        Returns: list[str]: Round URLs in response order, empty if network traffic is not captured.
+        """
+        if self.capture is None:
+            return []
+
+        urls = []
+        for _, payload in self.capture.read(url_filter="rounds"):
+            urls += [f"{self.vars.round_site_base_url}/performance/rounds/{round_id}"
+                     for round_id in self.parse_rounds_json(payload)]
+        return urls
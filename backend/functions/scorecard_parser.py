@@ -1,21 +1,64 @@
 # Import dependencies
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
+from shared import Variables, BlobClient, BlobCatalog
+from urllib.parse import urlsplit, urlunsplit
 from .selenium_driver import SeleniumDriver
-from shared import Variables, BlobClient
+from .driver_session import DriverSession
+from .network_capture import walk_json, pick
+from .html_tree import HtmlTree, HtmlNode
 from datetime import datetime, date
+from typing import Any, Optional
 import logging
 import re
 
+# Keys a Hole19 JSON response may use for each hole field, in order of preference
+JSON_HOLE_KEYS = {
+    "hole": ("number", "hole_number", "holeNumber", "hole"),
+    "Par": ("par",),
+    "S.i.": ("stroke_index", "strokeIndex", "handicap", "si"),
+    "Strokes": ("strokes", "score", "gross_score", "grossScore"),
+    "Putts": ("putts",),
+    "Fairways": ("fairway", "fairway_hit", "fairwayHit", "fairway_result", "fairwayResult"),
+    "Gir": ("gir", "green_in_regulation", "greenInRegulation", "green_hit", "greenHit")
+}
+
+# Keys a Hole19 JSON response may use for the round details and its players
+JSON_ROUND_KEYS = {
+    "date": ("played_at", "playedAt", "started_at", "startedAt", "date"),
+    "course": ("course_name", "courseName", "course"),
+    "holes": ("holes", "scores", "hole_scores", "holeScores"),
+    "name": ("name", "player_name", "playerName", "display_name", "displayName")
+}
+
 class ScorecardParser(SeleniumDriver, BlobClient):
     """
     Parses golf scorecards from the Hole19 website.
 
     Uses Selenium to extract round details, clean raw HTML data, and
     transform it into structured hole-level records.
+
+    By default each round page is read with a single `driver.page_source`
+    call and the scorecard grid is parsed in-process, rather than with a
+    WebDriver round trip for every cell. If the page source cannot be parsed,
+    the round falls back to reading the grid element by element.
+
+    When the browser profile captures network traffic, the round is first
+    read from the JSON response the page is rendered from, mapped straight
+    onto the same raw rows, and the rendered grid is only parsed if no such
+    response arrives. The URL of the first such response is kept as a template
+    in `round_api_url`, so the HTTP mode can request the JSON of other rounds.
     """
+    site = "hole19"
+
     def __init__(self, logger: logging.Logger,
                  driver_path: str = 'chromedriver.exe',
-                 headless: bool = False) -> None:
+                 headless: bool = False,
+                 use_page_source: bool = True,
+                 capture_timeout: float = 5,
+                 max_capture_misses: int = 3) -> None:
         """
         Initialize the ScorecardParser.
 
@@ -25,22 +68,41 @@ class ScorecardParser(SeleniumDriver, BlobClient):
             logger (logging.Logger): Logger instance for recording progress and errors.
             driver_path (str, optional): Path to the ChromeDriver executable. Defaults to 'chromedriver.exe'.
             headless (bool, optional): Whether to run Chrome in headless mode. Defaults to False.
+            use_page_source (bool, optional): Whether to parse rounds from the page source, with the
+                element by element path as a fallback. Defaults to True.
+            capture_timeout (float, optional): Seconds to wait for a round's JSON response when
+                network traffic is captured. Defaults to 5.
+            max_capture_misses (int, optional): Consecutive rounds without a JSON response after
+                which capture is no longer waited for. Defaults to 3.
         """
         super().__init__()
         self.driver_path = driver_path
         self.headless = headless
+        self.use_page_source = use_page_source
+        self.capture_timeout = capture_timeout
+        self.max_capture_misses = max_capture_misses
+        self.capture_misses = 0
+        self.round_api_url: Optional[str] = None
         self.logger = logger
         self.vars = Variables()
+        self.catalog = BlobCatalog()
 
-    def initiate_driver(self) -> None:
+    def initiate_driver(self, session: Optional[DriverSession] = None) -> None:
         """
         Configure and start the Selenium WebDriver.
 
-        Creates a ChromeDriver instance with the given path and headless setting.
+        Borrows the browser of a shared `DriverSession` if one is given, otherwise
+        creates a ChromeDriver instance with the given path and headless setting.
+
+        Args: session (Optional[DriverSession]): Shared browser session to borrow. Defaults to None.
 
         Returns: None
         """
-        self.driver = self.configure_driver(driver_path=self.driver_path, headless=self.headless)
+        if session is not None:
+            self.driver = session.borrow()
+            self.profile = session.profile
+        else:
+            self.driver = self.configure_driver(driver_path=self.driver_path, headless=self.headless)
 
     def parse_fairways(self, cell_elements: list) -> list[str]:
         """
@@ -57,20 +119,29 @@ class ScorecardParser(SeleniumDriver, BlobClient):
         for cell in cell_elements:
             try:
                 img = cell.find_element(By.CSS_SELECTOR, 'img')
-                alt = img.get_attribute('alt').lower()
-                if 'target' in alt:
-                    directions.append('Target')
-                elif 'right' in alt:
-                    directions.append('Right')
-                elif 'left' in alt:
-                    directions.append('Left')
-                else:
-                    directions.append('N/A')
+                directions.append(self.fairway_direction(img.get_attribute('alt')))
             except Exception:
                 directions.append('N/A')
 
         return directions
 
+    def fairway_direction(self, alt: str) -> str:
+        """
+        Classify a fairway icon.
+
+        Args: alt (str): Alt text of the fairway icon.
+
+        Returns: str: "Target", "Right", "Left" or "N/A".
+        """
+        alt = alt.lower()
+        if 'target' in alt:
+            return 'Target'
+        elif 'right' in alt:
+            return 'Right'
+        elif 'left' in alt:
+            return 'Left'
+        return 'N/A'
+
     def parse_gir(self, cell_elements: list) -> list[bool]:
         """
         Parse greens in regulation (GIR).
@@ -282,6 +353,223 @@ class ScorecardParser(SeleniumDriver, BlobClient):
 
         return scorecard_data
 
+    def parse_html_rows(self, line: HtmlNode, scorecard_data: dict) -> dict:
+        """
+        Parse a row of the scorecard from the page source.
+
+        Mirrors `parse_scorecard_rows` on a parsed `HtmlNode`, producing the same values.
+
+        Args: line (HtmlNode): Parsed `div.contents` row of the scorecard grid.
+            scorecard_data (dict): Dictionary to populate with parsed data.
+
+        Returns: dict: Updated scorecard data.
+        """
+        # Get row label from the sticky first cell
+        label_span = next((span for sticky in line.find_all('div', cls='sticky')
+                           for span in sticky.find_all('span', cls='truncate')), None)
+        if label_span is None or not label_span.text:
+            return scorecard_data
+
+        label = label_span.text.capitalize()
+
+        # Get hole cells only, excluding the sticky label cell and OUT/IN/TOTAL summary cells
+        hole_cells = [
+            c for c in line.children
+            if c.tag == 'div' and 'sticky' not in c.classes and 'shrink-0' not in c.classes
+        ]
+
+        if 'fairways' in label.lower():
+            scorecard_data[label] = [
+                self.fairway_direction(img.get_attribute('alt') or '') if (img := cell.find('img')) else 'N/A'
+                for cell in hole_cells
+            ]
+
+        elif 'gir' in label.lower():
+            scorecard_data[label] = [cell.find('img', alt='greenHit') is not None for cell in hole_cells]
+
+        elif self.vars.round_site_player_name.lower() in label.lower():
+            strokes = []
+            for cell in hole_cells:
+                span = next((node for node in cell.find_all('span')
+                             if node.parent.tag == 'span' and node.parent.parent.tag == 'span'), None)
+                strokes.append((span.text or None) if span is not None else None)
+            scorecard_data[label] = strokes
+
+        else:
+            scorecard_data[label] = [cell.text or 'N/A' for cell in hole_cells]
+
+        return scorecard_data
+
+    def parse_page_source(self, page_source: str) -> tuple[dict[str, list], date | None, str | None]:
+        """
+        Parse a round from the page source in a single pass.
+
+        Args: page_source (str): HTML of the scorecard page.
+
+        Returns: tuple[dict[str, list], date | None, str | None]: Raw scorecard data by stat type,
+            the round date and the normalized course name.
+
+        Raises: ValueError: If the page has no scorecard grid.
+        """
+        root = HtmlTree.parse(page_source)
+
+        # Read the round details
+        details = root.find('section', cls='round-details')
+        paragraphs = list(details.find_all('p')) if details is not None else []
+        round_date, course_name = None, None
+        try:
+            round_date = datetime.strptime(paragraphs[0].text, "%d/%m/%Y").date()
+        except Exception as e:
+            self.logger.error(f"Error extracting date: {e}")
+        try:
+            course_name = next(p for p in paragraphs if p.nth_of_type(2)).text.lower().replace(" ", "_")
+        except Exception as e:
+            self.logger.error(f"Error extracting course name: {e}")
+
+        # Locate the scorecard grid
+        scorecard_section = root.find('section', cls='round-scorecard')
+        scorecard_grid = scorecard_section.find('section', cls='grid') if scorecard_section is not None else None
+        if scorecard_grid is None:
+            raise ValueError("no scorecard grid in page source")
+
+        scorecard_data = {}
+        for line in scorecard_grid.find_all('div', cls='contents'):
+            scorecard_data = self.parse_html_rows(line=line, scorecard_data=scorecard_data)
+
+        if not scorecard_data:
+            raise ValueError("no scorecard rows in page source")
+
+        return scorecard_data, round_date, course_name
+
+    def json_fairway(self, value: Any) -> str:
+        """
+        Classify a fairway value from a JSON response.
+
+        Args: value (Any): True for a fairway hit, or a direction such as "left".
+
+        Returns: str: "Target", "Right", "Left" or "N/A".
+        """
+        if value is True or str(value).lower() in ("hit", "target", "center", "centre", "fairway"):
+            return 'Target'
+        if isinstance(value, str):
+            return self.fairway_direction(value)
+        return 'N/A'
+
+    def find_json_holes(self, payload: Any) -> dict[int, dict]:
+        """
+        Collect the player's holes from a JSON response, by hole number.
+
+        Hole lists without scores (e.g. the course layout) are merged with the
+        scored list of the player named `round_site_player_name`, or else the
+        first scored list, so par and stroke index may come from either.
+
+        Args: payload (Any): Decoded JSON response.
+
+        Returns: dict[int, dict]: Hole fields keyed as in `JSON_HOLE_KEYS`, by hole number.
+
+        Raises: ValueError: If the response holds no scored holes.
+        """
+        layouts, scored, mine = [], [], []
+        player = self.vars.round_site_player_name.lower()
+
+        for node in walk_json(payload):
+            holes = pick(node, JSON_ROUND_KEYS["holes"])
+            if not isinstance(holes, list) or not holes or not all(isinstance(hole, dict) for hole in holes):
+                continue
+
+            if not any(pick(hole, JSON_HOLE_KEYS["Strokes"]) is not None for hole in holes):
+                layouts.append(holes)
+                continue
+
+            scored.append(holes)
+            if player and player in str(pick(node, JSON_ROUND_KEYS["name"], "")).lower():
+                mine.append(holes)
+
+        if not scored:
+            raise ValueError("no scored holes in JSON response")
+
+        by_number = {}
+        for holes in layouts + (mine or scored)[:1]:
+            for position, hole in enumerate(holes, start=1):
+                number = int(pick(hole, JSON_HOLE_KEYS["hole"], position))
+                by_number.setdefault(number, {}).update({
+                    key: value for key, aliases in JSON_HOLE_KEYS.items()
+                    if (value := pick(hole, aliases)) is not None
+                })
+        return by_number
+
+    def parse_scorecard_json(self, payload: Any) -> tuple[dict[str, list], date | None, str | None]:
+        """
+        Parse a round from the JSON response its page is rendered from.
+
+        Produces the same raw rows as `parse_page_source`, so both feed `build_scorecard`.
+
+        Args: payload (Any): Decoded JSON response.
+
+        Returns: tuple[dict[str, list], date | None, str | None]: Raw scorecard data by stat type,
+            the round date and the normalized course name.
+
+        Raises: ValueError: If the response holds no scored holes.
+        """
+        by_number = self.find_json_holes(payload)
+        holes = [by_number.get(number, {}) for number in range(1, 19)]
+
+        # Map hole fields onto the rows of the rendered scorecard
+        scorecard_data = {
+            "Par": [str(hole.get("Par", "N/A")) for hole in holes],
+            self.vars.round_site_player_name: [str(hole["Strokes"]) if hole.get("Strokes") else None
+                                               for hole in holes]
+        }
+        for key in ("S.i.", "Putts"):
+            if any(key in hole for hole in holes):
+                scorecard_data[key] = [str(hole.get(key, "N/A")) for hole in holes]
+        if any("Fairways" in hole for hole in holes):
+            scorecard_data["Fairways"] = [self.json_fairway(hole.get("Fairways")) for hole in holes]
+        if any("Gir" in hole for hole in holes):
+            scorecard_data["Gir"] = [hole.get("Gir") is True for hole in holes]
+
+        # Read the round details from the first object carrying them
+        round_date, course_name = None, None
+        for node in walk_json(payload):
+            value = pick(node, JSON_ROUND_KEYS["date"])
+            if round_date is None and isinstance(value, str):
+                try:
+                    round_date = datetime.fromisoformat(value.replace("Z", "+00:00")).date()
+                except ValueError:
+                    pass
+
+            value = pick(node, JSON_ROUND_KEYS["course"])
+            value = value.get("name") if isinstance(value, dict) else value
+            if course_name is None and isinstance(value, str) and value.strip():
+                course_name = value.strip().lower().replace(" ", "_")
+
+        return scorecard_data, round_date, course_name
+
+    def parse_scorecard_elements(self) -> tuple[dict[str, list], date | None, str | None]:
+        """
+        Parse a round element by element through the WebDriver.
+
+        Args: None
+
+        Returns: tuple[dict[str, list], date | None, str | None]: Raw scorecard data by stat type,
+            the round date and the normalized course name.
+        """
+        scorecard_data = {}
+
+        round_date = self.get_round_date()
+        course_name = self.get_course_name()
+
+        scorecard_section = self.driver.find_element(By.CSS_SELECTOR, 'section.round-scorecard')
+
+        scorecard_grid = scorecard_section.find_element(By.CSS_SELECTOR, 'section.grid')
+
+        round_lines = scorecard_grid.find_elements(By.CSS_SELECTOR, 'div.contents')
+
+        for line in round_lines:
+            scorecard_data = self.parse_scorecard_rows(line=line, scorecard_data=scorecard_data)
+
+        return scorecard_data, round_date, course_name
+
     def transform_scorecard_data(self, scorecard_data: dict[str, list]) -> list[dict]:
         """
         Transform scorecard structure.
@@ -353,9 +641,9 @@ class ScorecardParser(SeleniumDriver, BlobClient):
         """
         Identify new Hole19 scorecards that are not yet stored in blob storage.
 
-        Extracts scorecard IDs from the provided URLs, compares them with IDs of
-        scorecards already saved in the "golf/scorecards" container, and returns
-        the URLs of scorecards that are new.
+        Extracts scorecard IDs from the provided URLs, compares them with the rounds
+        recorded in the ingest catalog (bootstrapped from storage on first use), and
+        returns the URLs of scorecards that are new.
 
         Args:
             scorecard_urls (list): List of Hole19 scorecard URLs to check.
@@ -365,39 +653,120 @@ class ScorecardParser(SeleniumDriver, BlobClient):
         """
         scorecard_ids = [url.split("/")[-1] for url in scorecard_urls]
 
-        collected_scorecard = self.list_blob_filenames(container_name="golf", directory_path="scorecards")
+        self.catalog.ensure()
 
-        collected_scorecard_ids = [file.split("_")[-1].replace(".json", "") for file in collected_scorecard]
+        collected_scorecard_ids = self.catalog.ids(kind="round")
 
         return [f"https://www.hole19golf.com/performance/rounds/{id}"
-                for id in list(set(scorecard_ids) - set(collected_scorecard_ids))]
+                for id in list(set(scorecard_ids) - collected_scorecard_ids)]
 
     def collect_scorecard_data(self, url: str) -> tuple[list[dict], str]:
         """
         Collect and process scorecard data from a URL.
 
-        Navigates to a scorecard page, extracts rows, transforms them into hole-level data,
-        cleans values, and annotates results.
+        Navigates to a scorecard page, extracts rows (from the captured JSON response, the
+        page source, or element by element as a fallback), transforms them into hole-level
+        data, cleans values, and annotates results.
 
         Args: url (str): The scorecard page URL.
 
         Returns: tuple[list[dict], str]: Processed scorecard data and output file name.
         """
-        scorecard_data = {}
+        capture = self.network_capture() if self.capture_misses < self.max_capture_misses else None
+        if capture is not None:
+            capture.clear()
 
-        self.driver.get(url)
-        round_date = self.get_round_date()
-        course_name = self.get_course_name()
-        file_name = f'scorecards/{course_name}_{round_date}_{url.split("/")[-1]}.json'
+        self.navigate(url)
 
-        scorecard_section = self.driver.find_element(By.CSS_SELECTOR, 'section.round-scorecard')
+        # Read the round from the JSON response behind the page when network traffic is captured
+        scorecard_data = None
+        if capture is not None:
+            try:
+                scorecard_data, round_date, course_name = capture.wait_for(
+                    parse=self.parse_scorecard_json, url_filter=url.split("/")[-1], timeout=self.capture_timeout)
+                self.capture_misses = 0
+                self.remember_round_api_url(url=url, response_url=capture.matched_url)
+            except Exception as e:
+                self.capture_misses += 1
+                self.logger.warning(f"No scorecard JSON captured, parsing the page instead - {e}")
 
-        scorecard_grid = scorecard_section.find_element(By.CSS_SELECTOR, 'section.grid')
+        if scorecard_data is None:
+            scorecard_data, round_date, course_name = self.parse_rendered_round(url=url)
 
-        round_lines = scorecard_grid.find_elements(By.CSS_SELECTOR, 'div.contents')
+        return self.build_scorecard(scorecard_data=scorecard_data, round_date=round_date,
+                                    course_name=course_name, url=url)
 
-        for line in round_lines:
-            scorecard_data = self.parse_scorecard_rows(line=line, scorecard_data=scorecard_data)
+    def remember_round_api_url(self, url: str, response_url: Optional[str]) -> None:
+        """
+        Keep the URL of the JSON response a round was read from as a template for other rounds.
+
+        Only path segments equal to the round ID become the `{round_id}` placeholder,
+        so the ID appearing elsewhere (e.g. inside another ID or the query) is left as is.
+
+        Args:
+            url (str): The scorecard page URL, ending in the round ID.
+            response_url (Optional[str]): URL of the JSON response the round was read from.
+
+        Returns: None
+        """
+        if self.round_api_url is not None or not isinstance(response_url, str):
+            return
+
+        # Escape literal braces, then template the path segments naming the round
+        round_id = url.rstrip("/").split("/")[-1]
+        parts = urlsplit(response_url.replace("{", "{{").replace("}", "}}"))
+        segments = parts.path.split("/")
+        if round_id in segments:
+            path = "/".join("{round_id}" if segment == round_id else segment for segment in segments)
+            self.round_api_url = urlunsplit(parts._replace(path=path))
+
+    def parse_rendered_round(self, url: str) -> tuple[dict[str, list], date | None, str | None]:
+        """
+        Parse the round rendered in the browser.
+
+        Reads the page source, or the grid element by element as a fallback.
+
+        Args: url (str): The scorecard page URL, for logging.
+
+        Returns: tuple[dict[str, list], date | None, str | None]: Raw scorecard data by stat type,
+            the round date and the normalized course name.
+        """
+        # Wait for the scorecard grid, which an eager page load may return before
+        try:
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'section.round-scorecard div.contents')))
+        except TimeoutException:
+            self.logger.warning(f"Scorecard grid did not appear on {url}")
+
+        # Parse the round from a single page source snapshot, falling back to the WebDriver
+        scorecard_data = None
+        if self.use_page_source:
+            try:
+                scorecard_data, round_date, course_name = self.parse_page_source(self.driver.page_source)
+            except Exception as e:
+                self.logger.warning(f"Parsing page source failed, reading elements instead - {e}")
+
+        if scorecard_data is None:
+            scorecard_data, round_date, course_name = self.parse_scorecard_elements()
+
+        return scorecard_data, round_date, course_name
+
+    def build_scorecard(self, scorecard_data: dict[str, list], round_date: date | None,
+                        course_name: str | None, url: str) -> tuple[list[dict], str]:
+        """
+        Turn raw scorecard rows into the stored hole-level records.
+
+        Transforms rows into hole-level data, cleans values, drops unplayed holes
+        and annotates results, whichever path the rows were read by.
+
+        Args: scorecard_data (dict[str, list]): Raw scorecard data by stat type.
+            round_date (date | None): Date of the round.
+            course_name (str | None): Normalized course name.
+            url (str): The scorecard page URL.
+
+        Returns: tuple[list[dict], str]: Processed scorecard data and output file name.
+        """
+        file_name = f'scorecards/{course_name}_{round_date}_{url.split("/")[-1]}.json'
 
         transformed_scorecard_data = self.transform_scorecard_data(scorecard_data=scorecard_data)
 
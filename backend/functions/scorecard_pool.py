@@ -0,0 +1,215 @@
+# Import dependencies
+from selenium.common.exceptions import WebDriverException
+from ..interfaces.scrape_models import ScrapeReport
+from .scorecard_navigator import Hole19Navigator
+from .scorecard_parser import ScorecardParser
+from .browser_profile import BrowserProfile
+from typing import Callable, Optional
+from .rate_limiter import RateLimiter
+import threading
+import logging
+import queue
+import time
+
+class ScorecardWorkerPool:
+    """
+    Scrapes Hole19 round pages with a pool of logged-in browser workers.
+
+    Each worker runs its own Chrome session on a thread, logs in once, and then
+    takes round URLs from a shared queue until it is empty. Page loads across
+    all workers go through one `RateLimiter`, so adding workers never raises
+    the request rate above the configured limit.
+
+    Failures are isolated per worker: a round that fails is recorded and the
+    worker moves on; a worker whose browser session dies restarts it, and a
+    worker that cannot restart or fails `max_failures` rounds in a row retires
+    while the others drain the queue. Scraped rounds are passed to `on_result`
+    as they complete (one call at a time), so they stream into the exporter
+    instead of waiting for the whole batch.
+
+    Typical usage example:
+        pool = ScorecardWorkerPool(logger=logger, workers=4, rate_limiter=RateLimiter(rate=2.0))
+        report = pool.run(urls=new_urls, on_result=export_round)
+
+    Attributes:
+        workers (int): Number of browser workers to start.
+        rate_limiter (RateLimiter): Limiter shared by every worker's page loads.
+        max_failures (int): Consecutive failed rounds after which a worker retires.
+        profile (Optional[BrowserProfile]): Browser profile of every worker.
+    """
+    def __init__(self, logger: logging.Logger,
+                 driver_path: str = 'chromedriver.exe',
+                 headless: bool = False,
+                 workers: int = 2,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 max_failures: int = 3,
+                 profile: Optional[BrowserProfile] = None) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            logger (logging.Logger): Logger instance for recording progress and errors.
+            driver_path (str, optional): Path to the ChromeDriver executable. Defaults to 'chromedriver.exe'.
+            headless (bool, optional): Whether to run Chrome in headless mode. Defaults to False.
+            workers (int, optional): Number of browser workers to start. Defaults to 2.
+            rate_limiter (Optional[RateLimiter], optional): Limiter shared by all workers. Defaults to no limit.
+            max_failures (int, optional): Consecutive failed rounds after which a worker retires. Defaults to 3.
+            profile (Optional[BrowserProfile], optional): Browser profile of every worker, each with its own
+                user-data directory. Defaults to the one configured in Variables.
+        """
+        self.logger = logger
+        self.driver_path = driver_path
+        self.headless = headless
+        self.workers = max(workers, 1)
+        self.rate_limiter = rate_limiter or RateLimiter(rate=0)
+        self.max_failures = max_failures
+        self.profile = profile
+        self._result_lock = threading.Lock()
+
+    def start_worker(self, index: int = 1) -> ScorecardParser:
+        """
+        Start a browser session and log it into Hole19.
+
+        Args: index (int, optional): Worker number, keeping concurrent user-data directories apart. Defaults to 1.
+
+        Returns:
+            ScorecardParser: A parser driving the logged-in session.
+
+        Raises:
+            WebDriverException: If the browser cannot be started or the login fails.
+        """
+        parser = ScorecardParser(logger=self.logger, driver_path=self.driver_path, headless=self.headless)
+        parser.profile = (self.profile or BrowserProfile.from_variables(parser.vars)).for_worker(index)
+        parser.initiate_driver()
+
+        try:
+            navigator = Hole19Navigator(logger=self.logger, driver_path=self.driver_path, headless=self.headless)
+            navigator.driver = parser.driver
+            navigator.profile = parser.profile
+            self.rate_limiter.acquire()
+            navigator.login_to_website()
+        except BaseException:
+            parser.driver.quit()
+            raise
+
+        return parser
+
+    def run(self, urls: list[str], on_result: Callable[[str, list[dict], str], None]) -> ScrapeReport:
+        """
+        Scrape every URL across the pool.
+
+        Args:
+            urls (list[str]): Round URLs to scrape.
+            on_result (Callable[[str, list[dict], str], None]): Called with the URL, scorecard and
+                output file name of each round as it completes. Exceptions count as failures of that round.
+
+        Returns:
+            ScrapeReport: Which rounds were scraped and which failed.
+        """
+        report = ScrapeReport()
+        pending: queue.Queue[str] = queue.Queue()
+        for url in urls:
+            pending.put(url)
+
+        # Run the workers on their own threads until the queue drains or every worker retires
+        started = time.perf_counter()
+        threads = [threading.Thread(target=self._work, args=(index, pending, on_result, report),
+                                    name=f"scorecard-worker-{index}", daemon=True)
+                   for index in range(1, min(self.workers, len(urls)) + 1)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Anything left was never attempted because no worker survived
+        while not pending.empty():
+            report.failed[pending.get_nowait()] = RuntimeError("No scorecard worker available")
+
+        report.seconds = time.perf_counter() - started
+        return report
+
+    def _work(self, index: int, pending: queue.Queue, on_result: Callable, report: ScrapeReport) -> None:
+        """
+        Worker loop: scrape rounds from the queue on one browser session.
+
+        Returns: None
+        """
+        parser = self._start(index)
+        if parser is None:
+            return
+
+        with self._result_lock:
+            report.workers += 1
+
+        failures = 0
+        while failures < self.max_failures:
+            try:
+                url = pending.get_nowait()
+            except queue.Empty:
+                break
+
+            error = self._scrape(parser, url, on_result, report)
+            if error is None:
+                failures = 0
+                continue
+
+            failures += 1
+            self.logger.error(f"Scorecard worker {index} failed to collect {url} - {error}")
+
+            # Replace a browser session that died
+            if isinstance(error, WebDriverException):
+                self._quit(parser)
+                parser = self._start(index)
+                if parser is None:
+                    return
+
+        if failures >= self.max_failures:
+            self.logger.error(f"Scorecard worker {index} retired after {failures} consecutive failures")
+
+        self._quit(parser)
+
+    def _start(self, index: int) -> Optional[ScorecardParser]:
+        """
+        Start a worker's browser session, logging instead of raising on failure.
+
+        Returns:
+            Optional[ScorecardParser]: The logged-in parser, or None if the session could not start.
+        """
+        try:
+            return self.start_worker(index=index)
+        except Exception as e:
+            self.logger.error(f"Scorecard worker {index} failed to start its browser - {e}")
+            return None
+
+    def _scrape(self, parser: ScorecardParser, url: str, on_result: Callable,
+                report: ScrapeReport) -> Optional[Exception]:
+        """
+        Scrape one round and hand it on as soon as it completes.
+
+        Returns:
+            Optional[Exception]: The error that failed the round, or None on success.
+        """
+        try:
+            self.rate_limiter.acquire()
+            scorecard, file_name = parser.collect_scorecard_data(url=url)
+
+            with self._result_lock:
+                on_result(url, scorecard, file_name)
+                report.succeeded.append(url)
+            return None
+
+        except Exception as e:
+            with self._result_lock:
+                report.failed[url] = e
+            return e
+
+    def _quit(self, parser: ScorecardParser) -> None:
+        """
+        Close a worker's browser session, ignoring errors from a session that already died.
+
+        Returns: None
+        """
+        try:
+            parser.driver.quit()
+        except Exception:
+            pass
@@ -1,10 +1,15 @@
-
 # Import dependencies
 from ..interfaces.selenium_driver_base import AbstractSeleniumDriver
 from selenium.webdriver.chrome.webdriver import WebDriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from .navigation_metrics import NavigationMetrics
+from .network_capture import NetworkCapture
+from .browser_profile import BrowserProfile
 from selenium import webdriver
+from shared import Variables
+from typing import Optional
+import time
 
 class SeleniumDriver(AbstractSeleniumDriver):
     """
@@ -15,23 +20,41 @@ class SeleniumDriver(AbstractSeleniumDriver):
     such as headless mode and suppressed logging. It ensures consistent setup
     for browser automation tasks across the project.
 
+    Chrome is launched with a `BrowserProfile`, by default the one named by
+    the `browser_profile` variable. Subclasses set `site` so the profile can
+    allow the resources their site needs, and load pages with `navigate`,
+    which times every page load into `NavigationMetrics`.
+
     Inherits from:
         AbstractSeleniumDriver: Base class that defines the Selenium driver
         interface/contract to be implemented.
+
+    Attributes:
+        site (Optional[str]): Site key used to look up the profile's allowed URLs.
+        profile (Optional[BrowserProfile]): Profile the driver was launched with.
     """
-    def configure_driver(self, driver_path: str = 'chromedriver.exe', headless: bool = False) -> WebDriver:
+    site: Optional[str] = None
+    profile: Optional[BrowserProfile] = None
+
+    def configure_driver(self, driver_path: str = 'chromedriver.exe', headless: bool = False,
+                         profile: Optional[BrowserProfile] = None, site: Optional[str] = None) -> WebDriver:
         """
         Configures and returns a Chrome WebDriver instance.
 
         This method sets up a Selenium Chrome driver with custom options,
         such as suppressed logging and optional headless mode. The driver
         is maximized on launch to ensure consistent element rendering.
+        Profiles that block resources enable the DevTools network domain and
+        block them with `Network.setBlockedURLs`.
 
         Args:
             driver_path (str, optional): Path to the ChromeDriver executable.
                 Defaults to 'chromedriver.exe'.
             headless (bool, optional): Whether to run the browser in headless mode
                 (without a visible UI). Defaults to False.
+            profile (Optional[BrowserProfile], optional): Browser profile to apply.
+                Defaults to `self.profile`, or else the one configured in Variables.
+            site (Optional[str], optional): Site the browser will be used on. Defaults to `self.site`.
 
         Returns:
             WebDriver: A configured instance of Selenium's Chrome WebDriver.
@@ -40,6 +63,9 @@ class SeleniumDriver(AbstractSeleniumDriver):
             selenium.common.exceptions.WebDriverException:
                 If the WebDriver cannot be started with the given configuration.
         """
+        profile = profile or self.profile or BrowserProfile.from_variables(Variables())
+        site = site or self.site
+
         # Configure logging to suppress unwanted messages
         chrome_options = Options()
         chrome_options.add_argument("--log-level=3")
@@ -48,9 +74,60 @@ class SeleniumDriver(AbstractSeleniumDriver):
         if headless:
             chrome_options.add_argument("--headless")
 
+        # Apply the profile's switches and page-load strategy
+        for argument in profile.arguments():
+            chrome_options.add_argument(argument)
+        chrome_options.page_load_strategy = profile.page_load_strategy
+
+        # Record network events in the performance log for capture
+        if profile.capture_network:
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
         # Configure Driver with options
         service = Service(executable_path=driver_path)
         driver = webdriver.Chrome(service=service, options=chrome_options)
         driver.maximize_window()
 
+        # Block the resources the profile does not need on this site
+        blocked_urls = profile.blocked_for(site)
+        if blocked_urls:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls})
+
+        self.profile = profile
         return driver
+
+    def navigate(self, url: str) -> float:
+        """
+        Load a page in `self.driver`, recording how long it took.
+
+        Args:
+            url (str): Page to load.
+
+        Returns:
+            float: Seconds the page load took.
+
+        Raises:
+            selenium.common.exceptions.WebDriverException: If the page cannot be loaded.
+        """
+        profile = self.profile.name if self.profile else "default"
+        started = time.perf_counter()
+        error = True
+        try:
+            self.driver.get(url)
+            error = False
+        finally:
+            seconds = time.perf_counter() - started
+            NavigationMetrics.record(caller=type(self).__name__, profile=profile, seconds=seconds, error=error)
+        return seconds
+
+    def network_capture(self) -> Optional[NetworkCapture]:
+        """
+        Capture of the JSON responses `self.driver` receives, if its profile records network events.
+
+        Returns:
+            Optional[NetworkCapture]: The capture, or None if network capture is off.
+        """
+        if self.profile is None or not self.profile.capture_network:
+            return None
+        return NetworkCapture(driver=self.driver)
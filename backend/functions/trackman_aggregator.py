@@ -1,5 +1,7 @@
 # Import dependencies
-from shared import Variables, BlobClient
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from shared import Variables, BlobClient, ShotTable
+from typing import Callable
 from datetime import datetime
 import statistics as stat
 import logging
@@ -14,6 +16,7 @@ class TrackManAggregator(BlobClient):
     Attributes:
         logger (logging.Logger): Logger for tracking events and errors.
         vars (Variables): Configuration variables.
+        shot_table (ShotTable): Columnar store of every shot, partitioned by club and date.
     """
     def __init__(self, logger: logging.Logger):
         """
@@ -25,25 +28,52 @@ class TrackManAggregator(BlobClient):
         super().__init__()
         self.logger = logger
         self.vars = Variables()
+        self.shot_table = ShotTable()
+
+    def stream_sessions(self, files: list, read_session: Callable[[str], list]) -> list:
+        """
+        Apply a streaming read to many session files concurrently.
+
+        Each session is parsed incrementally by `read_session` on a bounded thread
+        pool, so no session document is ever held in memory whole; unreadable
+        sessions are logged and skipped.
+
+        Args:
+            files (list): Session blob names.
+            read_session (Callable[[str], list]): Reads the values needed from one session blob.
+
+        Returns:
+            list: Concatenated values read from every readable session, in completion order.
+        """
+        values = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(read_session, file): file for file in files}
+            for future in as_completed(futures):
+                try:
+                    values.extend(future.result())
+                except Exception as e:
+                    self.logger.error(f"Failed to read range session {futures[future]} - {e}")
+
+        return values
 
     def collect_clubs_used_at_range(self) -> list:
         """
         Collect a sorted list of unique clubs used across all range sessions.
 
+        Session files are streamed concurrently and only each stroke group's club
+        name is decoded; unreadable sessions are logged and skipped.
+
         Returns:
             list: Alphabetically sorted list of clubs used.
         """
         # Collect a list of files in a blob container
         files = self.list_blob_filenames(container_name="golf", directory_path="trackman_session_summary")
 
-        clubs = []
-        for file_name in files:
-            # Read the JSON file
-            data = self.read_blob_to_dict(container="golf", input_filename=file_name)
-
-            # Collect a list of clubs used in the session
-            session_clubs = [club['Club'] for club in data['StrokeGroups']]
-            clubs.extend(session_clubs)
+        # Stream every session's club names, order is irrelevant as clubs are sorted below
+        clubs = self.stream_sessions(files, lambda file: [
+            club for _, club in self.iter_blob_json(container="golf", input_filename=file,
+                                                    patterns=[("StrokeGroups", "*", "Club")])
+        ])
 
         # Sort clubs alphabetically
         clubs = list(set(clubs))
@@ -60,27 +90,55 @@ class TrackManAggregator(BlobClient):
         Args:
             club (str): Club name to summarize data for.
         """
+        self.summarise_range_clubs_data(clubs=[club])
+
+    def summarise_range_clubs_data(self, clubs: list) -> None:
+        """
+        Summarize all range session data for several clubs in one pass.
+
+        Streams every session once, groups strokes by club across all sessions, and
+        exports each club summary (most recent shot first) to Blob Storage in a
+        single parallel flush. The same strokes are written to the columnar
+        `ShotTable` so readers can load only the columns they need. Each stroke
+        records the `Session` document it came from so trajectory plots can load
+        its ball trajectory on demand; summaries never carry trajectories.
+
+        Args:
+            clubs (list): Club names to summarize data for.
+        """
         # List all files in the full_session_summary directory
         files = self.list_blob_filenames(container_name="golf", directory_path="trackman_session_summary")
 
-        # Iterate through all sessions and summarise data at a club level
-        range_club_summary = []
-        for file_name in files:
-            # Read the JSON file
-            data = self.read_blob_to_dict(container="golf", input_filename=file_name)
+        # Stream all sessions concurrently, keeping only the strokes of the clubs being inspected
+        range_club_summary = {club: [] for club in clubs}
+        club_strokes = self.stream_sessions(files, lambda file: [
+            (club, {**stroke, "Session": file})
+            for club, stroke in self.iter_session_strokes(container="golf", input_filename=file, clubs=clubs)
+        ])
 
-            # Filter data based on club being inspected
-            range_data = [club_data['Strokes'] for club_data in data['StrokeGroups'] if club_data['Club'] == club]
-            range_club_summary.extend(range_data)
+        # Group strokes at a club level, dropping trajectories inlined by sessions stored before the split
+        for club, stroke in club_strokes:
+            stroke["Measurement"].pop("BallTrajectory", None)
+            range_club_summary[club].append(stroke)
 
         # Sort by 'Time' key in descending order (most recent first)
-        sorted_data = sorted(range_club_summary[0], key=lambda x: datetime.fromisoformat(x['Time']), reverse=True)
-
-        # Write the list to the JSON file
-        self.export_dict_to_blob(
-            data=sorted_data,
-            container='golf',
-            output_filename=f'trackman_club_summary/{club}.json')
+        club_summaries = {
+            f'trackman_club_summary/{club}.json':
+                sorted(strokes, key=lambda x: datetime.fromisoformat(x['Time']), reverse=True)
+            for club, strokes in range_club_summary.items() if strokes
+        }
+
+        # Write every club summary in a single parallel flush
+        report = self.export_dicts_to_blobs(payloads=club_summaries, container='golf')
+        if not report.ok:
+            self.logger.error(f"Failed to export club summaries - {report}")
+
+        # Write the columnar shot table partitions for the same clubs
+        report = self.shot_table.write_club_shots(
+            clubs_strokes={club: strokes for club, strokes in range_club_summary.items() if strokes}
+        )
+        if not report.ok:
+            self.logger.error(f"Failed to export shot table partitions - {report}")
 
     def collect_yardage_book_data(self, clubs: str) -> None:
         """
@@ -88,17 +146,28 @@ class TrackManAggregator(BlobClient):
 
         Aggregates statistics such as average carry, max/min distance, ball speed, launch angle,
         and exports JSON summaries for the latest 10, 20, 30, 40, 50, and 100 shots per club.
+        Only the five summarised measurement columns of each club's latest 100 shots are read
+        from the shot table, and all six summaries are written in one parallel flush.
 
         Args:
             clubs (str): List of club names to include in the yardage book summaries.
         """
+        # Read only the summarised columns of each club's most recent shots
+        columns = ['Carry', 'Total', 'BallSpeed', 'MaxHeight', 'LaunchAngle']
+        club_shots = {}
+        for club, table in self.shot_table.read_clubs_shots(clubs=clubs, columns=columns, limit=100):
+            if isinstance(table, Exception):
+                self.logger.error(f"Failed to read shot table for {club} - {table}")
+                continue
+            if table.num_rows:
+                club_shots[club] = self.shot_table.to_strokes(table)
+
         # Iterate through clubs and latest x amount of shots
+        yardage_books = {}
         for shots in [10, 20, 30, 40, 50, 100]:
             yardage_book = []
-            for club in clubs:
-                # Read the JSON file
-                data = self.read_blob_to_dict(container="golf",
-                                              input_filename=f"trackman_club_summary/{club}.json")[0:shots]
+            for club, club_summary in club_shots.items():
+                data = club_summary[0:shots]
 
                 # Generate dictionary of club data
                 club_data = {
@@ -114,8 +183,9 @@ class TrackManAggregator(BlobClient):
                 }
                 yardage_book.append({club: club_data})
 
-            # Write the list to the JSON file
-            self.export_dict_to_blob(
-                data=yardage_book,
-                container='golf',
-                output_filename=f'trackman_yardage_summary/latest_{shots}_shot_summary.json')
+            yardage_books[f'trackman_yardage_summary/latest_{shots}_shot_summary.json'] = yardage_book
+
+        # Write every yardage summary in a single parallel flush
+        report = self.export_dicts_to_blobs(payloads=yardage_books, container='golf')
+        if not report.ok:
+            self.logger.error(f"Failed to export yardage summaries - {report}")
@@ -28,6 +28,8 @@ class TrackManAuth(AbstractDataCollection, SeleniumDriver):
         trackman_auth.login_to_website()
         token = trackman_auth.collect_trackman_access_token()
     """
+    site = "trackman"
+
     def __init__(
         self,
         logger: logging.Logger,
@@ -67,7 +69,7 @@ class TrackManAuth(AbstractDataCollection, SeleniumDriver):
         """
         try:
             # Navigate the trackman report page
-            self.driver.get("https://portal.trackmangolf.com/player/activities?type=reports")
+            self.navigate("https://portal.trackmangolf.com/player/activities?type=reports")
 
             # Enter Password into login form
             WebDriverWait(self.driver, 10) \
@@ -99,7 +101,7 @@ class TrackManAuth(AbstractDataCollection, SeleniumDriver):
             Exception: If the access token cannot be retrieved.
         """
         # Navigate to authentication url
-        self.driver.get("https://portal.trackmangolf.com/api/account/me")
+        self.navigate("https://portal.trackmangolf.com/api/account/me")
 
         # Locate the <body> tag and get its inner HTML (content inside the body tag)
         body_content = self.driver.find_element("tag name", "pre").get_attribute("innerHTML")
@@ -1,8 +1,10 @@
 # Import dependencies
+from shared import Variables, BlobClient, AsyncBlobClient, BlobWriteReport, BlobCatalog, TrackManSessions
 from backend.functions.selenium_driver import SeleniumDriver
-from shared import Variables, BlobClient
-import logging
+from typing import Optional
 import requests
+import logging
+import asyncio
 import time
 
 class TrackManParser(SeleniumDriver, BlobClient):
@@ -32,6 +34,8 @@ class TrackManParser(SeleniumDriver, BlobClient):
         super().__init__()
         self.logger = logger
         self.vars = Variables()
+        self.catalog = BlobCatalog()
+        self.sessions = TrackManSessions()
 
     def collect_range_session_ids(
         self,
@@ -111,31 +115,27 @@ class TrackManParser(SeleniumDriver, BlobClient):
         """
         Identify TrackMan session IDs that have not yet been collected.
 
-        Compares the provided list of session IDs against session summary files
-        already stored in the "golf/trackman_session_summary" blob container.
-        Any session IDs not present in storage are returned as new.
+        Compares the provided list of session IDs against the sessions recorded in
+        the ingest catalog (bootstrapped from storage on first use), so no container
+        listing is needed. Any session IDs not in the catalog are returned as new.
 
         Args: range_session_ids (list): A list of session IDs to check for new data.
 
         Returns: list: A list of session IDs that are not yet collected.
         """
-        collected_sessions = self.list_blob_filenames(container_name="golf", directory_path="trackman_session_summary")
+        self.catalog.ensure()
 
-        collected_sessions_ids = [file.split("-session-")[-1].replace(".json", "") for file in collected_sessions]
+        return list(set(range_session_ids) - self.catalog.ids(kind="session"))
 
-        return list(set(range_session_ids) - set(collected_sessions_ids))
-
-    def collect_range_session_data(self, session_id: str) -> None:
+    def fetch_range_session_report(self, session_id: str) -> Optional[tuple[str, dict]]:
         """
-        Collect and upload data for a specific range session.
-
-        Retrieves session data from the TrackMan API and uploads it to Azure Blob Storage.
+        Download the report for a specific range session from the TrackMan API.
 
         Args:
             session_id (str): The ID of the range session to collect.
 
-        Raises:
-            Exception: If session data cannot be retrieved or uploaded.
+        Returns:
+            Optional[tuple[str, dict]]: Output blob name and report data, or None if every retry failed.
         """
         # URL and API endpoint
         url = "https://golf-player-activities.trackmangolf.com/api/reports/getreport"
@@ -165,16 +165,81 @@ class TrackManParser(SeleniumDriver, BlobClient):
                 if response.status_code == 200:
 
                     # Define file name
-                    file_name = f"{response.json()['StrokeGroups'][0]['Date']}-session-{session_id}.json"
-
-                    self.export_dict_to_blob(
-                        data=response.json(),
-                        container='golf',
-                        output_filename=f'trackman_session_summary/{file_name}')
+                    report = response.json()
+                    file_name = f"{report['StrokeGroups'][0]['Date']}-session-{session_id}.json"
 
-                    return
+                    return f'trackman_session_summary/{file_name}', report
 
             except BaseException:
                 time.sleep(3 + (2 ** retry))
 
         self.logger.error(f'Failed to collect range session data for session id {session_id}')
+        return None
+
+    def collect_range_sessions_data(self, session_ids: list, max_concurrency: int = 8) -> BlobWriteReport:
+        """
+        Collect and upload data for many range sessions concurrently.
+
+        Runs `collect_range_sessions_data_async` on a fresh event loop.
+
+        Args:
+            session_ids (list): IDs of the range sessions to collect.
+            max_concurrency (int): Upper bound on concurrent TrackMan API requests.
+
+        Returns:
+            BlobWriteReport: Aggregated report of which session uploads succeeded and failed.
+        """
+        return asyncio.run(self.collect_range_sessions_data_async(session_ids=session_ids,
+                                                                  max_concurrency=max_concurrency))
+
+    async def collect_range_sessions_data_async(self, session_ids: list, max_concurrency: int = 8) -> BlobWriteReport:
+        """
+        Collect and upload data for many range sessions on a single event loop.
+
+        TrackMan reports are fetched concurrently (the blocking HTTP calls run in
+        worker threads), every report is then split into its metrics and trajectory
+        documents and uploaded in one batch through `AsyncBlobClient`, and the
+        sessions whose documents were all uploaded are recorded in the ingest catalog.
+        While a `BlobWriteBuffer` is active the uploads are only queued, so it is
+        flushed before any session is recorded.
+
+        Args:
+            session_ids (list): IDs of the range sessions to collect.
+            max_concurrency (int): Upper bound on concurrent TrackMan API requests.
+
+        Returns:
+            BlobWriteReport: Aggregated report of which session uploads succeeded and failed.
+        """
+        async with AsyncBlobClient() as client:
+
+            # Fetch every session report concurrently
+            sessions = await client.gather(
+                [asyncio.to_thread(self.fetch_range_session_report, session_id) for session_id in session_ids],
+                max_concurrency=max_concurrency
+            )
+
+            # Upload the metrics and trajectory documents of all fetched reports in one batch
+            payloads, documents = {}, {}
+            for session in sessions:
+                if session and not isinstance(session, BaseException):
+                    documents[session[0]] = self.sessions.session_payloads(blob_name=session[0], report=session[1])
+                    payloads.update(documents[session[0]])
+            report = await client.export_dicts_to_blobs(payloads=payloads, container='golf')
+
+            # Buffered writes are only stored once flushed, so flush before trusting the report
+            if BlobClient.write_buffer is not None:
+                flushed = await asyncio.to_thread(BlobClient.write_buffer.flush)
+                failed = {name: error for name, error in flushed.failed.items() if name in payloads}
+                report = BlobWriteReport(succeeded=[name for name in report.succeeded if name not in failed],
+                                         failed={**report.failed, **failed})
+
+            # Record the sessions whose documents were all uploaded in a single transaction, so a session
+            # with a failed document is fetched again by the next sync
+            succeeded = set(report.succeeded)
+            entries = [
+                BlobCatalog.session_entry(blob_name=name, report=payloads[name])
+                for name, session_documents in documents.items() if succeeded.issuperset(session_documents)
+            ]
+            await asyncio.to_thread(self.catalog.record, entries)
+
+            return report
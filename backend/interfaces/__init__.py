@@ -1,8 +1,13 @@
 # Import directory codebase
 from .data_collection_base import AbstractDataCollection
 from .selenium_driver_base import AbstractSeleniumDriver
+from .scrape_models import ScrapeReport, DriverSessionReport, RoundListingReport, NavigationStats
 
 __all__ = [
     "AbstractDataCollection",
-    "AbstractSeleniumDriver"
+    "AbstractSeleniumDriver",
+    "DriverSessionReport",
+    "NavigationStats",
+    "RoundListingReport",
+    "ScrapeReport"
 ]
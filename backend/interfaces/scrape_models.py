@@ -0,0 +1,147 @@
+# Import dependencies
+from dataclasses import dataclass, field
+
+@dataclass
+class ScrapeReport:
+    """
+    Aggregated outcome of scraping a batch of pages with a pool of browser workers.
+
+    Attributes:
+        succeeded (list[str]): URLs that were scraped and handed on for export.
+        failed (dict[str, BaseException]): URLs that could not be scraped mapped to the raised error.
+        workers (int): Browser workers that started successfully.
+        seconds (float): Wall-clock duration of the batch.
+    """
+    succeeded: list[str] = field(default_factory=list)
+    failed: dict[str, BaseException] = field(default_factory=dict)
+    workers: int = 0
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether every page in the batch was scraped.
+
+        Returns:
+            bool: True if no page failed.
+        """
+        return not self.failed
+
+    def __str__(self) -> str:
+        """
+        Summarise the batch in a single log-friendly line.
+
+        Returns:
+            str: Count of scraped and failed pages, worker count and duration.
+        """
+        return (f"{len(self.succeeded)} scraped, {len(self.failed)} failed "
+                f"by {self.workers} workers in {self.seconds:.1f}s")
+
+@dataclass
+class DriverSessionReport:
+    """
+    Lifecycle counters of a shared browser session.
+
+    Attributes:
+        starts (int): Browsers launched, including restarts after failed health checks.
+        borrows (int): Times a class borrowed the session's browser.
+        restarts (int): Browsers replaced because a health check failed.
+        startup_seconds (float): Total seconds spent launching and warming up browsers.
+    """
+    starts: int = 0
+    borrows: int = 0
+    restarts: int = 0
+    startup_seconds: float = 0.0
+
+    @property
+    def saved_seconds(self) -> float:
+        """
+        Startup time avoided by borrowing a running browser instead of launching one per borrower.
+
+        Returns:
+            float: Borrows served without a launch multiplied by the mean startup time.
+        """
+        if not self.starts:
+            return 0.0
+        return max(self.borrows - self.starts, 0) * self.startup_seconds / self.starts
+
+    def __str__(self) -> str:
+        """
+        Summarise the session in a single log-friendly line.
+
+        Returns:
+            str: Launches, borrows, restarts and startup seconds spent and saved.
+        """
+        return (f"{self.starts} browser launches for {self.borrows} borrows ({self.restarts} restarts), "
+                f"{self.startup_seconds:.1f}s starting up, {self.saved_seconds:.1f}s saved")
+
+@dataclass
+class RoundListingReport:
+    """
+    Outcome of paging a round history into view with "Load More".
+
+    Attributes:
+        pages_loaded (int): "Load More" clicks that loaded a further page of rounds.
+        rounds_loaded (int): Round links in view once paging stopped.
+        stopped_at_known (bool): Whether paging stopped because an already ingested round came into view.
+        pages_skipped (int): Estimated page loads avoided by stopping at a known round.
+        seconds (float): Wall-clock duration of the paging.
+    """
+    pages_loaded: int = 0
+    rounds_loaded: int = 0
+    stopped_at_known: bool = False
+    pages_skipped: int = 0
+    seconds: float = 0.0
+
+    def __str__(self) -> str:
+        """
+        Summarise the paging in a single log-friendly line.
+
+        Returns:
+            str: Pages and rounds loaded, pages skipped and duration.
+        """
+        summary = f"{self.rounds_loaded} rounds in {self.pages_loaded} page loads"
+        if self.stopped_at_known:
+            summary += f", stopped at a known round ({self.pages_skipped} page loads skipped)"
+        return summary + f" in {self.seconds:.1f}s"
+
+@dataclass
+class NavigationStats:
+    """
+    Page loads made by one class under one browser profile.
+
+    Attributes:
+        caller (str): Name of the class that navigated (e.g. "Hole19Navigator").
+        profile (str): Name of the browser profile the navigations ran under.
+        navigations (int): Page loads made.
+        errors (int): Page loads that raised.
+        seconds (float): Total seconds spent waiting for page loads.
+    """
+    caller: str
+    profile: str
+    navigations: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        """
+        Mean duration of a page load.
+
+        Returns:
+            float: Seconds per navigation, 0 if none were made.
+        """
+        return self.seconds / self.navigations if self.navigations else 0.0
+
+    def __str__(self) -> str:
+        """
+        Summarise the navigations in a single log-friendly line.
+
+        Returns:
+            str: Caller, profile, navigation count and mean duration.
+        """
+        summary = (f"{self.caller} [{self.profile}]: {self.navigations} navigations, "
+                   f"{self.mean_seconds:.2f}s each")
+        if self.errors:
+            summary += f", {self.errors} failed"
+        return summary
@@ -1,5 +1,6 @@
 # Import dependencies
 from selenium.webdriver.chrome.webdriver import WebDriver
+from typing import Any, Optional
 from abc import ABC, abstractmethod
 
 class AbstractSeleniumDriver(ABC):
@@ -17,7 +18,9 @@ class AbstractSeleniumDriver(ABC):
     def configure_driver(
         self,
         driver_path: str = 'chromedriver.exe',
-        headless: bool = False
+        headless: bool = False,
+        profile: Optional[Any] = None,
+        site: Optional[str] = None
     ) -> WebDriver:
         """
         Create and configure a Selenium WebDriver instance.
@@ -31,6 +34,10 @@ class AbstractSeleniumDriver(ABC):
                 Defaults to 'chromedriver.exe'.
             headless (bool, optional): If True, launches the browser without
                 a visible UI. Defaults to False.
+            profile (Optional[Any], optional): Browser profile to apply, the
+                implementation's default if None.
+            site (Optional[str], optional): Site the browser will be used on,
+                for site-specific profile settings. Defaults to None.
 
         Returns:
             WebDriver: A fully configured Selenium WebDriver instance, ready
@@ -0,0 +1,44 @@
+# Import dependencies
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from backend.functions.logging import configure_logging
+from shared import BlobClient, BlobCodecs
+import argparse
+
+# Parse command line arguments
+parser = argparse.ArgumentParser(description="Re-encode existing JSON blobs with a storage codec")
+parser.add_argument("--container", default="golf", help="Container holding the blobs")
+parser.add_argument("--prefix", default="", help="Only migrate blobs whose name starts with this prefix")
+parser.add_argument("--codec", default=None, choices=BlobCodecs.available(),
+                    help="Target codec (defaults to the blob_codec variable)")
+parser.add_argument("--workers", type=int, default=BlobClient.max_workers, help="Concurrent blob rewrites")
+args = parser.parse_args()
+
+# Configure logger
+logger = configure_logging()
+
+# Collect the blobs to migrate, skipping those the listing shows are already encoded
+client = BlobClient(codec=args.codec)
+entries = [entry for entry in client.list_blob_entries(args.container, args.prefix, use_cache=False)
+           if entry.name.endswith(".json")]
+blob_names = [entry.name for entry in entries if entry.content_encoding != client.codec.name]
+logger.info(f"Re-encoding {len(blob_names)} blobs in '{args.container}' with {client.codec.name} "
+            f"({len(entries) - len(blob_names)} already encoded)")
+
+# Re-encode every blob concurrently, tallying the stored size before and after
+bytes_before, bytes_after, failures = 0, 0, 0
+with ThreadPoolExecutor(max_workers=args.workers) as executor:
+    futures = {executor.submit(client.recompress_blob, args.container, name): name for name in blob_names}
+    for future in as_completed(futures):
+        try:
+            before, after = future.result()
+            bytes_before += before
+            bytes_after += after
+        except Exception as e:
+            failures += 1
+            logger.error(f"Failed to re-encode {futures[future]}: {e}")
+
+# Report the outcome
+saved = bytes_before - bytes_after
+ratio = bytes_after / bytes_before if bytes_before else 1.0
+logger.info(f"Re-encoded {len(blob_names) - failures} blobs, {failures} failed: "
+            f"{bytes_before:,} -> {bytes_after:,} bytes ({saved:,} saved, {ratio:.0%} of original)")
@@ -0,0 +1,32 @@
+# Import dependencies
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from backend.functions.logging import configure_logging
+from shared import TrackManSessions
+import argparse
+
+# Parse command line arguments
+parser = argparse.ArgumentParser(description="Split stored TrackMan sessions into metrics and trajectory documents")
+parser.add_argument("--workers", type=int, default=TrackManSessions.max_workers, help="Concurrent session rewrites")
+args = parser.parse_args()
+
+# Configure logger
+logger = configure_logging()
+
+# Collect the stored session metrics documents
+sessions = TrackManSessions()
+blob_names = sessions.list_blob_filenames(container_name=sessions.container, directory_path=f"{sessions.prefix}/")
+logger.info(f"Checking {len(blob_names)} sessions in '{sessions.container}' for inline trajectories")
+
+# Split every legacy session concurrently
+split, failures = 0, 0
+with ThreadPoolExecutor(max_workers=args.workers) as executor:
+    futures = {executor.submit(sessions.split_legacy_session, name): name for name in blob_names}
+    for future in as_completed(futures):
+        try:
+            split += future.result()
+        except Exception as e:
+            failures += 1
+            logger.error(f"Failed to split {futures[future]}: {e}")
+
+# Report the outcome
+logger.info(f"Split {split} sessions, {len(blob_names) - split - failures} already split, {failures} failed")
@@ -8,6 +8,8 @@ from .functions import (
     collect_club_trajectory_data,
     collect_yardage_summary_data,
     render_club_yardage_analysis,
+    render_blob_io_diagnostics,
+    summarise_blob_io_data,
     aggregate_fairway_data,
     render_course_overview,
     display_club_metrics,
@@ -25,6 +27,8 @@ __all__ = [
     "collect_club_trajectory_data",
     "collect_yardage_summary_data",
     "render_club_yardage_analysis",
+    "render_blob_io_diagnostics",
+    "summarise_blob_io_data",
     "aggregate_fairway_data",
     "render_course_overview",
     "display_club_metrics",
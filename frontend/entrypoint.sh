@@ -9,6 +9,18 @@ cat <<EOF > /app/.streamlit/secrets.toml
 [general]
 blob_storage_connection_string = "${BLOB_STORAGE_CONNECTION_STRING:-}"
 golf_course_name= "${GOLF_COURSE_NAME:-}"
+blob_cache_directory = "${BLOB_CACHE_DIRECTORY:-}"
+blob_cache_max_mb = "${BLOB_CACHE_MAX_MB:-256}"
+blob_cache_max_age = "${BLOB_CACHE_MAX_AGE:-0}"
+blob_codec = "${BLOB_CODEC:-gzip}"
+blob_serializer = "${BLOB_SERIALIZER:-json}"
+blob_listing_ttl = "${BLOB_LISTING_TTL:-30}"
+blob_timeout = "${BLOB_TIMEOUT:-30}"
+blob_retries = "${BLOB_RETRIES:-3}"
+blob_backoff = "${BLOB_BACKOFF:-0.2}"
+blob_hedge_percentile = "${BLOB_HEDGE_PERCENTILE:-0}"
+blob_snapshot_directory = "${BLOB_SNAPSHOT_DIRECTORY:-}"
+blob_snapshot_ttl = "${BLOB_SNAPSHOT_TTL:-60}"
 
 [auth]
 redirect_uri = "${REDIRECT_URI:-}"
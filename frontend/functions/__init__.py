@@ -4,6 +4,7 @@ from .ui_sections import (
     render_trackman_session_analysis,
     render_trackman_club_analysis,
     render_club_yardage_analysis,
+    render_blob_io_diagnostics,
     render_course_overview,
     render_hole_metrics
 )
@@ -11,6 +12,7 @@ from .data_functions import (
     transform_stroke_per_hole_data,
     collect_club_trajectory_data,
     collect_yardage_summary_data,
+    summarise_blob_io_data,
     aggregate_fairway_data,
     extract_stat_flags
 )
@@ -26,6 +28,8 @@ __all__ = [
     "collect_club_trajectory_data",
     "collect_yardage_summary_data",
     "render_club_yardage_analysis",
+    "render_blob_io_diagnostics",
+    "summarise_blob_io_data",
     "aggregate_fairway_data",
     "render_course_overview",
     "display_club_metrics",
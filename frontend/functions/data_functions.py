@@ -1,6 +1,8 @@
 # Import dependencies
 from shared import BlobClient, Variables
+from typing import Iterable, Optional
 import pandas as pd
+import itertools
 
 def transform_stroke_per_hole_data(data: list) -> pd.DataFrame:
     """
@@ -89,8 +91,8 @@ def extract_stat_flags(metrics) -> list[bool, bool, bool]:
     return min_stats, max_stats, avg_stats
 
 def collect_club_trajectory_data(
-    data: list,
-    total_shots: int = 200
+    data: Iterable[dict],
+    total_shots: Optional[int] = 200
 ) -> tuple[pd.DataFrame, pd.DataFrame, list, list, list]:
     """
     Collects and processes trajectory data for a specified golf club.
@@ -99,8 +101,8 @@ def collect_club_trajectory_data(
     extracts relevant trajectory and performance metrics for a specified number of shots.
 
     Args:
-        data (list): A list of shot data.
-        total_shots (int = 200): The number of shots to process from the dataset.
+        data (Iterable[dict]): Shot data, either a list or a stream of strokes consumed one at a time.
+        total_shots (Optional[int] = 200): The number of shots to process from the dataset, None for all shots.
 
     Returns:
         tuple: A tuple containing:
@@ -125,7 +127,7 @@ def collect_club_trajectory_data(
     ball_speeds = []
 
     # Iterate through data and collect stats
-    for idx, data_set in enumerate(data[0:total_shots]):
+    for idx, data_set in enumerate(itertools.islice(data, total_shots)):
 
         # Collect and append stroke stat
         carry_data.append(data_set['Measurement']['Carry'])
@@ -315,3 +317,36 @@ def summarise_hole_performance_data(variables: Variables, rounds: int) -> pd.Dat
     df["Par"] = df["Par"].astype(str)
 
     return df
+
+def summarise_blob_io_data(operations: list[dict], group_by: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Summarise blob I/O operations from a `BlobMetrics` report.
+
+    Sums calls, errors, bytes and time across every operation sharing the
+    selected tag, and adds up the latency histograms of all operations.
+
+    Args:
+        operations (list[dict]): The report's `operations` entries.
+        group_by (str): Tag to group by: "caller", "prefix", "operation" or "container".
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]:
+            - Per tag totals, most time spent first.
+            - Calls per latency bucket, fastest bucket first.
+    """
+    # Sum counters per tag value
+    df = pd.DataFrame(operations, columns=[group_by, "calls", "errors", "bytes", "total_ms", "max_ms"])
+    summary_df = df.groupby(group_by, as_index=False).agg(
+        {"calls": "sum", "errors": "sum", "bytes": "sum", "total_ms": "sum", "max_ms": "max"}
+    )
+    summary_df["mean_ms"] = (summary_df["total_ms"] / summary_df["calls"].where(summary_df["calls"] > 0)).round(2)
+    summary_df = summary_df.sort_values("total_ms", ascending=False)
+
+    # Add up histograms, keeping the bucket order of the report
+    buckets = {}
+    for operation in operations:
+        for bucket, calls in operation.get("histogram", {}).items():
+            buckets[bucket] = buckets.get(bucket, 0) + calls
+    histogram_df = pd.DataFrame({"Latency": list(buckets), "Calls": list(buckets.values())})
+
+    return summary_df, histogram_df
@@ -28,7 +28,8 @@ def get_navigation(vars: Variables) -> st.navigation:
                     title="Hole by Hole Analysis", icon="🏌"),
             st.Page(page="pages/course_overview.py",
                     title="Course Overview", icon="⛳")
-        ]
+        ],
+        "Diagnostics": [st.Page("pages/blob_io_diagnostics.py", title="Blob I/O", icon="🩺")]
     }
 
     # Construct streamlit navigation object
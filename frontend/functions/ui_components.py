@@ -2,8 +2,24 @@
 from streamlit_components.plot_functions import PlotlyPlotter
 from .data_functions import collect_club_trajectory_data
 from .plots import plot_final_trajectory_contour
+from typing import Iterable
 import streamlit as st
 
+def format_average(values: list, unit: str) -> str:
+    """
+    Format the average of a metric for a Streamlit metric box.
+
+    Args:
+        values (list): Metric values of each shot.
+        unit (str): Unit appended to the average.
+
+    Returns:
+        str: The average rounded to 2 decimals with its unit, or "-" if there are no values.
+    """
+    if not values:
+        return "-"
+    return f'{round(sum(values)/len(values), 2)}{unit}'
+
 def display_club_metrics(
     total_shots: int,
     carry_data: list,
@@ -15,7 +31,8 @@ def display_club_metrics(
 
     This function calculates and displays the average carry, average total
     distance, and average ball speed from the last `total_shots` using Streamlit
-    metrics. Each metric is shown in a separate column on the page.
+    metrics. Each metric is shown in a separate column on the page, as "-"
+    when there are no shots to average.
 
     Args:
         total_shots (int): The total number of shots considered for calculating
@@ -34,22 +51,22 @@ def display_club_metrics(
     # Render average carry metric in column 1
     with col1:
         st.metric(label=f'Average Carry  (Last {total_shots} shots)',
-                  value=f'{round(sum(carry_data)/len(carry_data), 2)}m',
+                  value=format_average(values=carry_data, unit='m'),
                   border=True)
 
     # Render average distance metric in column 2
     with col2:
         st.metric(label=f'Average Distance (Last {total_shots} shots)',
-                  value=f'{round(sum(total_distance)/len(total_distance), 2)}m',
+                  value=format_average(values=total_distance, unit='m'),
                   border=True)
 
     # Render average ball speed metric in column 3
     with col3:
         st.metric(label=f'Avg Ball Speed  (Last {total_shots} shots)',
-                  value=f'{round(sum(ball_speeds)/len(ball_speeds), 2)}mph',
+                  value=format_average(values=ball_speeds, unit='mph'),
                   border=True)
 
-def display_club_summary_shot_trajectories(data: list, total_shots: int | None = None) -> None:
+def display_club_summary_shot_trajectories(data: Iterable[dict], total_shots: int | None = None) -> None:
     """
     Displays a summary of golf shot trajectories for a club using Streamlit.
 
@@ -58,20 +75,23 @@ def display_club_summary_shot_trajectories(data: list, total_shots: int | None =
     including shot trajectories and shot distribution plots.
 
     Args:
-        data (list): A list of shot data records.
+        data (Iterable[dict]): Shot data records, e.g. a list or a stream of strokes.
         total_shots (int | None, optional): The number of shots to include
-            Defaults to the length of `data` if not provided.
+            Defaults to every shot in `data` if not provided or 0.
 
     Returns: None
     """
-    # Handle total shot logic
-    if not total_shots:
-        total_shots = len(data)
+    # Treat 0 shots as every shot, before the data is cut to that many
+    total_shots = total_shots or None
 
     # Collect page data
     final_flight_df, final_end_df, carry_data, total_distance, ball_speeds = \
         collect_club_trajectory_data(data=data, total_shots=total_shots)
 
+    # Handle total shot logic
+    if total_shots is None:
+        total_shots = len(carry_data)
+
     # Render club metric boxes
     display_club_metrics(total_shots=total_shots,
                          carry_data=carry_data,
@@ -6,10 +6,11 @@ from .data_functions import (
     summarise_hole_performance_data,
     transform_stroke_per_hole_data,
     collect_yardage_summary_data,
+    summarise_blob_io_data,
     aggregate_fairway_data,
     extract_stat_flags
 )
-from shared import BlobClient, Variables
+from shared import BlobClient, BlobCatalog, BlobMetrics, ShotTable, TrackManSessions, Variables
 import streamlit as st
 
 def render_hole_metrics(vars: Variables) -> list[dict]:
@@ -38,12 +39,8 @@ def render_hole_metrics(vars: Variables) -> list[dict]:
     # Render slider within the final column
     with columns[-1]:
 
-        # Read all round data from blob storage
-        all_rounds = BlobClient(source="frontend") \
-            .list_blob_filenames(container_name="golf", directory_path="scorecards")
-
-        # Determine how many round have been played
-        home_rounds_count = len([round for round in all_rounds if vars.golf_course_name.lower() in round.lower()])
+        # Determine how many round have been played from the ingest catalog
+        home_rounds_count = len(BlobCatalog(source="frontend").entries(kind="round", course=vars.golf_course_name))
 
         # Render rounds slider
         rounds = st.slider(label="Last N Rounds",
@@ -151,9 +148,8 @@ def render_trackman_club_analysis() -> None:
     columns = st.columns([2, 1, 2])
 
     # Collect a list of clubs used on the trackman range
-    blob_files = BlobClient(source="frontend") \
-        .list_blob_filenames(container_name="golf", directory_path="trackman_club_summary")
-    clubs = [f.replace('.json', '').split("/")[-1] for f in blob_files]
+    shot_table = ShotTable(source="frontend")
+    clubs = shot_table.list_clubs()
 
     # Render select box within first column
     with columns[0]:
@@ -163,9 +159,15 @@ def render_trackman_club_analysis() -> None:
     with columns[-1]:
         total_shots = st.slider(label="Most recent shots:", min_value=0, max_value=30, value=10)
 
-    # Read data from blob storage
-    data = BlobClient(source="frontend") \
-        .read_blob_to_dict(container="golf", input_filename=f"trackman_club_summary/{club}.json")
+    # Read only the displayed metrics of the most recent shots from the shot table (0 reads every shot)
+    data = shot_table.to_strokes(shot_table.read_shots(
+        club=club,
+        columns=["Time", "Session", "Carry", "Total", "BallSpeed"],
+        limit=total_shots or None
+    ))
+
+    # Load the ball trajectories of just these shots from their sessions' trajectory documents
+    data = TrackManSessions(source="frontend").attach_trajectories(club=club, strokes=data)
 
     # Render plots and summary metrics
     display_club_summary_shot_trajectories(data=data, total_shots=total_shots)
@@ -187,35 +189,29 @@ def render_trackman_session_analysis() -> None:
     # Define columns object
     columns = st.columns([2, 2, 2])
 
-    # Collect a list of clubs used on the trackman range
-    blob_files = BlobClient(source="frontend") \
-        .list_blob_filenames(container_name="golf", directory_path="trackman_session_summary")
-
-    # Create sessions dictionary
-    sessions = [{"date": f.replace('.json', '').split("/")[-1].split("-session-")[0], "file_name": f}
-                for f in blob_files]
+    # Collect the recorded range sessions from the ingest catalog, most recent first
+    sessions = BlobCatalog(source="frontend").entries(kind="session")
 
     # Render session date select box in the first column
     with columns[0]:
         session_date = st.selectbox(
             label='Trackman Session Date',
-            options=[session['date'] for session in sessions]
+            options=[session.date for session in sessions]
         )
 
-        # Define file name based on frontend inputs
-        filename = [entry["file_name"] for entry in sessions if entry["date"] == session_date][0]
-
-    # Read data from blob
-    data = BlobClient(source="frontend").read_blob_to_dict(container="golf", input_filename=filename)["StrokeGroups"]
+        # Define session based on frontend inputs
+        session = [entry for entry in sessions if entry.date == session_date][0]
 
     # Render club select box within second column
     with columns[1]:
         club = st.selectbox(
             label='Club',
-            options=list(set([shot["Club"] for shot in data]))
+            options=session.clubs
         )
 
-    club_data = [shot["Strokes"] for shot in data if shot["Club"] == club][0]
+    # Stream the selected club's strokes, loading only that club's trajectories
+    club_data = (stroke for _, stroke in TrackManSessions(source="frontend").iter_strokes(
+        blob_name=session.blob_name, clubs=[club], trajectories=True))
 
     # Render plots and summary metrics
     display_club_summary_shot_trajectories(data=club_data)
@@ -355,3 +351,77 @@ def render_course_overview(variables: Variables) -> None:
 
         # Show the figure
         st.plotly_chart(fig)
+
+def render_blob_io_diagnostics() -> None:
+    """
+    Render a Streamlit diagnostics page for blob storage I/O.
+
+    Shows the blob calls, bytes moved and latency recorded either by this
+    dashboard process or by a pipeline run (from the JSON reports the backend
+    exports to `diagnostics/blob_io/`), grouped by caller, prefix, operation
+    or container so the stage dominating I/O stands out.
+
+    Returns: None
+    """
+    # Define page title
+    st.title('Blob I/O Diagnostics')
+
+    # Define columns object
+    columns = st.columns([3, 1, 2])
+
+    # List the exported pipeline reports, most recent first
+    client = BlobClient(source="frontend")
+    reports = sorted(client.list_blob_filenames(container_name="golf", directory_path="diagnostics/blob_io/"),
+                     key=lambda name: name.rsplit("/", 1)[-1], reverse=True)
+
+    # Render report select box within the first column
+    with columns[0]:
+        source = st.selectbox(
+            label="Report",
+            options=["This dashboard"] + reports,
+            format_func=lambda name: name.removeprefix("diagnostics/blob_io/").removesuffix(".json")
+        )
+
+    # Render group by select box within the last column
+    with columns[-1]:
+        group_by = st.selectbox(label="Group By", options=["caller", "prefix", "operation", "container"])
+
+    # Collect the selected report
+    if source == "This dashboard":
+        report = BlobMetrics.report(pipeline="frontend")
+    else:
+        report = client.read_blob_to_dict(container="golf", input_filename=source)
+
+    # Handle reports without any recorded I/O
+    if not report["operations"]:
+        st.info("No blob I/O recorded yet")
+        return
+
+    # Summarise the report at the selected grouping
+    summary_df, histogram_df = summarise_blob_io_data(operations=report["operations"], group_by=group_by)
+
+    # Render headline metrics
+    metric_columns = st.columns(4)
+    metric_columns[0].metric(label="Calls", value=f"{summary_df['calls'].sum():,}")
+    metric_columns[1].metric(label="Errors", value=f"{summary_df['errors'].sum():,}")
+    metric_columns[2].metric(label="Data Moved", value=f"{summary_df['bytes'].sum() / 1024 / 1024:,.2f} MB")
+    metric_columns[3].metric(label="Time in Blob Calls", value=f"{summary_df['total_ms'].sum() / 1000:,.2f} s")
+
+    # Render per group table and time breakdown
+    with st.expander(label=f"I/O by {group_by.capitalize()}", expanded=True):
+        st.dataframe(data=summary_df, hide_index=True)
+        st.plotly_chart(PlotlyPlotter(
+            df=summary_df,
+            x=group_by,
+            y="total_ms",
+            color=group_by,
+            title=f"Time in Blob Calls by {group_by.capitalize()} (ms)").plot_bar())
+
+    # Render latency histogram
+    with st.expander(label="Latency Histogram", expanded=True):
+        st.plotly_chart(PlotlyPlotter(df=histogram_df, x="Latency", y="Calls", title="Blob Call Latency").plot_bar())
+
+    # Render how often calls were retried, timed out or hedged and writes coalesced (absent from older reports)
+    if report.get("policy_events"):
+        with st.expander(label="Retries, Hedges and Coalesced Writes", expanded=False):
+            st.dataframe(data=report["policy_events"], hide_index=True)
@@ -9,7 +9,7 @@ if str(ROOT) not in sys.path:
 
 # Import further dependencies following parent system path change
 from functions import get_navigation # noqa
-from shared import Variables # noqa
+from shared import BlobSnapshot, Variables # noqa
 import streamlit as st # noqa
 
 # Ensure user is authenticated to use application
@@ -18,5 +18,9 @@ if not st.user.is_logged_in:
 
 # Render application if user is logged in
 if st.user.is_logged_in:
+
+    # Serve pages from the latest published dashboard snapshot
+    BlobSnapshot(source="frontend").refresh()
+
     pg = get_navigation(vars=Variables(source="frontend"))
     pg.run()
@@ -0,0 +1,18 @@
+# Import dependencies
+from streamlit_components.ui_components import configure_page_config
+from functions.ui_sections import render_blob_io_diagnostics
+import streamlit as st
+
+# Set page config
+configure_page_config(repository_name='golf-ui-streamlit',
+                      page_icon=":golf:")
+
+# Ensure user is authenticated to use application
+if not st.user.is_logged_in:
+    st.login('auth0')
+
+# If logged in, render page components
+if st.user.is_logged_in:
+
+    # Render blob I/O diagnostics section
+    render_blob_io_diagnostics()
@@ -1,9 +1,41 @@
 # Import dependencies
-from .functions import Variables, BlobClient
-from .interfaces import AbstractBlobClient
+from .interfaces import (
+    AbstractAsyncBlobClient, AbstractBlobClient, AbstractBlobCodec, AbstractBlobSerializer, BlobReadResult,
+    BlobWriteReport, BlobCacheStats, BlobEntry, CatalogEntry, BlobOperationStats, BufferedWrite
+)
+from .functions import (
+    Variables, AsyncBlobClient, BlobClient, BlobServiceRegistry, BlobListingCache, BlobDiskCache, BlobCodecs, ShotTable,
+    BlobCatalog, JsonStream, BlobSerializers, TrackManSessions, BlobMetrics, BlobRequestPolicy,
+    BlobWriteBuffer, BlobSnapshot, SnapshotPack
+)
 
 __all__ = [
+    "AbstractAsyncBlobClient",
     "AbstractBlobClient",
+    "AbstractBlobCodec",
+    "AbstractBlobSerializer",
+    "BlobServiceRegistry",
+    "BlobRequestPolicy",
+    "BlobCacheStats",
+    "BlobOperationStats",
+    "BlobWriteReport",
+    "BlobWriteBuffer",
+    "BlobSnapshot",
+    "SnapshotPack",
+    "BufferedWrite",
+    "BlobListingCache",
+    "BlobMetrics",
+    "BlobDiskCache",
+    "BlobCodecs",
+    "BlobSerializers",
+    "JsonStream",
+    "BlobReadResult",
+    "BlobEntry",
+    "CatalogEntry",
+    "AsyncBlobClient",
     "BlobClient",
+    "BlobCatalog",
+    "TrackManSessions",
+    "ShotTable",
     "Variables"
 ]
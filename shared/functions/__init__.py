@@ -1,8 +1,37 @@
 # Import dependencies
+from .blob_service_registry import BlobServiceRegistry
+from .blob_request_policy import BlobRequestPolicy
+from .blob_listing_cache import BlobListingCache
+from .blob_metrics import BlobMetrics
+from .blob_disk_cache import BlobDiskCache
+from .blob_serializers import BlobSerializers
+from .blob_codecs import BlobCodecs
+from .json_stream import JsonStream
+from .async_blob_client import AsyncBlobClient
+from .blob_snapshot import BlobSnapshot, SnapshotPack
+from .blob_write_buffer import BlobWriteBuffer
 from .blob_client import BlobClient
+from .blob_catalog import BlobCatalog
+from .trackman_sessions import TrackManSessions
+from .shot_table import ShotTable
 from .variables import Variables
 
 __all__ = [
+    "BlobServiceRegistry",
+    "BlobRequestPolicy",
+    "BlobListingCache",
+    "BlobMetrics",
+    "BlobDiskCache",
+    "BlobCodecs",
+    "BlobSerializers",
+    "JsonStream",
+    "AsyncBlobClient",
+    "BlobSnapshot",
+    "SnapshotPack",
+    "BlobWriteBuffer",
     "BlobClient",
+    "BlobCatalog",
+    "TrackManSessions",
+    "ShotTable",
     "Variables"
 ]
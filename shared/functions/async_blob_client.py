@@ -0,0 +1,352 @@
+# Install dependencies
+from ..interfaces.async_blob_client_base import AbstractAsyncBlobClient
+from ..interfaces.blob_models import BlobReadResult, BlobWriteReport, BufferedWrite
+from typing import Any, Awaitable, ContextManager, Dict, List, Optional, Union
+from azure.storage.blob.aio import BlobServiceClient
+from azure.core.exceptions import HttpResponseError
+from azure.storage.blob import ContentSettings
+from .blob_listing_cache import BlobListingCache
+from .blob_disk_cache import BlobDiskCache
+from .blob_serializers import BlobSerializers
+from .blob_metrics import BlobMetrics
+from .blob_client import BlobClient
+from .blob_codecs import BlobCodecs
+from .variables import Variables
+import asyncio
+import hashlib
+
+class AsyncBlobClient(AbstractAsyncBlobClient):
+    """
+    An asyncio client for interacting with Azure Blob Storage.
+
+    Implements the same list / read JSON / write JSON contract as `BlobClient` on
+    top of the `azure.storage.blob.aio` SDK, plus `gather`-style batch helpers that
+    keep hundreds of blob operations in flight on a single event loop.
+
+    Async SDK clients are bound to the event loop they were created on, so each
+    instance owns its own pooled service client. Use it as an async context
+    manager so the underlying connections are closed when the work is done.
+
+    Payloads are serialized, encoded and decoded with the same serializers and codecs as `BlobClient`,
+    and every call is recorded in `BlobMetrics` in the same way. Writes follow the
+    `BlobClient` write path too: they go to the active `BlobWriteBuffer` if there
+    is one, record the content hash so unchanged blobs are not uploaded again,
+    and invalidate cached listings and disk cache entries of the blob. Calls are
+    not run under `BlobRequestPolicy`; retries are left to the async SDK's own
+    retry policy, and there is no per-call deadline or hedging.
+
+    Typical usage example:
+        async with AsyncBlobClient() as client:
+            results = await client.read_blobs_to_dicts(container="golf", input_filenames=names)
+
+    Attributes:
+        max_concurrency (int): Default number of in-flight operations for batch helpers.
+        cache (Optional[BlobDiskCache]): Disk cache whose entries writes invalidate.
+        codec (AbstractBlobCodec): Codec applied to payloads on write.
+        serializer (AbstractBlobSerializer): Serializer applied to documents on write.
+    """
+    max_concurrency = 64
+
+    def __init__(self, source: str = "backend", codec: Optional[str] = None, serializer: Optional[str] = None):
+        """
+        Initialize the AsyncBlobClient instance.
+
+        Args:
+            source (str): Where configuration variables are loaded from ("backend" or "frontend").
+            codec (Optional[str]): Codec used on write. Defaults to the `blob_codec` variable.
+            serializer (Optional[str]): Serializer used on write. Defaults to the `blob_serializer` variable.
+        """
+        super().__init__()
+        self.vars = Variables(source=source)
+
+        # Share the disk cache sync clients read through, so writes can invalidate it
+        self.cache = BlobDiskCache.for_directory(
+            directory=self.vars.blob_cache_directory,
+            max_bytes=self.vars.blob_cache_max_mb * 1024 * 1024,
+            max_age=self.vars.blob_cache_max_age
+        ) if self.vars.blob_cache_directory else None
+        self.codec = BlobCodecs.get(codec or self.vars.blob_codec)
+        self.serializer = BlobSerializers.get(serializer or self.vars.blob_serializer)
+        self._service_client = None
+
+    @property
+    def service_client(self) -> BlobServiceClient:
+        """
+        Return the async `BlobServiceClient`, creating it on first use.
+
+        Returns:
+            BlobServiceClient: Async service client shared by every call on this instance.
+        """
+        if self._service_client is None:
+            self._service_client = BlobServiceClient.from_connection_string(
+                self.vars.blob_account_connection_string
+            )
+        return self._service_client
+
+    def timed(self, operation: str, container: str, blob: Optional[str]) -> ContextManager[dict]:
+        """
+        Time a blob operation issued by this client and record it in `BlobMetrics`.
+
+        Args:
+            operation (str): Operation type (e.g. "read", "write", "list").
+            container (str): Container the operation targets.
+            blob (Optional[str]): Blob name or listing prefix.
+
+        Returns:
+            ContextManager[dict]: Context yielding the sample, whose `bytes` the block may set.
+        """
+        return BlobMetrics.timed(operation, container, blob, caller=type(self).__name__)
+
+    async def close(self) -> None:
+        """
+        Close the underlying async service client and its connection pool.
+
+        Returns: None
+        """
+        if self._service_client is not None:
+            await self._service_client.close()
+            self._service_client = None
+
+    async def __aenter__(self) -> "AsyncBlobClient":
+        """
+        Enter the async context.
+
+        Returns:
+            AsyncBlobClient: This client.
+        """
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        """
+        Close the client when leaving the async context.
+
+        Returns: None
+        """
+        await self.close()
+
+    async def list_blob_filenames(
+        self,
+        container_name: str,
+        directory_path: Optional[str] = ""
+    ) -> List[str]:
+        """
+        List blob filenames in a container, optionally filtered by a directory prefix.
+
+        Args:
+            container_name (str): Name of the container.
+            directory_path (Optional[str]): Directory prefix inside the container.
+
+        Returns:
+            List[str]: List of blob names matching the prefix.
+        """
+        # Collect a list of files in a container
+        container_client = self.service_client.get_container_client(container_name)
+        with self.timed("list", container_name, directory_path):
+            return [blob.name async for blob in container_client.list_blobs(name_starts_with=directory_path)]
+
+    async def export_dict_to_blob(
+        self,
+        data: list,
+        container: str,
+        output_filename: str
+    ) -> bool:
+        """
+        Upload a Python list or dictionary to Azure Blob Storage as a JSON file.
+
+        Args:
+            data (list): The Python object to be serialized and uploaded.
+            container (str): Name of the Azure Blob Storage container.
+            output_filename (str): The blob name under which the JSON data will be saved.
+
+        Returns:
+            bool: False if the upload was skipped because the blob was unchanged, True otherwise.
+        """
+        # Serialize and encode the data, recording the format, codec and content hash
+        serialized = self.serializer.dumps(data)
+        return await self.submit_write(BufferedWrite(
+            container=container,
+            name=output_filename,
+            data=self.codec.encode(serialized),
+            content_type=self.serializer.content_type,
+            content_encoding=self.codec.name,
+            caller=type(self).__name__,
+            content_hash=hashlib.sha256(serialized).hexdigest()
+        ))
+
+    async def submit_write(self, write: BufferedWrite) -> bool:
+        """
+        Hand an encoded payload to the active write-behind buffer, or upload it straight away.
+
+        As in `BlobClient.upload_stored_blob`, a blob already holding the same
+        content hash is left alone, and a write drops cached copies and listings
+        of the previous version.
+
+        Args:
+            write (BufferedWrite): The payload and the content settings to store it with.
+
+        Returns:
+            bool: False if the upload was skipped because the blob was unchanged, True if it was
+                uploaded or buffered.
+        """
+        if BlobClient.write_buffer is not None:
+            await asyncio.to_thread(BlobClient.write_buffer.put, write)
+            return True
+
+        # Upload the stored bytes with their Content-Type, Content-Encoding and content hash
+        blob_client = self.service_client.get_blob_client(container=write.container, blob=write.name)
+        content_settings = ContentSettings(content_type=write.content_type, content_encoding=write.content_encoding)
+        metadata = {BlobClient.content_hash_key: write.content_hash} if write.content_hash else None
+        with self.timed("write", write.container, write.name) as sample:
+
+            # Leave the blob alone when it already holds the same content
+            if BlobClient.skip_unchanged and write.content_hash \
+                    and await self.stored_content_hash(blob_client) == write.content_hash:
+                sample["operation"] = "write_skipped"
+                return False
+
+            sample["bytes"] = len(write.data)
+            await blob_client.upload_blob(write.data, overwrite=True, content_settings=content_settings,
+                                          metadata=metadata)
+
+        # Drop cached copies and listings of the previous version
+        BlobListingCache.invalidate(self.vars.blob_account_connection_string, write.container, write.name)
+        if self.cache is not None:
+            self.cache.invalidate(write.container, write.name)
+        return True
+
+    async def stored_content_hash(self, blob_client: Any) -> Optional[str]:
+        """
+        Fetch the content hash recorded on the stored version of a blob.
+
+        Args:
+            blob_client (Any): Async SDK client of the blob.
+
+        Returns:
+            Optional[str]: The recorded hash, or None if the blob does not exist, has no hash
+                or its properties could not be read.
+        """
+        try:
+            properties = await blob_client.get_blob_properties()
+        except HttpResponseError:
+            return None
+        return (properties.metadata or {}).get(BlobClient.content_hash_key)
+
+    async def read_blob_to_dict(
+        self,
+        container: str,
+        input_filename: str
+    ) -> Union[list, dict]:
+        """
+        Download and deserialize JSON data from Azure Blob Storage.
+
+        Args:
+            container (str): Name of the Azure Blob Storage container to read from.
+            input_filename (str): The name of the blob (JSON file) to retrieve.
+
+        Returns:
+            Union[list, dict]: The deserialized JSON content.
+
+        Raises:
+            json.JSONDecodeError: If the blob content cannot be parsed as valid JSON.
+            azure.core.exceptions.ResourceNotFoundError: If the specified blob does not exist.
+        """
+        # Download the stored blob content as bytes
+        blob_client = self.service_client.get_blob_client(container=container, blob=input_filename)
+        with self.timed("read", container, input_filename) as sample:
+            download_stream = await blob_client.download_blob(decompress=False)
+            blob_data = await download_stream.readall()
+            sample["bytes"] = len(blob_data)
+
+        # Decode with the recorded codec and convert bytes to Python object with the recorded format
+        content_settings = download_stream.properties.content_settings
+        serializer = BlobSerializers.for_content_type(content_settings.content_type)
+        return serializer.loads(BlobCodecs.decode(blob_data, content_settings.content_encoding))
+
+    async def gather(
+        self,
+        awaitables: List[Awaitable],
+        max_concurrency: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Await many operations concurrently with a bound on how many are in flight.
+
+        Behaves like `asyncio.gather(..., return_exceptions=True)`: results are
+        returned in input order and exceptions are returned in place of results.
+
+        Args:
+            awaitables (List[Awaitable]): Operations to run.
+            max_concurrency (Optional[int]): Upper bound on in-flight operations. Defaults to `max_concurrency`.
+
+        Returns:
+            List[Any]: Result or raised exception for each awaitable, in input order.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+
+        # Wrap each awaitable so it only starts once a slot is free
+        async def bounded(awaitable: Awaitable) -> Any:
+            async with semaphore:
+                return await awaitable
+
+        return await asyncio.gather(*(bounded(awaitable) for awaitable in awaitables), return_exceptions=True)
+
+    async def read_blobs_to_dicts(
+        self,
+        container: str,
+        input_filenames: List[str],
+        max_concurrency: Optional[int] = None
+    ) -> List[BlobReadResult]:
+        """
+        Download and deserialize many JSON blobs concurrently.
+
+        Args:
+            container (str): Name of the Azure Blob Storage container to read from.
+            input_filenames (List[str]): Names of the blobs to retrieve.
+            max_concurrency (Optional[int]): Upper bound on in-flight downloads.
+
+        Returns:
+            List[BlobReadResult]: One result per blob in request order.
+        """
+        outcomes = await self.gather(
+            [self.read_blob_to_dict(container=container, input_filename=name) for name in input_filenames],
+            max_concurrency=max_concurrency
+        )
+
+        # Pair each outcome with its blob, keeping errors per blob
+        return [
+            BlobReadResult(name=name, error=outcome) if isinstance(outcome, BaseException)
+            else BlobReadResult(name=name, data=outcome)
+            for name, outcome in zip(input_filenames, outcomes)
+        ]
+
+    async def export_dicts_to_blobs(
+        self,
+        payloads: Dict[str, Union[list, dict]],
+        container: str,
+        max_concurrency: Optional[int] = None
+    ) -> BlobWriteReport:
+        """
+        Serialize and upload many Python objects to Azure Blob Storage concurrently.
+
+        Args:
+            payloads (Dict[str, Union[list, dict]]): Output blob names mapped to the data to upload.
+            container (str): Name of the Azure Blob Storage container.
+            max_concurrency (Optional[int]): Upper bound on in-flight uploads.
+
+        Returns:
+            BlobWriteReport: Aggregated report of which uploads succeeded and failed.
+        """
+        outcomes = await self.gather(
+            [self.export_dict_to_blob(data=data, container=container, output_filename=name)
+             for name, data in payloads.items()],
+            max_concurrency=max_concurrency
+        )
+
+        # Aggregate outcomes into a single report
+        report = BlobWriteReport()
+        for name, outcome in zip(payloads, outcomes):
+            if isinstance(outcome, BaseException):
+                report.failed[name] = outcome
+            else:
+                report.succeeded.append(name)
+
+        return report
@@ -0,0 +1,232 @@
+# Import dependencies
+from azure.core.exceptions import ResourceExistsError, ResourceModifiedError, ResourceNotFoundError
+from ..interfaces.blob_models import CatalogEntry
+from azure.storage.blob import ContentSettings
+from typing import List, Optional, Set
+from azure.core import MatchConditions
+from .blob_client import BlobClient
+from .blob_serializers import BlobSerializers
+from .blob_codecs import BlobCodecs
+from dataclasses import asdict
+import random
+import time
+
+class BlobCatalog(BlobClient):
+    """
+    A single catalog blob recording every ingested round and range session.
+
+    Pipelines add records as they ingest data, and readers query the catalog
+    instead of enumerating container prefixes. Updates are read-modify-write
+    transactions guarded by the catalog blob's ETag (optimistic concurrency):
+    a write only succeeds if nobody replaced the catalog since it was read,
+    otherwise the update is retried against the new version.
+
+    Typical usage example:
+        catalog = BlobCatalog(source="frontend")
+        rounds = catalog.entries(kind="round", course="braid_hills")
+
+    Attributes:
+        container (str): Container holding the catalog.
+        catalog_name (str): Blob name of the catalog.
+        max_attempts (int): Attempts made by `record` before giving up on a contended catalog.
+    """
+    container = "golf"
+    catalog_name = "catalog/ingest_catalog.json"
+    max_attempts = 5
+
+    def entries(
+        self,
+        kind: Optional[str] = None,
+        course: Optional[str] = None,
+        club: Optional[str] = None
+    ) -> List[CatalogEntry]:
+        """
+        Query catalog records, most recent first.
+
+        Args:
+            kind (Optional[str]): Only return records of this kind ("round" or "session").
+            course (Optional[str]): Only return rounds whose course contains this name (case-insensitive).
+            club (Optional[str]): Only return sessions in which this club was hit.
+
+        Returns:
+            List[CatalogEntry]: Matching records ordered by date, newest first.
+        """
+        # Read the catalog, treating a missing catalog as empty
+        try:
+            document = self.read_blob_to_dict(container=self.container, input_filename=self.catalog_name)
+        except ResourceNotFoundError:
+            return []
+
+        # Apply the requested filters
+        records = [CatalogEntry(**record) for record in document["entries"].values()]
+        if kind is not None:
+            records = [record for record in records if record.kind == kind]
+        if course is not None:
+            records = [record for record in records if course.lower() in (record.course or "").lower()]
+        if club is not None:
+            records = [record for record in records if club in record.clubs]
+
+        return sorted(records, key=lambda record: record.date, reverse=True)
+
+    def ids(self, kind: str) -> Set[str]:
+        """
+        Identifiers of every catalogued record of a kind.
+
+        Args:
+            kind (str): Record kind ("round" or "session").
+
+        Returns:
+            Set[str]: Source system identifiers.
+        """
+        return {record.id for record in self.entries(kind=kind)}
+
+    def exists(self) -> bool:
+        """
+        Whether the catalog blob has been created.
+
+        Returns:
+            bool: True if the catalog exists.
+        """
+        return self.service_client.get_blob_client(container=self.container, blob=self.catalog_name).exists()
+
+    def record(self, entries: List[CatalogEntry]) -> None:
+        """
+        Add or replace records in the catalog in a single conditional write.
+
+        Args:
+            entries (List[CatalogEntry]): Records to add; records with the same kind and id are replaced.
+
+        Returns: None
+
+        Raises:
+            azure.core.exceptions.ResourceModifiedError: If the catalog kept changing for `max_attempts` attempts.
+        """
+        if not entries:
+            return
+
+        blob_client = self.service_client.get_blob_client(container=self.container, blob=self.catalog_name)
+        for attempt in range(1, self.max_attempts + 1):
+
+            # Read the current catalog and the version it was read at
+            try:
+                with self.timed("read", self.container, self.catalog_name) as sample:
+                    download_stream = blob_client.download_blob(decompress=False)
+                    stored = download_stream.readall()
+                    sample["bytes"] = len(stored)
+                etag = download_stream.properties.etag
+                content_settings = download_stream.properties.content_settings
+                document = BlobSerializers.for_content_type(content_settings.content_type).loads(
+                    BlobCodecs.decode(stored, content_settings.content_encoding))
+            except ResourceNotFoundError:
+                etag, document = None, {"entries": {}}
+
+            # Merge the new records
+            for entry in entries:
+                document["entries"][entry.key] = asdict(entry)
+
+            # Write only if the catalog is unchanged since it was read (or still missing)
+            conditions = {"etag": etag, "match_condition": MatchConditions.IfNotModified} if etag else {}
+            encoded = self.codec.encode(self.serializer.dumps(document))
+            try:
+                with self.timed("write", self.container, self.catalog_name) as sample:
+                    sample["bytes"] = len(encoded)
+                    blob_client.upload_blob(
+                        encoded,
+                        overwrite=etag is not None,
+                        content_settings=ContentSettings(content_type=self.serializer.content_type,
+                                                         content_encoding=self.codec.name),
+                        **conditions
+                    )
+                break
+
+            # Another writer got there first, back off and retry against the new version
+            except (ResourceModifiedError, ResourceExistsError):
+                if attempt == self.max_attempts:
+                    raise
+                time.sleep(random.uniform(0, 0.1 * 2 ** attempt))
+
+        # Drop cached copies of the previous catalog version
+        self.invalidate_cached_blob(self.container, self.catalog_name)
+
+    def rebuild(self) -> List[CatalogEntry]:
+        """
+        Rebuild the catalog from the blobs already in storage.
+
+        This is the one place that enumerates the scorecard and session prefixes;
+        it bootstraps a catalog for data ingested before the catalog existed.
+
+        Returns:
+            List[CatalogEntry]: Records written to the catalog.
+        """
+        entries = []
+
+        # Scorecards are stored as scorecards/{course}_{date}_{id}.json
+        for name in self.list_blob_filenames(container_name=self.container, directory_path="scorecards/"):
+            entry = self.round_entry(blob_name=name)
+            if entry is not None:
+                entries.append(entry)
+
+        # Sessions are stored as trackman_session_summary/{date}-session-{id}.json, clubs come from the report
+        session_names = self.list_blob_filenames(container_name=self.container,
+                                                 directory_path="trackman_session_summary/")
+        for result in self.read_blobs_to_dicts(container=self.container, input_filenames=session_names):
+            if result.ok:
+                entries.append(self.session_entry(blob_name=result.name, report=result.data))
+
+        self.record(entries)
+        return entries
+
+    def ensure(self) -> None:
+        """
+        Bootstrap the catalog from storage if it does not exist yet.
+
+        Returns: None
+        """
+        if not self.exists():
+            self.rebuild()
+
+    @staticmethod
+    def round_entry(blob_name: str) -> Optional[CatalogEntry]:
+        """
+        Build the catalog record for a Hole19 scorecard from its blob name.
+
+        Scorecards are stored as `scorecards/{course}_{date}_{id}.json`; course names
+        may themselves contain underscores, so the name is split from the right.
+
+        Args:
+            blob_name (str): Blob the scorecard is stored in.
+
+        Returns:
+            Optional[CatalogEntry]: Round record, or None if the name does not follow the scorecard layout.
+        """
+        parts = blob_name.removeprefix("scorecards/").removesuffix(".json").rsplit("_", 2)
+        if not blob_name.endswith(".json") or len(parts) != 3:
+            return None
+
+        course, date, round_id = parts
+        return CatalogEntry(kind="round", id=round_id, date=date, blob_name=blob_name, course=course)
+
+    @staticmethod
+    def session_entry(blob_name: str, report: dict) -> CatalogEntry:
+        """
+        Build the catalog record for a TrackMan range session report.
+
+        Sessions are stored as `trackman_session_summary/{date}-session-{id}.json`, so
+        the date and id come from the blob name; a session without stroke groups is
+        recorded with no clubs.
+
+        Args:
+            blob_name (str): Blob the report is stored in.
+            report (dict): TrackMan session report.
+
+        Returns:
+            CatalogEntry: Session record with its date and clubs.
+        """
+        date, _, session_id = blob_name.removesuffix(".json").split("/")[-1].rpartition("-session-")
+        return CatalogEntry(
+            kind="session",
+            id=session_id,
+            date=date,
+            blob_name=blob_name,
+            clubs=sorted({group["Club"] for group in report.get("StrokeGroups") or []})
+        )
@@ -1,9 +1,26 @@
 # Install dependencies
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from ..interfaces.blob_client_base import AbstractBlobClient
-from azure.storage.blob import BlobServiceClient
-from typing import Optional, Union, List
+from ..interfaces.blob_models import BlobReadResult, BlobWriteReport, BlobEntry, BufferedWrite
+from .blob_service_registry import BlobServiceRegistry
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, Dict, Iterator, Optional, Sequence, Tuple, Union, List
+from azure.storage.blob import BlobServiceClient, ContentSettings
+from azure.core.exceptions import HttpResponseError
+from azure.core import MatchConditions
+from .blob_request_policy import BlobRequestPolicy
+from .blob_listing_cache import BlobListingCache
+from .blob_metrics import BlobMetrics
+from .blob_disk_cache import BlobDiskCache
+from .blob_serializers import BlobSerializers
+from .json_stream import JsonStream, PathKey
+from .blob_codecs import BlobCodecs
 from .variables import Variables
-import json
+import hashlib
+import time
+
+if TYPE_CHECKING:
+    from .blob_write_buffer import BlobWriteBuffer
+    from .blob_snapshot import SnapshotPack
 
 class BlobClient(AbstractBlobClient):
     """
@@ -19,6 +36,42 @@ class BlobClient(AbstractBlobClient):
     - Persisting application data (e.g., scorecards, reports) to blob storage.
     - Retrieving stored data for downstream processing.
 
+    All instances share pooled service and container clients through
+    `BlobServiceRegistry`, so constructing a `BlobClient` is cheap and repeated
+    calls reuse open keep-alive connections.
+
+    When a `BlobDiskCache` is configured (explicitly or via `blob_cache_directory`),
+    reads go through it: cached blobs are revalidated with a conditional GET on
+    their ETag and only downloaded again when they have changed.
+
+    Payloads are compressed with the configured codec (`blob_codec`, gzip by
+    default) and tagged with a matching Content-Encoding. Reads pick the codec
+    from that Content-Encoding, or from the payload's magic bytes, so blobs
+    written before compression was introduced keep working.
+
+    Every call to Azure is recorded in `BlobMetrics`, tagged with the container,
+    the blob's top-level prefix and the client's class name, so pipelines and
+    the dashboard can report where their blob I/O goes.
+
+    Reads, listings and unconditional writes run under a `BlobRequestPolicy`
+    (configured by the `blob_timeout`, `blob_retries`, `blob_backoff` and
+    `blob_hedge_percentile` variables), so a single slow or failed call is cut
+    off, retried with jittered backoff or, for reads, hedged with a duplicate.
+
+    Writes record a SHA-256 of their payload (before encoding) in the blob's
+    metadata. Before uploading, the stored blob's hash is fetched with a HEAD
+    request, and an unchanged payload is not uploaded again, leaving the blob,
+    its ETag and every cached copy of it untouched. Skipped uploads are recorded
+    in `BlobMetrics` as `write_skipped` operations.
+
+    While a `BlobWriteBuffer` is active, `export_dict_to_blob` and
+    `export_bytes_to_blob` hand their encoded payloads to it instead of uploading
+    them, and reads of a blob still held by the buffer are served from it.
+
+    While a dashboard snapshot is mapped (see `BlobSnapshot`), reads, streams and
+    listings of the blobs it packs are served from the local mapping without
+    contacting Azure.
+
     Inherits:
         AbstractBlobClient: Base class defining common blob client behavior.
         Variables: Provides configuration variables such as connection strings.
@@ -26,18 +79,128 @@ class BlobClient(AbstractBlobClient):
     Attributes:
         blob_account_connection_string (str): Inherited from `Variables`,
             used to authenticate and connect to the Azure Blob account.
+        max_workers (int): Default number of concurrent transfers for bulk operations.
+        stream_chunk_size (int): Bytes parsed at a time when streaming a blob from the dashboard snapshot.
+        cache (Optional[BlobDiskCache]): Read-through disk cache, or None when caching is disabled.
+        codec (AbstractBlobCodec): Codec applied to payloads on write.
+        policy (BlobRequestPolicy): Timeout, retry and hedging policy applied to blob calls.
+        write_buffer (Optional[BlobWriteBuffer]): Process-wide write-behind buffer, set while one is active.
+        snapshot (Optional[SnapshotPack]): Process-wide dashboard snapshot, set while one is mapped.
+        skip_unchanged (bool): Whether uploads of a payload identical to the stored one are skipped.
+        content_hash_key (str): Blob metadata key holding the payload hash.
     """
-    def __init__(self, source: str = "backend"):
+    max_workers = 8
+    stream_chunk_size = 64 * 1024
+    skip_unchanged = True
+    content_hash_key = "content_sha256"
+    write_buffer: Optional["BlobWriteBuffer"] = None
+    snapshot: Optional["SnapshotPack"] = None
+
+    def __init__(
+        self,
+        source: str = "backend",
+        cache: Optional[BlobDiskCache] = None,
+        codec: Optional[str] = None,
+        serializer: Optional[str] = None,
+        policy: Optional[BlobRequestPolicy] = None
+    ):
         """
         Initialize the BlobClient instance.
 
         Calls the parent class initializers (`AbstractBlobClient` and `Variables`)
         to ensure that the Azure Blob Storage connection string and other
         required configuration variables are set up before use.
+
+        Args:
+            source (str): Where configuration variables are loaded from ("backend" or "frontend").
+            cache (Optional[BlobDiskCache]): Disk cache for reads. Defaults to the shared cache in
+                `blob_cache_directory` when that variable is set.
+            codec (Optional[str]): Codec used on write. Defaults to the `blob_codec` variable.
+            serializer (Optional[str]): Serializer used on write. Defaults to the `blob_serializer` variable.
+            policy (Optional[BlobRequestPolicy]): Request policy for blob calls. Defaults to the policy configured
+                by the `blob_timeout`, `blob_retries`, `blob_backoff` and `blob_hedge_percentile` variables.
         """
         super().__init__()
         self.vars = Variables(source=source)
 
+        # Use the shared disk cache for the configured directory, if any
+        if cache is None and self.vars.blob_cache_directory:
+            cache = BlobDiskCache.for_directory(
+                directory=self.vars.blob_cache_directory,
+                max_bytes=self.vars.blob_cache_max_mb * 1024 * 1024,
+                max_age=self.vars.blob_cache_max_age
+            )
+        self.cache = cache
+        self.codec = BlobCodecs.get(codec or self.vars.blob_codec)
+        self.serializer = BlobSerializers.get(serializer or self.vars.blob_serializer)
+        self.policy = policy or BlobRequestPolicy.from_variables(self.vars)
+
+    @property
+    def service_client(self) -> BlobServiceClient:
+        """
+        Return the process-wide pooled `BlobServiceClient` for this storage account.
+
+        Returns:
+            BlobServiceClient: Shared service client keyed by the configured connection string.
+        """
+        return BlobServiceRegistry.get_service_client(self.vars.blob_account_connection_string)
+
+    def timed(self, operation: str, container: str, blob: Optional[str]) -> ContextManager[dict]:
+        """
+        Time a blob operation issued by this client and record it in `BlobMetrics`.
+
+        Args:
+            operation (str): Operation type (e.g. "read", "write", "list").
+            container (str): Container the operation targets.
+            blob (Optional[str]): Blob name or listing prefix.
+
+        Returns:
+            ContextManager[dict]: Context yielding the sample, whose `bytes` the block may set.
+        """
+        return BlobMetrics.timed(operation, container, blob, caller=type(self).__name__)
+
+    def guarded(
+        self,
+        operation: str,
+        function: Callable[[], Any],
+        container: str,
+        blob: Optional[str],
+        hedge: bool = False
+    ) -> Any:
+        """
+        Run a blob call under this client's request policy.
+
+        Args:
+            operation (str): Operation type (e.g. "read", "write", "list").
+            function (Callable[[], Any]): The call to make; must be safe to repeat.
+            container (str): Container the call targets.
+            blob (Optional[str]): Blob name or listing prefix.
+            hedge (bool): Whether the call may be hedged (reads only).
+
+        Returns:
+            Any: The call's result.
+        """
+        return self.policy.call(operation, function, container, blob, caller=type(self).__name__, hedge=hedge)
+
+    def export_metrics_report(self, pipeline: str, container: str = "golf") -> str:
+        """
+        Upload the blob I/O recorded in this process as a JSON report.
+
+        Reports are stored at `diagnostics/blob_io/{pipeline}/{timestamp}.json`,
+        where the dashboard's diagnostics page lists them.
+
+        Args:
+            pipeline (str): Name of the pipeline the report describes (e.g. "hole19").
+            container (str): Container to store the report in.
+
+        Returns:
+            str: Blob name of the uploaded report.
+        """
+        report = BlobMetrics.report(pipeline=pipeline)
+        output_filename = f"diagnostics/blob_io/{pipeline}/{report['generated_at']}.json"
+        self.export_dict_to_blob(data=report, container=container, output_filename=output_filename)
+        return output_filename
+
     def list_blob_filenames(
         self,
         container_name: str,
@@ -55,30 +218,91 @@ class BlobClient(AbstractBlobClient):
         Returns:
             List[str]: List of blob names matching the prefix.
         """
-        # Create blob service client + container client
-        blob_service_client = BlobServiceClient.from_connection_string(self.vars.blob_account_connection_string)
-        container_client = blob_service_client.get_container_client(container_name)
+        return [entry.name for entry in self.list_blob_entries(container_name, directory_path)]
+
+    def list_blob_entries(
+        self,
+        container_name: str,
+        directory_path: Optional[str] = "",
+        use_cache: bool = True
+    ) -> List[BlobEntry]:
+        """
+        List blobs in a container with their size, ETag and last-modified time.
 
-        # Collect a list of files in a container
-        blob_names = []
-        blobs_list = container_client.list_blobs(name_starts_with=directory_path)
-        for blob in blobs_list:
-            blob_names.append(blob.name)
+        Listings are served from the process-wide `BlobListingCache` while they are
+        younger than `blob_listing_ttl` seconds; writes made through any blob client
+        in this process invalidate the affected listings.
 
-        return blob_names
+        Args:
+            container_name (str): Name of the container.
+            directory_path (Optional[str]): Directory prefix inside the container (e.g. "folder1/subfolder/").
+            use_cache (bool): If False, always list from Azure (the fresh listing is still cached).
+
+        Returns:
+            List[BlobEntry]: Blobs matching the prefix, in name order.
+        """
+        account = self.vars.blob_account_connection_string
+        directory_path = directory_path or ""
+
+        # Answer listings of prefixes packed in the dashboard snapshot from the snapshot
+        snapshot = self.snapshot
+        if snapshot is not None and snapshot.covers(container_name, directory_path):
+            return snapshot.entries(container_name, directory_path)
+
+        # Serve a fresh cached listing when allowed
+        if use_cache and self.vars.blob_listing_ttl > 0:
+            entries = BlobListingCache.get(account, container_name, directory_path, ttl=self.vars.blob_listing_ttl)
+            if entries is not None:
+                return entries
+
+        # Collect the pooled container client
+        container_client = BlobServiceRegistry.get_container_client(account, container_name)
+
+        # Collect the blobs in the container with their properties
+        with self.timed("list", container_name, directory_path):
+            entries = self.guarded("list", lambda: [
+                BlobEntry(
+                    name=blob.name,
+                    size=blob.size,
+                    etag=blob.etag,
+                    last_modified=blob.last_modified,
+                    content_encoding=blob.content_settings.content_encoding
+                )
+                for blob in container_client.list_blobs(name_starts_with=directory_path)
+            ], container_name, directory_path)
+
+        BlobListingCache.put(account, container_name, directory_path, entries)
+        return entries
+
+    def invalidate_cached_blob(self, container: str, blob: str) -> None:
+        """
+        Drop cached content and listings that a write to a blob makes stale.
+
+        Args:
+            container (str): Name of the container written to.
+            blob (str): Name of the blob written.
+
+        Returns: None
+        """
+        BlobListingCache.invalidate(self.vars.blob_account_connection_string, container, blob)
+        if self.cache is not None:
+            self.cache.invalidate(container, blob)
 
     def export_dict_to_blob(
         self,
         data: list,
         container: str,
         output_filename: str
-    ) -> None:
+    ) -> bool:
         """
         Upload a Python list or dictionary to Azure Blob Storage as a JSON file.
 
-        The method serializes the given data into a JSON string, connects to the
-        specified Azure Blob Storage container, and writes the JSON to the given
-        blob filename. If the blob already exists, it will be overwritten.
+        The method serializes the given data with the client's serializer (JSON
+        unless configured otherwise), encodes it with the client's codec, connects
+        to the specified Azure Blob Storage container, and writes it to the given
+        blob filename with a matching Content-Type and Content-Encoding. If the
+        blob already exists, it will be overwritten, unless it already holds the
+        same serialized content.
 
         Args:
             data (list): The Python object (typically a list of dicts) to be serialized and uploaded.
@@ -86,23 +310,265 @@ class BlobClient(AbstractBlobClient):
             output_filename (str): The blob (file) name under which the JSON data will be saved.
 
         Returns:
-            None
+            bool: False if the upload was skipped because the blob was unchanged, True otherwise.
+        """
+        # Serialize and encode the data, recording the format, codec and content hash
+        serialized = self.serializer.dumps(data)
+        return self.submit_write(BufferedWrite(
+            container=container,
+            name=output_filename,
+            data=self.codec.encode(serialized),
+            content_type=self.serializer.content_type,
+            content_encoding=self.codec.name,
+            caller=type(self).__name__,
+            content_hash=hashlib.sha256(serialized).hexdigest()
+        ))
+
+    def submit_write(self, write: BufferedWrite) -> bool:
+        """
+        Hand an encoded payload to the active write-behind buffer, or upload it straight away.
+
+        Args:
+            write (BufferedWrite): The payload and the content settings to store it with.
+
+        Returns:
+            bool: False if the upload was skipped because the blob was unchanged, True if it was
+                uploaded or buffered.
+        """
+        if self.write_buffer is not None:
+            self.write_buffer.put(write)
+            return True
+        return self.upload_stored_blob(write)
+
+    def stored_content_hash(self, blob_client: Any, write: BufferedWrite) -> Optional[str]:
         """
-        # Convert the data to a JSON string
-        json_data = json.dumps(data)
+        Fetch the content hash recorded on the stored version of a blob.
 
-        # Connect to Azure Blob Storage
-        blob_service_client = BlobServiceClient.from_connection_string(
-            self.vars.blob_account_connection_string)
+        Args:
+            blob_client (Any): SDK client of the blob.
+            write (BufferedWrite): The write about to replace the blob.
+
+        Returns:
+            Optional[str]: The recorded hash, or None if the blob does not exist, has no hash
+                or its properties could not be read.
+        """
+        try:
+            properties = self.policy.call("head", blob_client.get_blob_properties, write.container, write.name,
+                                          caller=write.caller)
+        except HttpResponseError:
+            return None
+        return (properties.metadata or {}).get(self.content_hash_key)
 
+    def upload_stored_blob(self, write: BufferedWrite) -> bool:
+        """
+        Upload an already serialized and encoded payload, overwriting any existing blob.
+
+        When the write carries a content hash and the stored blob records the same
+        one, nothing is uploaded and cached copies are left valid. The upload (or
+        skip) is recorded in `BlobMetrics` under the client that issued the write,
+        which may differ from this client when a buffer flushes it.
+
+        Args:
+            write (BufferedWrite): The payload and the content settings to store it with.
+
+        Returns:
+            bool: False if the upload was skipped because the blob was unchanged, True otherwise.
+        """
         # Connect to the specific blob in the container
-        blob_client = blob_service_client.get_blob_client(
+        blob_client = self.service_client.get_blob_client(
+            container=write.container,
+            blob=write.name
+        )
+
+        # Upload the stored bytes with their Content-Type, Content-Encoding and content hash
+        content_settings = ContentSettings(content_type=write.content_type, content_encoding=write.content_encoding)
+        metadata = {self.content_hash_key: write.content_hash} if write.content_hash else None
+        with BlobMetrics.timed("write", write.container, write.name, caller=write.caller) as sample:
+
+            # Leave the blob alone when it already holds the same content
+            if self.skip_unchanged and write.content_hash \
+                    and self.stored_content_hash(blob_client, write) == write.content_hash:
+                sample["operation"] = "write_skipped"
+                return False
+
+            sample["bytes"] = len(write.data)
+            self.policy.call("write", lambda: blob_client.upload_blob(
+                write.data,
+                overwrite=True,
+                content_settings=content_settings,
+                metadata=metadata
+            ), write.container, write.name, caller=write.caller)
+
+        # Drop cached copies and listings of the previous version
+        self.invalidate_cached_blob(write.container, write.name)
+        return True
+
+    def download_blob_bytes(
+        self,
+        container: str,
+        input_filename: str
+    ) -> bytes:
+        """
+        Download and decode the content of a blob.
+
+        The codec is chosen from the blob's Content-Encoding, falling back to the
+        payload's magic bytes, so compressed and uncompressed blobs read alike.
+
+        Args:
+            container (str): Name of the Azure Blob Storage container to read from.
+            input_filename (str): The name of the blob to retrieve.
+
+        Returns:
+            bytes: The decoded blob content.
+
+        Raises:
+            azure.core.exceptions.ResourceNotFoundError: If the specified blob does not exist.
+            ValueError: If the blob uses a codec that is not available.
+        """
+        data, properties = self.download_stored_blob(container=container, input_filename=input_filename)
+        return BlobCodecs.decode(data, properties.get("content_encoding"))
+
+    def download_stored_blob(
+        self,
+        container: str,
+        input_filename: str
+    ) -> tuple[bytes, dict]:
+        """
+        Download the stored (still encoded) content of a blob, going through the disk cache when configured.
+
+        A cached copy validated within the cache's `max_age` is returned without
+        contacting Azure. Otherwise the blob is fetched with a conditional GET on the
+        cached ETag, so an unchanged blob costs a single 304 response with no body.
+
+        Args:
+            container (str): Name of the Azure Blob Storage container to read from.
+            input_filename (str): The name of the blob to retrieve.
+
+        Returns:
+            tuple[bytes, dict]: The stored content (a `memoryview` when served from the dashboard snapshot)
+                and the properties needed to decode it (`content_encoding` and `content_type`).
+
+        Raises:
+            azure.core.exceptions.ResourceNotFoundError: If the specified blob does not exist.
+        """
+        # Serve writes still held by the write-behind buffer
+        buffered = self.write_buffer.get(container, input_filename) if self.write_buffer is not None else None
+        if buffered is not None:
+            return buffered.data, buffered.properties
+
+        # Serve blobs packed in the dashboard snapshot as zero-copy views of the mapping
+        packed = self.snapshot.get(container, input_filename) if self.snapshot is not None else None
+        if packed is not None:
+            BlobMetrics.record("read_snapshot", container, input_filename, caller=type(self).__name__, seconds=0.0)
+            return packed
+
+        # Define blob client from the pooled service client
+        blob_client = self.service_client.get_blob_client(
             container=container,
-            blob=output_filename
+            blob=input_filename
         )
 
-        # Upload the JSON string to Azure Blob Storage
-        blob_client.upload_blob(json_data, overwrite=True)
+        # Serve fresh cache entries without a request
+        cached = self.cache.get(container, input_filename) if self.cache is not None else None
+        if cached is not None and self.cache.is_fresh(cached):
+            self.cache.record_hit(container, input_filename, revalidated=False)
+            BlobMetrics.record("read_cached", container, input_filename, caller=type(self).__name__, seconds=0.0)
+            return cached.data, cached.properties
+
+        # Download the stored bytes (the SDK would otherwise try to decompress them itself),
+        # or only confirm the cached version is current
+        def download() -> tuple:
+            if cached is None:
+                download_stream = blob_client.download_blob(decompress=False)
+            else:
+                download_stream = blob_client.download_blob(
+                    decompress=False,
+                    etag=cached.etag,
+                    match_condition=MatchConditions.IfModified
+                )
+            return download_stream, download_stream.readall()
+
+        # Body transfer is part of the guarded call, so slow transfers are timed out and hedged too
+        with self.timed("read", container, input_filename) as sample:
+            try:
+                download_stream, blob_data = self.guarded("read", download, container, input_filename, hedge=True)
+            except HttpResponseError as e:
+                if cached is None or e.status_code != 304:
+                    raise
+                sample["operation"] = "read_revalidated"
+                self.cache.record_hit(container, input_filename, revalidated=True)
+                return cached.data, cached.properties
+
+            sample["bytes"] = len(blob_data)
+
+        # Store the new version for the next read
+        content_settings = download_stream.properties.content_settings
+        properties = {"content_encoding": content_settings.content_encoding,
+                      "content_type": content_settings.content_type}
+        if self.cache is not None:
+            self.cache.put(container, input_filename, etag=download_stream.properties.etag, data=blob_data,
+                           properties=properties)
+        return blob_data, properties
+
+    def recompress_blob(
+        self,
+        container: str,
+        input_filename: str,
+        codec: Optional[str] = None
+    ) -> tuple[int, int]:
+        """
+        Re-encode a stored blob with another codec, leaving its content and format unchanged.
+
+        The rewrite is conditional on the ETag that was read, so a blob updated
+        concurrently is never overwritten with stale content. The blob's metadata,
+        including its content hash, is carried over unchanged.
+
+        Args:
+            container (str): Name of the Azure Blob Storage container.
+            input_filename (str): The name of the blob to re-encode.
+            codec (Optional[str]): Target codec. Defaults to the client's codec.
+
+        Returns:
+            tuple[int, int]: Stored size in bytes before and after re-encoding.
+
+        Raises:
+            azure.core.exceptions.ResourceModifiedError: If the blob changed while being re-encoded.
+        """
+        target = BlobCodecs.get(codec) if codec else self.codec
+
+        # Download the stored bytes together with their entity tag
+        blob_client = self.service_client.get_blob_client(container=container, blob=input_filename)
+        with self.timed("read", container, input_filename) as sample:
+            download_stream = blob_client.download_blob(decompress=False)
+            stored = download_stream.readall()
+            sample["bytes"] = len(stored)
+        current = BlobCodecs.detect(stored, download_stream.properties.content_settings.content_encoding)
+
+        # Leave blobs already written with the target codec untouched
+        if current.name == target.name:
+            return len(stored), len(stored)
+
+        # Rewrite the payload only if nobody replaced it in the meantime, keeping its
+        # metadata since the content hash covers the serialized payload, not the encoding
+        encoded = target.encode(current.decode(stored))
+        with self.timed("write", container, input_filename) as sample:
+            sample["bytes"] = len(encoded)
+            self.guarded("write", lambda: blob_client.upload_blob(
+                encoded,
+                overwrite=True,
+                content_settings=ContentSettings(
+                    content_type=download_stream.properties.content_settings.content_type or "application/json",
+                    content_encoding=target.name
+                ),
+                metadata=download_stream.properties.metadata or None,
+                etag=download_stream.properties.etag,
+                match_condition=MatchConditions.IfNotModified
+            ), container, input_filename)
+
+        # Drop cached copies and listings of the previous encoding
+        self.invalidate_cached_blob(container, input_filename)
+
+        return len(stored), len(encoded)
 
     def read_blob_to_dict(
         self,
@@ -113,8 +579,9 @@ class BlobClient(AbstractBlobClient):
         Download and deserialize JSON data from Azure Blob Storage.
 
         This method connects to the specified Azure Blob Storage container, retrieves
-        the contents of the given blob, and converts the JSON data into a native Python
-        object (list or dictionary).
+        the contents of the given blob, and converts the data into a native Python
+        object (list or dictionary). The decoder is chosen from the blob's Content-Type,
+        so JSON and MessagePack blobs read alike.
 
         Args:
             container (str): Name of the Azure Blob Storage container to read from.
@@ -128,20 +595,308 @@ class BlobClient(AbstractBlobClient):
             azure.core.exceptions.ResourceNotFoundError: If the specified blob does not exist.
             Exception: For other unexpected errors during retrieval or parsing.
         """
-        # Define blob service client
-        blob_service_client = BlobServiceClient.from_connection_string(
-            self.vars.blob_account_connection_string
-        )
+        # Download blob content as bytes
+        data, properties = self.download_stored_blob(container=container, input_filename=input_filename)
+        blob_data = BlobCodecs.decode(data, properties.get("content_encoding"))
+
+        # Convert bytes to Python object with the decoder matching the blob's format
+        return BlobSerializers.for_content_type(properties.get("content_type")).loads(blob_data)
+
+    def iter_blob_json(
+        self,
+        container: str,
+        input_filename: str,
+        patterns: Sequence[Sequence[PathKey]]
+    ) -> Iterator[Tuple[tuple, Any]]:
+        """
+        Stream selected values out of a JSON blob without loading the whole document.
+
+        The blob is downloaded chunk by chunk, decoded incrementally with the codec
+        it was written with, and parsed by `JsonStream`, so peak memory is bounded by
+        the largest selected value rather than by the blob size. Streaming reads
+        do not use or populate the disk cache; writes still held by the write-behind
+        buffer and blobs packed in the dashboard snapshot are parsed from memory in
+        chunks of the same size. Only the downloads are recorded as stream latency.
+
+        Args:
+            container (str): Name of the Azure Blob Storage container to read from.
+            input_filename (str): The name of the blob (JSON file) to stream.
+            patterns (Sequence[Sequence[PathKey]]): Paths of the values to yield, "*" matching any key or index
+                (e.g. [("StrokeGroups", "*", "Club")]).
+
+        Returns:
+            Iterator[Tuple[tuple, Any]]: Path and decoded value of each selected value, in document order.
+
+        Raises:
+            ValueError: If the blob content is not valid JSON, e.g. it was written with a binary serializer.
+            azure.core.exceptions.ResourceNotFoundError: If the specified blob does not exist.
+        """
+        # Parse writes held by the write-behind buffer, then blobs packed in the dashboard snapshot, from memory
+        buffered = self.write_buffer.get(container, input_filename) if self.write_buffer is not None else None
+        packed = self.snapshot.get(container, input_filename) \
+            if buffered is None and self.snapshot is not None else None
+        if buffered is not None or packed is not None:
+            data, properties = (buffered.data, buffered.properties) if buffered is not None else packed
+            if BlobSerializers.for_content_type(properties["content_type"]).content_type != "application/json":
+                raise ValueError(f"Cannot stream {input_filename}, it is stored as {properties['content_type']}")
+            BlobMetrics.record("stream_buffered" if buffered is not None else "stream_snapshot", container,
+                               input_filename, caller=type(self).__name__, seconds=0.0)
+            chunks = (bytes(data[start:start + self.stream_chunk_size])
+                      for start in range(0, len(data), self.stream_chunk_size))
+            yield from JsonStream(patterns=patterns).iter_items(
+                BlobCodecs.decode_stream(chunks, properties["content_encoding"]))
+            return
+
+        # Time only the calls that fetch stored bytes, not the parsing or the consumer's work between values
+        sample = {"seconds": 0.0, "bytes": 0, "error": False}
 
-        # Define container client
-        blob_client = blob_service_client.get_blob_client(
+        def fetch(call: Callable[[], Any]) -> Any:
+            started = time.perf_counter()
+            try:
+                return call()
+            except Exception:
+                sample["error"] = True
+                raise
+            finally:
+                sample["seconds"] += time.perf_counter() - started
+
+        # Count the stored bytes as they arrive
+        def fetched(chunks: Iterator[bytes]) -> Iterator[bytes]:
+            while (chunk := fetch(lambda: next(chunks, None))) is not None:
+                sample["bytes"] += len(chunk)
+                yield chunk
+
+        try:
+            # Open a chunked download of the stored bytes
+            blob_client = self.service_client.get_blob_client(container=container, blob=input_filename)
+            download_stream = fetch(lambda: self.guarded(
+                "stream", lambda: blob_client.download_blob(decompress=False), container, input_filename))
+            content_encoding = download_stream.properties.content_settings.content_encoding
+
+            # Only JSON documents can be parsed incrementally
+            content_type = download_stream.properties.content_settings.content_type
+            if BlobSerializers.for_content_type(content_type).content_type != "application/json":
+                raise ValueError(f"Cannot stream {input_filename}, it is stored as {content_type}")
+
+            # Decode and parse the chunks as they are downloaded
+            chunks = BlobCodecs.decode_stream(fetched(download_stream.chunks()), content_encoding)
+            yield from JsonStream(patterns=patterns).iter_items(chunks)
+        finally:
+            BlobMetrics.record("stream", container, input_filename, caller=type(self).__name__,
+                               seconds=sample["seconds"], nbytes=sample["bytes"], error=sample["error"])
+
+    def iter_stroke_groups(self, container: str, input_filename: str) -> Iterator[dict]:
+        """
+        Stream the stroke groups of a TrackMan session report one at a time.
+
+        Args:
+            container (str): Name of the Azure Blob Storage container to read from.
+            input_filename (str): The name of the session report blob.
+
+        Returns:
+            Iterator[dict]: Each entry of the report's `StrokeGroups`, in order.
+        """
+        for _, group in self.iter_blob_json(container, input_filename, patterns=[("StrokeGroups", "*")]):
+            yield group
+
+    def iter_session_strokes(
+        self,
+        container: str,
+        input_filename: str,
+        clubs: Optional[Sequence[str]] = None
+    ) -> Iterator[Tuple[str, dict]]:
+        """
+        Stream the strokes of a TrackMan session report one at a time.
+
+        Only each group's `Club` and its individual strokes are decoded. Strokes
+        are yielded as soon as they are parsed once their group's club is known;
+        strokes that precede the `Club` key in a group are held until it arrives.
+
+        Args:
+            container (str): Name of the Azure Blob Storage container to read from.
+            input_filename (str): The name of the session report blob.
+            clubs (Optional[Sequence[str]]): Only yield strokes hit with these clubs. Defaults to every club.
+
+        Returns:
+            Iterator[Tuple[str, dict]]: Each stroke paired with the club it was hit with.
+        """
+        patterns = [("StrokeGroups", "*", "Club"), ("StrokeGroups", "*", "Strokes", "*")]
+        group, club, held = None, None, []
+        for path, value in self.iter_blob_json(container, input_filename, patterns=patterns):
+
+            # Start a new stroke group
+            if path[1] != group:
+                group, club, held = path[1], None, []
+
+            # Release strokes held until the club was known
+            if path[2] == "Club":
+                club = value
+                if clubs is None or club in clubs:
+                    yield from ((club, stroke) for stroke in held)
+                held = []
+            elif club is None:
+                held.append(value)
+            elif clubs is None or club in clubs:
+                yield club, value
+
+    def read_blobs_to_dicts(
+        self,
+        container: str,
+        input_filenames: List[str],
+        max_workers: Optional[int] = None,
+        ordered: bool = True
+    ) -> Iterator[BlobReadResult]:
+        """
+        Download and deserialize many JSON blobs concurrently.
+
+        Each blob is read through `read_blob_to_dict` on a bounded thread pool, so
+        wall time scales with the pool size rather than with the number of blobs.
+        A failure on one blob is captured on its `BlobReadResult` and does not
+        abort the rest of the batch.
+
+        Args:
+            container (str): Name of the Azure Blob Storage container to read from.
+            input_filenames (List[str]): Names of the blobs (JSON files) to retrieve.
+            max_workers (Optional[int]): Upper bound on concurrent downloads. Defaults to `max_workers`.
+            ordered (bool): If True, yield results in the order of `input_filenames`;
+                otherwise yield each result as soon as its download completes.
+
+        Returns:
+            Iterator[BlobReadResult]: One result per requested blob.
+        """
+        # Submit every download to a bounded thread pool
+        executor = ThreadPoolExecutor(max_workers=max_workers or self.max_workers)
+        futures = [
+            (name, executor.submit(self.read_blob_to_dict, container=container, input_filename=name))
+            for name in input_filenames
+        ]
+        names = {future: name for name, future in futures}
+
+        try:
+            # Yield results in request order or in completion order
+            pending = [future for _, future in futures] if ordered else as_completed(names)
+            for future in pending:
+                try:
+                    yield BlobReadResult(name=names[future], data=future.result())
+                except Exception as e:
+                    yield BlobReadResult(name=names[future], error=e)
+
+        # Abandon outstanding downloads if the caller stops iterating early
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def export_dicts_to_blobs(
+        self,
+        payloads: Dict[str, Union[list, dict]],
+        container: str,
+        max_workers: Optional[int] = None
+    ) -> BlobWriteReport:
+        """
+        Serialize and upload many Python objects to Azure Blob Storage concurrently.
+
+        Each payload is written through `export_dict_to_blob` on a bounded thread pool,
+        turning a series of sequential round trips into a single parallel flush. Every
+        upload is attempted; failures are collected into the returned report rather
+        than aborting the batch.
+
+        Args:
+            payloads (Dict[str, Union[list, dict]]): Output blob names mapped to the data to upload.
+            container (str): Name of the Azure Blob Storage container where the data will be stored.
+            max_workers (Optional[int]): Upper bound on concurrent uploads. Defaults to `max_workers`.
+
+        Returns:
+            BlobWriteReport: Aggregated report of which uploads succeeded and failed.
+        """
+        return self._export_concurrently(self.export_dict_to_blob, payloads, container, max_workers)
+
+    def export_bytes_to_blob(
+        self,
+        data: bytes,
+        container: str,
+        output_filename: str,
+        content_type: str = "application/octet-stream"
+    ) -> bool:
+        """
+        Upload an already serialized binary payload (e.g. a Parquet file) to Azure Blob Storage.
+
+        The payload is stored as-is, without a codec, since binary formats carry their
+        own compression. If the blob already exists, it will be overwritten, unless it
+        already holds the same bytes.
+
+        Args:
+            data (bytes): The payload to upload.
+            container (str): Name of the Azure Blob Storage container where the data will be stored.
+            output_filename (str): The blob (file) name under which the data will be saved.
+            content_type (str): MIME type recorded on the blob.
+
+        Returns:
+            bool: False if the upload was skipped because the blob was unchanged, True otherwise.
+        """
+        # Store the payload as-is, recording its format and content hash
+        return self.submit_write(BufferedWrite(
             container=container,
-            blob=input_filename
-        )
+            name=output_filename,
+            data=data,
+            content_type=content_type,
+            caller=type(self).__name__,
+            content_hash=hashlib.sha256(data).hexdigest()
+        ))
 
-        # Download blob content as bytes
-        download_stream = blob_client.download_blob()
-        blob_data = download_stream.readall()
+    def export_bytes_to_blobs(
+        self,
+        payloads: Dict[str, bytes],
+        container: str,
+        max_workers: Optional[int] = None
+    ) -> BlobWriteReport:
+        """
+        Upload many binary payloads to Azure Blob Storage concurrently.
+
+        Args:
+            payloads (Dict[str, bytes]): Output blob names mapped to the payload to upload.
+            container (str): Name of the Azure Blob Storage container where the data will be stored.
+            max_workers (Optional[int]): Upper bound on concurrent uploads. Defaults to `max_workers`.
+
+        Returns:
+            BlobWriteReport: Aggregated report of which uploads succeeded and failed.
+        """
+        return self._export_concurrently(self.export_bytes_to_blob, payloads, container, max_workers)
+
+    def _export_concurrently(
+        self,
+        export: Callable,
+        payloads: dict,
+        container: str,
+        max_workers: Optional[int] = None
+    ) -> BlobWriteReport:
+        """
+        Run a single-blob export function for every payload on a bounded thread pool.
+
+        Args:
+            export (Callable): Export function accepting `data`, `container` and `output_filename`.
+            payloads (dict): Output blob names mapped to the data to upload.
+            container (str): Name of the Azure Blob Storage container where the data will be stored.
+            max_workers (Optional[int]): Upper bound on concurrent uploads. Defaults to `max_workers`.
+
+        Returns:
+            BlobWriteReport: Aggregated report of which uploads succeeded and failed.
+        """
+        report = BlobWriteReport()
+
+        # Upload every payload on a bounded thread pool
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as executor:
+            futures = {
+                executor.submit(export, data=data, container=container, output_filename=name): name
+                for name, data in payloads.items()
+            }
+
+            # Collect the outcome of each upload as it completes
+            for future in as_completed(futures):
+                try:
+                    uploaded = future.result()
+                    report.succeeded.append(futures[future])
+                    if uploaded is False:
+                        report.skipped.append(futures[future])
+                except Exception as e:
+                    report.failed[futures[future]] = e
 
-        # Convert bytes to Python object
-        return json.loads(blob_data)
+        return report
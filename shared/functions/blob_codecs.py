@@ -0,0 +1,218 @@
+# Import dependencies
+from ..interfaces.blob_codec_base import AbstractBlobCodec
+from typing import Iterable, Iterator, Optional
+import itertools
+import gzip
+import zlib
+
+# zstandard is an optional dependency
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+class IdentityCodec(AbstractBlobCodec):
+    """
+    Pass-through codec for uncompressed blobs.
+    """
+    name = "identity"
+
+    def encode(self, data: bytes) -> bytes:
+        """
+        Return the payload unchanged.
+        """
+        return data
+
+    def decode(self, data: bytes) -> bytes:
+        """
+        Return the payload unchanged.
+        """
+        return data
+
+    def decode_stream(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Pass chunks through unchanged.
+        """
+        yield from chunks
+
+class GzipCodec(AbstractBlobCodec):
+    """
+    gzip codec, available everywhere through the standard library.
+
+    Attributes:
+        level (int): Compression level between 1 (fastest) and 9 (smallest).
+    """
+    name = "gzip"
+    magic = b"\x1f\x8b"
+
+    def __init__(self, level: int = 6):
+        """
+        Initialize the codec with a compression level.
+        """
+        self.level = level
+
+    def encode(self, data: bytes) -> bytes:
+        """
+        Compress a payload with gzip.
+        """
+        # mtime is pinned so identical payloads encode to identical bytes
+        return gzip.compress(data, compresslevel=self.level, mtime=0)
+
+    def decode(self, data: bytes) -> bytes:
+        """
+        Decompress a gzip payload.
+        """
+        return gzip.decompress(data)
+
+    def decode_stream(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Decompress a gzip payload chunk by chunk.
+        """
+        decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        for chunk in chunks:
+            yield decompressor.decompress(chunk)
+        yield decompressor.flush()
+
+class ZstdCodec(AbstractBlobCodec):
+    """
+    Zstandard codec, registered only when the `zstandard` package is installed.
+
+    Attributes:
+        level (int): Compression level, higher is smaller and slower.
+    """
+    name = "zstd"
+    magic = b"\x28\xb5\x2f\xfd"
+
+    def __init__(self, level: int = 10):
+        """
+        Initialize the codec with a compression level.
+        """
+        self.level = level
+
+    def encode(self, data: bytes) -> bytes:
+        """
+        Compress a payload with Zstandard.
+        """
+        return zstandard.ZstdCompressor(level=self.level).compress(data)
+
+    def decode(self, data: bytes) -> bytes:
+        """
+        Decompress a Zstandard payload (frames without a content size are supported).
+        """
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+    def decode_stream(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Decompress a Zstandard payload chunk by chunk.
+        """
+        decompressor = zstandard.ZstdDecompressor().decompressobj()
+        for chunk in chunks:
+            yield decompressor.decompress(chunk)
+
+class BlobCodecs:
+    """
+    Registry of the blob codecs available in this process.
+
+    Writers look codecs up by name; readers resolve the codec for a payload from
+    its Content-Encoding, falling back to sniffing magic bytes so blobs written
+    without metadata (including every blob written before codecs existed) still
+    decode correctly.
+    """
+    _codecs: dict[str, AbstractBlobCodec] = {
+        codec.name: codec for codec in [IdentityCodec(), GzipCodec()] + ([ZstdCodec()] if zstandard else [])
+    }
+
+    @classmethod
+    def available(cls) -> list[str]:
+        """
+        Names of the codecs that can be used in this process.
+
+        Returns:
+            list[str]: Registered codec names.
+        """
+        return list(cls._codecs)
+
+    @classmethod
+    def get(cls, name: Optional[str]) -> AbstractBlobCodec:
+        """
+        Look up a codec by name.
+
+        Args:
+            name (Optional[str]): Codec name; empty or None selects the identity codec.
+
+        Returns:
+            AbstractBlobCodec: The registered codec.
+
+        Raises:
+            ValueError: If the codec is unknown or its optional dependency is missing.
+        """
+        codec = cls._codecs.get(name or IdentityCodec.name)
+        if codec is None:
+            raise ValueError(f"Unsupported blob codec '{name}', available codecs: {cls.available()}")
+        return codec
+
+    @classmethod
+    def register(cls, codec: AbstractBlobCodec) -> None:
+        """
+        Register an additional codec, replacing any codec with the same name.
+
+        Args:
+            codec (AbstractBlobCodec): Codec to register.
+
+        Returns: None
+        """
+        cls._codecs[codec.name] = codec
+
+    @classmethod
+    def detect(cls, data: bytes, content_encoding: Optional[str] = None) -> AbstractBlobCodec:
+        """
+        Resolve the codec a stored payload was written with.
+
+        Args:
+            data (bytes): Stored payload.
+            content_encoding (Optional[str]): Content-Encoding recorded on the blob, if any.
+
+        Returns:
+            AbstractBlobCodec: Codec recorded in the metadata, else the codec whose magic bytes match,
+                else the identity codec.
+        """
+        # Trust the recorded encoding when present
+        if content_encoding:
+            return cls.get(content_encoding)
+
+        # Otherwise sniff the payload
+        for codec in cls._codecs.values():
+            if codec.magic and data.startswith(codec.magic):
+                return codec
+        return cls.get(None)
+
+    @classmethod
+    def decode(cls, data: bytes, content_encoding: Optional[str] = None) -> bytes:
+        """
+        Decode a stored payload with the codec it was written with.
+
+        Args:
+            data (bytes): Stored payload.
+            content_encoding (Optional[str]): Content-Encoding recorded on the blob, if any.
+
+        Returns:
+            bytes: Raw payload.
+        """
+        return cls.detect(data, content_encoding).decode(data)
+
+    @classmethod
+    def decode_stream(cls, chunks: Iterable[bytes], content_encoding: Optional[str] = None) -> Iterator[bytes]:
+        """
+        Decode a stored payload arriving in chunks with the codec it was written with.
+
+        Args:
+            chunks (Iterable[bytes]): Stored payload in order.
+            content_encoding (Optional[str]): Content-Encoding recorded on the blob, if any.
+
+        Returns:
+            Iterator[bytes]: Raw payload in order.
+        """
+        # Peek at the first chunk so payloads without metadata can be sniffed
+        chunks = iter(chunks)
+        first = next(chunks, b"")
+        yield from cls.detect(first, content_encoding).decode_stream(itertools.chain([first], chunks))
@@ -0,0 +1,256 @@
+# Import dependencies
+from ..interfaces.blob_models import BlobCacheStats
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+import threading
+import hashlib
+import json
+import time
+import os
+
+@dataclass
+class CachedBlob:
+    """
+    A blob payload held in the disk cache.
+
+    Attributes:
+        etag (str): Entity tag of the blob version that was cached.
+        data (bytes): Raw blob content as stored in Azure.
+        properties (dict): Blob properties needed to decode the content (e.g. content encoding).
+        validated_at (float): Unix time the entry was last confirmed current against Azure.
+    """
+    etag: str
+    data: bytes
+    properties: dict = field(default_factory=dict)
+    validated_at: float = 0.0
+
+class BlobDiskCache:
+    """
+    Size-bounded, LRU evicted, on-disk cache of blob payloads keyed by container and blob name.
+
+    Entries remember the ETag of the version they hold so readers can revalidate
+    with a conditional GET (If-None-Match) and only download the blob again when
+    it has changed. Entries validated within `max_age` seconds are served without
+    contacting Azure at all.
+
+    One instance is shared per cache directory within a process (see `for_directory`),
+    so every `BlobClient` shares the same index, lock and statistics.
+
+    Attributes:
+        directory (str): Directory holding cached payloads and the index file.
+        max_bytes (int): Upper bound on the total size of cached payloads.
+        max_age (float): Seconds an entry is trusted without revalidation.
+        stats (BlobCacheStats): Hit, miss, revalidation and eviction counters.
+    """
+    _lock = threading.Lock()
+    _instances: dict[str, "BlobDiskCache"] = {}
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024, max_age: float = 0.0) -> None:
+        """
+        Open (or create) a cache directory and load its index.
+
+        Args:
+            directory (str): Directory holding cached payloads and the index file.
+            max_bytes (int): Upper bound on the total size of cached payloads. Defaults to 256 MB.
+            max_age (float): Seconds an entry is trusted without revalidation. Defaults to 0 (always revalidate).
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.stats = BlobCacheStats()
+        self.lock = threading.RLock()
+
+        # Load the persisted index, least recently used entry first
+        os.makedirs(directory, exist_ok=True)
+        self.index_path = os.path.join(directory, "index.json")
+        self.index: OrderedDict[str, dict] = OrderedDict()
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path) as f:
+                    self.index = OrderedDict(json.load(f))
+            except (OSError, ValueError):
+                self.index = OrderedDict()
+
+    @classmethod
+    def for_directory(cls, directory: str, max_bytes: int = 256 * 1024 * 1024, max_age: float = 0.0) -> "BlobDiskCache":
+        """
+        Return the process-wide cache instance for a directory, creating it on first use.
+
+        Args:
+            directory (str): Directory holding cached payloads and the index file.
+            max_bytes (int): Upper bound on the total size of cached payloads.
+            max_age (float): Seconds an entry is trusted without revalidation.
+
+        Returns:
+            BlobDiskCache: The shared cache instance for the directory.
+        """
+        with cls._lock:
+            cache = cls._instances.get(directory)
+            if cache is None:
+                cache = cls(directory=directory, max_bytes=max_bytes, max_age=max_age)
+                cls._instances[directory] = cache
+            return cache
+
+    @staticmethod
+    def make_key(container: str, blob: str) -> str:
+        """
+        Build the cache key (and payload filename stem) for a blob.
+
+        Returns:
+            str: Hex digest identifying the container/blob pair.
+        """
+        return hashlib.sha256(f"{container}/{blob}".encode()).hexdigest()
+
+    def payload_path(self, key: str) -> str:
+        """
+        Path of the file holding a cached payload.
+
+        Returns:
+            str: Absolute path of the payload file.
+        """
+        return os.path.join(self.directory, f"{key}.blob")
+
+    def get(self, container: str, blob: str) -> Optional[CachedBlob]:
+        """
+        Look up a cached blob without counting it as a hit or miss.
+
+        Args:
+            container (str): Container name.
+            blob (str): Blob name.
+
+        Returns:
+            Optional[CachedBlob]: The cached entry, or None if absent or unreadable.
+        """
+        key = self.make_key(container, blob)
+        with self.lock:
+            entry = self.index.get(key)
+            if entry is None:
+                return None
+            try:
+                with open(self.payload_path(key), "rb") as f:
+                    data = f.read()
+            except OSError:
+                self.index.pop(key, None)
+                return None
+
+        return CachedBlob(etag=entry["etag"], data=data, properties=entry.get("properties", {}),
+                          validated_at=entry.get("validated_at", 0.0))
+
+    def is_fresh(self, entry: CachedBlob) -> bool:
+        """
+        Whether an entry may be served without revalidating against Azure.
+
+        Returns:
+            bool: True if the entry was validated within `max_age` seconds.
+        """
+        return self.max_age > 0 and time.time() - entry.validated_at < self.max_age
+
+    def record_hit(self, container: str, blob: str, revalidated: bool) -> None:
+        """
+        Count a cache hit and mark the entry as most recently used.
+
+        Args:
+            container (str): Container name.
+            blob (str): Blob name.
+            revalidated (bool): True if Azure confirmed the entry with a 304 Not Modified.
+
+        Returns: None
+        """
+        key = self.make_key(container, blob)
+        with self.lock:
+            self.stats.hits += 1
+            if revalidated:
+                self.stats.revalidations += 1
+            if key in self.index:
+                self.index.move_to_end(key)
+                if revalidated:
+                    self.index[key]["validated_at"] = time.time()
+
+    def put(self, container: str, blob: str, etag: str, data: bytes, properties: Optional[dict] = None) -> None:
+        """
+        Store a freshly downloaded blob, counting a miss and evicting old entries if needed.
+
+        Args:
+            container (str): Container name.
+            blob (str): Blob name.
+            etag (str): Entity tag of the downloaded version.
+            data (bytes): Raw blob content.
+            properties (Optional[dict]): Blob properties needed to decode the content.
+
+        Returns: None
+        """
+        key = self.make_key(container, blob)
+        with self.lock:
+            self.stats.misses += 1
+
+            # Payloads larger than the whole cache are never stored
+            if len(data) > self.max_bytes:
+                return
+
+            # Write the payload atomically so readers never see a partial file
+            temp_path = self.payload_path(key) + ".tmp"
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, self.payload_path(key))
+
+            # Record the entry as most recently used and enforce the size bound
+            self.index[key] = {
+                "container": container,
+                "blob": blob,
+                "etag": etag,
+                "size": len(data),
+                "properties": properties or {},
+                "validated_at": time.time()
+            }
+            self.index.move_to_end(key)
+            self.evict()
+            self.save_index()
+
+    def evict(self) -> None:
+        """
+        Remove least recently used entries until the cache fits within `max_bytes`.
+
+        Returns: None
+        """
+        with self.lock:
+            total = sum(entry["size"] for entry in self.index.values())
+            while total > self.max_bytes and self.index:
+                key, entry = self.index.popitem(last=False)
+                total -= entry["size"]
+                self.stats.evictions += 1
+                try:
+                    os.remove(self.payload_path(key))
+                except OSError:
+                    pass
+
+    def invalidate(self, container: str, blob: str) -> None:
+        """
+        Drop a blob from the cache, e.g. after it has been overwritten.
+
+        Args:
+            container (str): Container name.
+            blob (str): Blob name.
+
+        Returns: None
+        """
+        key = self.make_key(container, blob)
+        with self.lock:
+            if self.index.pop(key, None) is not None:
+                try:
+                    os.remove(self.payload_path(key))
+                except OSError:
+                    pass
+                self.save_index()
+
+    def save_index(self) -> None:
+        """
+        Persist the index (in LRU order) so the cache survives process restarts.
+
+        Returns: None
+        """
+        with self.lock:
+            temp_path = self.index_path + ".tmp"
+            with open(temp_path, "w") as f:
+                json.dump(list(self.index.items()), f)
+            os.replace(temp_path, self.index_path)
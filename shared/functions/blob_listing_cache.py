@@ -0,0 +1,86 @@
+# Import dependencies
+from ..interfaces.blob_models import BlobEntry
+from typing import List, Optional
+import threading
+import time
+
+class BlobListingCache:
+    """
+    Process-wide, time-bounded cache of blob prefix listings.
+
+    Listing a prefix is a full round trip (and a paged one for large prefixes),
+    yet pipelines list the same prefixes many times per run. Listings are cached
+    per storage account, container and prefix for `ttl` seconds; a cached listing
+    also answers any longer prefix it covers. Every write made through a
+    `BlobClient` or `AsyncBlobClient` in this process invalidates the listings
+    that could contain the written blob, so callers always see their own writes.
+    """
+    _lock = threading.Lock()
+    _listings: dict[tuple[str, str, str], tuple[float, List[BlobEntry]]] = {}
+
+    @classmethod
+    def get(cls, account: str, container: str, prefix: str, ttl: float) -> Optional[List[BlobEntry]]:
+        """
+        Return a cached listing covering the prefix, if one is younger than `ttl`.
+
+        Args:
+            account (str): Storage account connection string.
+            container (str): Container name.
+            prefix (str): Blob name prefix being listed.
+            ttl (float): Maximum age in seconds of a usable listing.
+
+        Returns:
+            Optional[List[BlobEntry]]: Entries under the prefix, or None if no fresh listing covers it.
+        """
+        now = time.monotonic()
+        with cls._lock:
+            for (cached_account, cached_container, cached_prefix), (fetched_at, entries) in cls._listings.items():
+                if cached_account == account and cached_container == container and \
+                        prefix.startswith(cached_prefix) and now - fetched_at < ttl:
+                    return [entry for entry in entries if entry.name.startswith(prefix)]
+        return None
+
+    @classmethod
+    def put(cls, account: str, container: str, prefix: str, entries: List[BlobEntry]) -> None:
+        """
+        Store a freshly fetched listing.
+
+        Args:
+            account (str): Storage account connection string.
+            container (str): Container name.
+            prefix (str): Blob name prefix that was listed.
+            entries (List[BlobEntry]): Entries returned by Azure.
+
+        Returns: None
+        """
+        with cls._lock:
+            cls._listings[(account, container, prefix)] = (time.monotonic(), list(entries))
+
+    @classmethod
+    def invalidate(cls, account: str, container: str, name: Optional[str] = None) -> None:
+        """
+        Drop cached listings affected by a write.
+
+        Args:
+            account (str): Storage account connection string.
+            container (str): Container name.
+            name (Optional[str]): Blob that was written. Drops every listing of the container if omitted.
+
+        Returns: None
+        """
+        with cls._lock:
+            for key in list(cls._listings):
+                cached_account, cached_container, cached_prefix = key
+                if cached_account == account and cached_container == container and \
+                        (name is None or name.startswith(cached_prefix)):
+                    del cls._listings[key]
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Drop every cached listing.
+
+        Returns: None
+        """
+        with cls._lock:
+            cls._listings.clear()
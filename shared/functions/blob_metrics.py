@@ -0,0 +1,206 @@
+# Import dependencies
+from ..interfaces.blob_models import BlobOperationStats
+from typing import Dict, Iterator, List, Optional
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import threading
+import time
+
+class BlobMetrics:
+    """
+    Process-wide instrumentation of blob I/O.
+
+    Every blob operation made through a `BlobClient` (or one of its subclasses)
+    or an `AsyncBlobClient` is recorded here, tagged with the operation type,
+    the container, the blob's top-level prefix (e.g. `trackman_session_summary`)
+    and the name of the client class that issued it. For each combination of
+    tags the registry keeps call and error counts, stored bytes moved and a
+    latency histogram (see `BlobOperationStats`). Interventions of the
+    `BlobRequestPolicy` (retries, timeouts, hedges and hedge wins) and writes
+    coalesced by a `BlobWriteBuffer` are counted separately as events, under
+    the same tags.
+
+    Typical usage example:
+        with BlobMetrics.timed("read", container, blob, caller="ShotTable") as sample:
+            data = ...
+            sample["bytes"] = len(data)
+
+        report = BlobMetrics.report(pipeline="hole19")
+    """
+    _lock = threading.Lock()
+    _stats: Dict[tuple[str, str, str, str], BlobOperationStats] = {}
+    _events: Dict[tuple[str, str, str, str, str], int] = {}
+
+    @staticmethod
+    def prefix_of(name: Optional[str]) -> str:
+        """
+        Top-level prefix used to tag a blob or listing.
+
+        Args:
+            name (Optional[str]): Blob name or listing prefix.
+
+        Returns:
+            str: First path segment of the name, or "/" for blobs at the container root.
+        """
+        name = (name or "").lstrip("/")
+        return name.split("/", 1)[0] if "/" in name else "/"
+
+    @classmethod
+    def record(
+        cls,
+        operation: str,
+        container: str,
+        blob: Optional[str],
+        caller: str,
+        seconds: float,
+        nbytes: int = 0,
+        error: bool = False
+    ) -> None:
+        """
+        Record one blob operation.
+
+        Args:
+            operation (str): Operation type (e.g. "read", "write", "list").
+            container (str): Container the operation targeted.
+            blob (Optional[str]): Blob name or listing prefix.
+            caller (str): Name of the client class that issued the operation.
+            seconds (float): Latency of the operation.
+            nbytes (int): Stored bytes transferred.
+            error (bool): Whether the operation raised.
+
+        Returns: None
+        """
+        key = (operation, container, cls.prefix_of(blob), caller)
+        with cls._lock:
+            stats = cls._stats.get(key)
+            if stats is None:
+                stats = cls._stats[key] = BlobOperationStats(*key)
+            stats.add(seconds=seconds, nbytes=nbytes, error=error)
+
+    @classmethod
+    def count_event(cls, event: str, operation: str, container: str, blob: Optional[str], caller: str) -> None:
+        """
+        Count one intervention of the request policy or write-behind buffer.
+
+        Args:
+            event (str): What happened ("retry", "timeout", "hedge", "hedge_win" or "coalesced").
+            operation (str): Operation type the event happened on.
+            container (str): Container the operation targeted.
+            blob (Optional[str]): Blob name or listing prefix.
+            caller (str): Name of the client class that issued the operation.
+
+        Returns: None
+        """
+        key = (event, operation, container, cls.prefix_of(blob), caller)
+        with cls._lock:
+            cls._events[key] = cls._events.get(key, 0) + 1
+
+    @classmethod
+    def events(cls) -> List[dict]:
+        """
+        Copy the request policy and write buffer events counted so far.
+
+        Returns:
+            List[dict]: One entry per event, operation, container, prefix and caller, most frequent first.
+        """
+        with cls._lock:
+            events = [dict(zip(("event", "operation", "container", "prefix", "caller"), key), count=count)
+                      for key, count in cls._events.items()]
+        return sorted(events, key=lambda event: event["count"], reverse=True)
+
+    @classmethod
+    @contextmanager
+    def timed(cls, operation: str, container: str, blob: Optional[str], caller: str) -> Iterator[dict]:
+        """
+        Time the enclosed block and record it as one blob operation.
+
+        The block may set `sample["bytes"]` to the bytes it transferred, and
+        `sample["operation"]` to record it under another operation type (e.g. a
+        read that turned out to be served from cache). Exceptions are counted as
+        errors and re-raised.
+
+        Args:
+            operation (str): Operation type.
+            container (str): Container the operation targets.
+            blob (Optional[str]): Blob name or listing prefix.
+            caller (str): Name of the client class issuing the operation.
+
+        Returns:
+            Iterator[dict]: The mutable sample for the block.
+        """
+        sample = {"operation": operation, "bytes": 0}
+        error = False
+        started = time.perf_counter()
+        try:
+            yield sample
+        except Exception:
+            error = True
+            raise
+        finally:
+            cls.record(sample["operation"], container, blob, caller, seconds=time.perf_counter() - started,
+                       nbytes=sample["bytes"], error=error)
+
+    @classmethod
+    def snapshot(cls) -> List[BlobOperationStats]:
+        """
+        Copy the counters recorded so far.
+
+        Returns:
+            List[BlobOperationStats]: One entry per operation, container, prefix and caller.
+        """
+        with cls._lock:
+            return [BlobOperationStats(**{**vars(stats), "buckets": list(stats.buckets)})
+                    for stats in cls._stats.values()]
+
+    @classmethod
+    def totals(cls, by: str = "caller") -> Dict[str, BlobOperationStats]:
+        """
+        Merge the counters over every tag but one.
+
+        Args:
+            by (str): Tag to group by: "operation", "container", "prefix" or "caller".
+
+        Returns:
+            Dict[str, BlobOperationStats]: Merged counters keyed by tag value, most time spent first.
+        """
+        merged = {}
+        for stats in cls.snapshot():
+            tag = getattr(stats, by)
+            if tag not in merged:
+                merged[tag] = BlobOperationStats(operation="*", container="*", prefix="*", caller="*")
+                setattr(merged[tag], by, tag)
+            merged[tag].merge(stats)
+
+        return dict(sorted(merged.items(), key=lambda item: item[1].total_seconds, reverse=True))
+
+    @classmethod
+    def report(cls, pipeline: str) -> dict:
+        """
+        Build a JSON serializable report of the blob I/O recorded in this process.
+
+        Args:
+            pipeline (str): Name of the pipeline or application the report describes.
+
+        Returns:
+            dict: Generation time, pipeline name, per-caller totals, every operation's counters and the
+                request policy events.
+        """
+        return {
+            "pipeline": pipeline,
+            "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "totals": [stats.to_dict() for stats in cls.totals(by="caller").values()],
+            "operations": sorted((stats.to_dict() for stats in cls.snapshot()),
+                                 key=lambda operation: operation["total_ms"], reverse=True),
+            "policy_events": cls.events()
+        }
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Drop every recorded counter.
+
+        Returns: None
+        """
+        with cls._lock:
+            cls._stats.clear()
+            cls._events.clear()
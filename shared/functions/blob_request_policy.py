@@ -0,0 +1,287 @@
+# Import dependencies
+from azure.core.exceptions import HttpResponseError, ServiceRequestError, ServiceResponseError
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Optional, TypeVar
+from collections import deque
+from .blob_metrics import BlobMetrics
+from .variables import Variables
+import threading
+import random
+import time
+
+# Result type of a guarded blob call
+T = TypeVar("T")
+
+class BlobRequestPolicy:
+    """
+    Timeout, retry and hedging policy applied to blob calls.
+
+    A call runs under a deadline of `timeouts[operation]` seconds (falling back to
+    `timeout`) that bounds the whole SDK call, including the transfer of the
+    body and any retries the SDK makes internally. Timeouts, dropped connections
+    and throttling or server errors (408, 429 and 5xx) are retried up to
+    `retries` times with exponential backoff and full jitter. Other errors, such
+    as a missing blob or a 304 Not Modified, are raised at once.
+
+    Hedged reads are opt-in: when `hedge_percentile` is set, a read that is still
+    running after that percentile of recent latencies for the same operation and
+    prefix is duplicated, and whichever copy finishes first wins. Latencies are
+    tracked process-wide over the last `window` calls, and hedging starts once
+    `min_samples` have been seen.
+
+    Every retry, timeout, hedge and hedge win is counted in `BlobMetrics`, so
+    the diagnostics page shows how often each part of the policy fired.
+
+    Attributes:
+        timeout (float): Default deadline in seconds per attempt, 0 disables deadlines.
+        timeouts (Dict[str, float]): Deadlines overriding `timeout` for specific operations.
+        retries (int): Retries after the first attempt.
+        backoff (float): Base backoff in seconds, doubled on every retry.
+        max_backoff (float): Upper bound of a single backoff.
+        hedge_percentile (float): Latency percentile (0-100) after which reads are hedged, 0 disables hedging.
+    """
+    retryable_status_codes = {408, 429, 500, 502, 503, 504}
+    max_backoff = 10.0
+    min_hedge_delay = 0.02
+    min_samples = 20
+    window = 200
+
+    _lock = threading.Lock()
+    _executor: Optional[ThreadPoolExecutor] = None
+    _latencies: Dict[tuple[str, str, str], deque] = {}
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        retries: int = 3,
+        backoff: float = 0.2,
+        hedge_percentile: float = 0.0,
+        timeouts: Optional[Dict[str, float]] = None
+    ) -> None:
+        """
+        Initialize the policy.
+
+        Args:
+            timeout (float): Default deadline in seconds per attempt, 0 disables deadlines.
+            retries (int): Retries after the first attempt.
+            backoff (float): Base backoff in seconds, doubled on every retry.
+            hedge_percentile (float): Latency percentile (0-100) after which reads are hedged, 0 disables hedging.
+            timeouts (Optional[Dict[str, float]]): Deadlines for specific operations (e.g. {"write": 60}).
+        """
+        self.timeout = timeout
+        self.timeouts = dict(timeouts or {})
+        self.retries = retries
+        self.backoff = backoff
+        self.hedge_percentile = hedge_percentile
+
+    @classmethod
+    def from_variables(cls, variables: Variables) -> "BlobRequestPolicy":
+        """
+        Build the policy configured by the `blob_timeout`, `blob_retries`, `blob_backoff`
+        and `blob_hedge_percentile` variables.
+
+        Args:
+            variables (Variables): Loaded project variables.
+
+        Returns:
+            BlobRequestPolicy: The configured policy.
+        """
+        return cls(
+            timeout=variables.blob_timeout,
+            retries=variables.blob_retries,
+            backoff=variables.blob_backoff,
+            hedge_percentile=variables.blob_hedge_percentile
+        )
+
+    @classmethod
+    def executor(cls) -> ThreadPoolExecutor:
+        """
+        Return the process-wide pool that runs guarded attempts.
+
+        Returns:
+            ThreadPoolExecutor: Shared executor, created on first use.
+        """
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=64, thread_name_prefix="blob-request")
+            return cls._executor
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """
+        Whether an error is transient and worth retrying.
+
+        Args:
+            error (BaseException): Error raised by an attempt.
+
+        Returns:
+            bool: True for timeouts, connection failures and throttling or server errors.
+        """
+        if isinstance(error, (TimeoutError, ServiceRequestError, ServiceResponseError)):
+            return True
+        return isinstance(error, HttpResponseError) and error.status_code in self.retryable_status_codes
+
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        Seconds to wait before a retry, with full jitter.
+
+        Args:
+            attempt (int): Number of attempts made so far (1 for the first retry).
+
+        Returns:
+            float: Random delay up to the exponential backoff for the attempt.
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+    def hedge_delay(self, key: tuple[str, str, str]) -> Optional[float]:
+        """
+        Seconds after which a read is hedged, from the recent latencies of the same operation and prefix.
+
+        Args:
+            key (tuple[str, str, str]): Operation, container and prefix of the call.
+
+        Returns:
+            Optional[float]: Delay before issuing a duplicate, or None if hedging is off or samples are too few.
+        """
+        if not self.hedge_percentile:
+            return None
+        with self._lock:
+            samples = sorted(self._latencies.get(key, ()))
+        if len(samples) < self.min_samples:
+            return None
+
+        index = min(len(samples) - 1, int(len(samples) * self.hedge_percentile / 100))
+        return max(self.min_hedge_delay, samples[index])
+
+    def record_latency(self, key: tuple[str, str, str], seconds: float) -> None:
+        """
+        Add a successful attempt's latency to the rolling window used for hedging.
+
+        Args:
+            key (tuple[str, str, str]): Operation, container and prefix of the call.
+            seconds (float): Latency of the attempt.
+
+        Returns: None
+        """
+        with self._lock:
+            self._latencies.setdefault(key, deque(maxlen=self.window)).append(seconds)
+
+    def call(
+        self,
+        operation: str,
+        function: Callable[[], T],
+        container: str,
+        blob: Optional[str],
+        caller: str,
+        hedge: bool = False
+    ) -> T:
+        """
+        Run a blob call under the policy.
+
+        Args:
+            operation (str): Operation type (e.g. "read", "write", "list").
+            function (Callable[[], T]): The call to make; must be safe to repeat.
+            container (str): Container the call targets.
+            blob (Optional[str]): Blob name or listing prefix.
+            caller (str): Name of the client class making the call.
+            hedge (bool): Whether the call may be hedged (reads only).
+
+        Returns:
+            T: The call's result.
+
+        Raises:
+            TimeoutError: If the last attempt exceeded its deadline.
+            Exception: The last attempt's error, or the first non-retryable one.
+        """
+        key = (operation, container, BlobMetrics.prefix_of(blob))
+        for attempt in range(self.retries + 1):
+            try:
+                return self.attempt(key, function, blob, caller, hedge)
+            except Exception as e:
+                if attempt == self.retries or not self.is_retryable(e):
+                    raise
+
+            # Back off before retrying
+            BlobMetrics.count_event("retry", operation, container, blob, caller)
+            time.sleep(self.backoff_delay(attempt + 1))
+
+    def attempt(
+        self,
+        key: tuple[str, str, str],
+        function: Callable[[], T],
+        blob: Optional[str],
+        caller: str,
+        hedge: bool
+    ) -> T:
+        """
+        Make one attempt at a call, under its deadline and with an optional hedge.
+
+        Args:
+            key (tuple[str, str, str]): Operation, container and prefix of the call.
+            function (Callable[[], T]): The call to make.
+            blob (Optional[str]): Blob name or listing prefix.
+            caller (str): Name of the client class making the call.
+            hedge (bool): Whether a duplicate may be issued.
+
+        Returns:
+            T: The result of whichever copy finished first.
+
+        Raises:
+            TimeoutError: If no copy finished before the deadline.
+        """
+        operation, container, _ = key
+        timeout = self.timeouts.get(operation, self.timeout)
+        hedge_delay = self.hedge_delay(key) if hedge else None
+
+        # Without a deadline or a hedge there is nothing to supervise
+        started = time.monotonic()
+        if not timeout and hedge_delay is None:
+            result = function()
+            self.record_latency(key, time.monotonic() - started)
+            return result
+
+        # Run the call on the shared pool so it can be supervised
+        deadline = started + timeout if timeout else None
+        hedge_at = started + hedge_delay if hedge_delay is not None else None
+        pending: list[Future] = [self.executor().submit(function)]
+        primary, error = pending[0], None
+        while pending:
+
+            # Wait for a copy to finish, the hedge point or the deadline, whichever comes first
+            now = time.monotonic()
+            wake = [moment for moment in (deadline, hedge_at) if moment is not None]
+            done, _ = wait(pending, timeout=max(0.0, min(wake) - now) if wake else None,
+                           return_when=FIRST_COMPLETED)
+
+            # Return the first successful copy
+            for future in done:
+                pending.remove(future)
+                if future.exception() is None:
+                    self.record_latency(key, time.monotonic() - started)
+                    if future is not primary:
+                        BlobMetrics.count_event("hedge_win", operation, container, blob, caller)
+                    return future.result()
+                error = future.exception()
+
+            # Issue the duplicate read once the hedge point passes
+            now = time.monotonic()
+            if hedge_at is not None and now >= hedge_at and pending:
+                pending.append(self.executor().submit(function))
+                hedge_at = None
+                BlobMetrics.count_event("hedge", operation, container, blob, caller)
+
+            # Give up on copies still running past the deadline
+            if deadline is not None and now >= deadline and pending:
+                BlobMetrics.count_event("timeout", operation, container, blob, caller)
+                raise TimeoutError(f"Blob {operation} of {blob} timed out after {timeout}s")
+
+        raise error
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Forget the recorded latencies.
+
+        Returns: None
+        """
+        with cls._lock:
+            cls._latencies.clear()
@@ -0,0 +1,163 @@
+# Import dependencies
+from ..interfaces.blob_serializer_base import AbstractBlobSerializer
+from typing import Any, Optional
+import json
+
+# orjson and msgpack are optional dependencies
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+class JsonSerializer(AbstractBlobSerializer):
+    """
+    Standard library JSON, available everywhere.
+    """
+    name = "json"
+
+    def dumps(self, data: Any) -> bytes:
+        """
+        Serialize a document with `json`.
+        """
+        return json.dumps(data).encode()
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Deserialize a document with `json`, which only parses `bytes` and `str` (not views of a snapshot).
+        """
+        return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+class OrjsonSerializer(AbstractBlobSerializer):
+    """
+    JSON through orjson, registered only when the `orjson` package is installed.
+
+    Output is plain JSON, so blobs written with it are readable by any JSON
+    reader. NaN and infinite floats, which strict JSON cannot represent, are
+    written as null.
+    """
+    name = "orjson"
+
+    def dumps(self, data: Any) -> bytes:
+        """
+        Serialize a document with orjson.
+        """
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Deserialize a document with orjson, falling back to `json` for documents it rejects (e.g. NaN literals).
+        """
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+class MsgpackSerializer(AbstractBlobSerializer):
+    """
+    MessagePack binary format, registered only when the `msgpack` package is installed.
+    """
+    name = "msgpack"
+    content_type = "application/msgpack"
+
+    def dumps(self, data: Any) -> bytes:
+        """
+        Serialize a document with MessagePack.
+        """
+        return msgpack.packb(data, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Deserialize a MessagePack document.
+        """
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+class BlobSerializers:
+    """
+    Registry of the blob serializers available in this process.
+
+    Writers look serializers up by the configured name. Optional serializers
+    whose package is not installed fall back to standard library JSON, so a
+    configuration written for a fully provisioned host still works elsewhere.
+    Readers resolve the decoder from the blob's Content-Type: MessagePack blobs
+    are decoded with msgpack and every other blob as JSON, using the fastest
+    JSON decoder available.
+    """
+    _serializers: dict[str, AbstractBlobSerializer] = {
+        serializer.name: serializer for serializer in (
+            [JsonSerializer()] + ([OrjsonSerializer()] if orjson else []) + ([MsgpackSerializer()] if msgpack else [])
+        )
+    }
+    optional = ("orjson", "msgpack")
+
+    @classmethod
+    def available(cls) -> list[str]:
+        """
+        Names of the serializers that can be used in this process.
+
+        Returns:
+            list[str]: Registered serializer names.
+        """
+        return list(cls._serializers)
+
+    @classmethod
+    def get(cls, name: Optional[str]) -> AbstractBlobSerializer:
+        """
+        Look up a serializer by name.
+
+        Args:
+            name (Optional[str]): Serializer name; empty or None selects standard library JSON.
+
+        Returns:
+            AbstractBlobSerializer: The registered serializer, or standard library JSON if
+                the named serializer's optional package is not installed.
+
+        Raises:
+            ValueError: If the serializer is unknown.
+        """
+        serializer = cls._serializers.get(name or JsonSerializer.name)
+        if serializer is None and name in cls.optional:
+            return cls._serializers[JsonSerializer.name]
+        if serializer is None:
+            raise ValueError(f"Unsupported blob serializer '{name}', available serializers: {cls.available()}")
+        return serializer
+
+    @classmethod
+    def register(cls, serializer: AbstractBlobSerializer) -> None:
+        """
+        Register an additional serializer, replacing any serializer with the same name.
+
+        Args:
+            serializer (AbstractBlobSerializer): Serializer to register.
+
+        Returns: None
+        """
+        cls._serializers[serializer.name] = serializer
+
+    @classmethod
+    def for_content_type(cls, content_type: Optional[str]) -> AbstractBlobSerializer:
+        """
+        Resolve the decoder for a blob from its Content-Type.
+
+        Args:
+            content_type (Optional[str]): Content-Type recorded on the blob, if any.
+
+        Returns:
+            AbstractBlobSerializer: Serializer registered for the content type, else the fastest JSON serializer.
+
+        Raises:
+            ValueError: If the blob was written in a format whose package is not installed.
+        """
+        # Match non-JSON formats by their recorded content type
+        for serializer in cls._serializers.values():
+            if serializer.content_type != JsonSerializer.content_type and serializer.content_type == content_type:
+                return serializer
+        if content_type == MsgpackSerializer.content_type:
+            raise ValueError("Blob is MessagePack encoded but the msgpack package is not installed")
+
+        # Everything else is JSON, legacy blobs included
+        return cls._serializers.get(OrjsonSerializer.name, cls._serializers[JsonSerializer.name])
@@ -0,0 +1,118 @@
+# Import dependencies
+from azure.storage.blob import BlobServiceClient, ContainerClient
+from azure.core.pipeline.transport import RequestsTransport
+from requests.adapters import HTTPAdapter
+import threading
+import requests
+
+class BlobServiceRegistry:
+    """
+    Process-wide registry of pooled Azure Blob Storage clients.
+
+    Building a `BlobServiceClient` from a connection string creates a fresh HTTP
+    pipeline, so every call pays for a new TCP/TLS handshake. This registry holds
+    exactly one thread-safe `BlobServiceClient` per connection string, backed by a
+    keep-alive `requests.Session` connection pool, and caches the `ContainerClient`
+    objects derived from it. Every `BlobClient` instance (and subclass) resolves its
+    clients through this registry so connections are reused across the process.
+
+    Attributes:
+        pool_size (int): Maximum number of pooled keep-alive connections per host.
+    """
+    pool_size = 32
+
+    _lock = threading.Lock()
+    _service_clients: dict[str, BlobServiceClient] = {}
+    _container_clients: dict[tuple[str, str], ContainerClient] = {}
+
+    @classmethod
+    def _build_transport(cls) -> RequestsTransport:
+        """
+        Build a requests transport backed by a keep-alive connection pool.
+
+        Returns:
+            RequestsTransport: Transport sharing a pooled `requests.Session`.
+        """
+        # Mount a pooled adapter so concurrent callers reuse open connections
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=cls.pool_size, pool_maxsize=cls.pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        return RequestsTransport(session=session, session_owner=False)
+
+    @classmethod
+    def get_service_client(cls, connection_string: str) -> BlobServiceClient:
+        """
+        Return the shared `BlobServiceClient` for a connection string.
+
+        The client is created on first use and reused by every later caller.
+
+        Args:
+            connection_string (str): Azure Blob Storage connection string.
+
+        Returns:
+            BlobServiceClient: The pooled service client for the storage account.
+        """
+        # Fast path when the client has already been built
+        client = cls._service_clients.get(connection_string)
+        if client is not None:
+            return client
+
+        # Build the client under the lock so only one pipeline is ever created
+        with cls._lock:
+            client = cls._service_clients.get(connection_string)
+            if client is None:
+                client = BlobServiceClient.from_connection_string(
+                    connection_string,
+                    transport=cls._build_transport()
+                )
+                cls._service_clients[connection_string] = client
+
+        return client
+
+    @classmethod
+    def get_container_client(cls, connection_string: str, container_name: str) -> ContainerClient:
+        """
+        Return the cached `ContainerClient` for a container.
+
+        Args:
+            connection_string (str): Azure Blob Storage connection string.
+            container_name (str): Name of the container.
+
+        Returns:
+            ContainerClient: Container client sharing the pooled pipeline.
+        """
+        # Fast path when the container client has already been built
+        key = (connection_string, container_name)
+        client = cls._container_clients.get(key)
+        if client is not None:
+            return client
+
+        # Derive the container client from the shared service client
+        service_client = cls.get_service_client(connection_string)
+        with cls._lock:
+            client = cls._container_clients.get(key)
+            if client is None:
+                client = service_client.get_container_client(container_name)
+                cls._container_clients[key] = client
+
+        return client
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Close and forget every pooled client.
+
+        Intended for tests and for processes that need to rotate credentials.
+
+        Returns: None
+        """
+        with cls._lock:
+            for client in cls._service_clients.values():
+                try:
+                    client.close()
+                except Exception:
+                    pass
+            cls._service_clients.clear()
+            cls._container_clients.clear()
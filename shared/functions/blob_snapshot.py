@@ -0,0 +1,398 @@
+# Import dependencies
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError, ServiceRequestError
+from concurrent.futures import ThreadPoolExecutor
+from ..interfaces.blob_models import BlobEntry
+from typing import Dict, Iterable, List, Optional
+from datetime import datetime
+from .blob_client import BlobClient
+from .blob_codecs import BlobCodecs
+import tempfile
+import threading
+import hashlib
+import struct
+import mmap
+import json
+import time
+import glob
+import os
+
+class SnapshotPack:
+    """
+    Read-only view of a packed dashboard snapshot, memory-mapped from a local file.
+
+    A pack is a single file holding many blobs: an 8 byte magic, the length of
+    a JSON index as an unsigned 64-bit little-endian integer, the index itself
+    and then every payload back to back. Payloads are stored decoded (without
+    their codec), so a read is a `memoryview` slice of the mapping and nothing
+    is copied until a caller parses it.
+
+    The mapping is released once the pack and every slice handed out from it
+    are garbage collected, so a pack can be replaced while pages still hold
+    slices of the previous one.
+
+    Attributes:
+        path (str): Local file the pack is mapped from.
+        version (str): Content hash identifying the snapshot.
+        prefixes (Dict[str, List[str]]): Containers mapped to the blob prefixes packed in full.
+    """
+    magic = b"GOLFSNAP"
+    header = struct.Struct("<8sQ")
+
+    def __init__(self, path: str) -> None:
+        """
+        Map a pack file and parse its index.
+
+        Args:
+            path (str): Local pack file.
+
+        Raises:
+            ValueError: If the file is not a snapshot pack.
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Validate the header before trusting the index
+        if len(self._map) < self.header.size:
+            raise ValueError(f"{path} is not a dashboard snapshot")
+        magic, index_length = self.header.unpack_from(self._map)
+        if magic != self.magic:
+            raise ValueError(f"{path} is not a dashboard snapshot")
+
+        # Parse the index, whose offsets are relative to the start of the payloads
+        view = memoryview(self._map)
+        index = json.loads(bytes(view[self.header.size:self.header.size + index_length]))
+        self._payloads = view[self.header.size + index_length:]
+        self.version = index["version"]
+        self.prefixes = index["prefixes"]
+        self._entries = {(entry["container"], entry["name"]): entry for entry in index["entries"]}
+
+    @classmethod
+    def build(cls, prefixes: Dict[str, List[str]], blobs: Iterable[dict]) -> tuple[bytes, str]:
+        """
+        Pack blobs into a snapshot.
+
+        The pack's bytes depend only on its content, so packing unchanged blobs
+        produces an identical pack with the same version.
+
+        Args:
+            prefixes (Dict[str, List[str]]): Containers mapped to the blob prefixes packed in full.
+            blobs (Iterable[dict]): Blobs to pack, each with `container`, `name`, decoded `data`,
+                `content_type`, `etag` and `last_modified` (ISO format or None).
+
+        Returns:
+            tuple[bytes, str]: The pack and its version.
+        """
+        entries, payloads, offset = [], [], 0
+        for blob in sorted(blobs, key=lambda blob: (blob["container"], blob["name"])):
+            entry = {key: value for key, value in blob.items() if key != "data"}
+            entries.append({**entry, "offset": offset, "length": len(blob["data"])})
+            payloads.append(blob["data"])
+            offset += len(blob["data"])
+
+        # Version the pack by its content
+        digest = hashlib.sha256(json.dumps([prefixes, entries], sort_keys=True).encode())
+        for payload in payloads:
+            digest.update(payload)
+
+        version = digest.hexdigest()
+        index = json.dumps({"version": version, "prefixes": prefixes, "entries": entries}, sort_keys=True).encode()
+        return b"".join([cls.header.pack(cls.magic, len(index)), index, *payloads]), version
+
+    def get(self, container: str, blob: str) -> Optional[tuple[memoryview, dict]]:
+        """
+        Look up a packed blob.
+
+        Args:
+            container (str): Container of the blob.
+            blob (str): Name of the blob.
+
+        Returns:
+            Optional[tuple[memoryview, dict]]: Zero-copy view of the decoded payload and the properties needed to
+                parse it (as returned by `BlobClient.download_stored_blob`), or None if the blob is not packed.
+        """
+        entry = self._entries.get((container, blob))
+        if entry is None:
+            return None
+
+        data = self._payloads[entry["offset"]:entry["offset"] + entry["length"]]
+        return data, {"content_encoding": BlobCodecs.get(None).name, "content_type": entry["content_type"]}
+
+    def packed(self, container: str, entry: BlobEntry) -> Optional[dict]:
+        """
+        Reuse a packed blob for a new pack, if the listed blob is still the version packed.
+
+        Args:
+            container (str): Container of the blob.
+            entry (BlobEntry): Current listing entry of the blob.
+
+        Returns:
+            Optional[dict]: The blob as `build` takes it, with its payload copied out of the mapping,
+                or None if the blob is not packed or its ETag changed since.
+        """
+        packed = self._entries.get((container, entry.name))
+        if packed is None or packed["etag"] != entry.etag:
+            return None
+
+        data = bytes(self._payloads[packed["offset"]:packed["offset"] + packed["length"]])
+        blob = {key: value for key, value in packed.items() if key not in ("offset", "length")}
+        return {**blob, "container": container, "data": data}
+
+    def covers(self, container: str, prefix: str) -> bool:
+        """
+        Whether a listing of a prefix can be answered from the pack.
+
+        Args:
+            container (str): Container listed.
+            prefix (str): Listing prefix.
+
+        Returns:
+            bool: True if the prefix lies within one of the packed prefixes.
+        """
+        return any(prefix.startswith(packed) for packed in self.prefixes.get(container, ()))
+
+    def entries(self, container: str, prefix: str) -> List[BlobEntry]:
+        """
+        List the packed blobs under a prefix, as a blob listing would.
+
+        Args:
+            container (str): Container listed.
+            prefix (str): Listing prefix.
+
+        Returns:
+            List[BlobEntry]: Packed blobs matching the prefix, in name order, with their decoded size.
+        """
+        return [
+            BlobEntry(
+                name=name,
+                size=entry["length"],
+                etag=entry["etag"],
+                last_modified=datetime.fromisoformat(entry["last_modified"]) if entry["last_modified"] else None,
+                content_encoding=BlobCodecs.get(None).name
+            )
+            for (entry_container, name), entry in sorted(self._entries.items())
+            if entry_container == container and name.startswith(prefix)
+        ]
+
+class BlobSnapshot(BlobClient):
+    """
+    A packed snapshot of every blob the dashboard reads, published as a single blob.
+
+    The backend calls `publish` at the end of each pipeline run. It packs the
+    ingest catalog, hole summaries, club and yardage summaries, the shot table
+    and the session documents into one `SnapshotPack`, which is uploaded
+    unless its content is unchanged.
+
+    The frontend calls `refresh` on every script run. At most once per
+    `blob_snapshot_ttl` seconds it compares the published snapshot's content
+    hash with the one it has mapped. A new version is downloaded once per host
+    into `blob_snapshot_directory` (written aside and renamed into place, so
+    concurrent app processes share it), memory-mapped, and swapped in by
+    replacing `BlobClient.snapshot` in a single assignment. From then on every
+    `BlobClient` serves reads and listings of packed blobs from the mapping.
+    Blobs outside the snapshot, and all reads while none is published, go to
+    Azure as before. A `BlobSnapshot` itself never reads through the mapped
+    snapshot, so `publish` always packs what is currently stored.
+
+    Typical usage example:
+        BlobSnapshot(source="frontend").refresh()
+
+    Attributes:
+        container (str): Container the snapshot is stored in.
+        snapshot_name (str): Blob name of the published snapshot.
+        content_type (str): Content-Type recorded on the published snapshot.
+    """
+    container = "golf"
+    snapshot_name = "dashboard_snapshot/dashboard.pack"
+    content_type = "application/x-golf-snapshot"
+
+    # Read from storage, never from the currently mapped snapshot
+    snapshot = None
+
+    _lock = threading.Lock()
+    _checked_at: Optional[float] = None
+
+    @property
+    def prefixes(self) -> Dict[str, List[str]]:
+        """
+        Blob prefixes the dashboard reads, per container.
+
+        Returns:
+            Dict[str, List[str]]: Containers mapped to the prefixes to pack.
+        """
+        return {self.container: [
+            "catalog/",
+            f"{self.vars.golf_course_name}_golf_course_hole_summary/",
+            "trackman_club_summary/",
+            "trackman_yardage_summary/",
+            "trackman_shot_table/",
+            "trackman_session_summary/",
+            "trackman_session_trajectories/"
+        ]}
+
+    @property
+    def directory(self) -> str:
+        """
+        Local directory snapshot packs are downloaded to.
+
+        Returns:
+            str: The `blob_snapshot_directory` variable, or a directory in the system temp folder.
+        """
+        return self.vars.blob_snapshot_directory or os.path.join(tempfile.gettempdir(), "golf_dashboard_snapshot")
+
+    def publish(self) -> tuple[str, int, bool]:
+        """
+        Pack the blobs the dashboard reads and upload them as the published snapshot.
+
+        The new pack is built from the previously published one: blobs whose
+        listed ETag matches the packed one are copied from it, so only blobs
+        written since are downloaded. Without a readable previous snapshot
+        every blob is downloaded.
+
+        Returns:
+            tuple[str, int, bool]: Version of the snapshot, its size in bytes, and whether it was uploaded
+                (False when the published snapshot already had the same content).
+        """
+        # List every blob under the packed prefixes, bypassing cached listings
+        entries = [
+            (container, entry)
+            for container, prefixes in self.prefixes.items()
+            for prefix in prefixes
+            for entry in self.list_blob_entries(container, prefix, use_cache=False)
+        ]
+
+        # Reuse the blobs that are unchanged since the previous snapshot
+        try:
+            previous = self._load_published()
+        except (HttpResponseError, ServiceRequestError, TimeoutError, OSError, ValueError):
+            previous = None
+
+        blobs, changed = [], []
+        for container, entry in entries:
+            blob = previous.packed(container, entry) if previous is not None else None
+            if blob is None:
+                changed.append((container, entry))
+            else:
+                blobs.append(blob)
+
+        # Download and decode the changed blobs concurrently
+        def read(container: str, entry: BlobEntry) -> dict:
+            data, properties = self.download_stored_blob(container=container, input_filename=entry.name)
+            return {
+                "container": container,
+                "name": entry.name,
+                "data": BlobCodecs.decode(data, properties.get("content_encoding")),
+                "content_type": properties.get("content_type") or "application/json",
+                "etag": entry.etag,
+                "last_modified": entry.last_modified.isoformat() if entry.last_modified else None
+            }
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            blobs.extend(executor.map(lambda item: read(*item), changed))
+
+        # Upload the pack, which is skipped when its content hash is unchanged
+        pack, version = SnapshotPack.build(prefixes=self.prefixes, blobs=blobs)
+        uploaded = self.export_bytes_to_blob(data=pack, container=self.container, output_filename=self.snapshot_name,
+                                             content_type=self.content_type)
+        return version, len(pack), uploaded
+
+    def refresh(self, force: bool = False) -> Optional[SnapshotPack]:
+        """
+        Swap in the published snapshot if it changed since it was last checked.
+
+        Failures to check or download leave the current snapshot in place, so
+        pages keep being served while Azure is unreachable.
+
+        Args:
+            force (bool): Check now, even if the last check is younger than `blob_snapshot_ttl`.
+
+        Returns:
+            Optional[SnapshotPack]: The snapshot now being served, or None if none has been published.
+        """
+        with self._lock:
+            now = time.monotonic()
+            checked_at = BlobSnapshot._checked_at
+            if not force and checked_at is not None and now - checked_at < self.vars.blob_snapshot_ttl:
+                return BlobClient.snapshot
+            BlobSnapshot._checked_at = now
+
+            try:
+                pack = self._load_published()
+            except (HttpResponseError, ServiceRequestError, TimeoutError, OSError, ValueError):
+                return BlobClient.snapshot
+
+            # Swap atomically; readers holding the previous pack keep a valid mapping
+            if pack is not None and pack is not BlobClient.snapshot:
+                BlobClient.snapshot = pack
+                self._remove_stale_packs(keep=pack.path)
+            return BlobClient.snapshot
+
+    def _load_published(self) -> Optional[SnapshotPack]:
+        """
+        Map the published snapshot, downloading it if this host does not have it yet.
+
+        Returns:
+            Optional[SnapshotPack]: The published snapshot (the current one if unchanged), or None if none
+                has been published.
+        """
+        blob_client = self.service_client.get_blob_client(container=self.container, blob=self.snapshot_name)
+        try:
+            with self.timed("head", self.container, self.snapshot_name):
+                properties = self.guarded("head", blob_client.get_blob_properties, self.container, self.snapshot_name)
+        except ResourceNotFoundError:
+            return None
+
+        # Identify the version by its content hash, falling back to the ETag
+        version = (properties.metadata or {}).get(self.content_hash_key) or properties.etag.strip('"')
+        path = os.path.join(self.directory, f"dashboard-{version[:32]}.pack")
+        if BlobClient.snapshot is not None and BlobClient.snapshot.path == path:
+            return BlobClient.snapshot
+
+        # Download a version this host has not seen, writing it aside and renaming it into place
+        if not os.path.exists(path):
+            os.makedirs(self.directory, exist_ok=True)
+            temporary_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with self.timed("read", self.container, self.snapshot_name) as sample, \
+                        open(temporary_path, "wb") as file:
+                    download_stream = self.guarded("read", lambda: blob_client.download_blob(decompress=False),
+                                                   self.container, self.snapshot_name)
+                    sample["bytes"] = download_stream.readinto(file)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(temporary_path, path)
+            finally:
+                if os.path.exists(temporary_path):
+                    os.remove(temporary_path)
+
+        return SnapshotPack(path)
+
+    def _remove_stale_packs(self, keep: str) -> None:
+        """
+        Delete packs of previous versions from the local directory.
+
+        Mappings still open on a deleted file stay valid on POSIX; where the file
+        is still in use and cannot be removed it is left for a later refresh.
+
+        Args:
+            keep (str): Pack file to keep.
+
+        Returns: None
+        """
+        for path in glob.glob(os.path.join(self.directory, "dashboard-*.pack")):
+            if path != keep:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Stop serving the current snapshot and forget when it was last checked.
+
+        Returns: None
+        """
+        with cls._lock:
+            cls._checked_at = None
+            BlobClient.snapshot = None
@@ -0,0 +1,291 @@
+# Import dependencies
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from ..interfaces.blob_models import BlobWriteReport, BufferedWrite
+from typing import Dict, IO, Optional
+from .blob_metrics import BlobMetrics
+from .blob_client import BlobClient
+import threading
+import atexit
+import json
+import os
+
+class BlobWriteBuffer(BlobClient):
+    """
+    Write-behind buffer for pipeline outputs.
+
+    While the buffer is active (as a context manager), every `export_dict_to_blob`
+    and `export_bytes_to_blob` made through any `BlobClient` in the process is
+    serialized and encoded as usual but held in memory instead of uploaded.
+    Repeated writes to the same blob coalesce, so only the last version is ever
+    uploaded. `flush` uploads everything pending in parallel, and is meant to be
+    called at stage boundaries; the buffer also flushes when it is exited and,
+    as a last resort, when the interpreter exits.
+
+    Reads of a pending blob through `BlobClient`, streamed reads included, are
+    served from the buffer. Listings only see blobs once flushed, so a stage
+    that lists a previous stage's output must follow a flush. Batched exports
+    report buffered writes as succeeded; upload failures surface in the
+    `BlobWriteReport` returned by `flush`.
+
+    Every accepted write is appended to a spill file (`blob_spill_file`) and
+    synced to disk before `put` returns, and the file is rewritten with whatever
+    is still pending after each flush. Appends happen under the buffer lock, but
+    the sync does not: writers accepted while a sync is running are covered by
+    the next one, so concurrent writers share syncs instead of queueing behind
+    each other's. A buffer opened on a spill file left behind by a crashed run
+    replays it, so its writes are uploaded by the next flush rather than lost.
+    The spill file only helps if it outlives the run, so on an ephemeral
+    machine (e.g. a CI runner) it must sit in a directory that is restored
+    between runs.
+
+    Typical usage example:
+        with BlobWriteBuffer() as buffer:
+            aggregator.summarise_range_clubs_data(clubs=clubs)
+            report = buffer.flush()
+
+    Attributes:
+        spill_path (Optional[str]): Spill file of pending writes, or None to buffer in memory only.
+        recovered (int): Writes replayed from the spill file when the buffer was opened.
+        coalesced (int): Writes replaced by a later write to the same blob before being uploaded.
+    """
+    def __init__(self, source: str = "backend", spill_path: Optional[str] = None, **kwargs) -> None:
+        """
+        Initialize the buffer and replay any writes left in its spill file.
+
+        Args:
+            source (str): Where configuration variables are loaded from ("backend" or "frontend").
+            spill_path (Optional[str]): Spill file of pending writes. Defaults to the `blob_spill_file` variable;
+                an empty value disables spilling. A leading `~` is expanded.
+            **kwargs: Forwarded to `BlobClient` (e.g. `policy`).
+        """
+        super().__init__(source=source, **kwargs)
+        self.spill_path = spill_path if spill_path is not None else self.vars.blob_spill_file
+        self.spill_path = os.path.expanduser(self.spill_path) if self.spill_path else None
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._spill: Optional[IO[str]] = None
+        self._appended = 0
+        self._synced = 0
+        self._pending: Dict[tuple[str, str], BufferedWrite] = {}
+
+        # Replay writes a previous run accepted but never uploaded
+        self.recovered = self._load_spill()
+
+    def __enter__(self) -> "BlobWriteBuffer":
+        """
+        Make this the process-wide buffer that blob client writes go to.
+
+        Returns:
+            BlobWriteBuffer: The active buffer.
+
+        Raises:
+            RuntimeError: If another buffer is already active.
+        """
+        if BlobClient.write_buffer is not None:
+            raise RuntimeError("A blob write buffer is already active")
+
+        BlobClient.write_buffer = self
+        atexit.register(self.close)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """
+        Flush pending writes and stop buffering, even when the block raised.
+
+        Returns: None
+        """
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of blobs waiting to be uploaded.
+
+        Returns:
+            int: Pending write count.
+        """
+        with self._lock:
+            return len(self._pending)
+
+    def put(self, write: BufferedWrite) -> None:
+        """
+        Accept a write, replacing any pending write to the same blob.
+
+        Args:
+            write (BufferedWrite): The encoded payload to upload on the next flush.
+
+        Returns: None
+        """
+        with self._lock:
+            if write.key in self._pending:
+                self.coalesced += 1
+                BlobMetrics.count_event("coalesced", "write", write.container, write.name, write.caller)
+
+            # Journal the write, syncing it to disk outside the lock
+            if self.spill_path:
+                if self._spill is None:
+                    os.makedirs(os.path.dirname(os.path.abspath(self.spill_path)), exist_ok=True)
+                    self._spill = open(self.spill_path, "a", encoding="utf-8")
+                self._spill.write(json.dumps(write.to_record()) + "\n")
+                self._spill.flush()
+                self._appended += 1
+
+            self._pending[write.key] = write
+            appended = self._appended
+
+        # Acknowledge the write once it is on disk
+        self._sync_spill(appended)
+
+    def get(self, container: str, blob: str) -> Optional[BufferedWrite]:
+        """
+        Look up the pending write to a blob.
+
+        Args:
+            container (str): Container of the blob.
+            blob (str): Name of the blob.
+
+        Returns:
+            Optional[BufferedWrite]: The latest pending write, or None if the blob has none.
+        """
+        with self._lock:
+            return self._pending.get((container, blob))
+
+    def flush(self, max_workers: Optional[int] = None) -> BlobWriteReport:
+        """
+        Upload every pending write in parallel.
+
+        Writes stay pending (and readable from the buffer) until their upload
+        succeeds. Failed writes are kept for the next flush, as are writes
+        replaced while the flush was running.
+
+        Args:
+            max_workers (Optional[int]): Upper bound on concurrent uploads. Defaults to `max_workers`.
+
+        Returns:
+            BlobWriteReport: Which blobs were uploaded, which were unchanged and which failed.
+        """
+        with self._lock:
+            writes = list(self._pending.values())
+
+        report = BlobWriteReport()
+        if not writes:
+            return report
+
+        # Upload the latest version of every blob on a bounded thread pool
+        uploaded = []
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as executor:
+            futures = {executor.submit(self.upload_stored_blob, write): write for write in writes}
+            for future in as_completed(futures):
+                write = futures[future]
+                try:
+                    if not future.result():
+                        report.skipped.append(write.name)
+                    uploaded.append(write)
+                    report.succeeded.append(write.name)
+                except Exception as e:
+                    report.failed[write.name] = e
+
+        # Forget uploaded writes that were not replaced in the meantime, and journal the rest
+        with self._sync_lock, self._lock:
+            for write in uploaded:
+                if self._pending.get(write.key) is write:
+                    del self._pending[write.key]
+            self._rewrite_spill()
+
+        return report
+
+    def close(self) -> BlobWriteReport:
+        """
+        Flush pending writes and deactivate the buffer.
+
+        Returns:
+            BlobWriteReport: Outcome of the final flush.
+        """
+        atexit.unregister(self.close)
+        try:
+            return self.flush()
+        finally:
+            if BlobClient.write_buffer is self:
+                BlobClient.write_buffer = None
+            with self._sync_lock, self._lock:
+                if self._spill is not None:
+                    self._spill.close()
+                    self._spill = None
+
+    def _load_spill(self) -> int:
+        """
+        Replay the spill file into the pending writes.
+
+        A record cut short by a crash is skipped; every complete record before it
+        was acknowledged and is replayed, later records replacing earlier ones.
+
+        Returns:
+            int: Number of blobs recovered.
+        """
+        if not self.spill_path or not os.path.exists(self.spill_path):
+            return 0
+
+        with open(self.spill_path, encoding="utf-8") as spill:
+            for line in spill:
+                try:
+                    write = BufferedWrite.from_record(json.loads(line))
+                except (ValueError, TypeError, KeyError):
+                    continue
+                self._pending[write.key] = write
+
+        return len(self._pending)
+
+    def _sync_spill(self, appended: int) -> None:
+        """
+        Sync the spill file to disk up to a given append, unless another writer already has.
+
+        One sync covers every record appended before it started, so writers
+        waiting here while a sync runs are usually released without one.
+
+        Args:
+            appended (int): Number of appends the caller's record completed.
+
+        Returns: None
+        """
+        with self._sync_lock:
+            if self._synced >= appended:
+                return
+
+            with self._lock:
+                spill, target = self._spill, self._appended
+            if spill is not None:
+                os.fsync(spill.fileno())
+            self._synced = target
+
+    def _rewrite_spill(self) -> None:
+        """
+        Replace the spill file with the writes still pending, removing it when none are.
+
+        The new journal is written beside the old one and swapped in atomically,
+        so a crash mid-rewrite leaves one complete journal or the other. Callers
+        hold both the sync lock and the buffer lock.
+
+        Returns: None
+        """
+        if not self.spill_path:
+            return
+
+        # Close the append handle, every record appended so far is rewritten and synced below
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+        self._synced = self._appended
+
+        if not self._pending:
+            if os.path.exists(self.spill_path):
+                os.remove(self.spill_path)
+            return
+
+        temporary_path = f"{self.spill_path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as spill:
+            for write in self._pending.values():
+                spill.write(json.dumps(write.to_record()) + "\n")
+            spill.flush()
+            os.fsync(spill.fileno())
+        os.replace(temporary_path, self.spill_path)
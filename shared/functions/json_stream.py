@@ -0,0 +1,264 @@
+# Import dependencies
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import codecs
+import json
+import re
+
+# Tokens used to walk the document
+WHITESPACE = re.compile(r"\s*")
+STRING_TAIL = re.compile(r'(?:[^"\\]|\\.)*"', re.S)
+LITERAL = re.compile(r"[^\s,\]}]+")
+STRUCTURE = re.compile(r'[\[\]{}"]')
+
+# Path elements: object keys or array indices
+PathKey = Union[str, int]
+
+class JsonStream:
+    """
+    Incremental extraction of selected values from a JSON document arriving in chunks.
+
+    Callers describe the values they want with path patterns, where each element
+    is an object key or "*" for any array index or key, e.g.
+    `("StrokeGroups", "*", "Strokes", "*")` selects every stroke of every stroke
+    group. The document is walked token by token only down to the selected
+    values; each selected value is decoded with `json.loads` as soon as its last
+    byte arrives, and everything else is skipped by scanning for brackets and
+    quotes without building Python objects. Consumed input is dropped from the
+    buffer, including the scanned part of a skipped object or array, so peak
+    memory is bounded by the largest selected value (or skipped string or
+    number) rather than the whole document.
+
+    Typical usage example:
+        stream = JsonStream(patterns=[("StrokeGroups", "*", "Club")])
+        for path, club in stream.iter_items(chunks):
+            ...
+
+    Attributes:
+        patterns (List[tuple]): Path patterns of the values to extract.
+    """
+    # Consumed input kept in the buffer before it is compacted
+    compact_after = 1 << 16
+
+    def __init__(self, patterns: Sequence[Sequence[PathKey]]) -> None:
+        """
+        Initialize the stream with the patterns of the values to extract.
+
+        Args:
+            patterns (Sequence[Sequence[PathKey]]): Path patterns, "*" matching any key or index.
+        """
+        self.patterns = [tuple(pattern) for pattern in patterns]
+        self.buffer = ""
+        self.pos = 0
+        self.stack: List[list] = []
+        self.pending: Optional[list] = None
+        self.done = False
+
+    def iter_items(self, chunks: Iterable[bytes]) -> Iterator[Tuple[tuple, Any]]:
+        """
+        Extract the selected values from a UTF-8 encoded document.
+
+        Args:
+            chunks (Iterable[bytes]): The document in order.
+
+        Returns:
+            Iterator[Tuple[tuple, Any]]: Path of each selected value (keys and indices) and the decoded value,
+                in document order.
+
+        Raises:
+            ValueError: If the document is malformed or truncated.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        for chunk in chunks:
+            yield from self.feed(decoder.decode(chunk))
+        yield from self.feed(decoder.decode(b"", final=True), final=True)
+
+        if not self.done:
+            raise ValueError("Truncated JSON document")
+
+    def feed(self, text: str, final: bool = False) -> Iterator[Tuple[tuple, Any]]:
+        """
+        Consume the next piece of the document.
+
+        Args:
+            text (str): Next piece of the document.
+            final (bool): Whether this is the last piece.
+
+        Returns:
+            Iterator[Tuple[tuple, Any]]: Selected values completed by this piece.
+        """
+        self.compact()
+        self.buffer += text
+
+        while not self.done:
+
+            # Finish the value being captured or skipped
+            if self.pending is not None:
+                end = self.scan_value(final)
+                if end is None:
+                    return
+                action, path, start = self.pending[:3]
+                if action == "capture":
+                    yield path, json.loads(self.buffer[start:end])
+                self.pending = None
+                self.pos = end
+                self.value_done()
+                continue
+
+            # Read the next structural token
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos >= len(self.buffer):
+                return
+            if not self.step():
+                return
+
+    def step(self) -> bool:
+        """
+        Handle the structural token at the current position.
+
+        Returns:
+            bool: False if more input is needed to make progress.
+
+        Raises:
+            ValueError: If the token is not valid at this position.
+        """
+        char = self.buffer[self.pos]
+        frame = self.stack[-1] if self.stack else None
+
+        # Close the current container
+        if char in "}]" and frame is not None:
+            self.stack.pop()
+            self.pos += 1
+            self.value_done()
+
+        # Move to the next key or array item
+        elif char == "," and frame is not None and frame[2] == "comma":
+            frame[1] = frame[1] + 1 if frame[0] == "array" else None
+            frame[2] = "value" if frame[0] == "array" else "key"
+            self.pos += 1
+
+        # Read an object key
+        elif char == '"' and frame is not None and frame[2] == "key":
+            match = STRING_TAIL.match(self.buffer, self.pos + 1)
+            if match is None:
+                return False
+            frame[1] = json.loads(self.buffer[self.pos:match.end()])
+            frame[2] = "colon"
+            self.pos = match.end()
+
+        elif char == ":" and frame is not None and frame[2] == "colon":
+            frame[2] = "value"
+            self.pos += 1
+
+        # Start a value: descend into it, or capture or skip it whole
+        elif frame is None or frame[2] == "value":
+            path = tuple(entry[1] for entry in self.stack)
+            action = self.action(path)
+            if action == "descend" and char in "{[":
+                self.stack.append(["object", None, "key"] if char == "{" else ["array", 0, "value"])
+                self.pos += 1
+            else:
+                self.pending = ["capture" if action == "capture" else "skip", path, self.pos, self.pos, 0]
+
+        else:
+            raise ValueError(f"Unexpected {char!r} in JSON document")
+
+        return True
+
+    def action(self, path: tuple) -> str:
+        """
+        Decide how to handle the value at a path.
+
+        Args:
+            path (tuple): Keys and indices leading to the value.
+
+        Returns:
+            str: "descend" if a pattern selects values inside it, "capture" if a pattern selects it,
+                otherwise "skip".
+        """
+        def matches(pattern: tuple) -> bool:
+            return all(expected == "*" or expected == key for expected, key in zip(pattern, path))
+
+        if any(len(pattern) > len(path) and matches(pattern) for pattern in self.patterns):
+            return "descend"
+        if any(len(pattern) == len(path) and matches(pattern) for pattern in self.patterns):
+            return "capture"
+        return "skip"
+
+    def scan_value(self, final: bool) -> Optional[int]:
+        """
+        Find the end of the pending value without decoding it, resuming where the last scan stopped.
+
+        Args:
+            final (bool): Whether the buffer holds the rest of the document.
+
+        Returns:
+            Optional[int]: Buffer offset just past the value, or None if more input is needed.
+        """
+        _, _, start, scan, depth = self.pending
+
+        # A container already scanned into may have had its opening bracket compacted away
+        first = self.buffer[start] if depth == 0 else "["
+
+        # Strings end at the first unescaped quote
+        if first == '"':
+            match = STRING_TAIL.match(self.buffer, start + 1)
+            return match.end() if match else None
+
+        # Numbers and literals end at the next delimiter
+        if first not in "{[":
+            end = LITERAL.match(self.buffer, start).end()
+            return end if end < len(self.buffer) or final else None
+
+        # Containers end when their brackets balance, ignoring brackets inside strings
+        while True:
+            match = STRUCTURE.search(self.buffer, scan)
+            if match is None:
+                self.pending[3:] = [len(self.buffer), depth]
+                return None
+            if match.group() == '"':
+                string = STRING_TAIL.match(self.buffer, match.end())
+                if string is None:
+                    self.pending[3:] = [match.start(), depth]
+                    return None
+                scan = string.end()
+                continue
+            scan = match.end()
+            depth += 1 if match.group() in "{[" else -1
+            if depth == 0:
+                return scan
+
+    def value_done(self) -> None:
+        """
+        Record that the value at the current position has been consumed.
+
+        Returns: None
+        """
+        if self.stack:
+            self.stack[-1][2] = "comma"
+        else:
+            self.done = True
+
+    def compact(self) -> None:
+        """
+        Drop consumed input from the buffer.
+
+        A captured value is kept from its start, as it is decoded whole. A
+        skipped container is only kept from where its scan stopped, since the
+        scan resumes there with the bracket depth it reached.
+
+        Returns: None
+        """
+        if self.pending is None:
+            cut = self.pos
+        elif self.pending[0] == "skip" and self.pending[4] > 0:
+            cut = self.pending[3]
+        else:
+            cut = self.pending[2]
+        if cut < self.compact_after:
+            return
+
+        self.buffer = self.buffer[cut:]
+        self.pos = max(self.pos - cut, 0)
+        if self.pending is not None:
+            self.pending[2] = max(self.pending[2] - cut, 0)
+            self.pending[3] -= cut
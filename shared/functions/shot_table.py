@@ -0,0 +1,210 @@
+# Import dependencies
+from ..interfaces.blob_models import BlobWriteReport
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from .blob_client import BlobClient
+from datetime import datetime
+import pyarrow.parquet as pq
+import pyarrow as pa
+import io
+
+class ShotTable(BlobClient):
+    """
+    Columnar store of TrackMan range shots, one Parquet file per club and day.
+
+    Each stroke is flattened into a row holding its `Time`, `Club`, the `Session`
+    document it came from and every `Measurement` field as its own column. Ball
+    trajectories are not stored: they live in the session trajectory documents
+    (see `TrackManSessions`) and are attached on demand by the trajectory plots.
+    Partitions live at `trackman_shot_table/club={club}/date={date}.parquet`
+    and rows inside a partition are ordered most recent shot first, so readers can:
+        - decode only the columns they display (column projection), and
+        - stop downloading and decoding once they have enough rows (row-limit pushdown),
+          walking partitions newest first.
+
+    Attributes:
+        container (str): Container holding the shot table.
+        prefix (str): Blob prefix of the shot table.
+        compression (str): Parquet compression codec.
+    """
+    container = "golf"
+    prefix = "trackman_shot_table"
+    compression = "zstd"
+
+    def partition_name(self, club: str, date: str) -> str:
+        """
+        Blob name of the partition holding a club's shots for one day.
+
+        Args:
+            club (str): Club name.
+            date (str): ISO date (YYYY-MM-DD).
+
+        Returns:
+            str: Blob name of the partition.
+        """
+        return f"{self.prefix}/club={club}/date={date}.parquet"
+
+    def build_partitions(self, club: str, strokes: List[dict]) -> Dict[str, bytes]:
+        """
+        Flatten a club's strokes and encode them as one Parquet file per day.
+
+        Args:
+            club (str): Club name.
+            strokes (List[dict]): TrackMan strokes with `Time` and `Measurement` keys, and optionally the
+                `Session` blob they were read from.
+
+        Returns:
+            Dict[str, bytes]: Partition blob names mapped to Parquet file contents.
+        """
+        # Group flattened rows by the day the shot was hit
+        rows_by_date = {}
+        for stroke in strokes:
+            hit_at = datetime.fromisoformat(stroke["Time"])
+            measurement = {key: value for key, value in stroke["Measurement"].items() if key != "BallTrajectory"}
+            row = {"Time": stroke["Time"], "Club": club, "Session": stroke.get("Session"), **measurement}
+            rows_by_date.setdefault(hit_at.date().isoformat(), []).append((hit_at, row))
+
+        # Encode each day most recent shot first
+        partitions = {}
+        for date, rows in rows_by_date.items():
+            rows.sort(key=lambda row: row[0], reverse=True)
+            buffer = io.BytesIO()
+            pq.write_table(pa.Table.from_pylist([row for _, row in rows]), buffer, compression=self.compression)
+            partitions[self.partition_name(club, date)] = buffer.getvalue()
+
+        return partitions
+
+    def write_club_shots(self, clubs_strokes: Dict[str, List[dict]]) -> BlobWriteReport:
+        """
+        Write the shot table partitions for several clubs in one parallel flush.
+
+        Args:
+            clubs_strokes (Dict[str, List[dict]]): Club names mapped to all of their strokes.
+
+        Returns:
+            BlobWriteReport: Aggregated report of which partitions were written.
+        """
+        payloads = {}
+        for club, strokes in clubs_strokes.items():
+            payloads.update(self.build_partitions(club=club, strokes=strokes))
+
+        return self.export_bytes_to_blobs(payloads=payloads, container=self.container)
+
+    def list_clubs(self) -> List[str]:
+        """
+        List the clubs that have shots in the table.
+
+        Returns:
+            List[str]: Alphabetically sorted club names.
+        """
+        blob_names = self.list_blob_filenames(container_name=self.container, directory_path=f"{self.prefix}/club=")
+        return sorted({name[len(self.prefix) + 1:].split("/")[0].removeprefix("club=") for name in blob_names})
+
+    def list_partitions(self, club: str) -> List[str]:
+        """
+        List a club's partitions, most recent day first.
+
+        Args:
+            club (str): Club name.
+
+        Returns:
+            List[str]: Partition blob names.
+        """
+        blob_names = self.list_blob_filenames(container_name=self.container,
+                                              directory_path=f"{self.prefix}/club={club}/")
+        return sorted(blob_names, reverse=True)
+
+    def read_shots(
+        self,
+        club: str,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> pa.Table:
+        """
+        Read a club's shots, most recent first, decoding only the requested columns and rows.
+
+        Partitions are fetched newest first and reading stops as soon as `limit` rows
+        have been collected, so older partitions are never downloaded. Within a
+        partition, record batches are decoded only until the limit is reached.
+
+        Args:
+            club (str): Club name.
+            columns (Optional[List[str]]): Columns to decode (e.g. ["Carry", "Total"]). Defaults to all columns.
+                Columns missing from older partitions are returned as nulls, and columns stored as integers in
+                one partition and floats in another are returned as floats.
+            limit (Optional[int]): Maximum number of shots to return. Defaults to all shots.
+
+        Returns:
+            pa.Table: Shots for the club, most recent first.
+        """
+        tables = []
+        remaining = limit
+        for partition in self.list_partitions(club):
+            if remaining is not None and remaining <= 0:
+                break
+
+            # Decode only the requested columns present in this partition
+            parquet_file = pq.ParquetFile(pa.BufferReader(self.download_blob_bytes(self.container, partition)))
+            available = parquet_file.schema_arrow.names
+            projection = [column for column in columns if column in available] if columns else None
+
+            # Decode record batches until the row limit is reached
+            for batch in parquet_file.iter_batches(columns=projection, batch_size=remaining or 65536):
+                batch = batch.slice(0, remaining) if remaining is not None else batch
+                tables.append(pa.Table.from_batches([batch]))
+                if remaining is not None:
+                    remaining -= batch.num_rows
+                    if remaining <= 0:
+                        break
+
+        # Stitch partitions together, aligning schemas and widening types (e.g. int to float) that differ between days
+        if not tables:
+            return pa.table({column: pa.array([], type=pa.null()) for column in columns or []})
+        table = pa.concat_tables(tables, promote_options="permissive")
+        return table.select([column for column in columns if column in table.column_names]) if columns else table
+
+    def read_clubs_shots(
+        self,
+        clubs: List[str],
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[Tuple[str, Union[pa.Table, Exception]]]:
+        """
+        Read several clubs' shots concurrently through `read_shots`.
+
+        Args:
+            clubs (List[str]): Club names.
+            columns (Optional[List[str]]): Columns to decode. Defaults to all columns.
+            limit (Optional[int]): Maximum number of shots per club. Defaults to all shots.
+
+        Returns:
+            Iterator[Tuple[str, Union[pa.Table, Exception]]]: Each club paired with its shots,
+                or with the error raised while reading them, in the order of `clubs`.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [(club, executor.submit(self.read_shots, club=club, columns=columns, limit=limit))
+                       for club in clubs]
+            for club, future in futures:
+                try:
+                    yield club, future.result()
+                except Exception as e:
+                    yield club, e
+
+    @staticmethod
+    def to_strokes(table: pa.Table) -> List[dict]:
+        """
+        Convert shot table rows back into TrackMan stroke dictionaries.
+
+        Args:
+            table (pa.Table): Shots as returned by `read_shots`.
+
+        Returns:
+            List[dict]: Strokes shaped like the TrackMan report (`Time`, `Club`, `Session` and a `Measurement` dict).
+        """
+        strokes = []
+        for row in table.to_pylist():
+            stroke = {key: row.pop(key) for key in ("Time", "Club", "Session") if key in row}
+            stroke["Measurement"] = row
+            strokes.append(stroke)
+
+        return strokes
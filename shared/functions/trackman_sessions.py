@@ -0,0 +1,203 @@
+# Import dependencies
+from ..interfaces.blob_models import BlobWriteReport
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from azure.core.exceptions import ResourceNotFoundError
+from .blob_client import BlobClient
+
+class TrackManSessions(BlobClient):
+    """
+    Storage of TrackMan range session reports split into metrics and trajectories.
+
+    Ball trajectories make up most of a session report, but only the trajectory
+    plots use them. At ingest each report is therefore stored as two documents:
+        - a slim metrics document at `trackman_session_summary/{session}.json`,
+          the report with every `BallTrajectory` removed, and
+        - a trajectory document at `trackman_session_trajectories/{session}.json`
+          holding each stroke's `Time` and `BallTrajectory`, grouped like the report.
+    Metric readers (aggregation, yardages, club lists) read the slim document as
+    before, and trajectories are loaded on demand and matched to strokes by club
+    and time. Sessions ingested before the split have no trajectory document;
+    their trajectories are read from the original report instead.
+
+    Attributes:
+        container (str): Container holding the session documents.
+        prefix (str): Blob prefix of the metrics documents.
+        trajectory_prefix (str): Blob prefix of the trajectory documents.
+    """
+    container = "golf"
+    prefix = "trackman_session_summary"
+    trajectory_prefix = "trackman_session_trajectories"
+
+    def trajectory_name(self, blob_name: str) -> str:
+        """
+        Blob name of the trajectory document for a session.
+
+        Args:
+            blob_name (str): Blob name of the session's metrics document.
+
+        Returns:
+            str: Blob name of the trajectory document.
+        """
+        return f"{self.trajectory_prefix}/{blob_name.removeprefix(self.prefix + '/')}"
+
+    @staticmethod
+    def split_report(report: dict) -> Tuple[dict, dict]:
+        """
+        Split a TrackMan session report into its metrics and trajectory documents.
+
+        Args:
+            report (dict): TrackMan session report.
+
+        Returns:
+            Tuple[dict, dict]: The report without ball trajectories, and the trajectory document.
+        """
+        metrics = {**report, "StrokeGroups": []}
+        trajectories = {"StrokeGroups": []}
+        for group in report["StrokeGroups"]:
+            metrics_strokes, trajectory_strokes = [], []
+            for stroke in group.get("Strokes", []):
+                measurement = dict(stroke.get("Measurement", {}))
+                trajectory = measurement.pop("BallTrajectory", None)
+                metrics_strokes.append({**stroke, "Measurement": measurement})
+                trajectory_strokes.append({"Time": stroke.get("Time"), "BallTrajectory": trajectory})
+
+            metrics["StrokeGroups"].append({**group, "Strokes": metrics_strokes})
+            trajectories["StrokeGroups"].append({"Club": group.get("Club"), "Strokes": trajectory_strokes})
+
+        return metrics, trajectories
+
+    def session_payloads(self, blob_name: str, report: dict) -> Dict[str, dict]:
+        """
+        Build the documents to upload for a session report.
+
+        Args:
+            blob_name (str): Blob name of the session's metrics document.
+            report (dict): TrackMan session report.
+
+        Returns:
+            Dict[str, dict]: Metrics and trajectory blob names mapped to their documents.
+        """
+        metrics, trajectories = self.split_report(report)
+        return {blob_name: metrics, self.trajectory_name(blob_name): trajectories}
+
+    def export_session(self, blob_name: str, report: dict) -> BlobWriteReport:
+        """
+        Store a session report as its metrics and trajectory documents.
+
+        Args:
+            blob_name (str): Blob name of the session's metrics document.
+            report (dict): TrackMan session report.
+
+        Returns:
+            BlobWriteReport: Report of which documents were written.
+        """
+        return self.export_dicts_to_blobs(payloads=self.session_payloads(blob_name, report), container=self.container)
+
+    def read_trajectories(self, blob_name: str, clubs: Optional[Iterable[str]] = None) -> Dict[Tuple[str, str], list]:
+        """
+        Read the ball trajectories of one session, falling back to the original report for legacy sessions.
+
+        Args:
+            blob_name (str): Blob name of the session's metrics document.
+            clubs (Optional[Iterable[str]]): Only read trajectories of these clubs. Defaults to every club.
+
+        Returns:
+            Dict[Tuple[str, str], list]: Ball trajectories keyed by club and stroke time.
+        """
+        clubs = list(clubs) if clubs is not None else None
+        try:
+            strokes = list(self.iter_session_strokes(self.container, self.trajectory_name(blob_name), clubs=clubs))
+            return {(club, stroke["Time"]): stroke["BallTrajectory"] for club, stroke in strokes}
+
+        # Sessions ingested before the split keep their trajectories inline
+        except ResourceNotFoundError:
+            strokes = self.iter_session_strokes(self.container, blob_name, clubs=clubs)
+            return {(club, stroke["Time"]): stroke["Measurement"].get("BallTrajectory") for club, stroke in strokes}
+
+    def iter_strokes(
+        self,
+        blob_name: str,
+        clubs: Optional[Iterable[str]] = None,
+        trajectories: bool = False
+    ) -> Iterator[Tuple[str, dict]]:
+        """
+        Stream the strokes of a session, optionally with their ball trajectories.
+
+        Args:
+            blob_name (str): Blob name of the session's metrics document.
+            clubs (Optional[Iterable[str]]): Only yield strokes hit with these clubs. Defaults to every club.
+            trajectories (bool): Whether to attach each stroke's `BallTrajectory` to its measurement.
+
+        Returns:
+            Iterator[Tuple[str, dict]]: Each stroke paired with the club it was hit with.
+        """
+        clubs = list(clubs) if clubs is not None else None
+        if not trajectories:
+            yield from self.iter_session_strokes(self.container, blob_name, clubs=clubs)
+            return
+
+        # Load the selected clubs' trajectories, legacy sessions already carry them inline
+        try:
+            loaded = {(club, stroke["Time"]): stroke["BallTrajectory"] for club, stroke in
+                      self.iter_session_strokes(self.container, self.trajectory_name(blob_name), clubs=clubs)}
+        except ResourceNotFoundError:
+            yield from self.iter_session_strokes(self.container, blob_name, clubs=clubs)
+            return
+
+        # Stream the metrics and attach each stroke's trajectory
+        for club, stroke in self.iter_session_strokes(self.container, blob_name, clubs=clubs):
+            stroke["Measurement"]["BallTrajectory"] = loaded.get((club, stroke["Time"]))
+            yield club, stroke
+
+    def attach_trajectories(self, club: str, strokes: List[dict]) -> List[dict]:
+        """
+        Fill in the ball trajectories of strokes read from metrics only sources (e.g. the shot table).
+
+        Trajectory documents of every session referenced by the strokes' `Session`
+        field are read concurrently; strokes that already carry a trajectory or
+        have no session are left unchanged.
+
+        Args:
+            club (str): Club the strokes were hit with.
+            strokes (List[dict]): Strokes with `Time`, `Session` and `Measurement` keys.
+
+        Returns:
+            List[dict]: The same strokes, with `Measurement.BallTrajectory` set where it could be found.
+        """
+        missing = [stroke for stroke in strokes
+                   if stroke.get("Session") and stroke["Measurement"].get("BallTrajectory") is None]
+        sessions = sorted({stroke["Session"] for stroke in missing})
+
+        # Read the trajectory documents of the sessions involved concurrently
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            loaded = dict(zip(sessions, executor.map(lambda name: self.read_trajectories(name, [club]), sessions)))
+
+        for stroke in missing:
+            stroke["Measurement"]["BallTrajectory"] = loaded[stroke["Session"]].get((club, stroke["Time"]))
+
+        return strokes
+
+    def split_legacy_session(self, blob_name: str) -> bool:
+        """
+        Split a session stored before trajectories were separated into its two documents.
+
+        The trajectory document is written before the metrics document is slimmed,
+        so an interrupted migration never loses trajectories.
+
+        Args:
+            blob_name (str): Blob name of the session's metrics document.
+
+        Returns:
+            bool: True if the session was split, False if it had no inline trajectories.
+        """
+        report = self.read_blob_to_dict(container=self.container, input_filename=blob_name)
+        if not any("BallTrajectory" in stroke.get("Measurement", {})
+                   for group in report["StrokeGroups"] for stroke in group.get("Strokes", [])):
+            return False
+
+        metrics, trajectories = self.split_report(report)
+        self.export_dict_to_blob(data=trajectories, container=self.container,
+                                 output_filename=self.trajectory_name(blob_name))
+        self.export_dict_to_blob(data=metrics, container=self.container, output_filename=blob_name)
+        return True
@@ -5,6 +5,9 @@ import os
 
 load_dotenv()
 
+# Default journal of the write-behind buffer, outside the checkout so it survives a fresh clone
+DEFAULT_BLOB_SPILL_FILE = os.path.join(os.path.expanduser("~"), ".cache", "golf_ui", "blob_write_spill.jsonl")
+
 class Variables():
     """
     Centralized configuration manager for environment-based application variables.
@@ -20,13 +23,33 @@ class Variables():
 
         Attributes:
             chromedriver_path (str): Path to the ChromeDriver executable.
+            browser_profile (str): Chrome profile used for scraping ("default" or "lean").
+            browser_user_data_dir (str | None): Persistent Chrome user-data directory, a fresh profile if unset.
+            browser_capture_network (bool): Whether scrapers read the JSON responses behind pages.
             blob_account_connection_string (str): Azure Blob Storage connection string.
             golf_course_name (str): Name of the golf course for filtering/aggregation.
+            blob_cache_directory (str | None): Local directory for the blob disk cache, disabled if unset.
+            blob_cache_max_mb (int): Size bound of the blob disk cache in megabytes.
+            blob_cache_max_age (float): Seconds a cached blob is served without revalidation.
+            blob_codec (str): Codec used to compress blobs on write ("gzip", "zstd" or "identity").
+            blob_serializer (str): Serializer used for blob documents on write ("json", "orjson" or "msgpack").
+            blob_listing_ttl (float): Seconds a blob prefix listing is reused, 0 disables listing caching.
+            blob_timeout (float): Deadline in seconds for a single blob call, 0 disables deadlines.
+            blob_retries (int): Retries of a blob call after transient failures.
+            blob_backoff (float): Base backoff in seconds between retries, doubled on every retry.
+            blob_hedge_percentile (float): Latency percentile after which reads are hedged, 0 disables hedging.
+            blob_spill_file (str): Journal of writes held by the write-behind buffer, replayed after a crash.
+                Must be on storage that outlives the run (restored between runs on CI) to recover anything.
+            blob_snapshot_directory (str | None): Local directory dashboard snapshots are downloaded to,
+                the system temp directory if unset.
+            blob_snapshot_ttl (float): Seconds between checks for a newer dashboard snapshot.
 
             round_site_base_url (str): Base URL for the golf round tracking site.
             round_site_username (str): Username for the round site login.
             round_site_password (str): Password for the round site login.
             round_site_player_name (str): Display name of the player on the round site.
+            round_site_api_url (str | None): URL template of the JSON round endpoint fetched in HTTP mode,
+                `{round_id}` standing for the round ID; learned from the browser's network traffic if unset.
 
             trackman_username (str): Username for Trackman login.
             trackman_password (str): Password for Trackman login.
@@ -35,18 +58,48 @@ class Variables():
         if source == "backend":
             self.blob_account_connection_string = os.getenv("blob_storage_connection_string")
             self.golf_course_name = os.getenv("golf_course_name")
+            self.blob_cache_directory = os.getenv("blob_cache_directory")
+            self.blob_cache_max_mb = int(os.getenv("blob_cache_max_mb", default=256))
+            self.blob_cache_max_age = float(os.getenv("blob_cache_max_age", default=0))
+            self.blob_codec = os.getenv("blob_codec", default="gzip")
+            self.blob_serializer = os.getenv("blob_serializer", default="json")
+            self.blob_listing_ttl = float(os.getenv("blob_listing_ttl", default=30))
+            self.blob_timeout = float(os.getenv("blob_timeout", default=30))
+            self.blob_retries = int(os.getenv("blob_retries", default=3))
+            self.blob_backoff = float(os.getenv("blob_backoff", default=0.2))
+            self.blob_hedge_percentile = float(os.getenv("blob_hedge_percentile", default=0))
+            self.blob_spill_file = os.getenv("blob_spill_file", default=DEFAULT_BLOB_SPILL_FILE)
+            self.blob_snapshot_directory = os.getenv("blob_snapshot_directory")
+            self.blob_snapshot_ttl = float(os.getenv("blob_snapshot_ttl", default=60))
         else:
             self.blob_account_connection_string = st.secrets["general"]["blob_storage_connection_string"]
             self.golf_course_name = st.secrets["general"]["golf_course_name"]
+            self.blob_cache_directory = st.secrets["general"].get("blob_cache_directory") or None
+            self.blob_cache_max_mb = int(st.secrets["general"].get("blob_cache_max_mb") or 256)
+            self.blob_cache_max_age = float(st.secrets["general"].get("blob_cache_max_age") or 0)
+            self.blob_codec = st.secrets["general"].get("blob_codec") or "gzip"
+            self.blob_serializer = st.secrets["general"].get("blob_serializer") or "json"
+            self.blob_listing_ttl = float(st.secrets["general"].get("blob_listing_ttl") or 30)
+            self.blob_timeout = float(st.secrets["general"].get("blob_timeout") or 30)
+            self.blob_retries = int(st.secrets["general"].get("blob_retries") or 3)
+            self.blob_backoff = float(st.secrets["general"].get("blob_backoff") or 0.2)
+            self.blob_hedge_percentile = float(st.secrets["general"].get("blob_hedge_percentile") or 0)
+            self.blob_spill_file = st.secrets["general"].get("blob_spill_file") or DEFAULT_BLOB_SPILL_FILE
+            self.blob_snapshot_directory = st.secrets["general"].get("blob_snapshot_directory") or None
+            self.blob_snapshot_ttl = float(st.secrets["general"].get("blob_snapshot_ttl") or 60)
 
         # General Backend variables
         self.chromedriver_path = os.getenv("chromedriver_path", default="chromedriver.exe")
+        self.browser_profile = os.getenv("browser_profile", default="default")
+        self.browser_user_data_dir = os.getenv("browser_user_data_dir")
+        self.browser_capture_network = os.getenv("browser_capture_network", default="false").lower() == "true"
 
         # Backend - Scorecard variables
         self.round_site_base_url = os.getenv("round_site_base_url")
         self.round_site_username = os.getenv("round_site_username")
         self.round_site_password = os.getenv("round_site_password")
         self.round_site_player_name = os.getenv("round_site_player_name")
+        self.round_site_api_url = os.getenv("round_site_api_url")
 
         # Backend - Trackman variables
         self.trackman_username = os.getenv("trackman_username")
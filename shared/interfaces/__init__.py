@@ -1,6 +1,22 @@
 # Import dependencies
+from .blob_models import (
+    BlobReadResult, BlobWriteReport, BlobCacheStats, BlobEntry, CatalogEntry, BlobOperationStats, BufferedWrite
+)
+from .async_blob_client_base import AbstractAsyncBlobClient
 from .blob_client_base import AbstractBlobClient
+from .blob_serializer_base import AbstractBlobSerializer
+from .blob_codec_base import AbstractBlobCodec
 
 __all__ = [
-    "AbstractBlobClient"
+    "AbstractAsyncBlobClient",
+    "AbstractBlobClient",
+    "AbstractBlobCodec",
+    "AbstractBlobSerializer",
+    "BlobCacheStats",
+    "BlobWriteReport",
+    "BlobReadResult",
+    "BlobEntry",
+    "CatalogEntry",
+    "BlobOperationStats",
+    "BufferedWrite"
 ]
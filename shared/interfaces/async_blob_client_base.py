@@ -0,0 +1,91 @@
+# Import dependencies
+from .blob_models import BlobReadResult, BlobWriteReport
+from typing import Dict, List, Union, Optional
+from abc import ABC, abstractmethod
+
+class AbstractAsyncBlobClient(ABC):
+    """
+    Abstract base class defining the asyncio interface for blob storage backends.
+
+    Mirrors `AbstractBlobClient` with coroutine methods so many blob operations can
+    be awaited concurrently on a single event loop.
+    """
+    @abstractmethod
+    async def list_blob_filenames(self, container_name: str, directory_path: Optional[str] = None) -> List[str]:
+        """
+        List the names of blobs in a given container, optionally filtered by directory prefix.
+
+        Args:
+            container_name (str): The name of the container.
+            directory_path (Optional[str]): Prefix filter for blob names (e.g., "folder/").
+
+        Returns:
+            List[str]: A list of blob filenames matching the prefix.
+        """
+        pass
+
+    @abstractmethod
+    async def export_dict_to_blob(self, data: list, container: str, output_filename: str) -> None:
+        """
+        Uploads a list (or dict) as a JSON blob to the specified container.
+
+        Args:
+            data (list): The data to serialize and upload.
+            container (str): The target container name.
+            output_filename (str): The name of the output blob.
+        """
+        pass
+
+    @abstractmethod
+    async def read_blob_to_dict(self, container: str, input_filename: str) -> Union[list, dict]:
+        """
+        Downloads a blob and parses its content as JSON into a Python object.
+
+        Args:
+            container (str): The container name.
+            input_filename (str): The name of the blob to read.
+
+        Returns:
+            Union[list, dict]: The deserialized JSON object from the blob.
+        """
+        pass
+
+    @abstractmethod
+    async def read_blobs_to_dicts(
+        self,
+        container: str,
+        input_filenames: List[str],
+        max_concurrency: Optional[int] = None
+    ) -> List[BlobReadResult]:
+        """
+        Downloads many blobs concurrently and parses each as JSON.
+
+        Args:
+            container (str): The container name.
+            input_filenames (List[str]): Names of the blobs to read.
+            max_concurrency (Optional[int]): Upper bound on in-flight downloads.
+
+        Returns:
+            List[BlobReadResult]: One result per blob in request order, carrying either data or the error raised.
+        """
+        pass
+
+    @abstractmethod
+    async def export_dicts_to_blobs(
+        self,
+        payloads: Dict[str, Union[list, dict]],
+        container: str,
+        max_concurrency: Optional[int] = None
+    ) -> BlobWriteReport:
+        """
+        Uploads many lists (or dicts) as JSON blobs concurrently.
+
+        Args:
+            payloads (Dict[str, Union[list, dict]]): Output blob names mapped to the data to upload.
+            container (str): The target container name.
+            max_concurrency (Optional[int]): Upper bound on in-flight uploads.
+
+        Returns:
+            BlobWriteReport: Aggregated report of which uploads succeeded and failed.
+        """
+        pass
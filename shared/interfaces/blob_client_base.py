@@ -1,5 +1,6 @@
 # Import dependencies
-from typing import List, Union, Optional
+from typing import Any, Dict, Iterator, List, Sequence, Tuple, Union, Optional
+from .blob_models import BlobReadResult, BlobWriteReport, BlobEntry
 from abc import ABC, abstractmethod
 
 class AbstractBlobClient(ABC):
@@ -7,7 +8,7 @@ class AbstractBlobClient(ABC):
     Abstract base class defining the interface for interacting with blob storage backends.
 
     Subclasses must implement methods for listing blobs, uploading JSON data,
-    and reading JSON data from the storage backend.
+    and reading JSON data from the storage backend, both individually and in bulk.
     """
     @abstractmethod
     def list_blob_filenames(self, container_name: str, directory_path: Optional[str] = None) -> List[str]:
@@ -23,6 +24,20 @@ class AbstractBlobClient(ABC):
         """
         pass
 
+    @abstractmethod
+    def list_blob_entries(self, container_name: str, directory_path: Optional[str] = None) -> List[BlobEntry]:
+        """
+        List the blobs in a given container with their properties, optionally filtered by directory prefix.
+
+        Args:
+            container_name (str): The name of the container.
+            directory_path (Optional[str]): Prefix filter for blob names (e.g., "folder/").
+
+        Returns:
+            List[BlobEntry]: Blob names with size, ETag and last-modified time.
+        """
+        pass
+
     @abstractmethod
     def export_dict_to_blob(self, data: list, container: str, output_filename: str) -> None:
         """
@@ -48,3 +63,65 @@ class AbstractBlobClient(ABC):
             Union[list, dict]: The deserialized JSON object from the blob.
         """
         pass
+
+    @abstractmethod
+    def iter_blob_json(
+        self,
+        container: str,
+        input_filename: str,
+        patterns: Sequence[Sequence[Union[str, int]]]
+    ) -> Iterator[Tuple[tuple, Any]]:
+        """
+        Streams selected values out of a JSON blob without loading the whole document.
+
+        Args:
+            container (str): The container name.
+            input_filename (str): The name of the blob to stream.
+            patterns (Sequence[Sequence[Union[str, int]]]): Paths of the values to yield, "*" matching any key.
+
+        Returns:
+            Iterator[Tuple[tuple, Any]]: Path and decoded value of each selected value.
+        """
+        pass
+
+    @abstractmethod
+    def read_blobs_to_dicts(
+        self,
+        container: str,
+        input_filenames: List[str],
+        max_workers: Optional[int] = None,
+        ordered: bool = True
+    ) -> Iterator[BlobReadResult]:
+        """
+        Downloads many blobs concurrently and parses each as JSON.
+
+        Args:
+            container (str): The container name.
+            input_filenames (List[str]): Names of the blobs to read.
+            max_workers (Optional[int]): Upper bound on concurrent downloads.
+            ordered (bool): Yield results in input order if True, otherwise as they complete.
+
+        Returns:
+            Iterator[BlobReadResult]: One result per blob, carrying either data or the error raised.
+        """
+        pass
+
+    @abstractmethod
+    def export_dicts_to_blobs(
+        self,
+        payloads: Dict[str, Union[list, dict]],
+        container: str,
+        max_workers: Optional[int] = None
+    ) -> BlobWriteReport:
+        """
+        Uploads many lists (or dicts) as JSON blobs concurrently.
+
+        Args:
+            payloads (Dict[str, Union[list, dict]]): Output blob names mapped to the data to upload.
+            container (str): The target container name.
+            max_workers (Optional[int]): Upper bound on concurrent uploads.
+
+        Returns:
+            BlobWriteReport: Aggregated report of which uploads succeeded and failed.
+        """
+        pass
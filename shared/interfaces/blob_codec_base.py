@@ -0,0 +1,60 @@
+# Import dependencies
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, Optional
+
+class AbstractBlobCodec(ABC):
+    """
+    Abstract base class for content codecs applied to blob payloads.
+
+    A codec compresses serialized JSON before upload and reverses it after
+    download. The codec `name` is written to the blob's Content-Encoding so
+    readers can select the matching codec, and `magic` lets readers recognise
+    encoded payloads whose metadata is missing.
+
+    Attributes:
+        name (str): Content-Encoding value identifying the codec.
+        magic (Optional[bytes]): Leading bytes of every encoded payload, if any.
+    """
+    name: str = ""
+    magic: Optional[bytes] = None
+
+    @abstractmethod
+    def encode(self, data: bytes) -> bytes:
+        """
+        Encode a serialized payload for storage.
+
+        Args:
+            data (bytes): Raw payload.
+
+        Returns:
+            bytes: Encoded payload.
+        """
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> bytes:
+        """
+        Decode a stored payload.
+
+        Args:
+            data (bytes): Encoded payload.
+
+        Returns:
+            bytes: Raw payload.
+        """
+        pass
+
+    def decode_stream(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Decode a stored payload arriving in chunks.
+
+        Codecs that can decompress incrementally override this so callers never
+        hold the whole payload; the default buffers the payload and decodes it once.
+
+        Args:
+            chunks (Iterable[bytes]): Encoded payload in order.
+
+        Returns:
+            Iterator[bytes]: Raw payload in order.
+        """
+        yield self.decode(b"".join(chunks))
@@ -0,0 +1,340 @@
+# Import dependencies
+from typing import Optional, Union
+from dataclasses import dataclass, field
+from datetime import datetime
+import base64
+import bisect
+
+@dataclass
+class BlobReadResult:
+    """
+    Outcome of reading a single blob as part of a bulk read.
+
+    Bulk reads report failures per blob instead of aborting the whole batch, so
+    each result carries either the deserialized payload or the raised error.
+
+    Attributes:
+        name (str): Name of the blob that was read.
+        data (Union[list, dict, None]): Deserialized JSON content, or None on failure.
+        error (Optional[BaseException]): Exception raised while reading, or None on success.
+    """
+    name: str
+    data: Union[list, dict, None] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the blob was read successfully.
+
+        Returns:
+            bool: True if no error was raised.
+        """
+        return self.error is None
+
+@dataclass
+class BlobWriteReport:
+    """
+    Aggregated outcome of a batched upload.
+
+    Attributes:
+        succeeded (list[str]): Names of blobs that now hold their payload, whether uploaded or already unchanged.
+        failed (dict[str, BaseException]): Names of blobs that failed mapped to the raised error.
+        skipped (list[str]): Names of succeeded blobs whose upload was skipped because their content was unchanged.
+    """
+    succeeded: list[str] = field(default_factory=list)
+    failed: dict[str, BaseException] = field(default_factory=dict)
+    skipped: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether every blob in the batch was written.
+
+        Returns:
+            bool: True if no upload failed.
+        """
+        return not self.failed
+
+    def __str__(self) -> str:
+        """
+        Summarise the batch in a single log-friendly line.
+
+        Returns:
+            str: Count of written, unchanged and failed blobs, naming the failures.
+        """
+        summary = f"{len(self.succeeded)} written"
+        if self.skipped:
+            summary += f" ({len(self.skipped)} unchanged)"
+        summary += f", {len(self.failed)} failed"
+        if self.failed:
+            summary += " (" + ", ".join(f"{name}: {error}" for name, error in self.failed.items()) + ")"
+        return summary
+
+@dataclass
+class BlobCacheStats:
+    """
+    Counters describing how effective the blob disk cache has been.
+
+    Attributes:
+        hits (int): Reads served from cache, whether fresh or revalidated.
+        misses (int): Reads that had to download the blob body.
+        revalidations (int): Hits confirmed by Azure with a 304 Not Modified.
+        evictions (int): Entries removed to keep the cache within its size bound.
+    """
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        Fraction of reads served from cache.
+
+        Returns:
+            float: Hits divided by total reads, or 0.0 before any read.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __str__(self) -> str:
+        """
+        Summarise the counters in a single log-friendly line.
+
+        Returns:
+            str: Hit, miss, revalidation and eviction counts with the hit ratio.
+        """
+        return (f"{self.hits} hits ({self.revalidations} revalidated), {self.misses} misses, "
+                f"{self.evictions} evictions, {self.hit_ratio:.0%} hit ratio")
+
+@dataclass
+class BlobEntry:
+    """
+    A blob returned by a listing, with the properties Azure reports alongside its name.
+
+    Attributes:
+        name (str): Full blob name including any directory prefix.
+        size (int): Stored size in bytes.
+        etag (str): Entity tag of the current blob version.
+        last_modified (Optional[datetime]): Time the blob was last written.
+        content_encoding (Optional[str]): Codec recorded on the blob, if any.
+    """
+    name: str
+    size: int = 0
+    etag: str = ""
+    last_modified: Optional[datetime] = None
+    content_encoding: Optional[str] = None
+
+    @property
+    def filename(self) -> str:
+        """
+        Blob name without its directory prefix.
+
+        Returns:
+            str: Final path segment of the blob name.
+        """
+        return self.name.rsplit("/", 1)[-1]
+
+@dataclass
+class BufferedWrite:
+    """
+    A pending upload held by the write-behind buffer, already serialized and encoded as it will be stored.
+
+    Attributes:
+        container (str): Container the blob will be written to.
+        name (str): Name of the blob.
+        data (bytes): Stored bytes to upload.
+        content_type (str): MIME type recorded on the blob.
+        content_encoding (Optional[str]): Codec recorded on the blob, if any.
+        caller (str): Name of the client class that issued the write.
+        content_hash (Optional[str]): SHA-256 of the payload before encoding, used to skip unchanged uploads.
+    """
+    container: str
+    name: str
+    data: bytes
+    content_type: str
+    content_encoding: Optional[str] = None
+    caller: str = "BlobClient"
+    content_hash: Optional[str] = None
+
+    @property
+    def key(self) -> tuple[str, str]:
+        """
+        Key under which repeated writes to the same blob coalesce.
+
+        Returns:
+            tuple[str, str]: Container and blob name.
+        """
+        return self.container, self.name
+
+    @property
+    def properties(self) -> dict:
+        """
+        Properties needed to decode the buffered payload, as returned by `BlobClient.download_stored_blob`.
+
+        Returns:
+            dict: The `content_encoding` and `content_type` of the write.
+        """
+        return {"content_encoding": self.content_encoding, "content_type": self.content_type}
+
+    def to_record(self) -> dict:
+        """
+        JSON serializable form of the write, as stored in the spill file.
+
+        Returns:
+            dict: The write's fields, with the payload base64 encoded.
+        """
+        return {**vars(self), "data": base64.b64encode(self.data).decode("ascii")}
+
+    @classmethod
+    def from_record(cls, record: dict) -> "BufferedWrite":
+        """
+        Rebuild a write from its spill file record.
+
+        Args:
+            record (dict): Record produced by `to_record`.
+
+        Returns:
+            BufferedWrite: The pending write.
+        """
+        return cls(**{**record, "data": base64.b64decode(record["data"])})
+
+@dataclass
+class CatalogEntry:
+    """
+    A record of one ingested round or range session in the blob catalog.
+
+    Attributes:
+        kind (str): Record type, "round" for Hole19 scorecards or "session" for TrackMan range sessions.
+        id (str): Source system identifier of the round or session.
+        date (str): ISO date the round was played, or ISO timestamp the session started.
+        blob_name (str): Blob holding the ingested data.
+        course (Optional[str]): Course the round was played on (rounds only).
+        clubs (list[str]): Clubs hit during the session (sessions only).
+    """
+    kind: str
+    id: str
+    date: str
+    blob_name: str
+    course: Optional[str] = None
+    clubs: list[str] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        """
+        Unique key of the record within the catalog.
+
+        Returns:
+            str: Kind and identifier joined by a slash.
+        """
+        return f"{self.kind}/{self.id}"
+
+@dataclass
+class BlobOperationStats:
+    """
+    Counters, byte totals and a latency histogram for one kind of blob operation.
+
+    Latencies are counted into fixed buckets whose upper bounds (in milliseconds)
+    are `bucket_bounds_ms`; the final bucket counts everything slower.
+
+    Attributes:
+        operation (str): Operation type (e.g. "read", "write", "list", "stream").
+        container (str): Container the operation targeted.
+        prefix (str): First path segment of the blob or listing prefix.
+        caller (str): Name of the client class that issued the operation.
+        calls (int): Number of operations recorded.
+        errors (int): Number of operations that raised.
+        bytes (int): Stored bytes transferred.
+        total_seconds (float): Summed latency.
+        max_seconds (float): Slowest single operation.
+        buckets (list[int]): Operation counts per latency bucket.
+    """
+    bucket_bounds_ms = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    operation: str
+    container: str
+    prefix: str
+    caller: str
+    calls: int = 0
+    errors: int = 0
+    bytes: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(BlobOperationStats.bucket_bounds_ms) + 1))
+
+    def add(self, seconds: float, nbytes: int = 0, error: bool = False) -> None:
+        """
+        Record one operation.
+
+        Args:
+            seconds (float): Latency of the operation.
+            nbytes (int): Stored bytes transferred.
+            error (bool): Whether the operation raised.
+
+        Returns: None
+        """
+        self.calls += 1
+        self.errors += int(error)
+        self.bytes += nbytes
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.buckets[bisect.bisect_left(self.bucket_bounds_ms, seconds * 1000)] += 1
+
+    def merge(self, other: "BlobOperationStats") -> None:
+        """
+        Fold another set of counters into this one.
+
+        Args:
+            other (BlobOperationStats): Counters to add.
+
+        Returns: None
+        """
+        self.calls += other.calls
+        self.errors += other.errors
+        self.bytes += other.bytes
+        self.total_seconds += other.total_seconds
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+        self.buckets = [mine + theirs for mine, theirs in zip(self.buckets, other.buckets)]
+
+    def percentile_ms(self, quantile: float) -> float:
+        """
+        Estimate a latency percentile from the histogram.
+
+        Args:
+            quantile (float): Quantile between 0 and 1 (e.g. 0.95).
+
+        Returns:
+            float: Upper bound in milliseconds of the bucket holding the quantile (the slowest call for the
+                final bucket), or 0.0 before any call.
+        """
+        target, seen = quantile * self.calls, 0
+        for bound, count in zip(self.bucket_bounds_ms, self.buckets):
+            seen += count
+            if count and seen >= target:
+                return float(bound)
+        return self.max_seconds * 1000
+
+    def to_dict(self) -> dict:
+        """
+        Serialize the counters for a JSON report.
+
+        Returns:
+            dict: Tags, counters, derived latencies and the histogram keyed by bucket label.
+        """
+        labels = [f"<={bound}ms" for bound in self.bucket_bounds_ms] + [f">{self.bucket_bounds_ms[-1]}ms"]
+        return {
+            "operation": self.operation,
+            "container": self.container,
+            "prefix": self.prefix,
+            "caller": self.caller,
+            "calls": self.calls,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "mean_ms": round(self.total_seconds * 1000 / self.calls, 3) if self.calls else 0.0,
+            "p50_ms": self.percentile_ms(0.5),
+            "p95_ms": self.percentile_ms(0.95),
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "histogram": dict(zip(labels, self.buckets))
+        }
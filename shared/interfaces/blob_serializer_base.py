@@ -0,0 +1,45 @@
+# Import dependencies
+from abc import ABC, abstractmethod
+from typing import Any
+
+class AbstractBlobSerializer(ABC):
+    """
+    Abstract base class for the serialization formats used for blob documents.
+
+    A serializer turns Python lists and dictionaries into bytes before they are
+    encoded and uploaded, and back again after download. The serializer's
+    `content_type` is written to the blob's Content-Type so readers can select
+    a matching decoder without being told how the blob was written.
+
+    Attributes:
+        name (str): Configuration name identifying the serializer.
+        content_type (str): Content-Type recorded on blobs written with the serializer.
+    """
+    name: str = ""
+    content_type: str = "application/json"
+
+    @abstractmethod
+    def dumps(self, data: Any) -> bytes:
+        """
+        Serialize a document.
+
+        Args:
+            data (Any): Python list or dictionary.
+
+        Returns:
+            bytes: Serialized document.
+        """
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """
+        Deserialize a document.
+
+        Args:
+            data (bytes): Serialized document.
+
+        Returns:
+            Any: Python list or dictionary.
+        """
+        pass
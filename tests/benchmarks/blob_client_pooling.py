@@ -0,0 +1,81 @@
+# Import dependencies
+from tests.benchmarks.blob_stand_in import BlobStandIn
+from shared import BlobClient, BlobServiceRegistry
+from azure.storage.blob import BlobServiceClient
+import statistics as stat
+import argparse
+import time
+import json
+
+def read_with_fresh_client(connection_string: str, container: str, blob: str) -> dict:
+    """
+    Read a JSON blob the way `BlobClient` did before pooling: one new pipeline per call.
+
+    Returns:
+        dict: Deserialized blob content.
+    """
+    service_client = BlobServiceClient.from_connection_string(connection_string)
+    data = service_client.get_blob_client(container=container, blob=blob).download_blob().readall()
+    service_client.close()
+    return json.loads(data)
+
+def time_calls(func, calls: int) -> list[float]:
+    """
+    Time repeated invocations of a callable.
+
+    Returns:
+        list[float]: Per-call latencies in milliseconds.
+    """
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        func()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+def main() -> None:
+    """
+    Compare per-call latency of fresh versus pooled Azure clients against a local stand-in.
+
+    Returns: None
+    """
+    # Parse benchmark arguments
+    parser = argparse.ArgumentParser(description="Benchmark pooled BlobServiceClient reuse")
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--connect-delay-ms", type=float, default=20.0,
+                        help="Simulated TCP/TLS handshake cost per new connection")
+    args = parser.parse_args()
+
+    with BlobStandIn(connect_delay=args.connect_delay_ms / 1000) as stand_in:
+
+        # Seed a realistic scorecard sized payload
+        client = BlobClient()
+        client.vars.blob_account_connection_string = stand_in.connection_string
+        payload = [{"hole": hole, "Par": 4, "Strokes": 5, "Putts": 2, "Gir": False} for hole in range(1, 19)]
+        client.export_dict_to_blob(data=payload, container="golf", output_filename="bench/scorecard.json")
+
+        # Baseline - fresh client and connection per call
+        connections_before = stand_in.connections
+        fresh = time_calls(
+            lambda: read_with_fresh_client(stand_in.connection_string, "golf", "bench/scorecard.json"), args.calls)
+        fresh_connections = stand_in.connections - connections_before
+
+        # Pooled - every BlobClient shares the registry's keep-alive pipeline
+        connections_before = stand_in.connections
+        pooled = time_calls(
+            lambda: client.read_blob_to_dict(container="golf", input_filename="bench/scorecard.json"), args.calls)
+        pooled_connections = stand_in.connections - connections_before
+
+        BlobServiceRegistry.reset()
+
+    # Report results
+    print(f"calls per mode:            {args.calls}")
+    print(f"fresh client   mean/p50:   {stat.mean(fresh):.2f} / {stat.median(fresh):.2f} ms "
+          f"({fresh_connections} connections)")
+    print(f"pooled client  mean/p50:   {stat.mean(pooled):.2f} / {stat.median(pooled):.2f} ms "
+          f"({pooled_connections} connections)")
+    print(f"setup saved per call:      {stat.mean(fresh) - stat.mean(pooled):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
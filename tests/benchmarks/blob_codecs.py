@@ -0,0 +1,72 @@
+# Import dependencies
+from tests.benchmarks.blob_client_pooling import time_calls
+from tests.benchmarks.blob_stand_in import BlobStandIn
+from shared import BlobClient, BlobCodecs, BlobServiceRegistry
+import statistics as stat
+import argparse
+import random
+import json
+
+def make_session(strokes: int) -> list[dict]:
+    """
+    Build a TrackMan range session shaped payload with a dense ball trajectory per stroke.
+
+    Returns:
+        list[dict]: Simulated session report.
+    """
+    def trajectory() -> list[dict]:
+        speed, launch, side = random.uniform(30, 70), random.uniform(0.1, 0.4), random.uniform(-0.05, 0.05)
+        return [{"X": round(speed * t, 4), "Y": round(speed * launch * t - 4.9 * t * t, 4),
+                 "Z": round(speed * side * t, 4), "T": round(t, 3)}
+                for t in (step / 20 for step in range(60))]
+
+    return [{
+        "Club": random.choice(["Driver", "7Iron", "PitchingWedge"]),
+        "Time": f"2025-06-01T10:{i // 60:02d}:{i % 60:02d}",
+        "Measurement": {"Carry": round(random.uniform(80, 250), 2), "BallSpeed": round(random.uniform(30, 70), 2)},
+        "BallTrajectory": trajectory()
+    } for i in range(strokes)]
+
+def main() -> None:
+    """
+    Report stored size and read/write latency for each available codec against a bandwidth limited stand-in.
+
+    Returns: None
+    """
+    # Parse benchmark arguments
+    parser = argparse.ArgumentParser(description="Benchmark blob storage codecs")
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--strokes", type=int, default=300, help="Strokes in the simulated session payload")
+    parser.add_argument("--mbps", type=float, default=50.0, help="Simulated link bandwidth in megabits per second")
+    args = parser.parse_args()
+
+    payload = make_session(args.strokes)
+    raw_size = len(json.dumps(payload).encode())
+    print(f"raw JSON size: {raw_size:,} bytes, link: {args.mbps} Mbit/s, calls per codec: {args.calls}")
+
+    baseline = None
+    with BlobStandIn() as stand_in:
+        for name in BlobCodecs.available():
+            client = BlobClient(codec=name)
+            client.vars.blob_account_connection_string = stand_in.connection_string
+            blob_name = f"bench/session-{name}.json"
+
+            # Time serialisation + upload and download + deserialisation
+            writes = time_calls(lambda: client.export_dict_to_blob(payload, "golf", blob_name), args.calls)
+            reads = time_calls(lambda: client.read_blob_to_dict("golf", blob_name), args.calls)
+
+            # Add the transfer time the stored size would cost on the simulated link
+            stored, _ = client.download_stored_blob("golf", blob_name)
+            transfer_ms = len(stored) * 8 / (args.mbps * 1_000_000) * 1000
+            write_ms, read_ms = stat.mean(writes) + transfer_ms, stat.mean(reads) + transfer_ms
+            baseline = baseline or (len(stored), write_ms, read_ms)
+            print(f"{name:<9} stored {len(stored):>9,} bytes ({len(stored) / raw_size:6.1%})  "
+                  f"write {write_ms:7.2f} ms  read {read_ms:7.2f} ms  "
+                  f"saved {baseline[0] - len(stored):>9,} bytes, "
+                  f"{baseline[1] - write_ms:6.2f} ms per write, {baseline[2] - read_ms:6.2f} ms per read")
+
+        BlobServiceRegistry.reset()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# Import dependencies
+from tests.benchmarks.blob_stand_in import BlobStandIn
+from shared import BlobClient, BlobDiskCache, BlobServiceRegistry
+from tests.benchmarks.blob_client_pooling import time_calls
+import statistics as stat
+import tempfile
+import argparse
+import logging
+import random
+
+def main() -> None:
+    """
+    Compare read latency without a cache, with ETag revalidation and with a freshness window.
+
+    Returns: None
+    """
+    # Parse benchmark arguments
+    parser = argparse.ArgumentParser(description="Benchmark the blob disk cache")
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--strokes", type=int, default=500, help="Strokes in the simulated session payload")
+    parser.add_argument("--request-delay-ms", type=float, default=5.0,
+                        help="Simulated service latency per request")
+    args = parser.parse_args()
+
+    # The SDK logs a warning for every bodiless 304 response
+    logging.getLogger("azure").setLevel(logging.ERROR)
+
+    with BlobStandIn(request_delay=args.request_delay_ms / 1000) as stand_in, \
+            tempfile.TemporaryDirectory() as revalidate_dir, tempfile.TemporaryDirectory() as fresh_dir:
+
+        # Seed a TrackMan session sized payload
+        uncached = BlobClient()
+        uncached.vars.blob_account_connection_string = stand_in.connection_string
+        payload = [{"Club": "7Iron", "Carry": random.uniform(120, 160), "Trajectory": [random.random()] * 30}
+                   for _ in range(args.strokes)]
+        uncached.export_dict_to_blob(data=payload, container="golf", output_filename="bench/session.json")
+
+        # Build clients with and without caches
+        revalidating = BlobClient(cache=BlobDiskCache(directory=revalidate_dir))
+        fresh = BlobClient(cache=BlobDiskCache(directory=fresh_dir, max_age=3600))
+        for client in (revalidating, fresh):
+            client.vars.blob_account_connection_string = stand_in.connection_string
+
+        # Time repeated reads of the same unchanged blob
+        def read(client: BlobClient):
+            return client.read_blob_to_dict(container="golf", input_filename="bench/session.json")
+        baseline = time_calls(lambda: read(uncached), args.calls)
+        revalidated = time_calls(lambda: read(revalidating), args.calls)
+        windowed = time_calls(lambda: read(fresh), args.calls)
+
+        BlobServiceRegistry.reset()
+
+    # Report results
+    print(f"calls per mode:             {args.calls}")
+    print(f"no cache        mean/p50:   {stat.mean(baseline):.2f} / {stat.median(baseline):.2f} ms")
+    print(f"etag revalidate mean/p50:   {stat.mean(revalidated):.2f} / {stat.median(revalidated):.2f} ms "
+          f"({revalidating.cache.stats})")
+    print(f"fresh window    mean/p50:   {stat.mean(windowed):.2f} / {stat.median(windowed):.2f} ms "
+          f"({fresh.cache.stats})")
+
+
+if __name__ == "__main__":
+    main()
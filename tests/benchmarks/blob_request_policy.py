@@ -0,0 +1,78 @@
+# Import dependencies
+from tests.benchmarks.blob_stand_in import BlobStandIn
+from shared import BlobClient, BlobRequestPolicy, BlobMetrics, BlobServiceRegistry
+import statistics as stat
+import argparse
+import time
+
+def time_reads(client: BlobClient, calls: int) -> list[float]:
+    """
+    Time repeated reads of the benchmark blob.
+
+    Returns:
+        list[float]: Per-call latencies in milliseconds.
+    """
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        client.read_blob_to_dict(container="golf", input_filename="bench/scorecard.json")
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+def percentile(latencies: list[float], q: float) -> float:
+    """
+    Nearest-rank percentile of a list of latencies.
+
+    Returns:
+        float: The q-th percentile.
+    """
+    ordered = sorted(latencies)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))]
+
+def main() -> None:
+    """
+    Compare the read latency tail with and without hedged reads against a stand-in with occasional slow requests.
+
+    Returns: None
+    """
+    # Parse benchmark arguments
+    parser = argparse.ArgumentParser(description="Benchmark hedged blob reads")
+    parser.add_argument("--calls", type=int, default=300)
+    parser.add_argument("--request-delay-ms", type=float, default=5.0)
+    parser.add_argument("--slow-fraction", type=float, default=0.05, help="Share of requests hitting the slow tail")
+    parser.add_argument("--slow-delay-ms", type=float, default=250.0)
+    parser.add_argument("--hedge-percentile", type=float, default=90.0)
+    args = parser.parse_args()
+
+    with BlobStandIn(request_delay=args.request_delay_ms / 1000, slow_fraction=args.slow_fraction,
+                     slow_delay=args.slow_delay_ms / 1000) as stand_in:
+
+        # Seed a realistic scorecard sized payload
+        payload = [{"hole": hole, "Par": 4, "Strokes": 5, "Putts": 2, "Gir": False} for hole in range(1, 19)]
+        plain = BlobClient(policy=BlobRequestPolicy(hedge_percentile=0))
+        plain.vars.blob_account_connection_string = stand_in.connection_string
+        plain.export_dict_to_blob(data=payload, container="golf", output_filename="bench/scorecard.json")
+
+        # Baseline - deadlines and retries only
+        baseline = time_reads(plain, args.calls)
+
+        # Hedged - duplicate reads still running past the configured percentile
+        BlobMetrics.reset()
+        hedged_client = BlobClient(policy=BlobRequestPolicy(hedge_percentile=args.hedge_percentile))
+        hedged_client.vars.blob_account_connection_string = stand_in.connection_string
+        hedged = time_reads(hedged_client, args.calls)
+        events = {event["event"]: event["count"] for event in BlobMetrics.events()}
+
+        BlobServiceRegistry.reset()
+        BlobRequestPolicy.reset()
+
+    # Report results
+    print(f"calls per mode:            {args.calls}")
+    for label, latencies in (("baseline", baseline), ("hedged", hedged)):
+        print(f"{label:<9}  p50/p99/max:  {percentile(latencies, 50):.2f} / {percentile(latencies, 99):.2f} / "
+              f"{max(latencies):.2f} ms  (mean {stat.mean(latencies):.2f} ms)")
+    print(f"hedges issued / won:       {events.get('hedge', 0)} / {events.get('hedge_win', 0)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# Import dependencies
+from tests.benchmarks.blob_client_pooling import time_calls
+from tests.benchmarks.blob_codecs import make_session
+from shared import BlobCodecs, BlobSerializers
+import statistics as stat
+import argparse
+import random
+
+def make_rounds(rounds: int) -> list[dict]:
+    """
+    Build a hole level scorecard aggregate shaped like `scorecards_aggregated` blobs.
+
+    Returns:
+        list[dict]: Simulated hole records for every round.
+    """
+    return [{
+        "hole": hole,
+        "Par": par,
+        "S. index": (hole * 7) % 18 + 1,
+        "Strokes": (strokes := par + random.choice([-1, 0, 0, 1, 1, 2])),
+        "Putts": random.choice([1, 2, 2, 3]),
+        "Fairways": random.choice(["Target", "Left", "Right", "N/A"]),
+        "Gir": strokes - 2 <= par,
+        "result": random.choice(["Birdie", "Par", "Bogey", "Double Bogey or worse"]),
+        "round_date": f"2025-{round_index % 12 + 1:02d}-{round_index % 28 + 1:02d}",
+        "course": "braid_hills"
+    } for round_index in range(rounds) for hole, par in enumerate([4, 4, 3, 5, 4, 4, 3, 4, 5] * 2, start=1)]
+
+def main() -> None:
+    """
+    Report serialize/deserialize latency and stored size for each available serializer.
+
+    Returns: None
+    """
+    # Parse benchmark arguments
+    parser = argparse.ArgumentParser(description="Benchmark blob document serializers")
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=200, help="Rounds in the simulated scorecard payload")
+    parser.add_argument("--strokes", type=int, default=300, help="Strokes in the simulated session payload")
+    parser.add_argument("--codec", default="gzip", help="Codec applied after serialization")
+    args = parser.parse_args()
+
+    codec = BlobCodecs.get(args.codec)
+    payloads = {"scorecards": make_rounds(args.rounds), "session": {"StrokeGroups": make_session(args.strokes)}}
+    print(f"serializers: {BlobSerializers.available()}, codec: {codec.name}, calls per serializer: {args.calls}")
+
+    for label, payload in payloads.items():
+        baseline = None
+        for name in BlobSerializers.available():
+            serializer = BlobSerializers.get(name)
+            serialized = serializer.dumps(payload)
+
+            # Time serialization and deserialization on their own
+            dumps_ms = stat.mean(time_calls(lambda: serializer.dumps(payload), args.calls))
+            loads_ms = stat.mean(time_calls(lambda: serializer.loads(serialized), args.calls))
+            stored = len(codec.encode(serialized))
+
+            baseline = baseline or (dumps_ms, loads_ms)
+            print(f"{label:<10} {name:<8} raw {len(serialized):>10,} bytes  stored {stored:>9,} bytes  "
+                  f"dumps {dumps_ms:7.2f} ms ({baseline[0] / dumps_ms:4.1f}x)  "
+                  f"loads {loads_ms:7.2f} ms ({baseline[1] / loads_ms:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# Import dependencies
+from tests.benchmarks.blob_stand_in import BlobStandIn
+from shared import BlobClient, BlobMetrics, BlobServiceRegistry
+import argparse
+import time
+
+def rewrite_outputs(client: BlobClient, payloads: dict) -> tuple[float, int]:
+    """
+    Rewrite every aggregator output the way a pipeline run does.
+
+    Returns:
+        tuple[float, int]: Wall time in milliseconds and stored bytes uploaded.
+    """
+    BlobMetrics.reset()
+    start = time.perf_counter()
+    report = client.export_dicts_to_blobs(payloads=payloads, container="golf")
+    elapsed = (time.perf_counter() - start) * 1000
+    assert report.ok, report
+    return elapsed, sum(stats.bytes for stats in BlobMetrics.snapshot() if stats.operation == "write")
+
+def main() -> None:
+    """
+    Compare rewriting unchanged aggregator outputs with and without content hash checks.
+
+    Returns: None
+    """
+    # Parse benchmark arguments
+    parser = argparse.ArgumentParser(description="Benchmark skipping unchanged blob uploads")
+    parser.add_argument("--rounds", type=int, default=60, help="Rounds aggregated into each hole summary")
+    parser.add_argument("--request-delay-ms", type=float, default=10.0)
+    args = parser.parse_args()
+
+    # Hole summaries and a course overview as written by RoundAggregator
+    payloads = {
+        f"bench_golf_course_hole_summary/hole_{hole}.json": [
+            {"hole": hole, "Par": 4, "Strokes": 4 + played % 3, "Putts": 2, "date": f"2025-01-{played % 28 + 1:02d}"}
+            for played in range(args.rounds)
+        ]
+        for hole in range(1, 19)
+    }
+    payloads["bench_golf_course_hole_summary/course_overview.json"] = [{"Hole 1": {"Par": 4}}]
+
+    with BlobStandIn(request_delay=args.request_delay_ms / 1000) as stand_in:
+        client = BlobClient()
+        client.vars.blob_account_connection_string = stand_in.connection_string
+        rewrite_outputs(client, payloads)
+
+        # Baseline - every run uploads every output again
+        client.skip_unchanged = False
+        baseline_ms, baseline_bytes = rewrite_outputs(client, payloads)
+
+        # Hashed - unchanged outputs cost a HEAD request and no upload
+        client.skip_unchanged = True
+        skipped_ms, skipped_bytes = rewrite_outputs(client, payloads)
+        skipped = sum(stats.calls for stats in BlobMetrics.snapshot() if stats.operation == "write_skipped")
+
+        BlobServiceRegistry.reset()
+
+    # Report results
+    print(f"outputs per run:           {len(payloads)}")
+    print(f"rewrite everything:        {baseline_ms:.2f} ms, {baseline_bytes:,} bytes uploaded")
+    print(f"skip unchanged:            {skipped_ms:.2f} ms, {skipped_bytes:,} bytes uploaded ({skipped} skipped)")
+
+
+if __name__ == "__main__":
+    main()
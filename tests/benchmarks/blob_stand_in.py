@@ -0,0 +1,315 @@
+# Import dependencies
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from email.utils import formatdate
+from urllib.parse import urlparse, parse_qs, unquote
+from xml.sax.saxutils import escape
+import threading
+import hashlib
+import random
+import time
+
+# Well-known development storage credentials accepted by the Azure SDK
+ACCOUNT_NAME = "devstoreaccount1"
+ACCOUNT_KEY = "Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6IFsuFq2UVErCz4I6tq/K1SZFPTOtr/KBHBeksoGMGw=="
+
+class StoredBlob:
+    """
+    In-memory representation of a single stored blob.
+
+    Attributes:
+        data (bytes): Raw blob content.
+        etag (str): Quoted entity tag derived from the content and write counter.
+        last_modified (str): RFC 1123 formatted modification timestamp.
+        content_type (str): Content type recorded on write.
+        content_encoding (str | None): Content encoding recorded on write.
+        metadata (dict): User metadata recorded from `x-ms-meta-*` headers.
+    """
+    def __init__(self, data: bytes, version: int, headers) -> None:
+        """
+        Build a stored blob from an upload request.
+
+        Args:
+            data (bytes): Uploaded content.
+            version (int): Monotonic write counter used to make ETags unique.
+            headers: Incoming request headers.
+        """
+        self.data = data
+        self.etag = f'"0x{hashlib.md5(data + str(version).encode()).hexdigest()[:16].upper()}"'
+        self.last_modified = formatdate(usegmt=True)
+        self.content_type = headers.get("x-ms-blob-content-type", "application/octet-stream")
+        self.content_encoding = headers.get("x-ms-blob-content-encoding")
+        self.metadata = {
+            key[len("x-ms-meta-"):]: value
+            for key, value in headers.items() if key.lower().startswith("x-ms-meta-")
+        }
+
+class BlobStandInHandler(BaseHTTPRequestHandler):
+    """
+    Request handler implementing the subset of the Blob REST API used by `BlobClient`.
+
+    Supports Put Blob, Get Blob (ranged and conditional), Get Blob Properties and
+    List Blobs. Artificial connection and request delays emulate the TLS handshake
+    and service latency of a remote storage account.
+    """
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    wbufsize = 64 * 1024
+
+    def setup(self) -> None:
+        """
+        Accept a new TCP connection, paying the configured handshake delay once.
+
+        Returns: None
+        """
+        super().setup()
+        self.server.connections += 1
+        time.sleep(self.server.connect_delay)
+
+    def log_message(self, format, *args) -> None:
+        """
+        Silence per-request access logging.
+
+        Returns: None
+        """
+        pass
+
+    def _split_path(self) -> tuple[str, str, dict]:
+        """
+        Split the request path into container, blob name and query parameters.
+
+        Returns:
+            tuple[str, str, dict]: Container name, blob name and parsed query string.
+        """
+        parsed = urlparse(self.path)
+        parts = unquote(parsed.path).lstrip("/").split("/", 2)
+        container = parts[1] if len(parts) > 1 else ""
+        blob = parts[2] if len(parts) > 2 else ""
+        return container, blob, parse_qs(parsed.query)
+
+    def _send(self, status: int, body: bytes = b"", headers: dict | None = None) -> None:
+        """
+        Write a complete response with a Content-Length so the connection stays alive.
+
+        Returns: None
+        """
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("x-ms-version", "2025-01-05")
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _blob_headers(self, blob: StoredBlob) -> dict:
+        """
+        Build the property headers returned for a stored blob.
+
+        Returns:
+            dict: Response headers describing the blob.
+        """
+        headers = {
+            "ETag": blob.etag,
+            "Last-Modified": blob.last_modified,
+            "Content-Type": blob.content_type,
+            "x-ms-blob-type": "BlockBlob",
+        }
+        if blob.content_encoding:
+            headers["Content-Encoding"] = blob.content_encoding
+        for key, value in blob.metadata.items():
+            headers[f"x-ms-meta-{key}"] = value
+        return headers
+
+    def do_PUT(self) -> None:
+        """
+        Handle Put Blob, honouring If-Match and If-None-Match preconditions.
+
+        Returns: None
+        """
+        time.sleep(self.server.request_delay)
+        container, name, _ = self._split_path()
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        with self.server.lock:
+            existing = self.server.blobs.get((container, name))
+
+            # Reject writes whose preconditions no longer hold
+            if_match = self.headers.get("If-Match")
+            if_none_match = self.headers.get("If-None-Match")
+            if (if_match and (existing is None or existing.etag != if_match)) or \
+                    (if_none_match == "*" and existing is not None):
+                self._send(412, headers={"x-ms-error-code": "ConditionNotMet"})
+                return
+
+            self.server.version += 1
+            blob = StoredBlob(body, self.server.version, self.headers)
+            self.server.blobs[(container, name)] = blob
+
+        self._send(201, headers={"ETag": blob.etag, "Last-Modified": blob.last_modified})
+
+    def do_HEAD(self) -> None:
+        """
+        Handle Get Blob Properties.
+
+        Returns: None
+        """
+        time.sleep(self.server.request_delay)
+        container, name, _ = self._split_path()
+        blob = self.server.blobs.get((container, name))
+        if blob is None:
+            self._send(404, headers={"x-ms-error-code": "BlobNotFound"})
+            return
+
+        headers = self._blob_headers(blob)
+        self.send_response(200)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(blob.data)))
+        self.end_headers()
+
+    def do_GET(self) -> None:
+        """
+        Handle Get Blob (with range and If-None-Match support) and List Blobs.
+
+        Returns: None
+        """
+        time.sleep(self.server.request_delay)
+        if random.random() < self.server.slow_fraction:
+            time.sleep(self.server.slow_delay)
+        container, name, query = self._split_path()
+
+        # Container level requests are blob listings
+        if query.get("comp") == ["list"]:
+            self._list_blobs(container, query.get("prefix", [""])[0])
+            return
+
+        blob = self.server.blobs.get((container, name))
+        if blob is None:
+            self._send(404, headers={"x-ms-error-code": "BlobNotFound"})
+            return
+
+        # Conditional GET against the current entity tag
+        if self.headers.get("If-None-Match") == blob.etag:
+            self._send(304, headers={"ETag": blob.etag})
+            return
+
+        # Serve the requested byte range
+        headers = self._blob_headers(blob)
+        size = len(blob.data)
+        byte_range = self.headers.get("x-ms-range") or self.headers.get("Range")
+        if byte_range and size:
+            start, _, end = byte_range.split("=")[-1].partition("-")
+            start, end = int(start), min(int(end or size - 1), size - 1)
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+            self._send(206, blob.data[start:end + 1], headers)
+        else:
+            self._send(200, blob.data, headers)
+
+    def _list_blobs(self, container: str, prefix: str) -> None:
+        """
+        Render a List Blobs XML response for a prefix.
+
+        Returns: None
+        """
+        entries = []
+        for (blob_container, name), blob in sorted(self.server.blobs.items()):
+            if blob_container != container or not name.startswith(prefix):
+                continue
+            metadata = "".join(f"<{key}>{escape(value)}</{key}>" for key, value in blob.metadata.items())
+            entries.append(
+                f"<Blob><Name>{escape(name)}</Name><Properties>"
+                f"<Last-Modified>{blob.last_modified}</Last-Modified><Etag>{blob.etag}</Etag>"
+                f"<Content-Length>{len(blob.data)}</Content-Length>"
+                f"<Content-Type>{blob.content_type}</Content-Type>"
+                f"<Content-Encoding>{blob.content_encoding or ''}</Content-Encoding>"
+                f"<BlobType>BlockBlob</BlobType></Properties><Metadata>{metadata}</Metadata></Blob>"
+            )
+        body = (
+            '<?xml version="1.0" encoding="utf-8"?>'
+            f'<EnumerationResults ServiceEndpoint="{self.server.endpoint}/" ContainerName="{container}">'
+            f"<Prefix>{escape(prefix)}</Prefix><Blobs>{''.join(entries)}</Blobs><NextMarker/></EnumerationResults>"
+        ).encode()
+        self._send(200, body, {"Content-Type": "application/xml"})
+
+class BlobStandIn:
+    """
+    Local in-memory stand-in for an Azure Blob Storage account.
+
+    Runs a threaded HTTP server on localhost that the real Azure SDK can talk to
+    through a development-storage style connection string. Intended for benchmarks
+    that need realistic connection and request behaviour without a cloud account.
+
+    Typical usage example:
+        with BlobStandIn(connect_delay=0.02) as stand_in:
+            client.vars.blob_account_connection_string = stand_in.connection_string
+    """
+    def __init__(
+        self,
+        connect_delay: float = 0.0,
+        request_delay: float = 0.0,
+        slow_fraction: float = 0.0,
+        slow_delay: float = 0.0
+    ) -> None:
+        """
+        Configure the stand-in server.
+
+        Args:
+            connect_delay (float): Seconds slept once per new TCP connection (handshake cost).
+            request_delay (float): Seconds slept on every request (service latency).
+            slow_fraction (float): Share of GET requests that are slowed down further (latency tail).
+            slow_delay (float): Extra seconds slept by the slowed down requests.
+        """
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), BlobStandInHandler)
+        self.server.daemon_threads = True
+        self.server.blobs = {}
+        self.server.lock = threading.Lock()
+        self.server.version = 0
+        self.server.connections = 0
+        self.server.connect_delay = connect_delay
+        self.server.request_delay = request_delay
+        self.server.slow_fraction = slow_fraction
+        self.server.slow_delay = slow_delay
+        self.server.endpoint = f"http://127.0.0.1:{self.server.server_port}/{ACCOUNT_NAME}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def connection_string(self) -> str:
+        """
+        Connection string pointing the Azure SDK at this stand-in.
+
+        Returns:
+            str: Development storage style connection string.
+        """
+        return (
+            f"DefaultEndpointsProtocol=http;AccountName={ACCOUNT_NAME};"
+            f"AccountKey={ACCOUNT_KEY};BlobEndpoint={self.server.endpoint};"
+        )
+
+    @property
+    def connections(self) -> int:
+        """
+        Number of TCP connections accepted so far.
+
+        Returns:
+            int: Accepted connection count.
+        """
+        return self.server.connections
+
+    def __enter__(self) -> "BlobStandIn":
+        """
+        Start serving requests in a background thread.
+
+        Returns:
+            BlobStandIn: The running stand-in.
+        """
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """
+        Stop the server and release the socket.
+
+        Returns: None
+        """
+        self.server.shutdown()
+        self.server.server_close()
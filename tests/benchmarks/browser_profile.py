@@ -0,0 +1,90 @@
+# Import dependencies
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from backend.functions.navigation_metrics import NavigationMetrics
+from backend.functions.scorecard_navigator import Hole19Navigator
+from backend.functions.scorecard_parser import ScorecardParser
+from backend.functions.browser_profile import BrowserProfile
+from backend.functions.trackman_auth import TrackManAuth
+from tests.benchmarks.webdriver_stand_in import make_round_page
+import threading
+import argparse
+import logging
+import time
+
+def make_asset_handler(delay: float) -> type:
+    """
+    Build a handler serving a round page whose images, fonts, stylesheet and analytics each take `delay` seconds.
+
+    Args:
+        delay (float): Seconds every asset request is held.
+
+    Returns:
+        type: The request handler class.
+    """
+    images = "".join(f'<img src="/img/flag-{hole}.png">' for hole in range(18))
+    assets = "".join([
+        '<link rel="stylesheet" href="/css/site.css">',
+        images,
+        '<style>@font-face { font-family: body; src: url(/fonts/body.woff2); }</style>',
+        '<script src="/www.google-analytics.com/analytics.js"></script>'
+    ])
+    page = make_round_page().replace("<body>", "<body>" + assets, 1).encode()
+
+    class AssetHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            # Serve the page at once, and every asset after the delay
+            if self.path != "/round":
+                time.sleep(delay)
+            body = page if self.path == "/round" else b""
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    return AssetHandler
+
+def main() -> None:
+    """
+    Compare per-navigation page load time of the default and lean browser profiles for each scraping class.
+
+    Needs Chrome and a ChromeDriver on the given path.
+
+    Returns: None
+    """
+    # Parse benchmark arguments
+    parser = argparse.ArgumentParser(description="Benchmark the lean browser profile against the default one")
+    parser.add_argument("--driver-path", default="chromedriver")
+    parser.add_argument("--navigations", type=int, default=5)
+    parser.add_argument("--asset-delay-ms", type=float, default=200.0,
+                        help="Simulated download time of every image, font, stylesheet and analytics script")
+    args = parser.parse_args()
+
+    # Serve the round page and its slow assets locally
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_asset_handler(args.asset_delay_ms / 1000))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/round"
+
+    logger = logging.getLogger("benchmark")
+    NavigationMetrics.reset()
+    try:
+        for cls in (Hole19Navigator, ScorecardParser, TrackManAuth):
+            for profile in (BrowserProfile(), BrowserProfile.lean()):
+                scraper = cls(logger=logger, driver_path=args.driver_path, headless=True)
+                scraper.driver = scraper.configure_driver(driver_path=args.driver_path, headless=True, profile=profile)
+                try:
+                    for _ in range(args.navigations):
+                        scraper.navigate(url)
+                finally:
+                    scraper.driver.quit()
+    finally:
+        server.shutdown()
+
+    for line in NavigationMetrics.summary():
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# Import dependencies
+from tests.benchmarks.webdriver_stand_in import WebDriverStandIn, make_round_page
+from tests.benchmarks.blob_client_pooling import time_calls
+from backend.functions.scorecard_parser import ScorecardParser
+import statistics as stat
+import argparse
+import logging
+
+def main() -> None:
+    """
+    Compare per-round parse latency of the page source path and the element by element WebDriver path.
+
+    Returns: None
+    """
+    # Parse benchmark arguments
+    parser = argparse.ArgumentParser(description="Benchmark Hole19 scorecard parsing from page source")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--round-trip-ms", type=float, default=2.0,
+                        help="Simulated chromedriver round trip per WebDriver command")
+    args = parser.parse_args()
+
+    scorecard_parser = ScorecardParser(logger=logging.getLogger("benchmark"))
+    scorecard_parser.vars.round_site_player_name = "Player1"
+    scorecard_parser.driver = WebDriverStandIn(page=make_round_page(), delay=args.round_trip_ms / 1000)
+
+    # Both paths must produce the same round
+    html_round = scorecard_parser.parse_page_source(scorecard_parser.driver.page_source)
+    element_round = scorecard_parser.parse_scorecard_elements()
+    assert html_round == element_round, "page source and element paths disagree"
+
+    results = {}
+    for label, parse in [("elements", scorecard_parser.parse_scorecard_elements),
+                         ("page_source", lambda: scorecard_parser.parse_page_source(
+                             scorecard_parser.driver.page_source))]:
+        scorecard_parser.driver.round_trips = 0
+        latencies = time_calls(parse, args.rounds)
+        results[label] = stat.mean(latencies)
+        print(f"{label:<12} mean {results[label]:8.2f} ms/round  "
+              f"max {max(latencies):8.2f} ms  "
+              f"round trips {scorecard_parser.driver.round_trips // args.rounds:5d}/round")
+
+    print(f"speed-up {results['elements'] / results['page_source']:.1f}x "
+          f"at {args.round_trip_ms} ms per WebDriver command")
+
+
+if __name__ == "__main__":
+    main()
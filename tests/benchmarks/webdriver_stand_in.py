@@ -0,0 +1,193 @@
+# Import dependencies
+from selenium.common.exceptions import NoSuchElementException
+from backend.functions.html_tree import HtmlTree, HtmlNode
+from selenium.webdriver.common.by import By
+from typing import Callable, Optional
+import time
+
+def make_round_page(player: str = "Player1", seed: int = 0) -> str:
+    """
+    Build the page source of an 18-hole Hole19 round with OUT/IN/TOTAL summary cells.
+
+    Returns:
+        str: HTML of the scorecard page.
+    """
+    pars = [4, 4, 3, 5, 4, 4, 3, 4, 5] * 2
+
+    def row(label: str, cells: list[str], summaries: list[str]) -> str:
+        front = "".join(f'<div class="flex items-center">{cell}</div>' for cell in cells[:9])
+        back = "".join(f'<div class="flex items-center">{cell}</div>' for cell in cells[9:])
+        out_cell, in_cell, total_cell = (f'<div class="shrink-0 font-bold">{value}</div>' for value in summaries)
+        return ('<div class="contents"><div class="sticky left-0 bg-white"><span class="truncate">'
+                f'{label}</span></div>{front}{out_cell}{back}{in_cell}{total_cell}</div>')
+
+    strokes = [par + (hole * 7 + seed) % 4 - 1 for hole, par in enumerate(pars)]
+    return "".join([
+        '<html><head><title>Round | Hole19</title></head><body><main>',
+        '<section class="round-details"><h2>Round</h2><p>21/06/2025</p><p>Braid Hills</p></section>',
+        '<section class="round-scorecard"><section class="grid">',
+        row("", [str(hole) for hole in range(1, 19)], ["OUT", "IN", "TOTAL"]),
+        row("PAR", [str(par) for par in pars], ["36", "36", "72"]),
+        row("S.I.", [str((hole * 7) % 18 + 1) for hole in range(18)], ["", "", ""]),
+        row(player, [f'<span class="score"><span><span>{value}</span></span></span>' for value in strokes],
+            [str(sum(strokes[:9])), str(sum(strokes[9:])), str(sum(strokes))]),
+        row("PUTTS", [str(1 + hole % 3) for hole in range(18)], ["", "", ""]),
+        row("FAIRWAYS", [f'<img src="fairway.svg" alt="fairway{["Target", "Left", "Right"][hole % 3]}">'
+                         for hole in range(18)], ["", "", ""]),
+        row("GIR", [f'<img src="green.svg" alt="{"greenHit" if hole % 2 else "greenMissed"}">'
+                    for hole in range(18)], ["", "", ""]),
+        '</section></section></main></body></html>'
+    ])
+
+class ElementStandIn:
+    """
+    WebElement stand-in answering the lookups `ScorecardParser` makes, one simulated round trip each.
+
+    Attributes:
+        node (HtmlNode): Parsed element backing this stand-in.
+        driver (WebDriverStandIn): Driver that charges and counts round trips.
+    """
+    def __init__(self, node: HtmlNode, driver: "WebDriverStandIn") -> None:
+        """
+        Wrap a parsed element.
+
+        Args:
+            node (HtmlNode): Parsed element.
+            driver (WebDriverStandIn): Driver charging the round trips.
+        """
+        self.node = node
+        self.driver = driver
+
+    @property
+    def text(self) -> str:
+        """
+        Rendered text of the element.
+
+        Returns:
+            str: The element's text.
+        """
+        self.driver.round_trip()
+        return self.node.text
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        """
+        Read an attribute.
+
+        Returns:
+            Optional[str]: The attribute value.
+        """
+        self.driver.round_trip()
+        return self.node.get_attribute(name)
+
+    def find_element(self, by: str, value: str) -> "ElementStandIn":
+        """
+        Find the first element matching a supported selector.
+
+        Returns:
+            ElementStandIn: The match.
+
+        Raises:
+            NoSuchElementException: If nothing matches.
+        """
+        matches = self.find_elements(by, value)
+        if not matches:
+            raise NoSuchElementException(value)
+        return matches[0]
+
+    def find_elements(self, by: str, value: str) -> list["ElementStandIn"]:
+        """
+        Find every element matching a supported selector.
+
+        Returns:
+            list[ElementStandIn]: The matches in document order.
+        """
+        self.driver.round_trip()
+        return [ElementStandIn(node, self.driver) for node in self.driver.select(self.node, by, value)]
+
+class WebDriverStandIn(ElementStandIn):
+    """
+    WebDriver stand-in serving a fixed page, charging a simulated chromedriver round trip per command.
+
+    Attributes:
+        page (str): HTML served as the current page.
+        delay (float): Seconds each command waits, the simulated chromedriver round trip.
+        round_trips (int): Commands issued so far.
+    """
+    # Selectors the scorecard parser issues, resolved against the parsed page
+    selectors: dict[tuple[str, str], Callable[[HtmlNode], list[HtmlNode]]] = {
+        (By.CSS_SELECTOR, 'section.round-details p'):
+            lambda node: [p for details in node.find_all('section', cls='round-details')
+                          for p in details.find_all('p')],
+        (By.CSS_SELECTOR, 'section.round-details p:nth-of-type(2)'):
+            lambda node: [p for details in node.find_all('section', cls='round-details')
+                          for p in details.find_all('p') if p.nth_of_type(2)],
+        (By.CSS_SELECTOR, 'section.round-scorecard'):
+            lambda node: list(node.find_all('section', cls='round-scorecard')),
+        (By.CSS_SELECTOR, 'section.grid'): lambda node: list(node.find_all('section', cls='grid')),
+        (By.CSS_SELECTOR, 'div.contents'): lambda node: list(node.find_all('div', cls='contents')),
+        (By.CSS_SELECTOR, 'div.sticky span.truncate'):
+            lambda node: [span for sticky in node.find_all('div', cls='sticky')
+                          for span in sticky.find_all('span', cls='truncate')],
+        (By.XPATH, './div'): lambda node: [child for child in node.children if child.tag == 'div'],
+        (By.CSS_SELECTOR, 'img'): lambda node: list(node.find_all('img')),
+        (By.CSS_SELECTOR, 'img[alt="greenHit"]'): lambda node: list(node.find_all('img', alt='greenHit')),
+        (By.CSS_SELECTOR, 'span > span > span'):
+            lambda node: [span for span in node.find_all('span')
+                          if span.parent.tag == 'span' and span.parent.parent.tag == 'span'],
+    }
+
+    def __init__(self, page: str, delay: float = 0.0) -> None:
+        """
+        Load a page.
+
+        Args:
+            page (str): HTML served as the current page.
+            delay (float): Seconds each command waits.
+        """
+        self.page = page
+        self.delay = delay
+        self.round_trips = 0
+        super().__init__(HtmlTree.parse(page), self)
+
+    @property
+    def page_source(self) -> str:
+        """
+        Serialized DOM of the current page, fetched in one command.
+
+        Returns:
+            str: HTML of the page.
+        """
+        self.round_trip()
+        return self.page
+
+    def get(self, url: str) -> None:
+        """
+        Navigate to a URL, which always serves the same page.
+
+        Returns: None
+        """
+        self.round_trip()
+
+    def round_trip(self) -> None:
+        """
+        Count a command and wait out its simulated latency.
+
+        Returns: None
+        """
+        self.round_trips += 1
+        if self.delay:
+            time.sleep(self.delay)
+
+    def select(self, node: HtmlNode, by: str, value: str) -> list[HtmlNode]:
+        """
+        Resolve a supported selector under an element.
+
+        Returns:
+            list[HtmlNode]: The matches in document order.
+
+        Raises:
+            NotImplementedError: If the selector is not one the parser issues.
+        """
+        if (by, value) not in self.selectors:
+            raise NotImplementedError(f"Unsupported selector {by}={value}")
+        return self.selectors[(by, value)](node)
@@ -0,0 +1,85 @@
+# Import dependencies
+from backend.functions.navigation_metrics import NavigationMetrics
+from backend.functions.browser_profile import BrowserProfile
+import pytest
+import os
+
+class TestBrowserProfile:
+    """
+    Unit tests for BrowserProfile.
+
+    Checks profile lookup by name, per-site allow-lists and the Chrome
+    switches each profile produces.
+    """
+    def test_from_name(self):
+        """
+        Known names should build their profile, unknown names should raise.
+        """
+        assert BrowserProfile.from_name("default") == BrowserProfile()
+        assert BrowserProfile.from_name("lean").page_load_strategy == "eager"
+
+        with pytest.raises(ValueError):
+            BrowserProfile.from_name("turbo")
+
+    def test_sites_subtract_their_allowed_urls(self):
+        """
+        A site should still load what its allow-list names, other sites should not.
+        """
+        profile = BrowserProfile.lean()
+
+        assert "*.css" not in profile.blocked_for("trackman")
+        assert "*.css" in profile.blocked_for(None)
+        assert "*.png" in profile.blocked_for("hole19")
+
+    def test_arguments(self, tmp_path):
+        """
+        Lean switches should disable extensions and GPU and point Chrome at the user-data directory.
+        """
+        assert BrowserProfile().arguments() == []
+        assert BrowserProfile.lean(user_data_dir=str(tmp_path)).arguments() == [
+            "--disable-extensions", "--disable-gpu", f"--user-data-dir={tmp_path}"
+        ]
+
+    def test_workers_get_their_own_user_data_dir(self, tmp_path):
+        """
+        Concurrent browsers should not share a locked user-data directory.
+        """
+        profile = BrowserProfile.lean(user_data_dir=str(tmp_path))
+
+        assert profile.for_worker(2).user_data_dir == os.path.join(str(tmp_path), "worker-2")
+        assert BrowserProfile.lean().for_worker(2).user_data_dir is None
+
+class TestNavigationMetrics:
+    """
+    Unit tests for NavigationMetrics.
+    """
+    def setup_method(self):
+        """
+        Start every test from an empty registry.
+        """
+        NavigationMetrics.reset()
+
+    def test_savings_against_default(self):
+        """
+        Per-navigation savings should compare the mean page loads of two profiles.
+        """
+        for seconds in (2.0, 4.0):
+            NavigationMetrics.record(caller="ScorecardParser", profile="default", seconds=seconds)
+        NavigationMetrics.record(caller="ScorecardParser", profile="lean", seconds=1.0)
+
+        assert NavigationMetrics.savings(caller="ScorecardParser") == pytest.approx(2.0)
+        assert NavigationMetrics.savings(caller="TrackManAuth") is None
+        assert NavigationMetrics.summary() == [
+            "ScorecardParser [default]: 2 navigations, 3.00s each",
+            "ScorecardParser [lean]: 1 navigations, 1.00s each (2.00s saved per navigation against default)"
+        ]
+
+    def test_errors_are_counted(self):
+        """
+        Failed page loads should count as navigations and errors.
+        """
+        NavigationMetrics.record(caller="TrackManAuth", profile="lean", seconds=0.5, error=True)
+
+        [stats] = NavigationMetrics.stats()
+        assert (stats.navigations, stats.errors) == (1, 1)
+        assert str(stats).endswith("1 failed")
@@ -0,0 +1,93 @@
+# Import dependencies
+from backend.functions.scorecard_navigator import Hole19Navigator
+from backend.functions.scorecard_parser import ScorecardParser
+from selenium.common.exceptions import WebDriverException
+from backend.functions.driver_session import DriverSession
+from unittest.mock import MagicMock, patch
+import logging
+import pytest
+
+@pytest.fixture
+def drivers():
+    """
+    Patch browser launches to hand out fake drivers, recording each one launched.
+    """
+    launched = []
+
+    def configure_driver(*args, **kwargs):
+        launched.append(MagicMock())
+        return launched[-1]
+
+    with patch.object(DriverSession, "configure_driver", side_effect=configure_driver):
+        yield launched
+
+class TestDriverSession:
+    """
+    Unit tests for DriverSession.
+
+    Uses fake drivers in place of Chrome to check that borrowers share one
+    browser, dead sessions are relaunched and the browser is always quit.
+    """
+    def make_session(self, **kwargs) -> DriverSession:
+        """
+        Build a session with a test logger.
+
+        Returns:
+            DriverSession: The session.
+        """
+        return DriverSession(logger=logging.getLogger("test_logger"), **kwargs)
+
+    def test_borrowers_share_one_browser(self, drivers):
+        """
+        Navigator and parser should borrow the same warmed-up browser, quit once on exit.
+        """
+        with self.make_session(warm_up_url="https://www.hole19golf.com") as session:
+            navigator = Hole19Navigator(logger=logging.getLogger("test_logger"))
+            parser = ScorecardParser(logger=logging.getLogger("test_logger"))
+            navigator.initiate_driver(session=session)
+            parser.initiate_driver(session=session)
+
+            assert navigator.driver is parser.driver is drivers[0]
+
+        assert len(drivers) == 1
+        drivers[0].get.assert_called_once_with("https://www.hole19golf.com")
+        drivers[0].quit.assert_called_once()
+        assert session.driver is None
+        assert session.report.starts == 1 and session.report.borrows == 2
+        assert session.report.saved_seconds == pytest.approx(session.report.startup_seconds)
+
+    def test_dead_browser_is_relaunched(self, drivers):
+        """
+        A borrow should replace a browser that fails its health check.
+        """
+        with self.make_session() as session:
+            drivers[0].execute_script.side_effect = WebDriverException("invalid session id")
+
+            assert session.borrow() is drivers[1]
+
+        drivers[0].quit.assert_called_once()
+        drivers[1].quit.assert_called_once()
+        assert session.report.restarts == 1 and session.report.starts == 2
+
+    def test_quit_when_block_raises(self, drivers):
+        """
+        The browser should be quit even when the run fails, and the error should propagate.
+        """
+        with pytest.raises(RuntimeError):
+            with self.make_session():
+                raise RuntimeError("login failed")
+
+        drivers[0].quit.assert_called_once()
+
+    def test_failed_warm_up_and_quit_are_tolerated(self):
+        """
+        A failed warm-up should leave the browser usable, and a failed quit should not raise.
+        """
+        session = self.make_session(warm_up_url="https://www.hole19golf.com")
+        with patch.object(DriverSession, "configure_driver", return_value=MagicMock()) as configure_driver:
+            configure_driver.return_value.get.side_effect = WebDriverException("net::ERR_NAME_NOT_RESOLVED")
+            configure_driver.return_value.quit.side_effect = WebDriverException("chrome not reachable")
+            with session:
+                assert session.borrow() is configure_driver.return_value
+
+        assert session.driver is None
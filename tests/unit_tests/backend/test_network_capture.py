@@ -0,0 +1,112 @@
+# Import dependencies
+from backend.functions.network_capture import NetworkCapture, walk_json, pick
+from selenium.common.exceptions import WebDriverException
+import base64
+import pytest
+import json
+
+class FakePerformanceLog:
+    """
+    Fake browser whose performance log replays queued network events.
+
+    Attributes:
+        entries (list[dict]): Log entries not yet read.
+        bodies (dict[str, dict]): Network.getResponseBody results by request ID.
+    """
+    def __init__(self) -> None:
+        self.entries = []
+        self.bodies = {}
+
+    def respond(self, request_id: str, url: str, body: str, mime_type: str = "application/json",
+                finished: bool = True, encoded: bool = False) -> None:
+        events = [("Network.responseReceived", {"requestId": request_id,
+                                                "response": {"url": url, "mimeType": mime_type}})]
+        if finished:
+            events.append(("Network.loadingFinished", {"requestId": request_id}))
+        self.entries += [{"message": json.dumps({"message": {"method": method, "params": params}})}
+                         for method, params in events]
+        self.bodies[request_id] = {"body": base64.b64encode(body.encode()).decode() if encoded else body,
+                                   "base64Encoded": encoded}
+
+    def get_log(self, log_type: str) -> list[dict]:
+        entries, self.entries = self.entries, []
+        return entries
+
+    def execute_cdp_cmd(self, command: str, params: dict) -> dict:
+        if params["requestId"] not in self.bodies:
+            raise WebDriverException("No resource with given identifier found")
+        return self.bodies[params["requestId"]]
+
+class TestNetworkCapture:
+    """
+    Unit tests for NetworkCapture.
+
+    Replays performance log events to check only finished JSON responses are
+    read, bodies are decoded, and waiting gives up when nothing matches.
+    """
+    @pytest.fixture(autouse=True)
+    def setup_capture(self):
+        """
+        Automatically create a capture over a fake performance log.
+        """
+        self.log = FakePerformanceLog()
+        self.capture = NetworkCapture(driver=self.log)
+
+    def test_reads_finished_json_responses(self):
+        """
+        Only JSON responses that finished loading and match the URL filter should be read.
+        """
+        self.log.respond("1", "https://api.hole19golf.com/rounds/42", '{"id": 42}', encoded=True)
+        self.log.respond("2", "https://www.hole19golf.com/app.js", "var a;", mime_type="text/javascript")
+        self.log.respond("3", "https://api.hole19golf.com/rounds/43", '{"id": 43}', finished=False)
+        self.log.respond("4", "https://api.hole19golf.com/me", '{"id": 7}')
+
+        assert self.capture.read(url_filter="rounds") == [("https://api.hole19golf.com/rounds/42", {"id": 42})]
+
+    def test_clear_forgets_earlier_responses(self):
+        """
+        Responses received before clearing should never be read.
+        """
+        self.log.respond("1", "https://api.hole19golf.com/rounds/41", '{"id": 41}')
+        self.capture.clear()
+        self.log.respond("2", "https://api.hole19golf.com/rounds/42", '{"id": 42}')
+
+        assert self.capture.read() == [("https://api.hole19golf.com/rounds/42", {"id": 42})]
+
+    def test_wait_for_skips_rejected_responses(self):
+        """
+        Waiting should return the first response the parser accepts.
+        """
+        self.log.respond("1", "https://api.hole19golf.com/rounds/42/stats", '{"stats": []}')
+        self.log.respond("2", "https://api.hole19golf.com/rounds/42", '{"holes": [1]}')
+
+        assert self.capture.wait_for(parse=lambda payload: payload["holes"], url_filter="42") == [1]
+        assert self.capture.matched_url == "https://api.hole19golf.com/rounds/42"
+
+    def test_wait_for_times_out(self):
+        """
+        Waiting should raise a TimeoutError naming the last rejection when nothing matches.
+        """
+        self.log.respond("1", "https://api.hole19golf.com/rounds/42", '{"stats": []}')
+
+        with pytest.raises(TimeoutError, match="1 rejected"):
+            self.capture.wait_for(parse=lambda payload: payload["holes"], timeout=0.05, interval=0.01)
+
+class TestJsonHelpers:
+    """
+    Unit tests for the JSON walking helpers.
+    """
+    def test_walk_json_visits_outermost_first(self):
+        """
+        Every nested object should be visited, outer objects before inner ones.
+        """
+        payload = {"round": {"course": {"name": "Braid Hills"}}, "players": [{"name": "Player1"}]}
+
+        assert [pick(node, ("name",)) for node in walk_json(payload)] == [None, None, "Braid Hills", "Player1"]
+
+    def test_pick_prefers_earlier_aliases(self):
+        """
+        The first alias present should win, the default applying when none is.
+        """
+        assert pick({"score": 5, "strokes": 4}, ("strokes", "score")) == 4
+        assert pick({}, ("strokes",), default="N/A") == "N/A"
@@ -1,5 +1,7 @@
 # Import dependencies
 from backend.functions.scorecard_aggregator import RoundAggregator
+from azure.core.exceptions import ResourceNotFoundError
+from shared.interfaces import BlobWriteReport
 from unittest.mock import MagicMock
 import pytest
 
@@ -96,11 +98,22 @@ class TestRoundAggregator:
         # Assert: only the two valid JSON files should have been read
         assert aggregator.read_blob_to_dict.call_count == 2
 
-        # Only one hole (hole 1) exists in the fake data, so export should be called once
-        aggregator.export_dict_to_blob.assert_called_once()
+        # Only one hole (hole 1) exists in the fake data, so it is exported once between two manifest writes
+        assert aggregator.export_dict_to_blob.call_count == 3
+        outputs = [call.kwargs["output_filename"] for call in aggregator.export_dict_to_blob.call_args_list]
+        assert outputs == ["new_york_golf_course_hole_summary/manifest.json",
+                           "new_york_golf_course_hole_summary/hole_1.json",
+                           "new_york_golf_course_hole_summary/manifest.json"]
+        exports = {call.kwargs["output_filename"]: call.kwargs["data"]
+                   for call in aggregator.export_dict_to_blob.call_args_list}
+        assert exports["new_york_golf_course_hole_summary/manifest.json"] == {
+            "schema_version": RoundAggregator.schema_version,
+            "scorecards": ["scorecards/new_york_2024-01-01.json", "scorecards/new_york_2024-02-01.json"]
+        }
 
         # Capture export arguments
-        args, kwargs = aggregator.export_dict_to_blob.call_args
+        kwargs = {"output_filename": "new_york_golf_course_hole_summary/hole_1.json",
+                  "data": exports["new_york_golf_course_hole_summary/hole_1.json"]}
         exported_data = kwargs["data"]
 
         # The exported data should be a list of hole entries
@@ -112,3 +125,158 @@ class TestRoundAggregator:
 
         # Verify the exported filename is correct
         assert kwargs["output_filename"] == "new_york_golf_course_hole_summary/hole_1.json"
+
+
+class FakeGolfContainer:
+    """
+    Dict-backed stand-in for the golf container, recording which blobs were read.
+
+    Attributes:
+        blobs (dict[str, object]): Stored documents by blob name.
+        reads (list[str]): Blob names read, in order.
+        failing (set[str]): Blob names whose writes raise.
+    """
+    def __init__(self, blobs: dict) -> None:
+        self.blobs = dict(blobs)
+        self.reads = []
+        self.failing = set()
+
+    def read_blob_to_dict(self, container: str, input_filename: str):
+        self.reads.append(input_filename)
+        if input_filename not in self.blobs:
+            raise ResourceNotFoundError("BlobNotFound")
+        return self.blobs[input_filename]
+
+    def export_dict_to_blob(self, data, container: str, output_filename: str) -> None:
+        if output_filename in self.failing:
+            raise ConnectionError("upload failed")
+        self.blobs[output_filename] = data
+
+    def list_blob_filenames(self, container_name: str, directory_path: str) -> list[str]:
+        return [name for name in self.blobs if name.startswith(directory_path)]
+
+class TestIncrementalAggregation:
+    """
+    Unit tests for RoundAggregator incremental hole summaries.
+
+    Checks that new rounds are merged into existing summaries by date without
+    re-reading history, and that a missing manifest or a schema version
+    change falls back to a full rebuild matching an incremental one.
+    """
+    @pytest.fixture(autouse=True)
+    def setup_container(self, aggregator):
+        """
+        Automatically wire the aggregator to a container holding three rounds, the middle one not yet merged.
+        """
+        self.aggregator = aggregator
+        self.container = FakeGolfContainer({
+            "scorecards/new_york_2024-01-01_1.json": [{"hole": 1, "Par": 4, "Strokes": 5},
+                                                      {"hole": 2, "Par": 3, "Strokes": 3}],
+            "scorecards/new_york_2024-02-01_2.json": [{"hole": 1, "Par": 4, "Strokes": 4}],
+            "scorecards/new_york_2024-03-01_3.json": [{"hole": 1, "Par": 4, "Strokes": 6},
+                                                      {"hole": 2, "Par": 3, "Strokes": 2}],
+        })
+        for name in ("read_blob_to_dict", "export_dict_to_blob", "list_blob_filenames"):
+            setattr(self.aggregator, name, getattr(self.container, name))
+
+    def summaries(self) -> dict:
+        """
+        Hole summary documents currently stored.
+
+        Returns:
+            dict: Documents by blob name.
+        """
+        return {name: data for name, data in self.container.blobs.items() if "hole_summary" in name}
+
+    def test_merges_new_rounds_by_date(self):
+        """
+        A run should read only its new scorecard and the summaries it touches, merging entries by date.
+        """
+        # Summarise the first and last rounds before the middle one is ingested
+        middle = self.container.blobs.pop("scorecards/new_york_2024-02-01_2.json")
+        self.aggregator.aggregate_holes_by_course(rebuild=True)
+        self.container.blobs["scorecards/new_york_2024-02-01_2.json"] = middle
+        self.container.reads.clear()
+
+        self.aggregator.aggregate_holes_by_course(new_scorecards=["scorecards/new_york_2024-02-01_2.json"])
+
+        assert self.container.reads == ["new_york_golf_course_hole_summary/manifest.json",
+                                        "scorecards/new_york_2024-02-01_2.json",
+                                        "new_york_golf_course_hole_summary/hole_1.json"]
+        hole_1 = self.container.blobs["new_york_golf_course_hole_summary/hole_1.json"]
+        assert [entry["date"] for entry in hole_1] == ["2024-03-01", "2024-02-01", "2024-01-01"]
+        assert len(self.container.blobs["new_york_golf_course_hole_summary/manifest.json"]["scorecards"]) == 3
+
+    def test_incremental_matches_full_rebuild(self):
+        """
+        Merging rounds one run at a time should produce the same summaries as rebuilding from scratch.
+        """
+        self.aggregator.aggregate_holes_by_course(new_scorecards=["scorecards/new_york_2024-01-01_1.json"])
+        self.aggregator.aggregate_holes_by_course(new_scorecards=["scorecards/new_york_2024-03-01_3.json"])
+        self.aggregator.aggregate_holes_by_course(new_scorecards=["scorecards/new_york_2024-02-01_2.json"])
+        incremental = self.summaries()
+
+        self.aggregator.aggregate_holes_by_course(rebuild=True)
+
+        assert self.summaries() == incremental
+
+    def test_repeated_merge_adds_nothing(self):
+        """
+        Scorecards already listed in the manifest should not be merged twice.
+        """
+        self.aggregator.aggregate_holes_by_course()
+        before = self.summaries()
+
+        self.aggregator.aggregate_holes_by_course(new_scorecards=["scorecards/new_york_2024-02-01_2.json"])
+
+        assert self.summaries() == before
+
+    def test_schema_change_rebuilds(self):
+        """
+        Summaries built by another schema version should be rebuilt from every scorecard.
+        """
+        self.aggregator.aggregate_holes_by_course()
+        self.container.blobs["new_york_golf_course_hole_summary/manifest.json"]["schema_version"] = 0
+        self.container.blobs["new_york_golf_course_hole_summary/hole_1.json"] = []
+        self.container.reads.clear()
+
+        self.aggregator.aggregate_holes_by_course(new_scorecards=["scorecards/new_york_2024-02-01_2.json"])
+
+        assert len(self.container.blobs["new_york_golf_course_hole_summary/hole_1.json"]) == 3
+        assert sum(name.startswith("scorecards/") for name in self.container.reads) == 3
+        assert "schema version 0" in self.aggregator.logger.warning.call_args.args[0]
+
+    def test_failed_summary_leaves_manifest_incomplete(self):
+        """
+        A summary that fails to store should raise and leave the manifest marked incomplete, so the next run rebuilds.
+        """
+        middle = self.container.blobs.pop("scorecards/new_york_2024-02-01_2.json")
+        self.aggregator.aggregate_holes_by_course(rebuild=True)
+        self.container.blobs["scorecards/new_york_2024-02-01_2.json"] = middle
+
+        self.container.failing.add("new_york_golf_course_hole_summary/hole_1.json")
+        with pytest.raises(RuntimeError, match="hole_1.json"):
+            self.aggregator.aggregate_holes_by_course(new_scorecards=["scorecards/new_york_2024-02-01_2.json"])
+        assert self.container.blobs["new_york_golf_course_hole_summary/manifest.json"]["schema_version"] is None
+
+        self.container.failing.clear()
+        self.aggregator.aggregate_holes_by_course(new_scorecards=[])
+
+        assert len(self.container.blobs["new_york_golf_course_hole_summary/hole_1.json"]) == 3
+        assert "did not complete" in self.aggregator.logger.warning.call_args.args[0]
+
+    def test_buffered_summaries_are_flushed_before_the_manifest(self):
+        """
+        While writes are buffered, the manifest should only be written once the flush stored every summary.
+        """
+        self.aggregator.aggregate_holes_by_course(rebuild=True)
+        buffer = MagicMock()
+        buffer.flush.side_effect = lambda: BlobWriteReport(
+            failed={"new_york_golf_course_hole_summary/hole_2.json": ConnectionError("upload failed")})
+        self.aggregator.write_buffer = buffer
+
+        with pytest.raises(RuntimeError, match="hole_2.json"):
+            self.aggregator.aggregate_holes_by_course(rebuild=True)
+
+        assert buffer.flush.call_count == 2
+        assert self.container.blobs["new_york_golf_course_hole_summary/manifest.json"]["schema_version"] is None
@@ -0,0 +1,149 @@
+# Import dependencies
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from backend.functions.scorecard_http import ScorecardHttpFetcher
+from backend.functions.scorecard_parser import ScorecardParser
+from unittest.mock import MagicMock
+import threading
+import json
+import logging
+import pytest
+
+# A round page with a single played hole
+ROUND_PAGE = (
+    '<html><body><section class="round-details"><p>21/06/2025</p><p>Braid Hills</p></section>'
+    '<section class="round-scorecard"><section class="grid">'
+    '<div class="contents"><div class="sticky"><span class="truncate">PAR</span></div><div>4</div></div>'
+    '<div class="contents"><div class="sticky"><span class="truncate">Player1</span></div>'
+    '<div><span><span><span>5</span></span></span></div></div>'
+    '</section></section></body></html>'
+)
+
+# The JSON the same round's page is rendered from
+ROUND_JSON = {"round": {"played_at": "2025-06-21T09:12:00Z",
+                        "course": {"name": "Braid Hills", "holes": [{"number": 1, "par": 4}]},
+                        "players": [{"name": "Player1", "holes": [{"number": 1, "strokes": 5}]}]}}
+
+class RoundHandler(BaseHTTPRequestHandler):
+    """
+    Serves round pages to requests carrying the login cookie, and redirects the rest to sign in.
+    """
+    def do_GET(self) -> None:
+        if self.path.startswith("/users/sign_in"):
+            body = b"<html><body><form></form></body></html>"
+        elif "_hole19_session=logged-in" not in (self.headers.get("Cookie") or ""):
+            self.send_response(302)
+            self.send_header("Location", "/users/sign_in")
+            self.end_headers()
+            return
+        elif self.path.endswith("/404"):
+            self.send_response(404)
+            self.end_headers()
+            return
+        elif self.path.startswith("/api/rounds/"):
+            body = json.dumps(ROUND_JSON).encode()
+        elif self.path.endswith("/client-rendered"):
+            body = b"<html><body><div id='root'></div></body></html>"
+        else:
+            body = ROUND_PAGE.encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json" if self.path.startswith("/api/") else "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+@pytest.fixture
+def site():
+    """
+    Run the round site on a local port for the duration of a test.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RoundHandler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+def make_driver(cookie_value: str = "logged-in") -> MagicMock:
+    """
+    Build a fake logged-in browser holding the site's session cookie.
+
+    Returns:
+        MagicMock: The fake driver.
+    """
+    driver = MagicMock()
+    driver.get_cookies.return_value = [{"name": "_hole19_session", "value": cookie_value,
+                                        "domain": "127.0.0.1", "path": "/", "httpOnly": True}]
+    driver.execute_script.return_value = "Mozilla/5.0 (X11; Linux x86_64) HeadlessChrome/120.0"
+    return driver
+
+class TestScorecardHttpFetcher:
+    """
+    Unit tests for ScorecardHttpFetcher.
+
+    Serves round pages from a local HTTP server that only answers requests
+    carrying the login cookie copied from the browser.
+    """
+    @pytest.fixture(autouse=True)
+    def setup_fetcher(self):
+        """
+        Automatically create a fetcher around a ScorecardParser with a mock player name.
+        """
+        parser = ScorecardParser(logger=logging.getLogger("test_logger"))
+        parser.vars.round_site_player_name = "Player1"
+        self.fetcher = ScorecardHttpFetcher(logger=logging.getLogger("test_logger"), parser=parser, workers=3)
+        yield
+        self.fetcher.close()
+
+    def test_fetches_rounds_with_browser_cookies(self, site):
+        """
+        Rounds should be fetched with the browser's cookies and built by the parser's transform chain.
+        """
+        assert self.fetcher.use_browser_cookies(make_driver()) == 1
+        assert self.fetcher.session.headers["User-Agent"].endswith("HeadlessChrome/120.0")
+
+        exported = {}
+        urls = [f"{site}/performance/rounds/{round_id}" for round_id in (101, 102, 103)]
+        report = self.fetcher.run(urls=urls, on_result=lambda url, scorecard, file_name: exported.update(
+            {file_name: scorecard}))
+
+        assert report.ok and sorted(report.succeeded) == sorted(urls)
+        assert exported["scorecards/braid_hills_2025-06-21_101.json"] == [
+            {"hole": 1, "Par": 4, "Strokes": 5, "result": "Bogey"}
+        ]
+
+    def test_unusable_responses_are_reported(self, site):
+        """
+        Missing pages and pages without a scorecard grid should be reported as failed.
+        """
+        self.fetcher.use_browser_cookies(make_driver())
+        urls = [f"{site}/performance/rounds/404", f"{site}/performance/rounds/client-rendered"]
+
+        report = self.fetcher.run(urls=urls, on_result=MagicMock())
+
+        assert sorted(report.failed) == sorted(urls)
+        assert report.succeeded == []
+
+    def test_fetches_rounds_from_json_endpoint(self, site):
+        """
+        With a JSON endpoint, client-rendered rounds should be read from their JSON response.
+        """
+        self.fetcher.use_browser_cookies(make_driver())
+        self.fetcher.api_url = f"{site}/api/rounds/{{round_id}}"
+
+        scorecard, file_name = self.fetcher.fetch(f"{site}/performance/rounds/client-rendered")
+
+        assert file_name == "scorecards/braid_hills_2025-06-21_client-rendered.json"
+        assert scorecard == [{"hole": 1, "Par": 4, "Strokes": 5, "result": "Bogey"}]
+
+    def test_rejected_login_is_reported(self, site):
+        """
+        A redirect to the sign-in page should fail the round with a PermissionError.
+        """
+        self.fetcher.use_browser_cookies(make_driver(cookie_value="expired"))
+
+        with pytest.raises(PermissionError):
+            self.fetcher.fetch(f"{site}/performance/rounds/101")
@@ -0,0 +1,160 @@
+# Import dependencies
+from backend.functions.scorecard_navigator import Hole19Navigator
+from unittest.mock import MagicMock
+import logging
+import pytest
+import time
+
+class FakeHistory:
+    """
+    Fake performance tab that shows one more page of rounds each time 'Load More' is clicked.
+
+    Attributes:
+        pages (list[list[str]]): Round IDs on each page, newest first.
+        shown (int): Pages currently in view.
+        clicks (int): 'Load More' clicks received.
+    """
+    def __init__(self, pages: list[list[str]]) -> None:
+        self.pages = pages
+        self.shown = 1
+        self.clicks = 0
+        self.button = MagicMock()
+        self.button.is_displayed.return_value = True
+        self.button.is_enabled.return_value = True
+
+    def execute_script(self, script: str, *args):
+        if "querySelectorAll" in script:
+            return [f"https://www.hole19golf.com/performance/rounds/{round_id}"
+                    for page in self.pages[:self.shown] for round_id in page]
+        if "click" in script:
+            self.clicks += 1
+            self.shown = min(self.shown + 1, len(self.pages))
+
+    def find_elements(self, by: str, value: str) -> list:
+        return [self.button] if self.shown < len(self.pages) else []
+
+class TestLoadHole19Rounds:
+    """
+    Unit tests for Hole19Navigator.load_hole19_rounds.
+
+    Drives a fake round history to check incremental paging stops at the
+    first ingested round unless a failed round is still to load, and that
+    the end of the history is detected from the page rather than a timeout.
+    """
+    @pytest.fixture(autouse=True)
+    def setup_navigator(self):
+        """
+        Automatically create a navigator over a five page history of three rounds per page.
+        """
+        self.history = FakeHistory([[str(page * 3 + index) for index in range(3, 0, -1)] for page in range(5, 0, -1)])
+        self.navigator = Hole19Navigator(logger=logging.getLogger("test_logger"))
+        self.navigator.driver = self.history
+
+    def test_full_history_ends_without_timeout(self):
+        """
+        Without known rounds every page should load, finishing well inside the wait timeout.
+        """
+        started = time.perf_counter()
+        report = self.navigator.load_hole19_rounds(known_ids=None, timeout=5, settle=0.01)
+
+        assert time.perf_counter() - started < 2
+        assert report.pages_loaded == 4 and report.rounds_loaded == 15
+        assert not report.stopped_at_known
+        assert len(self.navigator.collect_round_urls()) == 15
+
+    def test_stops_at_first_known_round(self):
+        """
+        Paging should stop on the page where an ingested round appears, and estimate the pages skipped.
+        """
+        known_ids = {str(round_id) for round_id in range(1, 13)}
+
+        report = self.navigator.load_hole19_rounds(known_ids=known_ids, timeout=5, settle=0.01)
+
+        assert self.history.clicks == 2
+        assert report.stopped_at_known and report.rounds_loaded == 9
+        assert report.pages_skipped == 3
+        assert "3 page loads skipped" in str(report)
+
+    def test_pages_back_to_rounds_that_failed_before(self):
+        """
+        Paging should continue past the first ingested round until every previously failed round is in view.
+        """
+        known_ids = {str(round_id) for round_id in range(4, 13)} - {"8"}
+
+        report = self.navigator.load_hole19_rounds(known_ids=known_ids, retry_ids={"8"}, timeout=5, settle=0.01)
+
+        assert self.history.clicks == 3
+        assert report.stopped_at_known and report.rounds_loaded == 12
+
+    def test_missing_failed_round_loads_whole_history(self):
+        """
+        A failed round that is no longer listed should page to the end of the history.
+        """
+        known_ids = {str(round_id) for round_id in range(4, 13)}
+
+        report = self.navigator.load_hole19_rounds(known_ids=known_ids, retry_ids={"99"}, timeout=5, settle=0.01)
+
+        assert report.pages_loaded == 4 and report.rounds_loaded == 15
+        assert not report.stopped_at_known
+
+    def test_no_new_rounds_loads_nothing(self):
+        """
+        When the newest round is already ingested no page should be loaded.
+        """
+        report = self.navigator.load_hole19_rounds(known_ids={"18"}, timeout=5, settle=0.01)
+
+        assert self.history.clicks == 0 and report.pages_loaded == 0
+        assert report.stopped_at_known
+
+    def test_click_that_loads_nothing_ends_paging(self):
+        """
+        A click that does not grow the list should end paging after the wait timeout.
+        """
+        self.history.execute_script = MagicMock(side_effect=lambda script, *args: [] if "querySelectorAll" in script
+                                                else None)
+
+        report = self.navigator.load_hole19_rounds(known_ids=None, timeout=0.2, settle=0.01)
+
+        assert report.pages_loaded == 0 and report.rounds_loaded == 0
+
+class TestCapturedRoundUrls:
+    """
+    Unit tests for collecting round URLs from captured round history responses.
+    """
+    @pytest.fixture(autouse=True)
+    def setup_navigator(self):
+        """
+        Automatically create a navigator showing one page of rounds.
+        """
+        self.navigator = Hole19Navigator(logger=logging.getLogger("test_logger"))
+        self.navigator.vars.round_site_base_url = "https://www.hole19golf.com"
+        self.navigator.driver = FakeHistory([["3", "2"]])
+
+    def test_parse_rounds_json(self):
+        """
+        Rounds listed under a "rounds" key or as a top-level list should be found.
+        """
+        assert self.navigator.parse_rounds_json({"data": {"rounds": [{"id": 3}, {"id": "2"}]}}) == ["3", "2"]
+        assert self.navigator.parse_rounds_json([{"id": 1, "course": "Braid Hills"}]) == ["1"]
+        assert self.navigator.parse_rounds_json({"id": 9}) == []
+
+    def test_captured_rounds_are_added_to_rendered_links(self):
+        """
+        Captured rounds not rendered as links should be appended once, after the rendered ones.
+        """
+        self.navigator.capture = MagicMock()
+        self.navigator.capture.read.return_value = [
+            ("https://api.hole19golf.com/rounds?page=1", {"rounds": [{"id": 3}, {"id": 2}, {"id": 1}]})
+        ]
+
+        assert self.navigator.collect_round_urls() == [
+            "https://www.hole19golf.com/performance/rounds/3",
+            "https://www.hole19golf.com/performance/rounds/2",
+            "https://www.hole19golf.com/performance/rounds/1"
+        ]
+
+    def test_no_capture_returns_rendered_links(self):
+        """
+        Without network capture only the rendered links should be returned.
+        """
+        assert len(self.navigator.collect_round_urls()) == 2
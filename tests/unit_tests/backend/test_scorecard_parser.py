@@ -1,6 +1,7 @@
 # Import dependencies
 from backend.functions.scorecard_parser import ScorecardParser
 from unittest.mock import MagicMock, patch
+from selenium.webdriver.common.by import By
 from datetime import date
 import logging
 import pytest
@@ -565,14 +566,261 @@ class TestIdentifyNewData:
             "https://www.hole19golf.com/performance/rounds/99999",
         ]
 
-        collected_files = [
-            "scorecard_12345.json",
-            "scorecard_67890.json",
-        ]
+        collected_ids = {"12345", "67890"}
 
         obj = ScorecardParser(logger=logging.Logger)
 
-        with patch.object(obj, "list_blob_filenames", return_value=collected_files):
+        with patch.object(obj.catalog, "ensure") as mock_ensure, \
+                patch.object(obj.catalog, "ids", return_value=collected_ids) as mock_ids:
             new_data = obj.identify_new_data(scorecard_urls)
 
         assert new_data == ["https://www.hole19golf.com/performance/rounds/99999"]
+        mock_ensure.assert_called_once()
+        mock_ids.assert_called_once_with(kind="round")
+
+def make_round_page(player: str = "Player1") -> str:
+    """
+    Build the page source of a nine-hole round with OUT summary cells.
+
+    Returns:
+        str: HTML of the scorecard page.
+    """
+    def row(label: str, cells: list[str], summary: str = "") -> str:
+        return "".join([
+            '<div class="contents"><div class="sticky left-0"><span class="truncate">' + label + '</span></div>',
+            "".join(f'<div class="flex">{cell}</div>' for cell in cells),
+            f'<div class="shrink-0">{summary}</div></div>'
+        ])
+
+    strokes = ["4", "5", "", "3", "4", "6", "4", "5", "4"]
+    fairways = ["fairwayTarget", "fairwayLeft", None, "fairwayRight", "fairwayTarget",
+                "fairwayTarget", None, "fairwayLeft", "fairwayTarget"]
+    return "".join([
+        '<html><head><title>Round</title></head><body>',
+        '<section class="round-details"><h2>Round</h2><p>21/06/2025</p><p> Braid Hills </p></section>',
+        '<section class="round-scorecard"><section class="grid">',
+        row("", [str(hole) for hole in range(1, 10)], "OUT"),
+        row("PAR", ["4", "5", "3", "4", "4", "5", "3", "4", "4"], "36"),
+        row("S.I.", [str(index) for index in [3, 1, 9, 5, 7, 2, 8, 4, 6]]),
+        row(player, [f'<span><span><span>{value}</span></span></span>' for value in strokes], "39"),
+        row("PUTTS", ["2", "2", "-", "1", "2", "3", "2", "2", "2"], "18"),
+        row("FAIRWAYS", [f'<img src="f.svg" alt="{alt}">' if alt else "" for alt in fairways]),
+        row("GIR", ['<img alt="greenHit"/>' if hit else '<img alt="greenMissed">'
+                    for hit in [True, False, False, True, True, False, True, False, True]]),
+        '</section></section></body></html>'
+    ])
+
+class TestParsePageSource:
+    """
+    Unit tests for the ScorecardParser page source path.
+
+    Ensures a round parsed from a single page source snapshot has the same
+    schema as one read element by element, and that unparseable pages fall
+    back to the WebDriver path.
+    """
+    @pytest.fixture(autouse=True)
+    def setup_parser(self):
+        """
+        Automatically create a ScorecardParser instance with a mock driver and player name.
+        """
+        logger = logging.getLogger("test_logger")
+        self.parser = ScorecardParser(logger=logger)
+        self.parser.vars.round_site_player_name = "Player1"
+        self.parser.driver = MagicMock()
+
+    def test_parses_rows_and_details(self):
+        """
+        Test that every stat row, the round date and the course name are parsed from the page source.
+        """
+        scorecard_data, round_date, course_name = self.parser.parse_page_source(make_round_page())
+
+        assert round_date == date(2025, 6, 21)
+        assert course_name == "braid_hills"
+        assert list(scorecard_data) == ["Par", "S.i.", "Player1", "Putts", "Fairways", "Gir"]
+        assert scorecard_data["Par"] == ["4", "5", "3", "4", "4", "5", "3", "4", "4"]
+        assert scorecard_data["Player1"] == ["4", "5", None, "3", "4", "6", "4", "5", "4"]
+        assert scorecard_data["Putts"][2] == "-"
+        assert scorecard_data["Fairways"][:4] == ["Target", "Left", "N/A", "Right"]
+        assert scorecard_data["Gir"][:3] == [True, False, False]
+
+    def test_rejects_page_without_scorecard(self):
+        """
+        Test that a page without a scorecard grid raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            self.parser.parse_page_source("<html><body><p>Loading...</p></body></html>")
+
+    def test_collect_scorecard_data_from_page_source(self):
+        """
+        Test that a round is collected from one page source read, looking up only the grid it waits for.
+        """
+        self.parser.driver.page_source = make_round_page()
+
+        scorecard, file_name = self.parser.collect_scorecard_data(
+            url="https://www.hole19golf.com/performance/rounds/12345"
+        )
+
+        assert file_name == "scorecards/braid_hills_2025-06-21_12345.json"
+        assert [hole["hole"] for hole in scorecard] == [1, 2, 4, 5, 6, 7, 8, 9]
+        assert scorecard[0] == {"hole": 1, "Par": 4, "S. index": 3, "Strokes": 4, "Putts": 2,
+                                "Fairways": "Target", "Gir": True, "result": "Par"}
+        self.parser.driver.find_element.assert_called_once_with(By.CSS_SELECTOR,
+                                                                'section.round-scorecard div.contents')
+        self.parser.driver.find_elements.assert_not_called()
+
+    def test_falls_back_to_elements(self):
+        """
+        Test that an unparseable page source falls back to reading elements through the WebDriver.
+        """
+        self.parser.driver.page_source = "<html><body></body></html>"
+        fallback = ({"Par": ["4"], "Player1": ["5"]}, date(2025, 6, 21), "braid_hills")
+
+        with patch.object(self.parser, "parse_scorecard_elements", return_value=fallback) as mock_elements:
+            scorecard, file_name = self.parser.collect_scorecard_data(
+                url="https://www.hole19golf.com/performance/rounds/12345"
+            )
+
+        mock_elements.assert_called_once()
+        assert file_name == "scorecards/braid_hills_2025-06-21_12345.json"
+        assert scorecard == [{"hole": 1, "Par": 4, "Strokes": 5, "result": "Bogey"}]
+
+def make_round_json() -> dict:
+    """
+    Build a round JSON response with a course layout and two players, of which Player1 played three holes.
+
+    Returns:
+        dict: The decoded response.
+    """
+    layout = [{"number": 1, "par": 4, "stroke_index": 3},
+              {"number": 2, "par": 3, "stroke_index": 17},
+              {"number": 3, "par": 5, "stroke_index": 1}]
+    player = [{"number": 2, "strokes": 3, "putts": 1, "gir": True},
+              {"number": 1, "strokes": 4, "putts": 2, "fairway": "hit", "gir": True},
+              {"number": 3, "strokes": 7, "putts": 3, "fairway": "left", "gir": False}]
+    return {"round": {"id": 12345, "played_at": "2025-06-21T09:12:00Z",
+                      "course": {"name": "Braid Hills", "holes": layout},
+                      "players": [{"name": "Someone Else", "holes": [{"number": 1, "strokes": 9}]},
+                                  {"name": "Player1", "holes": player}]}}
+
+class TestParseScorecardJson:
+    """
+    Unit tests for the ScorecardParser network capture path.
+
+    Ensures a round mapped from its JSON response has the same hole-level
+    schema as one parsed from the page, and that rounds without a captured
+    response fall back to the rendered page.
+    """
+    @pytest.fixture(autouse=True)
+    def setup_parser(self):
+        """
+        Automatically create a ScorecardParser instance with a mock driver and player name.
+        """
+        logger = logging.getLogger("test_logger")
+        self.parser = ScorecardParser(logger=logger, max_capture_misses=2)
+        self.parser.vars.round_site_player_name = "Player1"
+        self.parser.driver = MagicMock()
+
+    def test_maps_player_holes_onto_rows(self):
+        """
+        Test that the player's holes are merged with the course layout into raw rows, ordered by hole number.
+        """
+        scorecard_data, round_date, course_name = self.parser.parse_scorecard_json(make_round_json())
+
+        assert round_date == date(2025, 6, 21)
+        assert course_name == "braid_hills"
+        assert scorecard_data["Par"][:4] == ["4", "3", "5", "N/A"]
+        assert scorecard_data["Player1"][:4] == ["4", "3", "7", None]
+        assert scorecard_data["Fairways"][:3] == ["Target", "N/A", "Left"]
+        assert scorecard_data["Gir"][:3] == [True, True, False]
+
+    def test_builds_hole_level_schema(self):
+        """
+        Test that mapped rows produce the stored hole-level records.
+        """
+        scorecard_data, round_date, course_name = self.parser.parse_scorecard_json(make_round_json())
+
+        scorecard, file_name = self.parser.build_scorecard(
+            scorecard_data=scorecard_data, round_date=round_date, course_name=course_name,
+            url="https://www.hole19golf.com/performance/rounds/12345"
+        )
+
+        assert file_name == "scorecards/braid_hills_2025-06-21_12345.json"
+        assert scorecard == [
+            {"hole": 1, "Par": 4, "S. index": 3, "Strokes": 4, "Putts": 2, "Fairways": "Target", "Gir": True,
+             "result": "Par"},
+            {"hole": 2, "Par": 3, "S. index": 17, "Strokes": 3, "Putts": 1, "Fairways": None, "Gir": True,
+             "result": "Par"},
+            {"hole": 3, "Par": 5, "S. index": 1, "Strokes": 7, "Putts": 3, "Fairways": "Left", "Gir": False,
+             "result": "Double Bogey or worse"}
+        ]
+
+    def test_rejects_response_without_scores(self):
+        """
+        Test that a response without scored holes raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            self.parser.parse_scorecard_json({"round": {"course": {"holes": [{"number": 1, "par": 4}]}}})
+
+    def test_collect_scorecard_data_from_capture(self):
+        """
+        Test that a captured response is used without waiting for the rendered grid.
+        """
+        capture = MagicMock()
+        capture.wait_for.side_effect = lambda parse, **kwargs: parse(make_round_json())
+        capture.matched_url = "https://api.hole19golf.com/api/v2/rounds/12345?include=scores"
+
+        with patch.object(self.parser, "network_capture", return_value=capture):
+            scorecard, file_name = self.parser.collect_scorecard_data(
+                url="https://www.hole19golf.com/performance/rounds/12345"
+            )
+
+        capture.clear.assert_called_once()
+        assert capture.wait_for.call_args.kwargs["url_filter"] == "12345"
+        assert [hole["hole"] for hole in scorecard] == [1, 2, 3]
+        self.parser.driver.find_element.assert_not_called()
+
+        # The response URL is kept as the JSON endpoint of every round
+        assert self.parser.round_api_url == "https://api.hole19golf.com/api/v2/rounds/{round_id}?include=scores"
+
+    def test_round_api_url_templates_only_the_round_segment(self):
+        """
+        Test that only the path segment naming the round becomes the placeholder.
+        """
+        self.parser.remember_round_api_url(
+            url="https://www.hole19golf.com/performance/rounds/123",
+            response_url="https://api.hole19golf.com/api/v2/users/41234/rounds/123?since=1234&fields={a}"
+        )
+
+        assert self.parser.round_api_url == \
+            "https://api.hole19golf.com/api/v2/users/41234/rounds/{round_id}?since=1234&fields={{a}}"
+        assert self.parser.round_api_url.format(round_id="456") == \
+            "https://api.hole19golf.com/api/v2/users/41234/rounds/456?since=1234&fields={a}"
+
+    def test_round_api_url_needs_the_round_segment(self):
+        """
+        Test that a response URL carrying the round ID only outside its path is not kept.
+        """
+        self.parser.remember_round_api_url(
+            url="https://www.hole19golf.com/performance/rounds/123",
+            response_url="https://api.hole19golf.com/api/v2/rounds?id=123"
+        )
+
+        assert self.parser.round_api_url is None
+
+    def test_stops_waiting_after_repeated_misses(self):
+        """
+        Test that rounds without a captured response fall back to the page, and capture is dropped after misses.
+        """
+        capture = MagicMock()
+        capture.wait_for.side_effect = TimeoutError("No matching JSON response")
+        rendered = ({"Par": ["4"], "Player1": ["5"]}, date(2025, 6, 21), "braid_hills")
+
+        with patch.object(self.parser, "network_capture", return_value=capture) as network_capture, \
+                patch.object(self.parser, "parse_rendered_round", return_value=rendered):
+            for _ in range(3):
+                scorecard, _ = self.parser.collect_scorecard_data(
+                    url="https://www.hole19golf.com/performance/rounds/12345"
+                )
+
+        assert scorecard == [{"hole": 1, "Par": 4, "Strokes": 5, "result": "Bogey"}]
+        assert network_capture.call_count == 2
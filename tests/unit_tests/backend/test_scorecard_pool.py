@@ -0,0 +1,143 @@
+# Import dependencies
+from backend.functions.scorecard_pool import ScorecardWorkerPool
+from selenium.common.exceptions import WebDriverException
+from backend.functions.rate_limiter import RateLimiter
+from unittest.mock import MagicMock, patch
+import threading
+import logging
+import time
+
+def make_parser(fail_urls: frozenset = frozenset(), dead_urls: frozenset = frozenset()) -> MagicMock:
+    """
+    Build a fake logged-in parser that scrapes a one-hole round per URL.
+
+    Args:
+        fail_urls (frozenset): URLs whose page cannot be parsed.
+        dead_urls (frozenset): URLs on which the browser session dies.
+
+    Returns:
+        MagicMock: The fake parser.
+    """
+    def collect_scorecard_data(url: str):
+        if url in dead_urls:
+            raise WebDriverException("invalid session id")
+        if url in fail_urls:
+            raise ValueError("no scorecard grid")
+        return [{"hole": 1, "Strokes": 4}], f"scorecards/{url.split('/')[-1]}.json"
+
+    parser = MagicMock()
+    parser.collect_scorecard_data.side_effect = collect_scorecard_data
+    return parser
+
+class TestRateLimiter:
+    """
+    Unit tests for RateLimiter.
+
+    Ensures tokens are spaced at the configured rate across threads.
+    """
+    def test_spaces_acquisitions_across_threads(self):
+        """
+        Six acquisitions at 50 per second with a burst of one should take at least five intervals.
+        """
+        limiter = RateLimiter(rate=50.0)
+        started = time.monotonic()
+
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert time.monotonic() - started >= 5 / 50 - 0.01
+        assert limiter.waited > 0
+
+    def test_disabled(self):
+        """
+        A rate of zero should never wait.
+        """
+        limiter = RateLimiter(rate=0)
+        assert [limiter.acquire() for _ in range(100)] == [0.0] * 100
+
+class TestScorecardWorkerPool:
+    """
+    Unit tests for ScorecardWorkerPool.
+
+    Uses fake parsers in place of logged-in browser sessions so no browser
+    is launched, and checks results stream out while failures stay isolated.
+    """
+    urls = [f"https://www.hole19golf.com/performance/rounds/{round_id}" for round_id in range(1, 9)]
+
+    def run_pool(self, parsers: list, workers: int = 3, **kwargs):
+        """
+        Run the pool over `urls`, starting workers from the given parsers in order.
+
+        Returns:
+            tuple: The scrape report and the rounds handed to the exporter.
+        """
+        exported = []
+        pool = ScorecardWorkerPool(logger=logging.getLogger("test_logger"), workers=workers, **kwargs)
+        with patch.object(pool, "start_worker", side_effect=parsers):
+            report = pool.run(urls=self.urls, on_result=lambda url, scorecard, file_name: exported.append(file_name))
+        return report, exported
+
+    def test_scrapes_every_round(self):
+        """
+        Every round should be scraped once, exported as it completes, and every browser closed.
+        """
+        parsers = [make_parser() for _ in range(3)]
+
+        report, exported = self.run_pool(parsers)
+
+        assert report.ok and report.workers == 3
+        assert sorted(report.succeeded) == sorted(self.urls)
+        assert sorted(exported) == sorted(f"scorecards/{round_id}.json" for round_id in range(1, 9))
+        assert sum(parser.collect_scorecard_data.call_count for parser in parsers) == 8
+        for parser in parsers:
+            parser.driver.quit.assert_called_once()
+
+    def test_failed_round_is_isolated(self):
+        """
+        A round that fails should be reported without stopping its worker.
+        """
+        bad_url = self.urls[2]
+        parsers = [make_parser(fail_urls=frozenset({bad_url}))]
+
+        report, exported = self.run_pool(parsers, workers=1)
+
+        assert list(report.failed) == [bad_url]
+        assert len(report.succeeded) == 7 and len(exported) == 7
+
+    def test_dead_session_is_replaced(self):
+        """
+        A worker whose browser dies should close it and continue on a new session.
+        """
+        dead_url = self.urls[0]
+        first, replacement = make_parser(dead_urls=frozenset({dead_url})), make_parser()
+
+        report, _ = self.run_pool([first, replacement], workers=1)
+
+        assert list(report.failed) == [dead_url]
+        assert len(report.succeeded) == 7
+        first.driver.quit.assert_called_once()
+        assert replacement.collect_scorecard_data.call_count == 7
+
+    def test_worker_that_fails_to_start(self):
+        """
+        Workers that cannot start should leave the queue to the ones that did.
+        """
+        report, _ = self.run_pool([WebDriverException("chrome not reachable"), make_parser()], workers=2)
+
+        assert report.ok and report.workers == 1
+        assert len(report.succeeded) == 8
+
+    def test_retired_workers_leave_rounds_unattempted(self):
+        """
+        Rounds left once every worker has retired should be reported as failed.
+        """
+        parsers = [make_parser(fail_urls=frozenset(self.urls))]
+
+        report, exported = self.run_pool(parsers, workers=1, max_failures=2)
+
+        assert exported == [] and report.succeeded == []
+        assert sorted(report.failed) == sorted(self.urls)
+        assert sum(isinstance(error, RuntimeError) for error in report.failed.values()) == 6
@@ -1,4 +1,6 @@
 # Import dependencies
+from backend.functions.navigation_metrics import NavigationMetrics
+from backend.functions.browser_profile import BrowserProfile
 from backend.functions.selenium_driver import SeleniumDriver
 from unittest.mock import patch, MagicMock
 
@@ -55,3 +57,68 @@ class TestSeleniumDriver:
 
         # Verify that '--headless' was included in the Chrome options
         assert "--headless" in options.arguments
+
+    @patch("backend.functions.selenium_driver.webdriver.Chrome")
+    def test_configure_driver_lean(self, mock_chrome):
+        """
+        Lean profile: should load pages eagerly, disable extensions and GPU,
+        and block unused resources except those the site is allowed.
+        """
+        mock_chrome.return_value = MagicMock()
+
+        driver = SeleniumDriver().configure_driver(headless=True, profile=BrowserProfile.lean(), site="hole19")
+
+        # Inspect the Chrome options of the launch
+        _, kwargs = mock_chrome.call_args
+        options = kwargs["options"]
+        assert options.page_load_strategy == "eager"
+        assert {"--disable-extensions", "--disable-gpu"} <= set(options.arguments)
+
+        # Resources should be blocked through the DevTools network domain
+        driver.execute_cdp_cmd.assert_any_call("Network.enable", {})
+        _, blocked = driver.execute_cdp_cmd.call_args[0]
+        assert "*.png" in blocked["urls"] and "*google-analytics.com*" in blocked["urls"]
+        assert "*.css" not in blocked["urls"]
+
+    @patch("backend.functions.selenium_driver.webdriver.Chrome")
+    def test_configure_driver_default_profile_blocks_nothing(self, mock_chrome):
+        """
+        Default profile: should wait for the full page load and not touch the DevTools network domain.
+        """
+        mock_chrome.return_value = MagicMock()
+
+        driver = SeleniumDriver().configure_driver(profile=BrowserProfile())
+
+        _, kwargs = mock_chrome.call_args
+        assert kwargs["options"].page_load_strategy == "normal"
+        driver.execute_cdp_cmd.assert_not_called()
+
+    def test_navigate_records_timing(self):
+        """
+        Navigating should load the page and record it under the class and profile.
+        """
+        NavigationMetrics.reset()
+        selenium_driver = SeleniumDriver()
+        selenium_driver.driver = MagicMock()
+        selenium_driver.profile = BrowserProfile.lean()
+
+        selenium_driver.navigate("https://www.hole19golf.com")
+
+        selenium_driver.driver.get.assert_called_once_with("https://www.hole19golf.com")
+        [stats] = NavigationMetrics.stats()
+        assert (stats.caller, stats.profile, stats.navigations, stats.errors) == ("SeleniumDriver", "lean", 1, 0)
+
+    @patch("backend.functions.selenium_driver.webdriver.Chrome")
+    def test_configure_driver_network_capture(self, mock_chrome):
+        """
+        Network capture: should record network events in the performance log and hand out a capture.
+        """
+        mock_chrome.return_value = MagicMock()
+
+        selenium_driver = SeleniumDriver()
+        selenium_driver.driver = selenium_driver.configure_driver(profile=BrowserProfile(capture_network=True))
+
+        _, kwargs = mock_chrome.call_args
+        assert kwargs["options"].capabilities["goog:loggingPrefs"] == {"performance": "ALL"}
+        assert selenium_driver.network_capture().driver is selenium_driver.driver
+        assert SeleniumDriver().network_capture() is None
@@ -2,6 +2,7 @@
 from frontend.functions.data_functions import (
     summarise_hole_performance_data,
     collect_club_trajectory_data,
+    summarise_blob_io_data,
     aggregate_fairway_data,
     extract_stat_flags
 )
@@ -136,3 +137,48 @@ def test_collect_club_trajectory_data():
     assert list(end_df.columns) == ["x", "z", "Shot"]
     assert end_df["x"].tolist() == [100, 90]
     assert end_df["z"].tolist() == [30, 25]
+
+def test_collect_club_trajectory_data_streamed():
+    # Shots arrive one at a time from a generator, as when streamed from blob storage
+    def stream():
+        for carry in [250, 230, 210]:
+            yield {
+                "Measurement": {
+                    "Carry": carry,
+                    "Total": carry + 20,
+                    "BallSpeed": 150,
+                    "BallTrajectory": [{"X": 0, "Y": 0, "Z": 0}, {"X": 100, "Y": 10, "Z": 30}]
+                }
+            }
+
+    # Only the requested number of shots is consumed
+    _, end_df, carry, _, _ = collect_club_trajectory_data(stream(), total_shots=2)
+    assert carry == [250, 230]
+    assert len(end_df) == 2
+
+    # All shots are processed when no limit is given
+    _, _, carry, _, _ = collect_club_trajectory_data(stream(), total_shots=None)
+    assert carry == [250, 230, 210]
+
+def test_summarise_blob_io_data():
+    # Operations as exported in a blob I/O report
+    operations = [
+        {"caller": "ShotTable", "calls": 2, "errors": 0, "bytes": 100, "total_ms": 10.0, "max_ms": 7.0,
+         "histogram": {"<=1ms": 1, "<=2ms": 1}},
+        {"caller": "ShotTable", "calls": 1, "errors": 1, "bytes": 50, "total_ms": 5.0, "max_ms": 5.0,
+         "histogram": {"<=1ms": 0, "<=2ms": 1}},
+        {"caller": "BlobCatalog", "calls": 1, "errors": 0, "bytes": 10, "total_ms": 40.0, "max_ms": 40.0,
+         "histogram": {"<=1ms": 0, "<=2ms": 0}}
+    ]
+
+    # Call the function under test
+    summary_df, histogram_df = summarise_blob_io_data(operations, group_by="caller")
+
+    # Callers are summed and ordered by time spent
+    assert summary_df["caller"].tolist() == ["BlobCatalog", "ShotTable"]
+    assert summary_df["calls"].tolist() == [1, 3]
+    assert summary_df["bytes"].tolist() == [10, 150]
+    assert summary_df["mean_ms"].tolist() == [40.0, 5.0]
+
+    # Histograms are added up bucket by bucket in report order
+    assert histogram_df.to_dict("records") == [{"Latency": "<=1ms", "Calls": 1}, {"Latency": "<=2ms", "Calls": 2}]
@@ -20,7 +20,7 @@ def test_get_navigation():
 
         # Assert values
         assert result == "fake_nav_object"
-        assert mock_page.call_count == 6
+        assert mock_page.call_count == 7
 
         # Assert expected values in mocked object
         mock_nav.assert_called_once()
@@ -28,3 +28,4 @@ def test_get_navigation():
         assert "Overview" in pages_arg
         assert "Trackman" in pages_arg
         assert "Pinehurst Golf Course Analysis" in pages_arg
+        assert "Diagnostics" in pages_arg
@@ -33,6 +33,18 @@ def test_display_club_metrics():
         assert any(call.kwargs["value"] == expected_distance for call in metric_calls)
         assert any(call.kwargs["value"] == expected_speed for call in metric_calls)
 
+def test_display_club_metrics_without_shots():
+    with patch("frontend.functions.ui_components.st") as mock_st:  # Patch the Streamlit module
+        # Mock the columns
+        mock_col = MagicMock()
+        mock_st.columns.return_value = (mock_col, mock_col, mock_col)
+
+        # Call the function with no shots to average
+        display_club_metrics(0, [], [], [])
+
+        # Every metric should render a placeholder instead of dividing by zero
+        assert [call.kwargs["value"] for call in mock_st.metric.call_args_list] == ["-", "-", "-"]
+
 def test_display_club_summary_shot_trajectories():
     # Create fake shot data input (just needs to be non-empty)
     fake_data = [{"x": 1, "y": 2, "carry": 200, "total": 250, "speed": 140}]
@@ -99,3 +111,20 @@ def test_display_club_summary_shot_trajectories():
 
         # Verify the contour plot function was called with the final end dataframe
         mock_contour.assert_called_once_with(df=fake_final_end_df)
+
+def test_display_club_summary_shot_trajectories_zero_shots():
+    # Zero shots should collect every shot rather than none
+    with patch("frontend.functions.ui_components.collect_club_trajectory_data") as mock_collect, \
+         patch("frontend.functions.ui_components.display_club_metrics") as mock_metrics, \
+         patch("frontend.functions.ui_components.st"), \
+         patch("frontend.functions.ui_components.PlotlyPlotter"), \
+         patch("frontend.functions.ui_components.plot_final_trajectory_contour"):
+
+        # Return three shots from the collected data
+        mock_collect.return_value = (MagicMock(), MagicMock(), [200, 210, 190], [250, 260, 240], [140, 142, 138])
+
+        display_club_summary_shot_trajectories([], total_shots=0)
+
+        # Verify the data was collected without a limit and the metrics count every shot
+        mock_collect.assert_called_once_with(data=[], total_shots=None)
+        assert mock_metrics.call_args.kwargs["total_shots"] == 3
@@ -0,0 +1,205 @@
+# Import dependencies
+from azure.core.exceptions import ResourceNotFoundError
+from unittest.mock import patch, MagicMock, AsyncMock
+from shared import AsyncBlobClient, BlobClient
+import hashlib
+import asyncio
+import pytest
+import gzip
+import json
+
+@pytest.fixture
+def async_blob_client():
+    """
+    Provide an AsyncBlobClient instance for testing.
+    """
+    return AsyncBlobClient()
+
+def make_blob_client(payload: bytes = b"{}", error: Exception | None = None,
+                     stored_hash: str | None = None) -> MagicMock:
+    """
+    Build a fake async blob client whose download returns the given payload.
+
+    Args:
+        payload (bytes): Bytes returned by readall.
+        error (Exception | None): Exception raised by download_blob instead.
+        stored_hash (str | None): Content hash recorded on the stored blob, which does not exist if None.
+
+    Returns:
+        MagicMock: Fake async blob client.
+    """
+    blob_client = MagicMock()
+    blob_client.upload_blob = AsyncMock()
+    if stored_hash is None:
+        blob_client.get_blob_properties = AsyncMock(side_effect=ResourceNotFoundError("Blob not found"))
+    else:
+        blob_client.get_blob_properties = AsyncMock(return_value=MagicMock(metadata={"content_sha256": stored_hash}))
+    download_stream = MagicMock()
+    download_stream.readall = AsyncMock(return_value=payload)
+    download_stream.properties.content_settings.content_encoding = None
+    blob_client.download_blob = AsyncMock(return_value=download_stream, side_effect=error)
+    return blob_client
+
+class TestAsyncBlobClient:
+    """
+    Test suite for AsyncBlobClient functionality.
+
+    Covers listing, single reads and writes, and the
+    bounded gather-style batch helpers.
+    """
+
+    @patch("shared.functions.async_blob_client.BlobServiceClient")
+    def test_list_blob_filenames(self, mock_blob_service_client, async_blob_client):
+        """
+        Verify blob listing iterates the async pager.
+        """
+        # Fake an async pager of blobs
+        async def fake_list_blobs(name_starts_with):
+            for name in ["folder/a.json", "folder/b.json"]:
+                blob = MagicMock()
+                blob.name = name
+                yield blob
+
+        container_client = MagicMock()
+        container_client.list_blobs.side_effect = fake_list_blobs
+        mock_blob_service_client.from_connection_string.return_value.get_container_client.return_value = \
+            container_client
+
+        # Call the function under test
+        result = asyncio.run(async_blob_client.list_blob_filenames(container_name="golf", directory_path="folder/"))
+
+        # Verify results match expected filenames
+        assert result == ["folder/a.json", "folder/b.json"]
+
+    @patch("shared.functions.async_blob_client.BlobServiceClient")
+    def test_export_and_read_round_trip(self, mock_blob_service_client, async_blob_client):
+        """
+        Verify writes serialize to JSON and reads parse JSON.
+        """
+        # Return the same fake blob client for every blob
+        blob_client = make_blob_client(payload=b'[{"key": "value"}]')
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = blob_client
+
+        # Call the functions under test
+        asyncio.run(async_blob_client.export_dict_to_blob([{"key": "value"}], "golf", "out.json"))
+        result = asyncio.run(async_blob_client.read_blob_to_dict("golf", "out.json"))
+
+        # Verify the gzip encoded upload payload and the parsed result
+        args, kwargs = blob_client.upload_blob.await_args
+        assert gzip.decompress(args[0]) == json.dumps([{"key": "value"}]).encode()
+        assert kwargs["content_settings"].content_encoding == "gzip"
+        assert kwargs["metadata"] == {"content_sha256": hashlib.sha256(b'[{"key": "value"}]').hexdigest()}
+        assert result == [{"key": "value"}]
+
+    @patch("shared.functions.async_blob_client.BlobServiceClient")
+    def test_unchanged_write_skipped(self, mock_blob_service_client, async_blob_client):
+        """
+        Verify a blob already holding the same content is not uploaded again.
+        """
+        # Record the hash of the payload on the stored blob
+        blob_client = make_blob_client(stored_hash=hashlib.sha256(b'{"key": "value"}').hexdigest())
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = blob_client
+
+        # Call the function under test
+        uploaded = asyncio.run(async_blob_client.export_dict_to_blob({"key": "value"}, "golf", "out.json"))
+
+        # Verify nothing was uploaded
+        assert uploaded is False
+        blob_client.upload_blob.assert_not_awaited()
+
+    @patch("shared.functions.async_blob_client.BlobServiceClient")
+    def test_write_invalidates_cached_listings(self, mock_blob_service_client, async_blob_client):
+        """
+        Verify a write drops cached listings of its prefix.
+        """
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = \
+            make_blob_client()
+
+        # Call the function under test
+        with patch("shared.functions.async_blob_client.BlobListingCache.invalidate") as invalidate:
+            asyncio.run(async_blob_client.export_dict_to_blob([1], "golf", "folder/out.json"))
+
+        # Verify the listing cache was told about the write
+        assert invalidate.call_args.args[1:] == ("golf", "folder/out.json")
+
+    @patch("shared.functions.async_blob_client.BlobServiceClient")
+    def test_write_goes_to_active_buffer(self, mock_blob_service_client, async_blob_client):
+        """
+        Verify writes are held by the active write-behind buffer instead of uploaded.
+        """
+        blob_client = make_blob_client()
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = blob_client
+        buffer = MagicMock()
+
+        # Call the function under test with a buffer active
+        with patch.object(BlobClient, "write_buffer", buffer):
+            asyncio.run(async_blob_client.export_dict_to_blob([1], "golf", "out.json"))
+
+        # Verify the write was buffered with its content hash
+        write = buffer.put.call_args.args[0]
+        assert (write.container, write.name, write.caller) == ("golf", "out.json", "AsyncBlobClient")
+        assert write.content_hash == hashlib.sha256(b"[1]").hexdigest()
+        blob_client.upload_blob.assert_not_awaited()
+
+    @patch("shared.functions.async_blob_client.BlobServiceClient")
+    def test_read_blobs_to_dicts_isolates_errors(self, mock_blob_service_client, async_blob_client):
+        """
+        Verify batch reads keep order and report per blob failures.
+        """
+        # Fail only the missing blob
+        def fake_get_blob_client(container, blob):
+            if blob == "missing.json":
+                return make_blob_client(error=ResourceNotFoundError("Blob not found"))
+            return make_blob_client(payload=json.dumps({"name": blob}).encode())
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.side_effect = \
+            fake_get_blob_client
+
+        # Call the function under test
+        results = asyncio.run(async_blob_client.read_blobs_to_dicts(
+            container="golf", input_filenames=["a.json", "missing.json", "b.json"], max_concurrency=2))
+
+        # Verify ordering and error isolation
+        assert [result.name for result in results] == ["a.json", "missing.json", "b.json"]
+        assert results[0].data == {"name": "a.json"}
+        assert isinstance(results[1].error, ResourceNotFoundError)
+        assert results[2].ok
+
+    @patch("shared.functions.async_blob_client.BlobServiceClient")
+    def test_export_dicts_to_blobs_report(self, mock_blob_service_client, async_blob_client):
+        """
+        Verify batch uploads aggregate into one report.
+        """
+        # Return a fresh fake blob client per blob
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.side_effect = \
+            lambda container, blob: make_blob_client()
+
+        # Include a payload that cannot be serialized
+        payloads = {"a.json": [1], "b.json": {("not", "json")}}
+
+        # Call the function under test
+        report = asyncio.run(async_blob_client.export_dicts_to_blobs(payloads=payloads, container="golf"))
+
+        # Verify the aggregated report
+        assert report.succeeded == ["a.json"]
+        assert isinstance(report.failed["b.json"], TypeError)
+
+    def test_gather_bounds_concurrency(self, async_blob_client):
+        """
+        Verify gather never exceeds the configured number of in-flight operations.
+        """
+        in_flight = {"now": 0, "peak": 0}
+
+        # Track the peak number of concurrently running operations
+        async def operation(value):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.001)
+            in_flight["now"] -= 1
+            return value
+
+        # Call the function under test
+        results = asyncio.run(async_blob_client.gather([operation(i) for i in range(50)], max_concurrency=5))
+
+        # Verify order is preserved and the bound respected
+        assert results == list(range(50))
+        assert in_flight["peak"] == 5
@@ -0,0 +1,217 @@
+# Import dependencies
+from shared import BlobCatalog, BlobServiceRegistry, BlobListingCache, CatalogEntry
+from azure.core.exceptions import ResourceModifiedError, ResourceNotFoundError
+from unittest.mock import patch, MagicMock
+from azure.core import MatchConditions
+import pytest
+import json
+
+@pytest.fixture(autouse=True)
+def reset_blob_service_registry():
+    """
+    Clear pooled clients and cached listings between tests.
+
+    Ensures each test builds its clients from
+    its own patched BlobServiceClient.
+    """
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+    yield
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+
+class FakeCatalogBlob:
+    """
+    In-memory stand-in for the catalog blob honouring ETag preconditions.
+
+    Attributes:
+        data (bytes): Stored content, or None if the blob does not exist.
+        content_encoding (str): Stored Content-Encoding.
+        version (int): Counter used to derive the ETag.
+        conflicts (int): Number of upcoming uploads to reject as if another writer got there first.
+    """
+    def __init__(self) -> None:
+        self.data = None
+        self.content_encoding = None
+        self.version = 0
+        self.conflicts = 0
+
+    def exists(self) -> bool:
+        return self.data is not None
+
+    def download_blob(self, **kwargs) -> MagicMock:
+        if self.data is None:
+            raise ResourceNotFoundError("The specified blob does not exist.")
+        download_stream = MagicMock()
+        download_stream.readall.return_value = self.data
+        download_stream.properties.etag = f"0x{self.version}"
+        download_stream.properties.content_settings.content_encoding = self.content_encoding
+        return download_stream
+
+    def upload_blob(self, data: bytes, overwrite: bool = False, content_settings=None, etag=None,
+                    match_condition=None) -> None:
+        if self.conflicts:
+            self.conflicts -= 1
+            self.version += 1
+            raise ResourceModifiedError("The condition specified using HTTP conditional header(s) is not met.")
+        if match_condition == MatchConditions.IfNotModified and etag != f"0x{self.version}":
+            raise ResourceModifiedError("The condition specified using HTTP conditional header(s) is not met.")
+        self.data = data
+        self.content_encoding = content_settings.content_encoding
+        self.version += 1
+
+@pytest.fixture
+def catalog_blob():
+    """
+    Patch the Azure SDK so every blob client is the in-memory catalog blob.
+    """
+    catalog_blob = FakeCatalogBlob()
+    with patch("shared.functions.blob_service_registry.BlobServiceClient") as mock_blob_service_client:
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = catalog_blob
+        yield catalog_blob
+
+class TestBlobCatalog:
+    """
+    Test suite for BlobCatalog.
+
+    Covers recording and querying entries, optimistic
+    concurrency retries and parsing blob names into entries.
+    """
+
+    def test_missing_catalog_is_empty(self, catalog_blob):
+        """
+        Verify querying a catalog that does not exist returns no entries.
+        """
+        # Verify the empty results
+        assert BlobCatalog().entries() == []
+        assert BlobCatalog().ids(kind="round") == set()
+        assert not BlobCatalog().exists()
+
+    def test_record_and_query(self, catalog_blob):
+        """
+        Verify recorded entries are queryable by kind, course and club, newest first.
+        """
+        # Record rounds and a session
+        catalog = BlobCatalog()
+        catalog.record([
+            CatalogEntry(kind="round", id="1", date="2025-05-01", blob_name="a.json", course="braid_hills"),
+            CatalogEntry(kind="round", id="2", date="2025-06-01", blob_name="b.json", course="braid_hills"),
+            CatalogEntry(kind="round", id="3", date="2025-07-01", blob_name="c.json", course="gullane_no_1")
+        ])
+        catalog.record([CatalogEntry(kind="session", id="s1", date="2025-06-02T10:00:00", blob_name="s.json",
+                                     clubs=["Driver", "7Iron"])])
+
+        # Verify the queries
+        assert [entry.id for entry in catalog.entries(kind="round", course="Braid_Hills")] == ["2", "1"]
+        assert catalog.ids(kind="session") == {"s1"}
+        assert catalog.entries(club="Driver")[0].blob_name == "s.json"
+        assert catalog.entries(club="Putter") == []
+
+    def test_record_replaces_same_id(self, catalog_blob):
+        """
+        Verify re-recording an entry replaces it rather than duplicating it.
+        """
+        # Record the same round twice
+        catalog = BlobCatalog()
+        catalog.record([CatalogEntry(kind="round", id="1", date="2025-05-01", blob_name="old.json")])
+        catalog.record([CatalogEntry(kind="round", id="1", date="2025-05-01", blob_name="new.json")])
+
+        # Verify a single, updated entry
+        entries = catalog.entries()
+        assert len(entries) == 1
+        assert entries[0].blob_name == "new.json"
+
+    @patch("shared.functions.blob_catalog.time.sleep")
+    def test_record_retries_on_conflict(self, mock_sleep, catalog_blob):
+        """
+        Verify a write rejected by the ETag precondition is retried against the new version.
+        """
+        # Seed the catalog, then reject the next upload once
+        catalog = BlobCatalog()
+        catalog.record([CatalogEntry(kind="round", id="1", date="2025-05-01", blob_name="a.json")])
+        catalog_blob.conflicts = 1
+
+        # Call the function under test
+        catalog.record([CatalogEntry(kind="round", id="2", date="2025-06-01", blob_name="b.json")])
+
+        # Verify both entries survived the retry
+        assert catalog.ids(kind="round") == {"1", "2"}
+        assert mock_sleep.call_count == 1
+
+    @patch("shared.functions.blob_catalog.time.sleep")
+    def test_record_gives_up_after_max_attempts(self, mock_sleep, catalog_blob):
+        """
+        Verify a persistently contended catalog raises after max_attempts.
+        """
+        # Reject every upload
+        catalog = BlobCatalog()
+        catalog_blob.conflicts = catalog.max_attempts
+
+        # Verify the error is raised
+        with pytest.raises(ResourceModifiedError):
+            catalog.record([CatalogEntry(kind="round", id="1", date="2025-05-01", blob_name="a.json")])
+
+    def test_catalog_is_compressed(self, catalog_blob):
+        """
+        Verify the catalog is stored with the client's codec.
+        """
+        # Record an entry
+        BlobCatalog(codec="gzip").record([CatalogEntry(kind="round", id="1", date="2025-05-01", blob_name="a.json")])
+
+        # Verify the stored encoding
+        assert catalog_blob.content_encoding == "gzip"
+        assert catalog_blob.data[:2] == b"\x1f\x8b"
+
+    def test_round_entry(self):
+        """
+        Verify scorecard blob names are parsed from the right so course names may contain underscores.
+        """
+        # Call the function under test
+        entry = BlobCatalog.round_entry("scorecards/braid_hills_2025-06-01_12345.json")
+
+        # Verify the parsed entry
+        assert entry == CatalogEntry(kind="round", id="12345", date="2025-06-01",
+                                     blob_name="scorecards/braid_hills_2025-06-01_12345.json", course="braid_hills")
+        assert BlobCatalog.round_entry("scorecards/readme.txt") is None
+
+    def test_session_entry(self):
+        """
+        Verify session records take their date from the blob name and their clubs from the report.
+        """
+        # Define a session report
+        report = {"StrokeGroups": [
+            {"Date": "2025-06-02T10:00:00", "Club": "Driver"},
+            {"Date": "2025-06-02T10:00:00", "Club": "7Iron"}
+        ]}
+
+        # Call the function under test
+        entry = BlobCatalog.session_entry("trackman_session_summary/2025-06-02T10:00:00-session-abc.json", report)
+
+        # Verify the parsed entry
+        assert entry.id == "abc"
+        assert entry.date == "2025-06-02T10:00:00"
+        assert entry.clubs == ["7Iron", "Driver"]
+
+    def test_session_entry_without_stroke_groups(self):
+        """
+        Verify a session without stroke groups is recorded with no clubs, dated from its blob name.
+        """
+        # Call the function under test
+        entry = BlobCatalog.session_entry("trackman_session_summary/2025-06-03T09:30:00-session-def.json",
+                                          {"StrokeGroups": []})
+
+        # Verify the parsed entry
+        assert entry.id == "def"
+        assert entry.date == "2025-06-03T09:30:00"
+        assert entry.clubs == []
+
+    def test_stored_document_shape(self, catalog_blob):
+        """
+        Verify entries are stored keyed by kind and id.
+        """
+        # Record an entry with the identity codec so the document is readable
+        BlobCatalog(codec="identity").record([CatalogEntry(kind="round", id="1", date="2025-05-01",
+                                                           blob_name="a.json")])
+
+        # Verify the document
+        assert list(json.loads(catalog_blob.data)["entries"]) == ["round/1"]
@@ -1,9 +1,11 @@
 # Import dependencies
+from shared import BlobClient, BlobServiceRegistry, BlobListingCache
 from azure.core.exceptions import ResourceNotFoundError
 from unittest.mock import patch, MagicMock
-from shared import BlobClient
 import streamlit as st
+import hashlib
 import pytest
+import gzip
 import json
 
 @pytest.fixture(autouse=True)
@@ -26,6 +28,21 @@ def mock_streamlit_secrets(monkeypatch):
     monkeypatch.setattr(st, "secrets", fake_secrets)
 
 
+@pytest.fixture(autouse=True)
+def reset_blob_service_registry():
+    """
+    Clear pooled clients and cached listings between tests.
+
+    Ensures each test builds its clients from
+    its own patched BlobServiceClient.
+    """
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+    yield
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+
+
 @pytest.fixture
 def blob_client():
     """
@@ -44,7 +61,7 @@ class TestBlobClient:
     reading data back from blob storage.
     """
 
-    @patch("shared.functions.blob_client.BlobServiceClient")
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
     def test_list_blob_filenames_no_prefix(self, mock_blob_service_client, blob_client):
         """
         Verify blob listing without a prefix.
@@ -77,7 +94,7 @@ class TestBlobClient:
         # Ensure list_blobs was called with the correct prefix
         mock_container_client.list_blobs.assert_called_once_with(name_starts_with="")
 
-    @patch("shared.functions.blob_client.BlobServiceClient")
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
     def test_list_blob_filenames_with_prefix(self, mock_blob_service_client, blob_client):
         """
         Verify blob listing with a prefix.
@@ -110,7 +127,7 @@ class TestBlobClient:
         # Ensure list_blobs was called with correct prefix
         mock_container_client.list_blobs.assert_called_once_with(name_starts_with="folder/")
 
-    @patch("shared.functions.blob_client.BlobServiceClient")
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
     def test_export_dict_to_blob(self, mock_blob_service_client, blob_client):
         """
         Verify exporting valid data to blob storage.
@@ -128,10 +145,62 @@ class TestBlobClient:
         # Call the function under test
         blob_client.export_dict_to_blob(data, container="test-container", output_filename="output.json")
 
-        # Verify that upload_blob was called with correct JSON
-        mock_blob_client.upload_blob.assert_called_once_with(json.dumps(data), overwrite=True)
+        # Verify that upload_blob was called with gzip encoded JSON and matching content settings
+        args, kwargs = mock_blob_client.upload_blob.call_args
+        assert gzip.decompress(args[0]) == json.dumps(data).encode()
+        assert kwargs["overwrite"] is True
+        assert kwargs["content_settings"].content_encoding == "gzip"
+
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
+    def test_export_dict_to_blob_records_content_hash(self, mock_blob_service_client, blob_client):
+        """
+        Verify uploads record the hash of the serialized payload in blob metadata.
+
+        Ensures the hash is taken before encoding, so it
+        does not depend on the codec in use.
+        """
+        # Mock a blob that does not exist yet
+        mock_blob_client = MagicMock()
+        mock_blob_client.get_blob_properties.side_effect = ResourceNotFoundError("The specified blob does not exist.")
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = mock_blob_client
+
+        # Call the function under test
+        uploaded = blob_client.export_dict_to_blob([{"key": "value"}], container="c", output_filename="a.json")
+
+        # Verify the upload carries the payload hash
+        assert uploaded is True
+        _, kwargs = mock_blob_client.upload_blob.call_args
+        assert kwargs["metadata"] == {"content_sha256": hashlib.sha256(b'[{"key": "value"}]').hexdigest()}
+
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
+    def test_export_dict_to_blob_skips_unchanged(self, mock_blob_service_client, blob_client):
+        """
+        Verify a payload identical to the stored one is not uploaded again.
+
+        Ensures the stored blob and its cached listings
+        are left untouched and the skip is reported.
+        """
+        # Mock a blob already holding the same content
+        mock_blob_client = MagicMock()
+        mock_blob_client.get_blob_properties.return_value.metadata = {
+            "content_sha256": hashlib.sha256(b'[{"key": "value"}]').hexdigest()
+        }
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = mock_blob_client
+
+        # Call the function under test
+        with patch.object(BlobListingCache, "invalidate") as invalidate:
+            uploaded = blob_client.export_dict_to_blob([{"key": "value"}], container="c", output_filename="a.json")
+
+        # Verify nothing was uploaded or invalidated
+        assert uploaded is False
+        mock_blob_client.upload_blob.assert_not_called()
+        invalidate.assert_not_called()
+
+        # Verify changed content is still uploaded
+        assert blob_client.export_dict_to_blob([{"key": "other"}], container="c", output_filename="a.json") is True
+        mock_blob_client.upload_blob.assert_called_once()
 
-    @patch("shared.functions.blob_client.BlobServiceClient")
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
     def test_export_dict_to_blob_invalid_data(self, mock_blob_service_client, blob_client):
         """
         Verify error handling for invalid export data.
@@ -150,7 +219,7 @@ class TestBlobClient:
         with pytest.raises(TypeError):
             blob_client.export_dict_to_blob(data, container="test-container", output_filename="output.json")
 
-    @patch("shared.functions.blob_client.BlobServiceClient")
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
     def test_read_blob_to_dict_valid_json(self, mock_blob_service_client, blob_client):
         """
         Verify reading and parsing valid JSON data.
@@ -161,6 +230,7 @@ class TestBlobClient:
         # Mock the blob client to return JSON bytes
         mock_blob_client = MagicMock()
         mock_blob_client.download_blob.return_value.readall.return_value = b'[{"key": "value"}]'
+        mock_blob_client.download_blob.return_value.properties.content_settings.content_encoding = None
         mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = mock_blob_client
 
         # Call the function under test
@@ -169,7 +239,7 @@ class TestBlobClient:
         # Verify JSON is parsed correctly
         assert result == [{"key": "value"}]
 
-    @patch("shared.functions.blob_client.BlobServiceClient")
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
     def test_read_blob_to_dict_invalid_json(self, mock_blob_service_client, blob_client):
         """
         Verify error handling for invalid JSON.
@@ -180,13 +250,14 @@ class TestBlobClient:
         # Mock the blob client to return invalid JSON
         mock_blob_client = MagicMock()
         mock_blob_client.download_blob.return_value.readall.return_value = b'invalid json'
+        mock_blob_client.download_blob.return_value.properties.content_settings.content_encoding = None
         mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = mock_blob_client
 
         # Expect a JSONDecodeError when parsing invalid data
         with pytest.raises(json.JSONDecodeError):
             blob_client.read_blob_to_dict(container="test-container", input_filename="input.json")
 
-    @patch("shared.functions.blob_client.BlobServiceClient")
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
     def test_read_blob_to_dict_blob_not_found(self, mock_blob_service_client, blob_client):
         """
         Verify error handling for missing blobs.
@@ -202,3 +273,139 @@ class TestBlobClient:
         # Expect ResourceNotFoundError when blob is missing
         with pytest.raises(ResourceNotFoundError):
             blob_client.read_blob_to_dict(container="test-container", input_filename="missing.json")
+
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
+    def test_read_blob_to_dict_detects_codec(self, mock_blob_service_client, blob_client):
+        """
+        Verify compressed blobs are decoded on read.
+
+        Ensures the codec is taken from the Content-Encoding
+        and, when that is missing, from the payload itself.
+        """
+        # Return the same gzip payload with and without metadata
+        mock_blob_client = MagicMock()
+        mock_blob_client.download_blob.return_value.readall.return_value = gzip.compress(b'{"key": "value"}')
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = mock_blob_client
+        content_settings = mock_blob_client.download_blob.return_value.properties.content_settings
+
+        # Call the function under test with and without a recorded Content-Encoding
+        content_settings.content_encoding = "gzip"
+        recorded = blob_client.read_blob_to_dict(container="test-container", input_filename="input.json")
+        content_settings.content_encoding = None
+        sniffed = blob_client.read_blob_to_dict(container="test-container", input_filename="input.json")
+
+        # Verify both are decoded and the SDK was asked not to decompress
+        assert recorded == sniffed == {"key": "value"}
+        mock_blob_client.download_blob.assert_called_with(decompress=False)
+
+    def test_read_blobs_to_dicts_preserves_order(self, blob_client):
+        """
+        Verify bulk reads yield results in request order.
+
+        Ensures every blob is read once and the
+        results line up with the requested names.
+        """
+        # Return the filename back as the payload
+        blob_client.read_blob_to_dict = MagicMock(side_effect=lambda container, input_filename: {"f": input_filename})
+
+        # Call the function under test
+        names = [f"scorecards/round_{i}.json" for i in range(20)]
+        results = list(blob_client.read_blobs_to_dicts(container="test-container", input_filenames=names))
+
+        # Verify results come back in request order
+        assert [result.name for result in results] == names
+        assert [result.data["f"] for result in results] == names
+        assert blob_client.read_blob_to_dict.call_count == 20
+
+    def test_read_blobs_to_dicts_reports_errors_per_blob(self, blob_client):
+        """
+        Verify a failing blob does not abort the batch.
+
+        Ensures the failure is captured on its own
+        result while other blobs are still returned.
+        """
+        # Fail only the second blob
+        def fake_read(container, input_filename):
+            if input_filename == "missing.json":
+                raise ResourceNotFoundError("Blob not found")
+            return [{"key": input_filename}]
+        blob_client.read_blob_to_dict = MagicMock(side_effect=fake_read)
+
+        # Call the function under test in completion order
+        results = {
+            result.name: result for result in blob_client.read_blobs_to_dicts(
+                container="test-container",
+                input_filenames=["a.json", "missing.json", "b.json"],
+                ordered=False
+            )
+        }
+
+        # Verify successes and the isolated failure
+        assert results["a.json"].ok and results["a.json"].data == [{"key": "a.json"}]
+        assert results["b.json"].ok
+        assert not results["missing.json"].ok
+        assert isinstance(results["missing.json"].error, ResourceNotFoundError)
+
+    def test_export_dicts_to_blobs_uploads_every_payload(self, blob_client):
+        """
+        Verify batched uploads write every payload.
+
+        Ensures each blob goes through export_dict_to_blob
+        and the report lists every written blob.
+        """
+        # Patch the single upload so nothing is written
+        blob_client.export_dict_to_blob = MagicMock()
+
+        # Call the function under test
+        payloads = {f"hole_summary/hole_{i}.json": [{"hole": i}] for i in range(1, 19)}
+        report = blob_client.export_dicts_to_blobs(payloads=payloads, container="test-container", max_workers=4)
+
+        # Verify every payload was uploaded
+        assert report.ok
+        assert sorted(report.succeeded) == sorted(payloads)
+        blob_client.export_dict_to_blob.assert_any_call(
+            data=[{"hole": 1}], container="test-container", output_filename="hole_summary/hole_1.json")
+        assert blob_client.export_dict_to_blob.call_count == 18
+
+    def test_export_dicts_to_blobs_reports_failures(self, blob_client):
+        """
+        Verify one failed upload does not stop the batch.
+
+        Ensures the failure is collected in the report
+        while remaining payloads are still uploaded.
+        """
+        # Fail a single upload
+        def fake_export(data, container, output_filename):
+            if output_filename == "bad.json":
+                raise TypeError("not serializable")
+        blob_client.export_dict_to_blob = MagicMock(side_effect=fake_export)
+
+        # Call the function under test
+        report = blob_client.export_dicts_to_blobs(
+            payloads={"good.json": [1], "bad.json": [2], "other.json": [3]}, container="test-container")
+
+        # Verify the aggregated report
+        assert not report.ok
+        assert sorted(report.succeeded) == ["good.json", "other.json"]
+        assert isinstance(report.failed["bad.json"], TypeError)
+        assert "2 written, 1 failed" in str(report)
+
+    def test_export_dicts_to_blobs_reports_unchanged(self, blob_client):
+        """
+        Verify batched uploads report which payloads were unchanged.
+
+        Ensures skipped uploads still count as succeeded
+        and are summarised in the report.
+        """
+        # Skip every upload but one
+        blob_client.export_dict_to_blob = MagicMock(
+            side_effect=lambda data, container, output_filename: output_filename == "changed.json")
+
+        # Call the function under test
+        report = blob_client.export_dicts_to_blobs(
+            payloads={"changed.json": [1], "same.json": [2], "other.json": [3]}, container="test-container")
+
+        # Verify the unchanged payloads are reported
+        assert report.ok
+        assert sorted(report.skipped) == ["other.json", "same.json"]
+        assert "3 written (2 unchanged), 0 failed" in str(report)
@@ -0,0 +1,124 @@
+# Import dependencies
+from shared import BlobCodecs, BlobClient, BlobServiceRegistry, BlobListingCache
+from unittest.mock import patch, MagicMock
+from azure.core import MatchConditions
+import pytest
+import gzip
+
+@pytest.fixture(autouse=True)
+def reset_blob_service_registry():
+    """
+    Clear pooled clients and cached listings between tests.
+
+    Ensures each test builds its clients from
+    its own patched BlobServiceClient.
+    """
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+    yield
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+
+class TestBlobCodecs:
+    """
+    Test suite for the BlobCodecs registry.
+
+    Covers round trips for every available codec, detection
+    from metadata and magic bytes, and unknown codecs.
+    """
+
+    @pytest.mark.parametrize("name", BlobCodecs.available())
+    def test_round_trip(self, name):
+        """
+        Verify every available codec decodes what it encodes.
+        """
+        # Encode and decode a JSON payload
+        codec = BlobCodecs.get(name)
+        payload = b'[{"Club": "7Iron", "Carry": 150.5}]' * 100
+
+        # Verify the payload survives the round trip
+        assert codec.decode(codec.encode(payload)) == payload
+
+    @pytest.mark.parametrize("name", BlobCodecs.available())
+    def test_stream_round_trip(self, name):
+        """
+        Verify every available codec decodes a payload split into small chunks.
+        """
+        # Encode a payload and split it into chunks
+        encoded = BlobCodecs.get(name).encode(b'[{"Club": "7Iron", "Carry": 150.5}]' * 100)
+        chunks = [encoded[i:i + 7] for i in range(0, len(encoded), 7)]
+
+        # Verify the chunks decode with and without recorded metadata
+        assert b"".join(BlobCodecs.decode_stream(chunks, name)) == b'[{"Club": "7Iron", "Carry": 150.5}]' * 100
+        assert b"".join(BlobCodecs.decode_stream(chunks)) == b'[{"Club": "7Iron", "Carry": 150.5}]' * 100
+
+    def test_detect_from_metadata_and_magic(self):
+        """
+        Verify codecs are resolved from Content-Encoding, then from magic bytes.
+        """
+        # Encode a payload with gzip
+        encoded = gzip.compress(b"[]")
+
+        # Verify recorded encodings win and unrecorded payloads are sniffed
+        assert BlobCodecs.detect(encoded, "gzip").name == "gzip"
+        assert BlobCodecs.detect(encoded).name == "gzip"
+        assert BlobCodecs.detect(b"[]").name == "identity"
+
+    def test_unknown_codec(self):
+        """
+        Verify unknown codecs raise a ValueError.
+        """
+        with pytest.raises(ValueError):
+            BlobCodecs.get("brotli")
+
+class TestBlobClientRecompress:
+    """
+    Test suite for re-encoding existing blobs.
+
+    Covers conditional rewrites of legacy blobs and
+    skipping blobs already using the target codec.
+    """
+
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
+    def test_recompress_legacy_blob(self, mock_blob_service_client):
+        """
+        Verify an uncompressed blob is rewritten with gzip, conditional on its ETag and keeping its metadata.
+        """
+        # Return a legacy uncompressed blob
+        mock_blob_client = MagicMock()
+        download_stream = mock_blob_client.download_blob.return_value
+        download_stream.readall.return_value = b'[{"key": "value"}]' * 50
+        download_stream.properties.content_settings.content_encoding = None
+        download_stream.properties.etag = "0x1"
+        download_stream.properties.metadata = {"content_sha256": "abc"}
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = mock_blob_client
+
+        # Call the function under test
+        before, after = BlobClient(codec="gzip").recompress_blob("golf", "legacy.json")
+
+        # Verify the conditional rewrite and the reported sizes
+        args, kwargs = mock_blob_client.upload_blob.call_args
+        assert gzip.decompress(args[0]) == b'[{"key": "value"}]' * 50
+        assert kwargs["content_settings"].content_encoding == "gzip"
+        assert kwargs["etag"] == "0x1"
+        assert kwargs["match_condition"] == MatchConditions.IfNotModified
+        assert kwargs["metadata"] == {"content_sha256": "abc"}
+        assert (before, after) == (len(b'[{"key": "value"}]' * 50), len(args[0]))
+
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
+    def test_recompress_skips_current_codec(self, mock_blob_service_client):
+        """
+        Verify blobs already written with the target codec are left alone.
+        """
+        # Return a blob already stored with gzip
+        mock_blob_client = MagicMock()
+        download_stream = mock_blob_client.download_blob.return_value
+        download_stream.readall.return_value = gzip.compress(b"[]")
+        download_stream.properties.content_settings.content_encoding = "gzip"
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = mock_blob_client
+
+        # Call the function under test
+        BlobClient(codec="gzip").recompress_blob("golf", "current.json")
+
+        # Verify nothing was uploaded
+        mock_blob_client.upload_blob.assert_not_called()
@@ -0,0 +1,241 @@
+# Import dependencies
+from shared import BlobDiskCache, BlobClient, BlobServiceRegistry, BlobListingCache, BlobRequestPolicy
+from azure.core.exceptions import HttpResponseError
+from unittest.mock import patch, MagicMock
+from azure.core import MatchConditions
+import pytest
+import json
+
+@pytest.fixture(autouse=True)
+def reset_blob_service_registry():
+    """
+    Clear pooled clients and cached listings between tests.
+
+    Ensures each test builds its clients from
+    its own patched BlobServiceClient.
+    """
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+    yield
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+
+def make_download_stream(payload: bytes, etag: str) -> MagicMock:
+    """
+    Build a fake download stream returning the given payload and ETag.
+
+    Args:
+        payload (bytes): Bytes returned by readall.
+        etag (str): ETag reported on the stream properties.
+
+    Returns:
+        MagicMock: Fake download stream.
+    """
+    download_stream = MagicMock()
+    download_stream.readall.return_value = payload
+    download_stream.properties.etag = etag
+    download_stream.properties.content_settings.content_encoding = None
+    download_stream.properties.content_settings.content_type = "application/json"
+    return download_stream
+
+def make_not_modified() -> HttpResponseError:
+    """
+    Build the error raised by the SDK when a conditional GET returns 304.
+
+    Returns:
+        HttpResponseError: Error carrying a 304 status code.
+    """
+    response = MagicMock()
+    response.status_code = 304
+    return HttpResponseError(message="Not Modified", response=response)
+
+class TestBlobDiskCache:
+    """
+    Test suite for BlobDiskCache.
+
+    Covers storage and lookup, LRU eviction, invalidation,
+    persistence across instances and hit/miss statistics.
+    """
+
+    def test_put_and_get(self, tmp_path):
+        """
+        Verify stored payloads are returned with their ETag.
+        """
+        # Store a payload
+        cache = BlobDiskCache(directory=str(tmp_path))
+        cache.put("golf", "a.json", etag="0x1", data=b"[1]")
+
+        # Verify lookup returns the payload and misses return None
+        entry = cache.get("golf", "a.json")
+        assert entry.etag == "0x1"
+        assert entry.data == b"[1]"
+        assert cache.get("golf", "b.json") is None
+
+    def test_lru_eviction(self, tmp_path):
+        """
+        Verify least recently used entries are evicted to respect the size bound.
+        """
+        # Fill a cache that fits two payloads
+        cache = BlobDiskCache(directory=str(tmp_path), max_bytes=20)
+        cache.put("golf", "a.json", etag="0x1", data=b"a" * 10)
+        cache.put("golf", "b.json", etag="0x1", data=b"b" * 10)
+
+        # Touch the oldest entry, then overflow the cache
+        cache.record_hit("golf", "a.json", revalidated=False)
+        cache.put("golf", "c.json", etag="0x1", data=b"c" * 10)
+
+        # Verify the least recently used entry was evicted
+        assert cache.get("golf", "a.json") is not None
+        assert cache.get("golf", "b.json") is None
+        assert cache.get("golf", "c.json") is not None
+        assert cache.stats.evictions == 1
+
+    def test_index_persists_across_instances(self, tmp_path):
+        """
+        Verify a new process can reuse entries written by a previous one.
+        """
+        # Store with one instance and reopen the directory
+        BlobDiskCache(directory=str(tmp_path)).put("golf", "a.json", etag="0x1", data=b"[1]")
+        reopened = BlobDiskCache(directory=str(tmp_path))
+
+        # Verify the entry survived
+        assert reopened.get("golf", "a.json").data == b"[1]"
+
+    def test_invalidate(self, tmp_path):
+        """
+        Verify invalidated blobs are no longer served.
+        """
+        # Store and invalidate a payload
+        cache = BlobDiskCache(directory=str(tmp_path))
+        cache.put("golf", "a.json", etag="0x1", data=b"[1]")
+        cache.invalidate("golf", "a.json")
+
+        # Verify the entry is gone
+        assert cache.get("golf", "a.json") is None
+
+    def test_freshness_window(self, tmp_path):
+        """
+        Verify entries are only fresh within max_age.
+        """
+        # Store a payload in caches with and without a freshness window
+        fresh_cache = BlobDiskCache(directory=str(tmp_path / "fresh"), max_age=60)
+        fresh_cache.put("golf", "a.json", etag="0x1", data=b"[1]")
+        strict_cache = BlobDiskCache(directory=str(tmp_path / "strict"))
+        strict_cache.put("golf", "a.json", etag="0x1", data=b"[1]")
+
+        # Verify only the windowed cache skips revalidation
+        assert fresh_cache.is_fresh(fresh_cache.get("golf", "a.json"))
+        assert not strict_cache.is_fresh(strict_cache.get("golf", "a.json"))
+
+class TestBlobClientDiskCache:
+    """
+    Test suite for BlobClient reads through a BlobDiskCache.
+
+    Covers conditional revalidation, changed blobs,
+    fresh entries and invalidation on write.
+    """
+
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
+    def test_unchanged_blob_is_revalidated(self, mock_blob_service_client, tmp_path):
+        """
+        Verify a 304 response serves the cached payload.
+        """
+        # First read downloads, second read is answered with 304
+        blob_client = MagicMock()
+        blob_client.download_blob.side_effect = [
+            make_download_stream(json.dumps({"a": 1}).encode(), etag="0x1"),
+            make_not_modified()
+        ]
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = blob_client
+        client = BlobClient(cache=BlobDiskCache(directory=str(tmp_path)))
+
+        # Call the function under test twice
+        first = client.read_blob_to_dict("golf", "a.json")
+        second = client.read_blob_to_dict("golf", "a.json")
+
+        # Verify the second read was conditional and served from cache
+        assert first == second == {"a": 1}
+        blob_client.download_blob.assert_called_with(
+            decompress=False, etag="0x1", match_condition=MatchConditions.IfModified)
+        assert client.cache.stats.hits == 1
+        assert client.cache.stats.revalidations == 1
+        assert client.cache.stats.misses == 1
+
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
+    def test_changed_blob_is_downloaded(self, mock_blob_service_client, tmp_path):
+        """
+        Verify a changed blob replaces the cached version.
+        """
+        # Each read returns a new version
+        blob_client = MagicMock()
+        blob_client.download_blob.side_effect = [
+            make_download_stream(b"[1]", etag="0x1"),
+            make_download_stream(b"[2]", etag="0x2")
+        ]
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = blob_client
+        client = BlobClient(cache=BlobDiskCache(directory=str(tmp_path)))
+
+        # Call the function under test twice
+        client.read_blob_to_dict("golf", "a.json")
+        result = client.read_blob_to_dict("golf", "a.json")
+
+        # Verify the new version was returned and cached
+        assert result == [2]
+        assert client.cache.get("golf", "a.json").etag == "0x2"
+        assert client.cache.stats.misses == 2
+
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
+    def test_fresh_entry_skips_request(self, mock_blob_service_client, tmp_path):
+        """
+        Verify entries within max_age are served without contacting Azure.
+        """
+        # Only one download is available
+        blob_client = MagicMock()
+        blob_client.download_blob.side_effect = [make_download_stream(b"[1]", etag="0x1")]
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = blob_client
+        client = BlobClient(cache=BlobDiskCache(directory=str(tmp_path), max_age=60))
+
+        # Call the function under test twice
+        client.read_blob_to_dict("golf", "a.json")
+        result = client.read_blob_to_dict("golf", "a.json")
+
+        # Verify only one request was made
+        assert result == [1]
+        assert blob_client.download_blob.call_count == 1
+
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
+    def test_other_errors_propagate(self, mock_blob_service_client, tmp_path):
+        """
+        Verify non-304 errors during revalidation are raised.
+        """
+        # Download once, then fail with a server error
+        response = MagicMock()
+        response.status_code = 500
+        blob_client = MagicMock()
+        blob_client.download_blob.side_effect = [
+            make_download_stream(b"[1]", etag="0x1"),
+            HttpResponseError(message="Server Error", response=response)
+        ]
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = blob_client
+        client = BlobClient(cache=BlobDiskCache(directory=str(tmp_path)), policy=BlobRequestPolicy(retries=0))
+
+        # Verify the second read raises once retries are exhausted
+        client.read_blob_to_dict("golf", "a.json")
+        with pytest.raises(HttpResponseError):
+            client.read_blob_to_dict("golf", "a.json")
+
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
+    def test_write_invalidates_cache(self, mock_blob_service_client, tmp_path):
+        """
+        Verify exporting a blob drops its cached copy.
+        """
+        # Seed the cache with an old version
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = MagicMock()
+        client = BlobClient(cache=BlobDiskCache(directory=str(tmp_path)))
+        client.cache.put("golf", "a.json", etag="0x1", data=b"[1]")
+
+        # Call the function under test
+        client.export_dict_to_blob([2], "golf", "a.json")
+
+        # Verify the stale entry was removed
+        assert client.cache.get("golf", "a.json") is None
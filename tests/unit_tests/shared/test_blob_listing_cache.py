@@ -0,0 +1,124 @@
+# Import dependencies
+from shared import BlobClient, BlobServiceRegistry, BlobListingCache, BlobEntry
+from unittest.mock import patch, MagicMock
+from datetime import datetime, timezone
+import pytest
+
+@pytest.fixture(autouse=True)
+def reset_blob_service_registry():
+    """
+    Clear pooled clients and cached listings between tests.
+
+    Ensures each test builds its clients from
+    its own patched BlobServiceClient.
+    """
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+    yield
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+
+def make_blob(name: str) -> MagicMock:
+    """
+    Build a fake listed blob with properties.
+
+    Args:
+        name (str): Blob name.
+
+    Returns:
+        MagicMock: Fake BlobProperties.
+    """
+    blob = MagicMock()
+    blob.name = name
+    blob.size = 42
+    blob.etag = f"etag-{name}"
+    blob.last_modified = datetime(2025, 6, 1, tzinfo=timezone.utc)
+    blob.content_settings.content_encoding = "gzip"
+    return blob
+
+@pytest.fixture
+def container_client():
+    """
+    Patch the Azure SDK so listings return three fake blobs.
+    """
+    blobs = [make_blob("sessions/a.json"), make_blob("sessions/b.json"), make_blob("scorecards/c.json")]
+    container_client = MagicMock()
+    container_client.list_blobs.side_effect = \
+        lambda name_starts_with: [blob for blob in blobs if blob.name.startswith(name_starts_with)]
+
+    with patch("shared.functions.blob_service_registry.BlobServiceClient") as mock_blob_service_client:
+        mock_blob_service_client.from_connection_string.return_value.get_container_client.return_value = \
+            container_client
+        yield container_client
+
+class TestBlobListingCache:
+    """
+    Test suite for typed listings and the prefix listing cache.
+
+    Covers typed entries, reuse of cached listings,
+    serving sub-prefixes and invalidation on write.
+    """
+
+    def test_list_blob_entries_typed(self, container_client):
+        """
+        Verify listings carry size, ETag, last-modified and encoding.
+        """
+        # Call the function under test
+        entries = BlobClient().list_blob_entries(container_name="golf", directory_path="sessions/")
+
+        # Verify the typed records
+        assert entries[0] == BlobEntry(
+            name="sessions/a.json",
+            size=42,
+            etag="etag-sessions/a.json",
+            last_modified=datetime(2025, 6, 1, tzinfo=timezone.utc),
+            content_encoding="gzip"
+        )
+        assert entries[0].filename == "a.json"
+
+    def test_listing_reused_within_ttl(self, container_client):
+        """
+        Verify repeated and narrower listings are served from the cache.
+        """
+        # List a broad prefix, then the same and a narrower prefix from new clients
+        BlobClient().list_blob_filenames(container_name="golf", directory_path="")
+        again = BlobClient().list_blob_filenames(container_name="golf", directory_path="")
+        narrower = BlobClient().list_blob_filenames(container_name="golf", directory_path="sessions/")
+
+        # Verify only one request was made
+        assert container_client.list_blobs.call_count == 1
+        assert again == ["sessions/a.json", "sessions/b.json", "scorecards/c.json"]
+        assert narrower == ["sessions/a.json", "sessions/b.json"]
+
+    def test_listing_expires(self, container_client):
+        """
+        Verify a zero TTL always lists from Azure.
+        """
+        # Disable listing reuse
+        client = BlobClient()
+        client.vars.blob_listing_ttl = 0
+
+        # List twice
+        client.list_blob_filenames(container_name="golf", directory_path="sessions/")
+        client.list_blob_filenames(container_name="golf", directory_path="sessions/")
+
+        # Verify both listings hit Azure
+        assert container_client.list_blobs.call_count == 2
+
+    def test_write_invalidates_covering_listings(self, container_client):
+        """
+        Verify a write drops listings whose prefix covers the blob, and only those.
+        """
+        # Cache two unrelated prefixes
+        client = BlobClient()
+        client.list_blob_filenames(container_name="golf", directory_path="sessions/")
+        client.list_blob_filenames(container_name="golf", directory_path="scorecards/")
+
+        # Write a new session
+        client.export_dict_to_blob(data=[], container="golf", output_filename="sessions/new.json")
+
+        # Verify only the sessions listing is fetched again
+        client.list_blob_filenames(container_name="golf", directory_path="sessions/")
+        client.list_blob_filenames(container_name="golf", directory_path="scorecards/")
+        assert [call.kwargs["name_starts_with"] for call in container_client.list_blobs.call_args_list] == \
+            ["sessions/", "scorecards/", "sessions/"]
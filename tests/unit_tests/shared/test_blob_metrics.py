@@ -0,0 +1,137 @@
+# Import dependencies
+from shared import BlobClient, BlobMetrics, BlobOperationStats, BlobServiceRegistry, BlobListingCache
+from azure.core.exceptions import ResourceNotFoundError
+from unittest.mock import patch, MagicMock
+import pytest
+
+@pytest.fixture(autouse=True)
+def reset_blob_service_registry():
+    """
+    Clear pooled clients, cached listings and recorded metrics between tests.
+
+    Ensures each test builds its clients from
+    its own patched BlobServiceClient.
+    """
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+    BlobMetrics.reset()
+    yield
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+    BlobMetrics.reset()
+
+class TestBlobOperationStats:
+    """
+    Test suite for BlobOperationStats.
+
+    Covers histogram bucketing, percentile estimates and merging.
+    """
+
+    def test_histogram_and_percentiles(self):
+        """
+        Verify latencies land in the right buckets and percentiles read from them.
+        """
+        # Record nine fast calls and one slow one
+        stats = BlobOperationStats(operation="read", container="golf", prefix="scorecards", caller="BlobClient")
+        for _ in range(9):
+            stats.add(seconds=0.004, nbytes=10)
+        stats.add(seconds=0.3, nbytes=10, error=True)
+
+        # Verify counters and estimates
+        report = stats.to_dict()
+        assert (report["calls"], report["errors"], report["bytes"]) == (10, 1, 100)
+        assert report["histogram"]["<=5ms"] == 9
+        assert report["histogram"]["<=500ms"] == 1
+        assert report["p50_ms"] == 5.0
+        assert report["p95_ms"] == 500.0
+        assert report["max_ms"] == 300.0
+
+    def test_merge(self):
+        """
+        Verify merged counters add up and keep the slowest call.
+        """
+        first = BlobOperationStats(operation="read", container="golf", prefix="a", caller="A")
+        second = BlobOperationStats(operation="write", container="golf", prefix="b", caller="A")
+        first.add(seconds=0.001, nbytes=5)
+        second.add(seconds=2.0, nbytes=7)
+
+        # Call the function under test
+        first.merge(second)
+
+        # Verify the merged counters
+        assert (first.calls, first.bytes, first.max_seconds) == (2, 12, 2.0)
+        assert sum(first.buckets) == 2
+
+class TestBlobMetrics:
+    """
+    Test suite for BlobMetrics.
+
+    Covers tagging, error counting, per-caller totals
+    and instrumentation of BlobClient calls.
+    """
+
+    def test_timed_tags_and_errors(self):
+        """
+        Verify timed blocks are tagged by prefix and caller, and failures are counted and re-raised.
+        """
+        # Record a successful and a failed read
+        with BlobMetrics.timed("read", "golf", "scorecards/a.json", caller="ScorecardParser") as sample:
+            sample["bytes"] = 42
+        with pytest.raises(ResourceNotFoundError):
+            with BlobMetrics.timed("read", "golf", "scorecards/b.json", caller="ScorecardParser"):
+                raise ResourceNotFoundError("missing")
+
+        # Verify both calls share one entry
+        [stats] = BlobMetrics.snapshot()
+        assert (stats.operation, stats.prefix, stats.caller) == ("read", "scorecards", "ScorecardParser")
+        assert (stats.calls, stats.errors, stats.bytes) == (2, 1, 42)
+
+    def test_report_totals_by_caller(self):
+        """
+        Verify the report ranks callers by time spent and lists every operation.
+        """
+        BlobMetrics.record("read", "golf", "scorecards/a.json", caller="Fast", seconds=0.01)
+        BlobMetrics.record("write", "golf", "catalog/ingest_catalog.json", caller="Slow", seconds=0.5)
+        BlobMetrics.record("read", "golf", "catalog/ingest_catalog.json", caller="Slow", seconds=0.2)
+
+        # Call the function under test
+        report = BlobMetrics.report(pipeline="hole19")
+
+        # Verify totals and operations
+        assert report["pipeline"] == "hole19"
+        assert [(total["caller"], total["calls"]) for total in report["totals"]] == [("Slow", 2), ("Fast", 1)]
+        assert len(report["operations"]) == 3
+        assert report["operations"][0]["operation"] == "write"
+
+    def test_blob_client_is_instrumented(self):
+        """
+        Verify BlobClient reads, writes and listings are recorded under the client's class name.
+        """
+        # Patch the Azure SDK with a blob holding a small JSON document
+        download_stream = MagicMock()
+        download_stream.readall.return_value = b'{"a": 1}'
+        download_stream.properties.content_settings.content_encoding = None
+        download_stream.properties.content_settings.content_type = "application/json"
+        blob = MagicMock()
+        blob.download_blob.return_value = download_stream
+        listed = MagicMock()
+        listed.name = "scorecards/a.json"
+
+        with patch("shared.functions.blob_service_registry.BlobServiceClient") as mock_blob_service_client:
+            service = mock_blob_service_client.from_connection_string.return_value
+            service.get_blob_client.return_value = blob
+            service.get_container_client.return_value.list_blobs.return_value = [listed]
+
+            # Call the functions under test
+            client = BlobClient()
+            client.list_blob_filenames(container_name="golf", directory_path="scorecards/")
+            client.read_blob_to_dict(container="golf", input_filename="scorecards/a.json")
+            client.export_dict_to_blob(data={"a": 1}, container="golf", output_filename="scorecards/a.json")
+
+        # Verify every call was recorded with its bytes
+        stats = {stats.operation: stats for stats in BlobMetrics.snapshot()}
+        assert sorted(stats) == ["list", "read", "write"]
+        assert {entry.caller for entry in stats.values()} == {"BlobClient"}
+        assert {entry.prefix for entry in stats.values()} == {"scorecards"}
+        assert stats["read"].bytes == len(b'{"a": 1}')
+        assert stats["write"].bytes == len(blob.upload_blob.call_args[0][0])
@@ -0,0 +1,193 @@
+# Import dependencies
+from shared import BlobClient, BlobMetrics, BlobRequestPolicy, BlobServiceRegistry, BlobListingCache
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError, ServiceResponseError
+from unittest.mock import patch, MagicMock
+import threading
+import pytest
+import time
+
+@pytest.fixture(autouse=True)
+def reset_blob_service_registry():
+    """
+    Clear pooled clients, cached listings, metrics and recorded latencies between tests.
+
+    Ensures each test builds its clients from
+    its own patched BlobServiceClient.
+    """
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+    BlobMetrics.reset()
+    BlobRequestPolicy.reset()
+    yield
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+    BlobMetrics.reset()
+    BlobRequestPolicy.reset()
+
+def server_error(status_code: int) -> HttpResponseError:
+    """
+    Build the error raised by the SDK for an HTTP error status.
+
+    Args:
+        status_code (int): HTTP status of the failed response.
+
+    Returns:
+        HttpResponseError: Error carrying the status code.
+    """
+    response = MagicMock()
+    response.status_code = status_code
+    return HttpResponseError(message="Error", response=response)
+
+def event_counts() -> dict:
+    """
+    Count the recorded request policy events by name.
+
+    Returns:
+        dict: Event names mapped to how often they fired.
+    """
+    counts = {}
+    for event in BlobMetrics.events():
+        counts[event["event"]] = counts.get(event["event"], 0) + event["count"]
+    return counts
+
+class TestBlobRequestPolicy:
+    """
+    Test suite for BlobRequestPolicy.
+
+    Covers retries with backoff, deadlines, hedged reads
+    and the events counted for each.
+    """
+
+    def test_retries_transient_errors(self):
+        """
+        Verify throttling and connection errors are retried until the call succeeds.
+        """
+        # Fail twice with transient errors, then succeed
+        function = MagicMock(side_effect=[server_error(503), ServiceResponseError("reset"), "ok"])
+        policy = BlobRequestPolicy(retries=3, backoff=0)
+
+        # Verify the result and the retries counted
+        assert policy.call("read", function, "golf", "scorecards/a.json", caller="Test") == "ok"
+        assert function.call_count == 3
+        assert event_counts() == {"retry": 2}
+
+    def test_permanent_errors_are_not_retried(self):
+        """
+        Verify errors such as a missing blob are raised at once.
+        """
+        function = MagicMock(side_effect=ResourceNotFoundError("missing"))
+
+        # Verify the error is raised after a single attempt
+        with pytest.raises(ResourceNotFoundError):
+            BlobRequestPolicy(retries=3, backoff=0).call("read", function, "golf", "a.json", caller="Test")
+        assert function.call_count == 1
+
+    def test_retries_are_bounded(self):
+        """
+        Verify the last error is raised once retries are exhausted.
+        """
+        function = MagicMock(side_effect=server_error(500))
+
+        # Verify one attempt plus two retries were made
+        with pytest.raises(HttpResponseError):
+            BlobRequestPolicy(retries=2, backoff=0).call("write", function, "golf", "a.json", caller="Test")
+        assert function.call_count == 3
+
+    def test_backoff_is_jittered_and_capped(self):
+        """
+        Verify backoff delays grow exponentially within their cap.
+        """
+        policy = BlobRequestPolicy(backoff=1.0)
+        policy.max_backoff = 3.0
+
+        # Verify delays stay within the exponential bound and the cap
+        assert all(0 <= policy.backoff_delay(1) <= 1.0 for _ in range(50))
+        assert all(0 <= policy.backoff_delay(5) <= 3.0 for _ in range(50))
+
+    def test_deadline_cuts_off_slow_calls(self):
+        """
+        Verify a call exceeding its deadline is abandoned and retried.
+        """
+        # Hang on the first attempt only
+        release = threading.Event()
+        calls = []
+
+        def function():
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(5)
+            return "ok"
+
+        policy = BlobRequestPolicy(timeout=0.05, retries=1, backoff=0)
+
+        # Verify the retry returned well before the hung call would have
+        started = time.monotonic()
+        assert policy.call("read", function, "golf", "a.json", caller="Test") == "ok"
+        assert time.monotonic() - started < 1
+        assert event_counts() == {"timeout": 1, "retry": 1}
+        release.set()
+
+    def test_per_operation_timeouts(self):
+        """
+        Verify operation specific deadlines override the default.
+        """
+        policy = BlobRequestPolicy(timeout=10, retries=0, timeouts={"list": 0.05})
+
+        # Verify only the listing is cut off
+        with pytest.raises(TimeoutError):
+            policy.call("list", lambda: time.sleep(0.5), "golf", "scorecards/", caller="Test")
+
+    def test_hedged_read_wins(self):
+        """
+        Verify a read slower than the latency percentile is duplicated and the faster copy returned.
+        """
+        # Build up a history of fast reads
+        policy = BlobRequestPolicy(timeout=5, retries=0, hedge_percentile=95)
+        for _ in range(policy.min_samples):
+            policy.call("read", lambda: "fast", "golf", "scorecards/a.json", caller="Test", hedge=True)
+
+        # Make the next primary hang while its duplicate returns at once
+        release = threading.Event()
+        calls = []
+
+        def function():
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(5)
+                return "primary"
+            return "hedge"
+
+        # Verify the duplicate answered
+        assert policy.call("read", function, "golf", "scorecards/b.json", caller="Test", hedge=True) == "hedge"
+        assert event_counts() == {"hedge": 1, "hedge_win": 1}
+        release.set()
+
+    def test_no_hedge_without_history(self):
+        """
+        Verify reads are not hedged before enough latencies have been recorded.
+        """
+        policy = BlobRequestPolicy(hedge_percentile=95)
+        assert policy.hedge_delay(("read", "golf", "scorecards")) is None
+
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
+    def test_blob_client_retries_reads(self, mock_blob_service_client):
+        """
+        Verify BlobClient reads go through the policy.
+        """
+        # Fail the first download with a server error
+        download_stream = MagicMock()
+        download_stream.readall.return_value = b'{"a": 1}'
+        download_stream.properties.content_settings.content_encoding = None
+        download_stream.properties.content_settings.content_type = "application/json"
+        blob_client = MagicMock()
+        blob_client.download_blob.side_effect = [server_error(503), download_stream]
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = blob_client
+
+        # Call the function under test
+        client = BlobClient(policy=BlobRequestPolicy(retries=1, backoff=0))
+        data = client.read_blob_to_dict(container="golf", input_filename="scorecards/a.json")
+
+        # Verify the retry succeeded and was counted against the client
+        assert data == {"a": 1}
+        assert BlobMetrics.events() == [{"event": "retry", "operation": "read", "container": "golf",
+                                         "prefix": "scorecards", "caller": "BlobClient", "count": 1}]
@@ -0,0 +1,153 @@
+# Import dependencies
+from shared import BlobSerializers, BlobClient, BlobServiceRegistry, BlobListingCache, AbstractBlobSerializer
+from unittest.mock import patch, MagicMock
+import pytest
+import json
+
+@pytest.fixture(autouse=True)
+def reset_blob_service_registry():
+    """
+    Clear pooled clients and cached listings between tests.
+
+    Ensures each test builds its clients from
+    its own patched BlobServiceClient.
+    """
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+    yield
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+
+class ReprSerializer(AbstractBlobSerializer):
+    """
+    Non-JSON serializer used to check that readers dispatch on Content-Type.
+    """
+    name = "repr"
+    content_type = "text/x-python-repr"
+
+    def dumps(self, data):
+        return repr(data).encode()
+
+    def loads(self, data):
+        return eval(data)
+
+@pytest.fixture
+def repr_serializer(monkeypatch):
+    """
+    Register the repr serializer for the duration of a test.
+    """
+    monkeypatch.setattr(BlobSerializers, "_serializers", dict(BlobSerializers._serializers))
+    BlobSerializers.register(ReprSerializer())
+    yield
+
+class TestBlobSerializers:
+    """
+    Test suite for the BlobSerializers registry.
+
+    Covers round trips for every available serializer, fallbacks for
+    missing optional packages and decoder selection from Content-Type.
+    """
+
+    @pytest.mark.parametrize("name", BlobSerializers.available())
+    def test_round_trip(self, name):
+        """
+        Verify every available serializer loads what it dumps.
+        """
+        # Serialize and deserialize a session shaped document
+        serializer = BlobSerializers.get(name)
+        document = {"StrokeGroups": [{"Club": "7Iron", "Strokes": [{"Carry": 150.5, "Valid": True, "Note": None}]}]}
+
+        # Verify the document survives the round trip
+        assert serializer.loads(serializer.dumps(document)) == document
+
+    def test_missing_optional_falls_back_to_json(self, monkeypatch):
+        """
+        Verify optional serializers whose package is missing fall back to standard library JSON.
+        """
+        # Simulate a host without orjson or msgpack
+        monkeypatch.setattr(BlobSerializers, "_serializers", {"json": BlobSerializers.get("json")})
+
+        # Verify the fallbacks
+        assert BlobSerializers.get("orjson").name == "json"
+        assert BlobSerializers.get("msgpack").name == "json"
+        assert BlobSerializers.for_content_type("application/json").name == "json"
+        with pytest.raises(ValueError):
+            BlobSerializers.for_content_type("application/msgpack")
+
+    def test_unknown_serializer(self):
+        """
+        Verify unknown serializers raise a ValueError.
+        """
+        with pytest.raises(ValueError):
+            BlobSerializers.get("pickle")
+
+    def test_json_readers_accept_legacy_documents(self):
+        """
+        Verify JSON blobs, including NaN literals written by the standard library, decode with the JSON reader.
+        """
+        # Resolve the reader for JSON and untagged blobs
+        reader = BlobSerializers.for_content_type(None)
+
+        # Verify standard library output is accepted
+        assert reader.content_type == "application/json"
+        assert reader.loads(json.dumps({"Carry": 150.5}).encode()) == {"Carry": 150.5}
+        assert reader.loads(b'{"Carry": NaN}')["Carry"] != reader.loads(b'{"Carry": NaN}')["Carry"]
+
+class TestBlobClientSerializers:
+    """
+    Test suite for BlobClient writes and reads through serializers.
+
+    Covers tagging writes with the serializer's Content-Type
+    and decoding reads according to the recorded Content-Type.
+    """
+
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
+    def test_write_is_tagged(self, mock_blob_service_client, repr_serializer):
+        """
+        Verify exported blobs record the serializer's Content-Type.
+        """
+        # Set up the mocked blob client
+        mock_blob_client = MagicMock()
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = mock_blob_client
+
+        # Call the function under test
+        BlobClient(serializer="repr", codec="identity").export_dict_to_blob({"a": 1}, "golf", "a.bin")
+
+        # Verify the payload and its tag
+        args, kwargs = mock_blob_client.upload_blob.call_args
+        assert args[0] == b"{'a': 1}"
+        assert kwargs["content_settings"].content_type == "text/x-python-repr"
+
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
+    def test_read_dispatches_on_content_type(self, mock_blob_service_client, repr_serializer):
+        """
+        Verify readers pick the decoder recorded on the blob regardless of their own serializer.
+        """
+        # Return a repr encoded blob
+        download_stream = MagicMock()
+        download_stream.readall.return_value = b"{'a': 1}"
+        download_stream.properties.content_settings.content_encoding = None
+        download_stream.properties.content_settings.content_type = "text/x-python-repr"
+        mock_blob_client = MagicMock()
+        mock_blob_client.download_blob.return_value = download_stream
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = mock_blob_client
+
+        # Call the function under test with a JSON configured client
+        result = BlobClient(serializer="json").read_blob_to_dict("golf", "a.bin")
+
+        # Verify the blob was decoded with its recorded format
+        assert result == {"a": 1}
+
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
+    def test_binary_blobs_cannot_be_streamed(self, mock_blob_service_client, repr_serializer):
+        """
+        Verify streaming reads reject blobs that are not JSON.
+        """
+        # Return a repr encoded blob
+        mock_blob_client = MagicMock()
+        mock_blob_client.download_blob.return_value.properties.content_settings.content_type = "text/x-python-repr"
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = mock_blob_client
+
+        # Verify the streaming read raises
+        with pytest.raises(ValueError):
+            list(BlobClient().iter_stroke_groups("golf", "a.bin"))
@@ -0,0 +1,102 @@
+# Import dependencies
+from shared import BlobServiceRegistry, BlobListingCache, BlobClient
+from unittest.mock import patch, MagicMock
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+
+@pytest.fixture(autouse=True)
+def reset_blob_service_registry():
+    """
+    Clear pooled clients and cached listings between tests.
+
+    Ensures each test starts from an empty registry.
+    """
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+    yield
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+
+class TestBlobServiceRegistry:
+    """
+    Test suite for BlobServiceRegistry.
+
+    Covers client reuse per connection string, container
+    client caching and sharing across BlobClient instances.
+    """
+
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
+    def test_service_client_reused_per_connection_string(self, mock_blob_service_client):
+        """
+        Verify one service client is built per connection string.
+
+        Ensures repeated lookups return the same pooled client
+        and distinct connection strings get distinct clients.
+        """
+        # Return a new fake client for every construction
+        mock_blob_service_client.from_connection_string.side_effect = lambda *args, **kwargs: MagicMock()
+
+        # Look up clients for two different accounts
+        first = BlobServiceRegistry.get_service_client("account-a")
+        second = BlobServiceRegistry.get_service_client("account-a")
+        other = BlobServiceRegistry.get_service_client("account-b")
+
+        # Verify the same account shares a client
+        assert first is second
+        assert first is not other
+        assert mock_blob_service_client.from_connection_string.call_count == 2
+
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
+    def test_service_client_uses_pooled_transport(self, mock_blob_service_client):
+        """
+        Verify the service client is built with a shared keep-alive transport.
+        """
+        # Build the client
+        BlobServiceRegistry.get_service_client("account-a")
+
+        # Inspect the transport handed to the SDK
+        _, kwargs = mock_blob_service_client.from_connection_string.call_args
+        transport = kwargs["transport"]
+        adapter = transport.session.get_adapter("https://example.blob.core.windows.net")
+
+        # Verify the connection pool is sized for concurrent callers
+        assert adapter._pool_maxsize == BlobServiceRegistry.pool_size
+
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
+    def test_container_client_cached(self, mock_blob_service_client):
+        """
+        Verify container clients are derived once and cached.
+        """
+        # Look up the same container twice
+        first = BlobServiceRegistry.get_container_client("account-a", "golf")
+        second = BlobServiceRegistry.get_container_client("account-a", "golf")
+
+        # Verify only one container client was derived
+        assert first is second
+        mock_blob_service_client.from_connection_string.return_value \
+            .get_container_client.assert_called_once_with("golf")
+
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
+    def test_concurrent_lookups_build_single_client(self, mock_blob_service_client):
+        """
+        Verify concurrent first lookups only build one client.
+        """
+        # Resolve the client from many threads at once
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            clients = list(executor.map(lambda _: BlobServiceRegistry.get_service_client("account-a"), range(64)))
+
+        # Verify every thread received the same instance
+        assert len({id(client) for client in clients}) == 1
+        mock_blob_service_client.from_connection_string.assert_called_once()
+
+    @patch("shared.functions.blob_service_registry.BlobServiceClient")
+    def test_blob_clients_share_service_client(self, mock_blob_service_client, monkeypatch):
+        """
+        Verify separate BlobClient instances share the pooled client.
+        """
+        # Configure a connection string for backend clients
+        monkeypatch.setenv("blob_storage_connection_string", "account-a")
+
+        # Verify both instances resolve to the same pooled client
+        assert BlobClient().service_client is BlobClient().service_client
+        mock_blob_service_client.from_connection_string.assert_called_once()
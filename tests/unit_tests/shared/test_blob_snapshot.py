@@ -0,0 +1,252 @@
+# Import dependencies
+from shared import BlobClient, BlobSnapshot, SnapshotPack, BlobServiceRegistry, BlobListingCache
+from azure.core.exceptions import ResourceNotFoundError
+from unittest.mock import patch, MagicMock
+from datetime import datetime, timezone
+import hashlib
+import pytest
+import os
+
+@pytest.fixture(autouse=True)
+def reset_blob_service_registry():
+    """
+    Clear pooled clients, cached listings and any mapped snapshot between tests.
+
+    Ensures each test builds its clients from
+    its own patched BlobServiceClient.
+    """
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+    BlobSnapshot.reset()
+    yield
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+    BlobSnapshot.reset()
+
+class FakeBlob:
+    """
+    In-memory stand-in for a blob client backed by a shared dictionary.
+
+    Attributes:
+        store (dict): Blob names mapped to their stored bytes, content settings and metadata.
+        name (str): Name of this blob.
+    """
+    def __init__(self, store: dict, name: str) -> None:
+        self.store = store
+        self.name = name
+
+    def upload_blob(self, data: bytes, overwrite: bool = False, content_settings=None, metadata=None, **kwargs) -> None:
+        self.store[self.name] = (bytes(data), content_settings, metadata or {})
+
+    def get_blob_properties(self) -> MagicMock:
+        if self.name not in self.store:
+            raise ResourceNotFoundError("The specified blob does not exist.")
+        properties = MagicMock()
+        properties.metadata = self.store[self.name][2]
+        properties.etag = f'"{hashlib.md5(self.store[self.name][0]).hexdigest()}"'
+        return properties
+
+    def download_blob(self, **kwargs) -> MagicMock:
+        if self.name not in self.store:
+            raise ResourceNotFoundError("The specified blob does not exist.")
+        data, content_settings, _ = self.store[self.name]
+        download_stream = MagicMock()
+        download_stream.readall.return_value = data
+        download_stream.readinto.side_effect = lambda file: file.write(data)
+        download_stream.chunks.side_effect = lambda: iter([data])
+        download_stream.properties.content_settings = content_settings
+        return download_stream
+
+def listed(store: dict, name_starts_with: str) -> list:
+    """
+    List the in-memory store the way the SDK lists a container.
+
+    Returns:
+        list: Blob properties of every stored blob under the prefix.
+    """
+    blobs = []
+    for name, (data, content_settings, _) in sorted(store.items()):
+        if name.startswith(name_starts_with):
+            blob = MagicMock(size=len(data), etag=hashlib.md5(data).hexdigest(),
+                             last_modified=datetime(2025, 6, 1, tzinfo=timezone.utc), content_settings=content_settings)
+            blob.name = name
+            blobs.append(blob)
+    return blobs
+
+@pytest.fixture
+def store():
+    """
+    Patch the Azure SDK so blob clients read, write and list an in-memory store.
+    """
+    blobs = {}
+    with patch("shared.functions.blob_service_registry.BlobServiceClient") as mock_blob_service_client:
+        service = mock_blob_service_client.from_connection_string.return_value
+        service.get_blob_client.side_effect = lambda container, blob: FakeBlob(blobs, blob)
+        service.get_container_client.return_value.list_blobs.side_effect = \
+            lambda name_starts_with: listed(blobs, name_starts_with)
+        yield blobs
+
+def snapshot_client(tmp_path) -> BlobSnapshot:
+    """
+    Build a snapshot client downloading to a temporary directory.
+
+    Returns:
+        BlobSnapshot: The client.
+    """
+    client = BlobSnapshot()
+    client.vars.golf_course_name = "braid_hills"
+    client.vars.blob_snapshot_directory = str(tmp_path)
+    return client
+
+class TestSnapshotPack:
+    """
+    Test suite for SnapshotPack.
+
+    Covers the pack layout, zero-copy reads,
+    listings and content based versions.
+    """
+
+    def test_build_and_map(self, tmp_path):
+        """
+        Verify packed blobs are read back as views of the mapped file.
+        """
+        # Pack two blobs and write the pack to disk
+        blobs = [
+            {"container": "golf", "name": "trackman_club_summary/Driver.json", "data": b'[{"Carry": 230}]',
+             "content_type": "application/json", "etag": "a", "last_modified": "2025-06-01T00:00:00+00:00"},
+            {"container": "golf", "name": "catalog/ingest_catalog.json", "data": b'{"entries": {}}',
+             "content_type": "application/json", "etag": "b", "last_modified": None}
+        ]
+        data, version = SnapshotPack.build(prefixes={"golf": ["catalog/", "trackman_club_summary/"]}, blobs=blobs)
+        path = tmp_path / "dashboard.pack"
+        path.write_bytes(data)
+
+        # Call the function under test
+        pack = SnapshotPack(str(path))
+
+        # Verify reads are zero-copy views with identity encoding
+        payload, properties = pack.get("golf", "trackman_club_summary/Driver.json")
+        assert isinstance(payload, memoryview)
+        assert bytes(payload) == b'[{"Carry": 230}]'
+        assert properties == {"content_encoding": "identity", "content_type": "application/json"}
+        assert pack.get("golf", "trackman_club_summary/Iron.json") is None
+
+        # Verify listings and coverage
+        assert pack.version == version
+        assert pack.covers("golf", "trackman_club_summary/") and not pack.covers("golf", "diagnostics/")
+        assert [entry.name for entry in pack.entries("golf", "catalog/")] == ["catalog/ingest_catalog.json"]
+
+        # Verify the pack only depends on its content
+        assert SnapshotPack.build(prefixes={"golf": ["catalog/", "trackman_club_summary/"]},
+                                  blobs=list(reversed(blobs))) == (data, version)
+
+    def test_rejects_other_files(self, tmp_path):
+        """
+        Verify files that are not packs are refused.
+        """
+        path = tmp_path / "other.pack"
+        path.write_bytes(b"not a snapshot at all")
+        with pytest.raises(ValueError):
+            SnapshotPack(str(path))
+
+class TestBlobSnapshot:
+    """
+    Test suite for BlobSnapshot.
+
+    Covers publishing, serving reads from the
+    mapped snapshot and swapping in new versions.
+    """
+
+    def test_publish_and_serve(self, store, tmp_path):
+        """
+        Verify published blobs are served from the snapshot without touching storage.
+        """
+        # Store dashboard outputs and a blob outside the packed prefixes
+        client = BlobClient()
+        client.export_dict_to_blob(data=[{"Par": 4}], container="golf",
+                                   output_filename="braid_hills_golf_course_hole_summary/hole_1.json")
+        client.export_dict_to_blob(data={"StrokeGroups": [{"Club": "Driver"}]}, container="golf",
+                                   output_filename="trackman_session_summary/session-abc.json")
+        client.export_dict_to_blob(data={"pipeline": "hole19"}, container="golf",
+                                   output_filename="diagnostics/blob_io/hole19/report.json")
+
+        # Call the functions under test
+        version, size, uploaded = snapshot_client(tmp_path).publish()
+        assert uploaded and size == len(store[BlobSnapshot.snapshot_name][0])
+        assert snapshot_client(tmp_path).publish() == (version, size, False)
+        pack = snapshot_client(tmp_path).refresh()
+        assert pack.version == version
+
+        # Verify packed blobs are served even once gone from storage
+        del store["braid_hills_golf_course_hole_summary/hole_1.json"]
+        del store["trackman_session_summary/session-abc.json"]
+        assert client.read_blob_to_dict("golf", "braid_hills_golf_course_hole_summary/hole_1.json") == [{"Par": 4}]
+        assert client.list_blob_filenames("golf", "braid_hills_golf_course_hole_summary/") == [
+            "braid_hills_golf_course_hole_summary/hole_1.json"
+        ]
+        assert list(client.iter_stroke_groups("golf", "trackman_session_summary/session-abc.json")) == [
+            {"Club": "Driver"}
+        ]
+
+        # Verify blobs outside the snapshot still come from storage
+        assert client.read_blob_to_dict("golf", "diagnostics/blob_io/hole19/report.json") == {"pipeline": "hole19"}
+
+    def test_hot_swap(self, store, tmp_path):
+        """
+        Verify a new version is swapped in on the next check while views of the old one stay valid.
+        """
+        # Publish and map the first version
+        client = BlobClient()
+        client.export_dict_to_blob(data=[{"Carry": 230}], container="golf",
+                                   output_filename="trackman_club_summary/Driver.json")
+        snapshot_client(tmp_path).publish()
+        first = snapshot_client(tmp_path).refresh()
+        view, _ = client.download_stored_blob("golf", "trackman_club_summary/Driver.json")
+
+        # Publish a second version
+        client.export_dict_to_blob(data=[{"Carry": 241}], container="golf",
+                                   output_filename="trackman_club_summary/Driver.json")
+        snapshot_client(tmp_path).publish()
+
+        # Verify the version is only checked again once the ttl passed
+        assert snapshot_client(tmp_path).refresh() is first
+        second = snapshot_client(tmp_path).refresh(force=True)
+
+        # Verify readers see the new version and the old view is intact
+        assert second.version != first.version
+        assert client.read_blob_to_dict("golf", "trackman_club_summary/Driver.json") == [{"Carry": 241}]
+        assert bytes(view) == b'[{"Carry": 230}]'
+        assert os.listdir(tmp_path) == [os.path.basename(second.path)]
+
+    def test_publish_downloads_only_changed_blobs(self, store, tmp_path):
+        """
+        Verify a publish copies unchanged blobs from the previous snapshot and downloads only changed ones.
+        """
+        # Publish a first version of two club summaries
+        client = BlobClient()
+        for club, carry in (("Driver", 230), ("7 Iron", 150)):
+            client.export_dict_to_blob(data=[{"Carry": carry}], container="golf",
+                                       output_filename=f"trackman_club_summary/{club}.json")
+        snapshot_client(tmp_path).publish()
+
+        # Rewrite one summary and publish again
+        client.export_dict_to_blob(data=[{"Carry": 241}], container="golf",
+                                   output_filename="trackman_club_summary/Driver.json")
+        publisher = snapshot_client(tmp_path)
+        with patch.object(publisher, "download_stored_blob", wraps=publisher.download_stored_blob) as download:
+            publisher.publish()
+
+        # Verify only the changed blob was downloaded and the new pack holds both
+        assert [call.kwargs["input_filename"] for call in download.call_args_list] == [
+            "trackman_club_summary/Driver.json"
+        ]
+        snapshot_client(tmp_path).refresh(force=True)
+        assert client.read_blob_to_dict("golf", "trackman_club_summary/Driver.json") == [{"Carry": 241}]
+        assert client.read_blob_to_dict("golf", "trackman_club_summary/7 Iron.json") == [{"Carry": 150}]
+
+    def test_nothing_published(self, store, tmp_path):
+        """
+        Verify reads go to storage until a snapshot is published.
+        """
+        assert snapshot_client(tmp_path).refresh() is None
+        assert BlobClient.snapshot is None
@@ -0,0 +1,268 @@
+# Import dependencies
+from shared import BlobClient, BlobMetrics, BlobRequestPolicy, BlobWriteBuffer, BlobServiceRegistry, BlobListingCache
+from azure.core.exceptions import ResourceNotFoundError
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock
+import atexit
+import pytest
+import json
+import os
+
+@pytest.fixture(autouse=True)
+def reset_blob_service_registry():
+    """
+    Clear pooled clients, cached listings, metrics and any active buffer between tests.
+
+    Ensures each test builds its clients from
+    its own patched BlobServiceClient.
+    """
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+    BlobMetrics.reset()
+    yield
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+    BlobMetrics.reset()
+    BlobClient.write_buffer = None
+
+class FakeBlob:
+    """
+    In-memory stand-in for a blob client backed by a shared dictionary.
+
+    Attributes:
+        store (dict): Blob names mapped to their stored bytes, content settings and metadata.
+        name (str): Name of this blob.
+        failing (set): Blob names whose uploads raise.
+    """
+    def __init__(self, store: dict, name: str, failing: set) -> None:
+        self.store = store
+        self.name = name
+        self.failing = failing
+
+    def upload_blob(self, data: bytes, overwrite: bool = False, content_settings=None, metadata=None, **kwargs) -> None:
+        if self.name in self.failing:
+            raise ResourceNotFoundError("The specified container does not exist.")
+        self.store[self.name] = (data, content_settings, metadata or {})
+
+    def get_blob_properties(self) -> MagicMock:
+        if self.name not in self.store:
+            raise ResourceNotFoundError("The specified blob does not exist.")
+        properties = MagicMock()
+        properties.metadata = self.store[self.name][2]
+        return properties
+
+    def download_blob(self, **kwargs) -> MagicMock:
+        if self.name not in self.store:
+            raise ResourceNotFoundError("The specified blob does not exist.")
+        data, content_settings, _ = self.store[self.name]
+        download_stream = MagicMock()
+        download_stream.readall.return_value = data
+        download_stream.properties.content_settings = content_settings
+        return download_stream
+
+@pytest.fixture
+def store():
+    """
+    Patch the Azure SDK so blob clients read and write an in-memory store.
+
+    Yields the stored blobs and the set of blob names whose uploads fail.
+    """
+    blobs, failing = {}, set()
+    with patch("shared.functions.blob_service_registry.BlobServiceClient") as mock_blob_service_client:
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.side_effect = \
+            lambda container, blob: FakeBlob(blobs, blob, failing)
+        yield blobs, failing
+
+def make_buffer(spill_path) -> BlobWriteBuffer:
+    """
+    Build a buffer spilling to a temporary file that does not retry failed uploads.
+
+    Returns:
+        BlobWriteBuffer: The inactive buffer.
+    """
+    return BlobWriteBuffer(spill_path=str(spill_path), policy=BlobRequestPolicy(retries=0))
+
+class TestBlobWriteBuffer:
+    """
+    Test suite for BlobWriteBuffer.
+
+    Covers coalescing, reads of pending writes, parallel
+    flushes, failed uploads and recovery from the spill file.
+    """
+
+    def test_writes_coalesce_until_flushed(self, store, tmp_path):
+        """
+        Verify repeated writes to a blob are held back and only the last version is uploaded.
+        """
+        blobs, _ = store
+        client = BlobClient()
+
+        with make_buffer(tmp_path / "spill.jsonl") as buffer:
+            client.export_dict_to_blob(data={"version": 1}, container="golf", output_filename="out/a.json")
+            client.export_dict_to_blob(data={"version": 2}, container="golf", output_filename="out/a.json")
+            client.export_bytes_to_blob(data=b"parquet", container="golf", output_filename="out/b.parquet")
+
+            # Verify nothing is uploaded before the flush
+            assert blobs == {}
+            assert buffer.pending == 2
+            assert buffer.coalesced == 1
+
+            # Call the function under test
+            report = buffer.flush()
+
+        # Verify each blob is uploaded once with its latest content
+        assert sorted(report.succeeded) == ["out/a.json", "out/b.parquet"]
+        assert client.read_blob_to_dict(container="golf", input_filename="out/a.json") == {"version": 2}
+        assert blobs["out/b.parquet"][0] == b"parquet"
+
+        # Verify the coalesced write is counted against the client that issued it
+        assert [(event["event"], event["caller"], event["count"]) for event in BlobMetrics.events()] == [
+            ("coalesced", "BlobClient", 1)
+        ]
+
+    def test_pending_writes_are_readable(self, store, tmp_path):
+        """
+        Verify reads and streamed reads of a blob still held by the buffer return the buffered version.
+        """
+        blobs, _ = store
+        client = BlobClient()
+
+        with make_buffer(tmp_path / "spill.jsonl"):
+            client.export_dict_to_blob(data=[{"hole": 1}], container="golf", output_filename="out/a.json")
+            client.export_dict_to_blob(data={"StrokeGroups": [{"Club": "Driver"}]}, container="golf",
+                                       output_filename="out/session.json")
+
+            # Verify the reads are served without touching storage
+            assert client.read_blob_to_dict(container="golf", input_filename="out/a.json") == [{"hole": 1}]
+            assert list(client.iter_stroke_groups("golf", "out/session.json")) == [{"Club": "Driver"}]
+            assert blobs == {}
+
+    def test_exit_flushes_and_deactivates(self, store, tmp_path):
+        """
+        Verify leaving the buffer uploads pending writes and later writes go straight to storage.
+        """
+        blobs, _ = store
+        client = BlobClient()
+        spill_path = tmp_path / "spill.jsonl"
+
+        with make_buffer(spill_path):
+            client.export_dict_to_blob(data={}, container="golf", output_filename="out/a.json")
+
+        # Verify the write was uploaded and the spill file removed
+        assert "out/a.json" in blobs
+        assert not spill_path.exists()
+        assert BlobClient.write_buffer is None
+
+        # Verify writes after exit are not buffered
+        client.export_dict_to_blob(data={}, container="golf", output_filename="out/b.json")
+        assert "out/b.json" in blobs
+
+    def test_failed_uploads_stay_pending(self, store, tmp_path):
+        """
+        Verify a failed upload is reported, kept in the buffer and its spill file, and retried on the next flush.
+        """
+        blobs, failing = store
+        client = BlobClient()
+        spill_path = tmp_path / "spill.jsonl"
+        failing.add("out/b.json")
+
+        with make_buffer(spill_path) as buffer:
+            client.export_dict_to_blob(data={"a": 1}, container="golf", output_filename="out/a.json")
+            client.export_dict_to_blob(data={"b": 1}, container="golf", output_filename="out/b.json")
+
+            # Call the function under test
+            report = buffer.flush()
+
+            # Verify only the failed write remains pending and journalled
+            assert report.succeeded == ["out/a.json"]
+            assert list(report.failed) == ["out/b.json"]
+            assert buffer.pending == 1
+            assert [json.loads(line)["name"] for line in spill_path.read_text().splitlines()] == ["out/b.json"]
+
+            # Verify the next flush uploads it once storage recovers
+            failing.clear()
+            assert buffer.flush().succeeded == ["out/b.json"]
+
+        assert sorted(blobs) == ["out/a.json", "out/b.json"]
+
+    def test_spill_synced_outside_the_lock(self, store, tmp_path):
+        """
+        Verify concurrent writes are journalled in full while syncing the spill file never holds the buffer lock.
+        """
+        client = BlobClient()
+        spill_path = tmp_path / "spill.jsonl"
+        locked = []
+
+        with make_buffer(spill_path) as buffer:
+            real_fsync = os.fsync
+
+            def fsync(fileno: int) -> None:
+                locked.append(buffer._lock.locked())
+                real_fsync(fileno)
+
+            # Call the function under test from several threads at once
+            with patch("shared.functions.blob_write_buffer.os.fsync", side_effect=fsync), \
+                    ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(lambda index: client.export_dict_to_blob(
+                    data={"index": index}, container="golf", output_filename=f"out/{index}.json"), range(32)))
+
+            # Verify every write was journalled and synced by at most one sync each
+            assert len(spill_path.read_text().splitlines()) == 32
+            assert 0 < len(locked) <= 32 and not any(locked)
+
+    def test_spill_file_survives_crash(self, store, tmp_path):
+        """
+        Verify writes accepted before a crash are replayed and uploaded by the next buffer on the same spill file.
+        """
+        blobs, _ = store
+        client = BlobClient()
+        spill_path = tmp_path / "spill.jsonl"
+
+        # Accept writes and crash before flushing, leaving half a record behind
+        crashed = make_buffer(spill_path).__enter__()
+        client.export_dict_to_blob(data={"version": 1}, container="golf", output_filename="out/a.json")
+        client.export_dict_to_blob(data={"version": 2}, container="golf", output_filename="out/a.json")
+        client.export_dict_to_blob(data=[1, 2, 3], container="golf", output_filename="out/b.json")
+        atexit.unregister(crashed.close)
+        BlobClient.write_buffer = None
+        with open(spill_path, "a") as spill:
+            spill.write('{"container": "golf", "name": "out/c.js')
+
+        # Call the function under test
+        with make_buffer(spill_path) as buffer:
+            assert buffer.recovered == 2
+
+        # Verify the latest version of every acknowledged write was uploaded
+        assert client.read_blob_to_dict(container="golf", input_filename="out/a.json") == {"version": 2}
+        assert client.read_blob_to_dict(container="golf", input_filename="out/b.json") == [1, 2, 3]
+        assert sorted(blobs) == ["out/a.json", "out/b.json"]
+        assert not spill_path.exists()
+
+    def test_unchanged_writes_skipped_on_flush(self, store, tmp_path):
+        """
+        Verify a flush does not re-upload blobs whose stored content is unchanged.
+        """
+        blobs, _ = store
+        client = BlobClient()
+        client.export_dict_to_blob(data={"holes": 18}, container="golf", output_filename="out/a.json")
+        stored = blobs["out/a.json"]
+
+        with make_buffer(tmp_path / "spill.jsonl") as buffer:
+            client.export_dict_to_blob(data={"holes": 18}, container="golf", output_filename="out/a.json")
+            client.export_dict_to_blob(data={"holes": 9}, container="golf", output_filename="out/b.json")
+
+            # Call the function under test
+            report = buffer.flush()
+
+        # Verify only the new blob was uploaded
+        assert sorted(report.succeeded) == ["out/a.json", "out/b.json"]
+        assert report.skipped == ["out/a.json"]
+        assert blobs["out/a.json"] is stored
+
+    def test_single_active_buffer(self, tmp_path):
+        """
+        Verify a second buffer cannot be activated while one is active.
+        """
+        with make_buffer(tmp_path / "first.jsonl"):
+            with pytest.raises(RuntimeError):
+                make_buffer(tmp_path / "second.jsonl").__enter__()
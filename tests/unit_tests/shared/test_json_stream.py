@@ -0,0 +1,186 @@
+# Import dependencies
+from shared import BlobClient, BlobCodecs, BlobMetrics, BlobServiceRegistry, BlobListingCache, JsonStream
+from unittest.mock import patch, MagicMock
+import pytest
+import json
+import time
+
+# A session report whose second group lists its strokes before its club
+SESSION = {
+    "StrokeGroups": [
+        {"Club": "Driver", "Date": "2025-06-01T10:00:00", "Strokes": [
+            {"Time": "2025-06-01T10:01:00", "Measurement": {"Carry": 230.5, "Note": 'a "quoted" ]}\\'}},
+            {"Time": "2025-06-01T10:02:00", "Measurement": {"Carry": 241.0, "Note": "ünïcode"}}
+        ]},
+        {"Strokes": [{"Time": "2025-06-01T10:03:00", "Measurement": {"Carry": 150.0}}], "Club": "7Iron"}
+    ],
+    "Summary": {"Shots": 3}
+}
+
+@pytest.fixture(autouse=True)
+def reset_blob_service_registry():
+    """
+    Clear pooled clients and cached listings between tests.
+
+    Ensures each test builds its clients from
+    its own patched BlobServiceClient.
+    """
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+    yield
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+
+def split(data: bytes, size: int) -> list[bytes]:
+    """
+    Split a payload into fixed size chunks.
+
+    Args:
+        data (bytes): Payload to split.
+        size (int): Chunk size in bytes.
+
+    Returns:
+        list[bytes]: Chunks in order.
+    """
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+class TestJsonStream:
+    """
+    Test suite for JsonStream.
+
+    Covers extraction by path pattern across arbitrary
+    chunk boundaries, skipped values and malformed input.
+    """
+
+    @pytest.mark.parametrize("size", [1, 3, 64, 1 << 20])
+    def test_chunk_boundaries(self, size):
+        """
+        Verify selected values are extracted regardless of where chunks split the document.
+        """
+        # Stream the strokes of every group
+        payload = json.dumps(SESSION, ensure_ascii=False, indent=2).encode()
+        items = list(JsonStream(patterns=[("StrokeGroups", "*", "Strokes", "*")]).iter_items(split(payload, size)))
+
+        # Verify paths and values match the document
+        assert [path for path, _ in items] == [
+            ("StrokeGroups", 0, "Strokes", 0), ("StrokeGroups", 0, "Strokes", 1), ("StrokeGroups", 1, "Strokes", 0)
+        ]
+        assert [value for _, value in items] == SESSION["StrokeGroups"][0]["Strokes"] + \
+            SESSION["StrokeGroups"][1]["Strokes"]
+
+    def test_multiple_patterns(self):
+        """
+        Verify several patterns are served in document order from one pass.
+        """
+        # Stream clubs and the summary together
+        payload = json.dumps(SESSION).encode()
+        stream = JsonStream(patterns=[("StrokeGroups", "*", "Club"), ("Summary",)])
+
+        # Verify the selected values
+        assert [value for _, value in stream.iter_items(split(payload, 5))] == ["Driver", "7Iron", {"Shots": 3}]
+
+    def test_skipped_subtree_is_compacted(self):
+        """
+        Verify a large skipped container is dropped from the buffer as it is scanned rather than held whole.
+        """
+        # Skip a large trajectory array before the selected summary
+        document = {"Trajectory": [{"X": index, "Note": 'a "]}" b'} for index in range(5000)], "Summary": {"Shots": 3}}
+        payload = json.dumps(document).encode()
+        stream = JsonStream(patterns=[("Summary",)])
+        stream.compact_after = 256
+
+        # Feed the document chunk by chunk, recording the largest buffer held
+        items, largest = [], 0
+        for chunk in split(payload, 64):
+            items.extend(stream.feed(chunk.decode()))
+            largest = max(largest, len(stream.buffer))
+        items.extend(stream.feed("", final=True))
+
+        # Verify the value after the skipped array is extracted and the buffer stayed small
+        assert items == [(("Summary",), {"Shots": 3})]
+        assert largest < 1024 < len(payload)
+
+    def test_no_match(self):
+        """
+        Verify documents without the selected path yield nothing.
+        """
+        assert list(JsonStream(patterns=[("Missing", "*")]).iter_items([json.dumps(SESSION).encode()])) == []
+
+    def test_truncated_document(self):
+        """
+        Verify a truncated document raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            list(JsonStream(patterns=[("StrokeGroups", "*")]).iter_items([json.dumps(SESSION).encode()[:-10]]))
+
+class TestBlobClientStreaming:
+    """
+    Test suite for streaming JSON reads through BlobClient.
+
+    Covers decoding compressed chunks, stroke groups
+    and strokes paired with their club.
+    """
+
+    @pytest.fixture
+    def blob_client(self):
+        """
+        Patch the Azure SDK so downloads return the session report gzip compressed in small chunks.
+        """
+        download_stream = MagicMock()
+        download_stream.chunks.side_effect = lambda: iter(split(BlobCodecs.get("gzip").encode(
+            json.dumps(SESSION).encode()), 16))
+        download_stream.properties.content_settings.content_encoding = "gzip"
+        blob_client = MagicMock()
+        blob_client.download_blob.return_value = download_stream
+
+        with patch("shared.functions.blob_service_registry.BlobServiceClient") as mock_blob_service_client:
+            mock_blob_service_client.from_connection_string.return_value.get_blob_client.return_value = blob_client
+            yield blob_client
+
+    def test_iter_stroke_groups(self, blob_client):
+        """
+        Verify stroke groups are yielded one at a time from the compressed blob.
+        """
+        # Call the function under test
+        groups = list(BlobClient().iter_stroke_groups("golf", "session.json"))
+
+        # Verify the groups and that the stored bytes were requested
+        assert groups == SESSION["StrokeGroups"]
+        blob_client.download_blob.assert_called_once_with(decompress=False)
+
+    def test_iter_session_strokes(self, blob_client):
+        """
+        Verify strokes are paired with their club even when the club follows the strokes.
+        """
+        # Call the function under test
+        strokes = list(BlobClient().iter_session_strokes("golf", "session.json"))
+
+        # Verify every stroke carries its club
+        assert [(club, stroke["Measurement"]["Carry"]) for club, stroke in strokes] == [
+            ("Driver", 230.5), ("Driver", 241.0), ("7Iron", 150.0)
+        ]
+
+    def test_iter_session_strokes_filters_clubs(self, blob_client):
+        """
+        Verify only strokes of the requested clubs are yielded.
+        """
+        # Call the function under test
+        strokes = list(BlobClient().iter_session_strokes("golf", "session.json", clubs=["7Iron"]))
+
+        # Verify the filtered strokes
+        assert [club for club, _ in strokes] == ["7Iron"]
+
+    def test_consumer_time_not_recorded(self, blob_client):
+        """
+        Verify only the downloads count towards the recorded stream latency, not the consumer's work.
+        """
+        # Consume the groups slowly
+        BlobMetrics.reset()
+        for _ in BlobClient().iter_stroke_groups("golf", "session.json"):
+            time.sleep(0.1)
+
+        # Verify the stream was recorded once, with the downloaded bytes but without the consumer's time
+        [stats] = BlobMetrics.snapshot()
+        assert (stats.operation, stats.calls, stats.errors) == ("stream", 1, 0)
+        assert stats.bytes > 0
+        assert stats.total_seconds < 0.1
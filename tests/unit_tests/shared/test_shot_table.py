@@ -0,0 +1,175 @@
+# Import dependencies
+from unittest.mock import patch
+from shared import ShotTable
+import pytest
+
+def make_stroke(time: str, carry: float, **measurement) -> dict:
+    """
+    Build a TrackMan stroke with a short ball trajectory.
+
+    Args:
+        time (str): ISO timestamp of the shot.
+        carry (float): Carry distance.
+
+    Returns:
+        dict: Stroke shaped like the TrackMan report.
+    """
+    return {
+        "Time": time,
+        "Measurement": {
+            "Carry": carry,
+            "Total": carry + 10,
+            "BallSpeed": 40.0,
+            "BallTrajectory": [{"X": 0.0, "Y": 0.0, "Z": 0.0}, {"X": carry, "Y": 1.0, "Z": 2.0}],
+            **measurement
+        }
+    }
+
+@pytest.fixture
+def shot_table():
+    """
+    Provide a ShotTable backed by an in-memory blob store.
+
+    Uploads, listings and downloads are redirected to a dictionary
+    and every download is recorded on `downloads`.
+    """
+    table = ShotTable()
+    table.store = {}
+    table.downloads = []
+
+    def export_bytes_to_blob(data, container, output_filename, content_type="application/octet-stream"):
+        table.store[output_filename] = data
+
+    def list_blob_filenames(container_name, directory_path=""):
+        return [name for name in table.store if name.startswith(directory_path)]
+
+    def download_blob_bytes(container, input_filename):
+        table.downloads.append(input_filename)
+        return table.store[input_filename]
+
+    with patch.object(table, "export_bytes_to_blob", side_effect=export_bytes_to_blob), \
+            patch.object(table, "list_blob_filenames", side_effect=list_blob_filenames), \
+            patch.object(table, "download_blob_bytes", side_effect=download_blob_bytes):
+        yield table
+
+class TestShotTable:
+    """
+    Test suite for ShotTable.
+
+    Covers partitioning by club and date, column projection,
+    row-limit pushdown and conversion back to strokes.
+    """
+
+    def test_partitions_by_club_and_date(self, shot_table):
+        """
+        Verify shots are written to one partition per club and day.
+        """
+        # Write shots across two days for two clubs
+        report = shot_table.write_club_shots({
+            "7Iron": [make_stroke("2025-06-01T10:00:00", 150), make_stroke("2025-06-02T10:00:00", 152)],
+            "Driver": [make_stroke("2025-06-01T10:05:00", 230)]
+        })
+
+        # Verify partition layout and club listing
+        assert report.ok
+        assert sorted(shot_table.store) == [
+            "trackman_shot_table/club=7Iron/date=2025-06-01.parquet",
+            "trackman_shot_table/club=7Iron/date=2025-06-02.parquet",
+            "trackman_shot_table/club=Driver/date=2025-06-01.parquet"
+        ]
+        assert shot_table.list_clubs() == ["7Iron", "Driver"]
+
+    def test_read_projects_columns_most_recent_first(self, shot_table):
+        """
+        Verify reads return only requested columns, newest shot first.
+        """
+        # Write shots out of order across two days
+        shot_table.write_club_shots({"7Iron": [
+            make_stroke("2025-06-01T10:00:00", 148),
+            make_stroke("2025-06-02T09:00:00", 150),
+            make_stroke("2025-06-02T11:00:00", 155)
+        ]})
+
+        # Call the function under test
+        table = shot_table.read_shots(club="7Iron", columns=["Carry", "Total"])
+
+        # Verify projection and ordering
+        assert table.column_names == ["Carry", "Total"]
+        assert table.column("Carry").to_pylist() == [155, 150, 148]
+
+    def test_limit_skips_older_partitions(self, shot_table):
+        """
+        Verify the row limit stops reading before older partitions are downloaded.
+        """
+        # Write two shots on the latest day and one on an older day
+        shot_table.write_club_shots({"7Iron": [
+            make_stroke("2025-06-01T10:00:00", 148),
+            make_stroke("2025-06-02T09:00:00", 150),
+            make_stroke("2025-06-02T11:00:00", 155)
+        ]})
+
+        # Call the function under test
+        table = shot_table.read_shots(club="7Iron", columns=["Carry"], limit=2)
+
+        # Verify only the latest partition was downloaded
+        assert table.column("Carry").to_pylist() == [155, 150]
+        assert shot_table.downloads == ["trackman_shot_table/club=7Iron/date=2025-06-02.parquet"]
+
+    def test_schema_drift_between_partitions(self, shot_table):
+        """
+        Verify columns missing from older partitions are returned as nulls.
+        """
+        # Only the newer day records MaxHeight
+        shot_table.write_club_shots({"7Iron": [
+            make_stroke("2025-06-01T10:00:00", 148),
+            make_stroke("2025-06-02T10:00:00", 150, MaxHeight=25.0)
+        ]})
+
+        # Call the function under test
+        table = shot_table.read_shots(club="7Iron", columns=["Carry", "MaxHeight"])
+
+        # Verify the missing values are null
+        assert table.column("MaxHeight").to_pylist() == [25.0, None]
+
+    def test_mixed_numeric_types_between_partitions(self, shot_table):
+        """
+        Verify a column stored as integers one day and floats another is read as floats.
+        """
+        # Only whole carries were recorded on the older day
+        shot_table.write_club_shots({"7Iron": [
+            make_stroke("2025-06-01T10:00:00", 148),
+            make_stroke("2025-06-02T10:00:00", 150.5)
+        ]})
+
+        # Call the function under test
+        table = shot_table.read_shots(club="7Iron", columns=["Carry"])
+
+        # Verify both partitions are merged into a float column
+        assert table.column("Carry").to_pylist() == [150.5, 148.0]
+        assert str(table.schema.field("Carry").type) == "double"
+
+    def test_to_strokes_round_trip(self, shot_table):
+        """
+        Verify rows convert back into TrackMan shaped strokes referencing their session.
+        """
+        # Write and read back a single stroke
+        stroke = {**make_stroke("2025-06-01T10:00:00", 150), "Session": "trackman_session_summary/a.json"}
+        shot_table.write_club_shots({"7Iron": [stroke]})
+        table = shot_table.read_shots(club="7Iron", columns=["Time", "Session", "Carry", "BallTrajectory"])
+
+        # Verify nested measurements are restored
+        assert shot_table.to_strokes(table) == [{
+            "Time": "2025-06-01T10:00:00",
+            "Session": "trackman_session_summary/a.json",
+            "Measurement": {"Carry": 150}
+        }]
+
+    def test_trajectories_not_stored(self, shot_table):
+        """
+        Verify ball trajectories are left to the session trajectory documents.
+        """
+        # Write a stroke carrying a trajectory
+        shot_table.write_club_shots({"7Iron": [make_stroke("2025-06-01T10:00:00", 150)]})
+
+        # Verify the partition has no trajectory column
+        assert "BallTrajectory" not in shot_table.read_shots(club="7Iron").column_names
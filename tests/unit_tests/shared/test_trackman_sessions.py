@@ -0,0 +1,181 @@
+# Import dependencies
+from shared import TrackManSessions, BlobServiceRegistry, BlobListingCache
+from azure.core.exceptions import ResourceNotFoundError
+from unittest.mock import patch, MagicMock
+import pytest
+
+# A session report with two clubs and inline ball trajectories
+REPORT = {
+    "Id": "abc",
+    "StrokeGroups": [
+        {"Club": "Driver", "Date": "2025-06-01T10:00:00", "Strokes": [
+            {"Time": "2025-06-01T10:01:00", "Measurement": {"Carry": 230.5, "BallTrajectory": [{"X": 0}, {"X": 230}]}},
+            {"Time": "2025-06-01T10:02:00", "Measurement": {"Carry": 241.0, "BallTrajectory": [{"X": 0}, {"X": 241}]}}
+        ]},
+        {"Club": "7Iron", "Date": "2025-06-01T10:00:00", "Strokes": [
+            {"Time": "2025-06-01T10:03:00", "Measurement": {"Carry": 150.0, "BallTrajectory": [{"X": 0}, {"X": 150}]}}
+        ]}
+    ]
+}
+BLOB_NAME = "trackman_session_summary/2025-06-01T10:00:00-session-abc.json"
+
+@pytest.fixture(autouse=True)
+def reset_blob_service_registry():
+    """
+    Clear pooled clients and cached listings between tests.
+
+    Ensures each test builds its clients from
+    its own patched BlobServiceClient.
+    """
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+    yield
+    BlobServiceRegistry.reset()
+    BlobListingCache.reset()
+
+class FakeBlob:
+    """
+    In-memory stand-in for a blob client backed by a shared dictionary.
+
+    Attributes:
+        store (dict): Blob names mapped to their stored bytes, content settings and metadata.
+        name (str): Name of this blob.
+    """
+    def __init__(self, store: dict, name: str) -> None:
+        self.store = store
+        self.name = name
+
+    def upload_blob(self, data: bytes, overwrite: bool = False, content_settings=None, metadata=None, **kwargs) -> None:
+        self.store[self.name] = (data, content_settings, metadata or {})
+
+    def get_blob_properties(self) -> MagicMock:
+        if self.name not in self.store:
+            raise ResourceNotFoundError("The specified blob does not exist.")
+        properties = MagicMock()
+        properties.metadata = self.store[self.name][2]
+        return properties
+
+    def download_blob(self, **kwargs) -> MagicMock:
+        if self.name not in self.store:
+            raise ResourceNotFoundError("The specified blob does not exist.")
+        data, content_settings, _ = self.store[self.name]
+        download_stream = MagicMock()
+        download_stream.readall.return_value = data
+        download_stream.chunks.side_effect = lambda: iter([data[i:i + 32] for i in range(0, len(data), 32)])
+        download_stream.properties.content_settings = content_settings
+        return download_stream
+
+@pytest.fixture
+def store():
+    """
+    Patch the Azure SDK so blob clients read and write an in-memory store.
+    """
+    blobs = {}
+    with patch("shared.functions.blob_service_registry.BlobServiceClient") as mock_blob_service_client:
+        mock_blob_service_client.from_connection_string.return_value.get_blob_client.side_effect = \
+            lambda container, blob: FakeBlob(blobs, blob)
+        yield blobs
+
+class TestTrackManSessions:
+    """
+    Test suite for TrackManSessions.
+
+    Covers splitting reports at ingest, on-demand trajectory
+    loading and reading sessions stored before the split.
+    """
+
+    def test_split_report(self):
+        """
+        Verify the metrics document drops trajectories and the trajectory document keeps only them.
+        """
+        # Call the function under test
+        metrics, trajectories = TrackManSessions.split_report(REPORT)
+
+        # Verify metrics keep everything but the trajectories
+        assert metrics["Id"] == "abc"
+        assert [stroke["Measurement"] for group in metrics["StrokeGroups"] for stroke in group["Strokes"]] == [
+            {"Carry": 230.5}, {"Carry": 241.0}, {"Carry": 150.0}
+        ]
+
+        # Verify trajectories are grouped by club and keyed by time
+        assert trajectories["StrokeGroups"][1] == {"Club": "7Iron", "Strokes": [
+            {"Time": "2025-06-01T10:03:00", "BallTrajectory": [{"X": 0}, {"X": 150}]}
+        ]}
+
+        # Verify the original report is untouched
+        assert "BallTrajectory" in REPORT["StrokeGroups"][0]["Strokes"][0]["Measurement"]
+
+    def test_trajectory_name(self):
+        """
+        Verify trajectory documents mirror the session blob name under their own prefix.
+        """
+        assert TrackManSessions().trajectory_name(BLOB_NAME) == \
+            "trackman_session_trajectories/2025-06-01T10:00:00-session-abc.json"
+
+    def test_export_and_iter_strokes(self, store):
+        """
+        Verify strokes stream without trajectories unless asked for, then with only the selected club's.
+        """
+        # Store the session split in two
+        sessions = TrackManSessions()
+        assert sessions.export_session(BLOB_NAME, REPORT).ok
+        assert sorted(store) == [
+            "trackman_session_summary/2025-06-01T10:00:00-session-abc.json",
+            "trackman_session_trajectories/2025-06-01T10:00:00-session-abc.json"
+        ]
+
+        # Verify metrics only reads carry no trajectories
+        assert [stroke["Measurement"] for _, stroke in sessions.iter_strokes(BLOB_NAME, clubs=["7Iron"])] == [
+            {"Carry": 150.0}
+        ]
+
+        # Verify trajectories are attached on demand
+        strokes = list(sessions.iter_strokes(BLOB_NAME, clubs=["Driver"], trajectories=True))
+        assert [stroke["Measurement"]["BallTrajectory"][-1]["X"] for _, stroke in strokes] == [230, 241]
+
+    def test_legacy_session_fallback(self, store):
+        """
+        Verify sessions stored before the split still provide their trajectories.
+        """
+        # Store the whole report as a single document
+        sessions = TrackManSessions()
+        sessions.export_dict_to_blob(data=REPORT, container="golf", output_filename=BLOB_NAME)
+
+        # Verify both trajectory readers fall back to the original report
+        assert sessions.read_trajectories(BLOB_NAME, clubs=["7Iron"]) == {
+            ("7Iron", "2025-06-01T10:03:00"): [{"X": 0}, {"X": 150}]
+        }
+        strokes = list(sessions.iter_strokes(BLOB_NAME, clubs=["7Iron"], trajectories=True))
+        assert strokes[0][1]["Measurement"]["BallTrajectory"] == [{"X": 0}, {"X": 150}]
+
+    def test_attach_trajectories(self, store):
+        """
+        Verify shot table strokes get their trajectories from the sessions they reference.
+        """
+        # Store the session and build strokes as read from the shot table
+        sessions = TrackManSessions()
+        sessions.export_session(BLOB_NAME, REPORT)
+        strokes = [
+            {"Time": "2025-06-01T10:02:00", "Session": BLOB_NAME, "Measurement": {"Carry": 241.0}},
+            {"Time": "2025-06-01T09:00:00", "Session": None, "Measurement": {"Carry": 200.0}}
+        ]
+
+        # Call the function under test
+        sessions.attach_trajectories(club="Driver", strokes=strokes)
+
+        # Verify only strokes with a session are filled in
+        assert strokes[0]["Measurement"]["BallTrajectory"] == [{"X": 0}, {"X": 241}]
+        assert "BallTrajectory" not in strokes[1]["Measurement"]
+
+    def test_split_legacy_session(self, store):
+        """
+        Verify legacy sessions are split once and already split sessions are left alone.
+        """
+        # Store the whole report as a single document
+        sessions = TrackManSessions()
+        sessions.export_dict_to_blob(data=REPORT, container="golf", output_filename=BLOB_NAME)
+
+        # Verify the first call splits and the second finds nothing to do
+        assert sessions.split_legacy_session(BLOB_NAME) is True
+        assert sessions.split_legacy_session(BLOB_NAME) is False
+        assert sessions.read_blob_to_dict("golf", BLOB_NAME) == TrackManSessions.split_report(REPORT)[0]